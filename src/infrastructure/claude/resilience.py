@@ -0,0 +1,369 @@
+"""
+Worker SDK 실행 복원력(Resilience) 모듈.
+
+- 일시적(transient) 오류 분류
+- 지터(jitter)가 적용된 지수 백오프 재시도 정책
+- 모델별 서킷 브레이커 (CLI가 불안정한 동안 빠르게 실패)
+
+설정은 config/system_config.json의 performance.worker_retry_* 및
+resilience.circuit_breaker 섹션에서 로드합니다.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from claude_agent_sdk import (
+    CLINotFoundError,
+    ProcessError,
+    CLIJSONDecodeError,
+    ClaudeSDKError,
+)
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__, component="Resilience")
+
+
+class WorkerExecutionError(Exception):
+    """Worker SDK 실행 실패 예외.
+
+    재시도를 모두 소진했거나 재시도 불가능한 오류가 발생했을 때 발생합니다.
+    에러 텍스트를 출력으로 흘려보내지 않고 노드를 실패 처리하기 위해 사용합니다.
+
+    Attributes:
+        worker_name: Worker 이름
+        model: Claude 모델명
+        transient: 일시적 오류 여부
+        attempts: 시도 횟수 (최초 실행 포함)
+    """
+
+    def __init__(
+        self,
+        message: str,
+        worker_name: Optional[str] = None,
+        model: Optional[str] = None,
+        transient: bool = False,
+        attempts: int = 1,
+    ):
+        super().__init__(message)
+        self.worker_name = worker_name
+        self.model = model
+        self.transient = transient
+        self.attempts = attempts
+
+
+class CircuitOpenError(WorkerExecutionError):
+    """서킷 브레이커가 열려 있어 실행을 거부한 경우 발생하는 예외.
+
+    Attributes:
+        retry_after: 다음 시도까지 남은 시간 (초)
+    """
+
+    def __init__(self, message: str, retry_after: float = 0.0, **kwargs):
+        super().__init__(message, transient=True, **kwargs)
+        self.retry_after = retry_after
+
+
+class WorkerTimeoutError(WorkerExecutionError):
+    """Worker 실행이 제한 시간을 초과한 경우 발생하는 예외.
+
+    재시도하지 않습니다 (제한 시간은 재시도를 포함한 전체 실행에 적용).
+
+    Attributes:
+        timeout: 적용된 제한 시간 (초)
+    """
+
+    def __init__(self, message: str, timeout: float = 0.0, **kwargs):
+        super().__init__(message, **kwargs)
+        self.timeout = timeout
+
+
+# 일시적 오류로 판단하는 메시지 키워드 (소문자)
+_TRANSIENT_KEYWORDS = (
+    "overloaded",
+    "rate limit",
+    "rate_limit",
+    "timeout",
+    "timed out",
+    "connection",
+    "temporarily",
+    "503",
+    "529",
+)
+
+# 재시도해도 의미 없는 프로세스 종료 코드 (실행 권한 없음, 명령 없음)
+_PERMANENT_EXIT_CODES = (126, 127)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """오류가 재시도로 해결될 수 있는 일시적 오류인지 판단.
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        bool: 일시적 오류이면 True
+
+    Note:
+        - CLINotFoundError, CLIJSONDecodeError: 설치/버전 문제 → 재시도 불가
+        - ProcessError: 종료 코드 126/127을 제외하면 재시도 가능
+        - 타임아웃/연결 오류: 재시도 가능
+        - 기타 ClaudeSDKError: 메시지에 과부하/레이트 리밋 등의 키워드가 있으면 재시도 가능
+    """
+    if isinstance(error, (CLINotFoundError, CLIJSONDecodeError)):
+        return False
+
+    if isinstance(error, ProcessError):
+        return getattr(error, "exit_code", None) not in _PERMANENT_EXIT_CODES
+
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+
+    if isinstance(error, ClaudeSDKError):
+        message = str(error).lower()
+        return any(keyword in message for keyword in _TRANSIENT_KEYWORDS)
+
+    return False
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 정책 (지터가 적용된 지수 백오프).
+
+    Attributes:
+        enabled: 재시도 활성화 여부
+        max_attempts: 최대 시도 횟수 (최초 실행 포함)
+        base_delay: 기본 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+    """
+    enabled: bool = True
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        """다음 시도를 진행할지 판단.
+
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터 시작)
+            error: 발생한 예외
+
+        Returns:
+            bool: 재시도해야 하면 True
+        """
+        if not self.enabled or attempt >= self.max_attempts:
+            return False
+        return is_transient_error(error)
+
+    def compute_delay(self, attempt: int) -> float:
+        """재시도 전 대기 시간 계산 (Equal Jitter).
+
+        base_delay * 2^(attempt-1)을 max_delay로 제한한 뒤,
+        절반은 고정하고 나머지 절반에 무작위 지터를 적용합니다.
+        동시에 실패한 여러 노드가 같은 시점에 재시도하는 것을 방지합니다.
+
+        Args:
+            attempt: 방금 실패한 시도 번호 (1부터 시작)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        capped = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        half = capped / 2
+        return half + random.uniform(0, half)
+
+
+class CircuitBreaker:
+    """서킷 브레이커.
+
+    상태 전이:
+        closed → (연속 실패 failure_threshold회) → open
+        open → (timeout_seconds 경과) → half_open
+        half_open: 시험 요청은 한 번에 하나만 허용 (나머지는 즉시 거부)
+        half_open → (연속 성공 success_threshold회) → closed
+        half_open → (실패) → open
+
+    Attributes:
+        name: 브레이커 이름 (모델명)
+        failure_threshold: open으로 전환할 연속 실패 횟수
+        success_threshold: closed로 복귀할 연속 성공 횟수
+        timeout_seconds: open 상태 유지 시간 (초)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        success_threshold: int = 2,
+        timeout_seconds: float = 60.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.success_threshold = success_threshold
+        self.timeout_seconds = timeout_seconds
+
+        self._state = self.CLOSED
+        self._failure_count = 0
+        self._success_count = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 타임아웃이 지났으면 half_open으로 전환)."""
+        with self._lock:
+            self._refresh_state()
+            return self._state
+
+    def _refresh_state(self) -> None:
+        """open 상태의 타임아웃 경과 여부 확인 (lock 보유 상태에서 호출)."""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.timeout_seconds:
+            self._state = self.HALF_OPEN
+            self._success_count = 0
+            self._trial_in_flight = False
+            logger.info(f"[CircuitBreaker:{self.name}] half_open 전환 (시험 요청 허용)")
+
+    def allow_request(self) -> bool:
+        """요청 허용 여부.
+
+        half_open에서는 시험 요청 하나만 허용하고, 결과(record_success/record_failure)가
+        기록될 때까지 다른 요청은 거부합니다. 결과 없이 끝난 시험 요청(취소 등)이
+        timeout_seconds 이상 지나면 새 시험 요청을 허용합니다.
+
+        Returns:
+            bool: closed이거나 half_open 시험 요청이면 True, 그 외 False
+        """
+        with self._lock:
+            self._refresh_state()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                return False
+
+            now = time.monotonic()
+            if self._trial_in_flight and now - self._trial_started_at < self.timeout_seconds:
+                return False
+            self._trial_in_flight = True
+            self._trial_started_at = now
+            return True
+
+    def retry_after(self) -> float:
+        """open 상태(또는 half_open 시험 요청 진행 중)에서 다음 시도까지 남은 시간 (초)."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._trial_in_flight:
+                started_at = self._trial_started_at
+            elif self._state == self.OPEN:
+                started_at = self._opened_at
+            else:
+                return 0.0
+            return max(0.0, self.timeout_seconds - (time.monotonic() - started_at))
+
+    def record_success(self) -> None:
+        """성공 기록."""
+        with self._lock:
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN:
+                self._success_count += 1
+                if self._success_count >= self.success_threshold:
+                    self._state = self.CLOSED
+                    self._failure_count = 0
+                    logger.info(f"[CircuitBreaker:{self.name}] closed 복귀")
+            else:
+                self._failure_count = 0
+
+    def record_failure(self) -> None:
+        """실패 기록."""
+        with self._lock:
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+
+            self._failure_count += 1
+            if self._state == self.CLOSED and self._failure_count >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        """open 상태로 전환 (lock 보유 상태에서 호출)."""
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._success_count = 0
+        logger.warning(
+            f"[CircuitBreaker:{self.name}] open 전환 "
+            f"(연속 실패 {self._failure_count}회, {self.timeout_seconds}초 동안 요청 차단)"
+        )
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(name={self.name}, state={self._state})"
+
+
+# 모델별 서킷 브레이커 레지스트리
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+# 설정 캐시 (최초 1회 로드)
+_settings = None
+
+
+def _get_settings():
+    """시스템 설정 로드 (실패 시 기본값 사용)."""
+    global _settings
+    if _settings is None:
+        from src.infrastructure.config import SystemConfig, load_system_config
+        try:
+            _settings = load_system_config()
+        except Exception as e:
+            logger.warning(f"시스템 설정 로드 실패, 재시도/서킷 브레이커 기본값 사용: {e}")
+            _settings = SystemConfig()
+    return _settings
+
+
+def get_retry_policy() -> RetryPolicy:
+    """시스템 설정 기반 재시도 정책 반환.
+
+    Returns:
+        RetryPolicy: performance.worker_retry_* 설정이 반영된 정책
+    """
+    settings = _get_settings()
+    return RetryPolicy(
+        enabled=settings.worker_retry_enabled,
+        max_attempts=max(1, settings.worker_retry_max_attempts),
+        base_delay=settings.worker_retry_base_delay,
+        max_delay=settings.worker_retry_max_delay,
+    )
+
+
+def get_circuit_breaker(model: str) -> CircuitBreaker:
+    """모델별 서킷 브레이커 반환 (없으면 생성).
+
+    resilience.circuit_breaker.enable_per_worker가 false이면
+    모든 모델이 하나의 브레이커를 공유합니다.
+
+    Args:
+        model: Claude 모델명
+
+    Returns:
+        CircuitBreaker: 모델별 서킷 브레이커
+    """
+    settings = _get_settings()
+    key = model if settings.circuit_breaker_per_model else "~global"
+
+    with _breakers_lock:
+        if key not in _breakers:
+            _breakers[key] = CircuitBreaker(
+                name=key,
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                success_threshold=settings.circuit_breaker_success_threshold,
+                timeout_seconds=settings.circuit_breaker_timeout_seconds,
+            )
+        return _breakers[key]
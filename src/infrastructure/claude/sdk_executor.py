@@ -4,9 +4,11 @@ Agent SDK 실행 래퍼 모듈.
 클라이언트 코드의 중복을 제거하기 위한 Template Method Pattern 기반 Executor.
 """
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass
-from typing import AsyncIterator, Callable, Optional, Any, List, Awaitable
+from typing import AsyncIterator, Callable, Optional, Any, Dict, List, Awaitable
 from abc import ABC, abstractmethod
 
 from claude_agent_sdk import (
@@ -25,10 +27,26 @@ from claude_agent_sdk import (
     ClaudeSDKClient
 )
 
-from src.infrastructure.logging import get_logger
+from src.infrastructure.logging import get_logger, get_hot_path_logger, LogSampler
+from src.infrastructure.metrics import SDK_CONNECT_SECONDS, SDK_FIRST_TOKEN_SECONDS
+from .resilience import (
+    RetryPolicy,
+    WorkerExecutionError,
+    WorkerTimeoutError,
+    CircuitOpenError,
+    is_transient_error,
+    get_retry_policy,
+    get_circuit_breaker,
+)
 
 logger = get_logger(__name__)
 
+# 응답/블록 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
+
+# SDK 스트림 큐 크기 (생산자 Task와 소비자 간 backpressure)
+_STREAM_QUEUE_SIZE = 64
+
 
 @dataclass
 class SDKExecutionConfig:
@@ -38,18 +56,20 @@ class SDKExecutionConfig:
         model: Claude 모델명
         max_tokens: 최대 생성 토큰 수
         temperature: 샘플링 온도
-        timeout: 타임아웃 (초)
+        timeout: 타임아웃 (초, 재시도를 포함한 전체 실행에 적용, None이면 제한 없음)
         cli_path: Claude CLI 경로
         permission_mode: 권한 모드
         max_turns: 최대 대화 턴 수 (None이면 무제한)
         continue_conversation: 이전 세션 재개 여부
         setting_sources: 설정 파일 로드 소스 리스트 (예: ["user", "project", "local"])
         system_prompt: 시스템 프롬프트 (선택, Manager/Worker에서 제공)
+            Claude Code 기본 시스템 프롬프트 뒤에 추가됩니다 (preset append).
+            호출마다 바이트 단위로 동일해야 프롬프트 캐시가 적중합니다.
     """
     model: str = "claude-sonnet-4-5-20250929"
     max_tokens: int = 8000
     temperature: float = 0.7
-    timeout: int = 600
+    timeout: Optional[float] = 600
     cli_path: Optional[str] = None
     permission_mode: str = "acceptEdits"  # 기본값: acceptEdits (프로덕션 안전)
     max_turns: Optional[int] = None
@@ -76,6 +96,48 @@ class SDKExecutionConfig:
                 )
 
 
+class StreamChunk(str):
+    """타입 정보를 가진 스트림 청크.
+
+    str을 상속하므로 기존 문자열 소비자(SSE 전송, 문자열 결합 등)와 호환되며,
+    kind 속성으로 블록 타입을 전달합니다. 블록 타입은 SDK 응답을 처리하는
+    시점에 결정되므로 소비자가 JSON을 다시 파싱할 필요가 없습니다.
+
+    Attributes:
+        kind: 청크 타입 (text, thinking, tool_use, tool_result, status)
+
+    Example:
+        >>> chunk = StreamChunk("안녕하세요", StreamChunk.TEXT)
+        >>> chunk.kind, chunk.chunk_type
+        ('text', 'text')
+    """
+
+    TEXT = "text"  # 최종 출력 텍스트 (다음 노드로 전달)
+    THINKING = "thinking"  # Extended Thinking 사고 과정
+    TOOL_USE = "tool_use"  # 도구 호출
+    TOOL_RESULT = "tool_result"  # 도구 실행 결과
+    STATUS = "status"  # 시스템/진행 상태 메시지 (최종 출력에서 제외)
+
+    def __new__(cls, value: str, kind: str = "text"):
+        chunk = super().__new__(cls, value)
+        chunk.kind = kind
+        return chunk
+
+    @property
+    def chunk_type(self) -> str:
+        """UI 표시용 청크 타입 ("thinking", "tool", "text")."""
+        if self.kind == self.THINKING:
+            return "thinking"
+        if self.kind in (self.TOOL_USE, self.TOOL_RESULT):
+            return "tool"
+        return "text"
+
+    @property
+    def is_final_text(self) -> bool:
+        """다음 노드로 전달할 최종 텍스트인지 여부."""
+        return self.kind == self.TEXT
+
+
 class SDKResponseHandler(ABC):
     """SDK 응답 핸들러 추상 클래스.
 
@@ -91,7 +153,7 @@ class SDKResponseHandler(ABC):
             response: SDK 응답 객체
 
         Yields:
-            str: 추출된 텍스트 청크
+            str: 추출된 텍스트 청크 (블록 단위 StreamChunk)
         """
         pass
 
@@ -101,42 +163,58 @@ class SDKResponseHandler(ABC):
 
     def extract_text_from_response(self, response: Any) -> Optional[str]:
         """
-        SDK 응답 객체에서 텍스트 추출 (공통 로직).
+        SDK 응답 객체에서 텍스트 추출 (블록 구분 없이 결합).
+
+        Args:
+            response: SDK 응답 객체
+
+        Returns:
+            str: 추출된 텍스트 또는 None
+        """
+        chunks = self.extract_chunks_from_response(response)
+        if chunks:
+            return '\n'.join(chunks)
+        return None
+
+    def extract_chunks_from_response(self, response: Any) -> List["StreamChunk"]:
+        """
+        SDK 응답 객체에서 블록별 타입 청크 추출 (공통 로직).
 
         처리 순서:
-        1. AssistantMessage → content blocks 순회 → TextBlock/ThinkingBlock 추출
+        1. AssistantMessage → content blocks 순회 → 블록 타입별 청크 생성
         2. ResultMessage → 텍스트 없음 (usage 정보만)
         3. 폴백 → hasattr()로 동적 추출 (하위 호환성)
 
+        블록 타입은 생성 시점에 결정되므로, 소비자가 JSON을 다시 파싱하여
+        타입을 판별할 필요가 없습니다.
+
         Args:
             response: SDK 응답 객체
 
         Returns:
-            str: 추출된 텍스트 또는 None
+            List[StreamChunk]: 추출된 청크 목록 (없으면 빈 리스트)
         """
         # [1단계] AssistantMessage 처리
         # Claude가 생성한 응답 메시지 (텍스트, 사고 과정, 도구 호출 등)
         if isinstance(response, AssistantMessage):
             if not response.content:
-                logger.debug("AssistantMessage has no content")
-                return None
+                hot_logger.debug("AssistantMessage has no content")
+                return []
 
             # content blocks 순회 (여러 블록이 있을 수 있음)
             text_parts = []
             for i, content_block in enumerate(response.content):
                 # TextBlock: 일반 텍스트 응답
                 if isinstance(content_block, TextBlock):
-                    logger.debug(f"Extracted text from TextBlock #{i}")
-                    text_parts.append(content_block.text)
+                    hot_logger.debug("Extracted text from TextBlock #%d", i)
+                    text_parts.append(StreamChunk(content_block.text, StreamChunk.TEXT))
 
                 # ThinkingBlock: Extended Thinking 모드의 사고 과정
                 # JSON 형식으로 직렬화하여 프론트엔드에서 파싱 가능하도록 전달
                 elif isinstance(content_block, ThinkingBlock):
                     if hasattr(content_block, 'thinking') and content_block.thinking:
-                        logger.debug(
-                            f"🧠 ThinkingBlock detected (#{i})",
-                            length=len(content_block.thinking),
-                            preview=content_block.thinking[:100] + "..." if len(content_block.thinking) > 100 else content_block.thinking
+                        hot_logger.debug(
+                            "🧠 ThinkingBlock detected (#%d, %d자)", i, len(content_block.thinking)
                         )
                         # JSON 형식으로 직렬화하여 프론트엔드로 전달
                         thinking_json = json.dumps({
@@ -146,11 +224,11 @@ class SDKResponseHandler(ABC):
                                 "thinking": content_block.thinking
                             }]
                         }, ensure_ascii=False)
-                        text_parts.append(thinking_json)
+                        text_parts.append(StreamChunk(thinking_json, StreamChunk.THINKING))
 
                 # ToolUseBlock: 도구 호출 정보 (JSON 형식)
                 elif isinstance(content_block, ToolUseBlock):
-                    logger.debug(f"Found ToolUseBlock #{i}: {content_block.name}")
+                    hot_logger.debug("Found ToolUseBlock #%d: %s", i, content_block.name)
                     # JSON 형식으로 직렬화하여 프론트엔드에서 파싱 가능하도록
 
                     # tool_input 안전하게 추출
@@ -178,11 +256,11 @@ class SDKResponseHandler(ABC):
                             "input": tool_input
                         }]
                     }, ensure_ascii=False)
-                    text_parts.append(tool_json)
+                    text_parts.append(StreamChunk(tool_json, StreamChunk.TOOL_USE))
 
                 # ToolResultBlock: 도구 실행 결과 (JSON 형식)
                 elif isinstance(content_block, ToolResultBlock):
-                    logger.debug(f"Found ToolResultBlock #{i}: tool_use_id={content_block.tool_use_id}")
+                    hot_logger.debug("Found ToolResultBlock #%d: tool_use_id=%s", i, content_block.tool_use_id)
 
                     # Tool 결과 추출
                     tool_result = None
@@ -212,11 +290,11 @@ class SDKResponseHandler(ABC):
                             "content": tool_result
                         }]
                     }, ensure_ascii=False)
-                    text_parts.append(tool_result_json)
+                    text_parts.append(StreamChunk(tool_result_json, StreamChunk.TOOL_RESULT))
 
                 # 폴백: hasattr로 type='tool_use' 체크 (하위 호환성)
                 elif hasattr(content_block, 'type') and content_block.type == 'tool_use':
-                    logger.debug(f"Found tool_use block (fallback) #{i}")
+                    hot_logger.debug("Found tool_use block (fallback) #%d", i)
 
                     # tool_input 안전하게 추출
                     tool_input = {}
@@ -242,48 +320,48 @@ class SDKResponseHandler(ABC):
                             "input": tool_input
                         }]
                     }, ensure_ascii=False)
-                    text_parts.append(tool_json)
+                    text_parts.append(StreamChunk(tool_json, StreamChunk.TOOL_USE))
 
             # 텍스트 파트들을 결합하여 반환
             if text_parts:
-                return '\n'.join(text_parts)
+                return text_parts
 
             # content blocks는 있지만 텍스트가 없는 경우
-            logger.debug(
-                f"AssistantMessage has {len(response.content)} blocks but no text"
+            hot_logger.debug(
+                "AssistantMessage has %d blocks but no text", len(response.content)
             )
-            return None
+            return []
 
         # [2단계] ResultMessage 처리
         # 스트리밍 종료 시 전송되는 메타 정보 (usage 통계 등)
         elif isinstance(response, ResultMessage):
             # ResultMessage는 텍스트가 아닌 메타데이터만 포함
-            logger.debug("ResultMessage (no text content)")
-            return None
+            hot_logger.debug("ResultMessage (no text content)")
+            return []
 
         # [3단계] UserMessage 처리
         # 사용자 입력 메시지 (대화 히스토리에 포함될 수 있음)
         elif isinstance(response, UserMessage):
             if not response.content:
-                logger.debug("UserMessage has no content")
-                return None
+                hot_logger.debug("UserMessage has no content")
+                return []
 
             # content가 문자열인 경우
             if isinstance(response.content, str):
-                logger.debug("Extracted text from UserMessage (string content)")
-                return response.content
+                hot_logger.debug("Extracted text from UserMessage (string content)")
+                return [StreamChunk(response.content, StreamChunk.STATUS)]
 
             # content가 리스트인 경우 (blocks)
             if isinstance(response.content, list):
                 text_parts = []
                 for i, content_block in enumerate(response.content):
                     if isinstance(content_block, TextBlock):
-                        logger.debug(f"Extracted text from UserMessage TextBlock #{i}")
-                        text_parts.append(content_block.text)
+                        hot_logger.debug("Extracted text from UserMessage TextBlock #%d", i)
+                        text_parts.append(StreamChunk(content_block.text, StreamChunk.STATUS))
 
                     # ToolResultBlock: 도구 실행 결과 (UserMessage에 포함될 수 있음)
                     elif isinstance(content_block, ToolResultBlock):
-                        logger.debug(f"Found ToolResultBlock in UserMessage #{i}: tool_use_id={content_block.tool_use_id}")
+                        hot_logger.debug("Found ToolResultBlock in UserMessage #%d: tool_use_id=%s", i, content_block.tool_use_id)
 
                         # Tool 결과 추출
                         tool_result = None
@@ -310,13 +388,13 @@ class SDKResponseHandler(ABC):
                                 "content": tool_result
                             }]
                         }, ensure_ascii=False)
-                        text_parts.append(tool_result_json)
+                        text_parts.append(StreamChunk(tool_result_json, StreamChunk.TOOL_RESULT))
 
                 if text_parts:
-                    return '\n'.join(text_parts)
+                    return text_parts
 
-            logger.debug("UserMessage has no extractable text content")
-            return None
+            hot_logger.debug("UserMessage has no extractable text content")
+            return []
 
         # [4단계] SystemMessage 처리
         # 시스템 메타데이터 메시지 (SDK 내부 상태 정보 등)
@@ -325,38 +403,38 @@ class SDKResponseHandler(ABC):
             if hasattr(response, 'content'):
                 # content가 문자열인 경우
                 if isinstance(response.content, str):
-                    logger.debug("Extracted text from SystemMessage (string content)")
-                    return response.content
+                    hot_logger.debug("Extracted text from SystemMessage (string content)")
+                    return [StreamChunk(response.content, StreamChunk.STATUS)]
 
                 # content가 리스트인 경우 (blocks)
                 elif isinstance(response.content, list):
                     for i, content_block in enumerate(response.content):
                         if isinstance(content_block, TextBlock):
-                            logger.debug(f"Extracted text from SystemMessage TextBlock #{i}")
-                            return content_block.text
+                            hot_logger.debug("Extracted text from SystemMessage TextBlock #%d", i)
+                            return [StreamChunk(content_block.text, StreamChunk.STATUS)]
 
-            logger.debug("SystemMessage has no extractable text content")
-            return None
+            hot_logger.debug("SystemMessage has no extractable text content")
+            return []
 
         # [5단계] 폴백 처리 (하위 호환성)
         # 알 수 없는 응답 타입이거나 SDK 버전 변경 시 대비
-        logger.debug(f"Unknown response type: {type(response).__name__}, trying fallback")
+        hot_logger.debug("Unknown response type: %s, trying fallback", type(response).__name__)
 
         # 시도 1: content 리스트 확인
         if hasattr(response, 'content') and isinstance(response.content, list):
             for content in response.content:
                 if hasattr(content, 'text') and content.text:
-                    logger.debug("Extracted text from content list (fallback)")
-                    return content.text
+                    hot_logger.debug("Extracted text from content list (fallback)")
+                    return [StreamChunk(content.text, StreamChunk.TEXT)]
 
         # 시도 2: 직접 text 속성 확인
         if hasattr(response, 'text') and isinstance(response.text, str):
-            logger.debug("Extracted text directly (fallback)")
-            return response.text
+            hot_logger.debug("Extracted text directly (fallback)")
+            return [StreamChunk(response.text, StreamChunk.TEXT)]
 
         # 추출 실패
-        logger.debug("No text found in response")
-        return None
+        hot_logger.debug("No text found in response")
+        return []
 
     def extract_final_output_from_response(self, response: Any) -> Optional[str]:
         """
@@ -414,14 +492,14 @@ class SDKResponseHandler(ABC):
             }
         """
         if not usage_obj:
-            logger.debug(f"[{context}] No usage object provided")
+            hot_logger.debug("[%s] No usage object provided", context)
             return None
 
         usage_dict = {}
 
         # [방법 1] dict 타입인 경우
         if isinstance(usage_obj, dict):
-            logger.debug(f"[{context}] Extracting usage from dict")
+            hot_logger.debug("[%s] Extracting usage from dict", context)
             usage_dict['input_tokens'] = usage_obj.get('input_tokens', 0)
             usage_dict['output_tokens'] = usage_obj.get('output_tokens', 0)
             usage_dict['cache_read_tokens'] = usage_obj.get('cache_read_input_tokens', 0)
@@ -431,7 +509,7 @@ class SDKResponseHandler(ABC):
 
         # [방법 2] object 타입인 경우 (속성 접근)
         else:
-            logger.debug(f"[{context}] Extracting usage from object")
+            hot_logger.debug("[%s] Extracting usage from object", context)
             # 각 속성이 존재하는지 확인 후 추출
             if hasattr(usage_obj, 'input_tokens'):
                 usage_dict['input_tokens'] = usage_obj.input_tokens
@@ -439,12 +517,16 @@ class SDKResponseHandler(ABC):
                 usage_dict['output_tokens'] = usage_obj.output_tokens
             if hasattr(usage_obj, 'cache_read_tokens'):
                 usage_dict['cache_read_tokens'] = usage_obj.cache_read_tokens
+            elif hasattr(usage_obj, 'cache_read_input_tokens'):
+                usage_dict['cache_read_tokens'] = usage_obj.cache_read_input_tokens
             if hasattr(usage_obj, 'cache_creation_tokens'):
                 usage_dict['cache_creation_tokens'] = usage_obj.cache_creation_tokens
+            elif hasattr(usage_obj, 'cache_creation_input_tokens'):
+                usage_dict['cache_creation_tokens'] = usage_obj.cache_creation_input_tokens
 
         # 추출 성공 여부 확인
         if usage_dict:
-            logger.debug(f"[{context}] Usage extracted: {usage_dict}")
+            hot_logger.debug("[%s] Usage extracted: %s", context, usage_dict)
             return usage_dict
         else:
             logger.info(f"⚠️  [{context}] Failed to extract usage from: {type(usage_obj)}")
@@ -461,6 +543,10 @@ class WorkerResponseHandler(SDKResponseHandler):
     1. ResultMessage → usage 정보 추출 → 콜백 호출 → 종료
     2. AssistantMessage → usage 정보 추출 → 콜백 호출 → 텍스트 추출 → yield
     3. 알 수 없는 타입 → 폴백 처리
+
+    콜백에 전달되는 usage 딕셔너리에는 출처("source")가 포함됩니다.
+    - "result": ResultMessage의 최종 누적 사용량 (cost_usd 포함)
+    - "assistant" 등: 메시지 단위 사용량 (ResultMessage를 받지 못한 경우의 대체값)
     """
 
     def __init__(self, usage_callback: Optional[Callable[[dict], None]] = None):
@@ -479,18 +565,20 @@ class WorkerResponseHandler(SDKResponseHandler):
             response: query() 함수의 응답 객체
 
         Yields:
-            str: 추출된 텍스트 청크
+            str: 추출된 텍스트 청크 (블록 단위 StreamChunk)
         """
         # ====================================================================
         # [1단계] ResultMessage 처리 (스트리밍 종료, usage 정보만 존재)
         # ====================================================================
         if isinstance(response, ResultMessage):
-            logger.debug("[Worker] Processing ResultMessage (usage info)")
+            hot_logger.debug("[Worker] Processing ResultMessage (usage info)")
 
             # usage 정보 추출 및 콜백 호출
             if response.usage and self.usage_callback:
                 usage_dict = self.extract_usage_info(response.usage, context="Worker")
                 if usage_dict:
+                    usage_dict['source'] = "result"
+                    usage_dict['cost_usd'] = getattr(response, 'total_cost_usd', None)
                     logger.info(f"[Worker] Token usage (ResultMessage): {usage_dict}")
                     self.usage_callback(usage_dict)
 
@@ -501,57 +589,57 @@ class WorkerResponseHandler(SDKResponseHandler):
         # [2단계] AssistantMessage 처리 (Claude의 응답, 텍스트 + usage 포함)
         # ====================================================================
         if isinstance(response, AssistantMessage):
-            logger.debug("[Worker] Processing AssistantMessage")
+            hot_logger.debug("[Worker] Processing AssistantMessage")
 
             # (2-1) usage 정보 추출 및 콜백 호출
             if hasattr(response, 'usage') and response.usage and self.usage_callback:
                 usage_dict = self.extract_usage_info(response.usage, context="Worker")
                 if usage_dict:
-                    logger.info(f"[Worker] Token usage (AssistantMessage): {usage_dict}")
+                    usage_dict['source'] = "assistant"
+                    hot_logger.debug("[Worker] Token usage (AssistantMessage): %s", usage_dict)
                     self.usage_callback(usage_dict)
 
             # (2-2) 텍스트 추출 및 yield
-            text = self.extract_text_from_response(response)
-            if text:
-                yield text
+            for chunk in self.extract_chunks_from_response(response):
+                yield chunk
             return
 
         # ====================================================================
         # [3단계] UserMessage 처리 (사용자 입력 메시지)
         # ====================================================================
         if isinstance(response, UserMessage):
-            logger.debug("[Worker] Processing UserMessage")
+            hot_logger.debug("[Worker] Processing UserMessage")
 
             # UserMessage는 usage 정보가 없을 수 있으므로 확인 후 처리
             if hasattr(response, 'usage') and response.usage and self.usage_callback:
                 usage_dict = self.extract_usage_info(response.usage, context="Worker")
                 if usage_dict:
-                    logger.info(f"[Worker] Token usage (UserMessage): {usage_dict}")
+                    usage_dict['source'] = "user"
+                    hot_logger.debug("[Worker] Token usage (UserMessage): %s", usage_dict)
                     self.usage_callback(usage_dict)
 
             # 텍스트 추출 및 yield
-            text = self.extract_text_from_response(response)
-            if text:
-                yield text
+            for chunk in self.extract_chunks_from_response(response):
+                yield chunk
             return
 
         # ====================================================================
         # [4단계] SystemMessage 처리 (시스템 메타데이터)
         # ====================================================================
         if isinstance(response, SystemMessage):
-            logger.debug("[Worker] Processing SystemMessage")
+            hot_logger.debug("[Worker] Processing SystemMessage")
 
             # SystemMessage는 usage 정보가 없을 수 있으므로 확인 후 처리
             if hasattr(response, 'usage') and response.usage and self.usage_callback:
                 usage_dict = self.extract_usage_info(response.usage, context="Worker")
                 if usage_dict:
-                    logger.info(f"[Worker] Token usage (SystemMessage): {usage_dict}")
+                    usage_dict['source'] = "system"
+                    hot_logger.debug("[Worker] Token usage (SystemMessage): %s", usage_dict)
                     self.usage_callback(usage_dict)
 
             # 텍스트 추출 및 yield
-            text = self.extract_text_from_response(response)
-            if text:
-                yield text
+            for chunk in self.extract_chunks_from_response(response):
+                yield chunk
             return
 
         # ====================================================================
@@ -563,13 +651,15 @@ class WorkerResponseHandler(SDKResponseHandler):
         if hasattr(response, 'usage') and response.usage and self.usage_callback:
             usage_dict = self.extract_usage_info(response.usage, context="Worker")
             if usage_dict:
+                usage_dict['source'] = "fallback"
                 logger.info(f"[Worker] Token usage (fallback): {usage_dict}")
                 self.usage_callback(usage_dict)
 
         # (3-2) 텍스트 추출 시도
-        text = self.extract_text_from_response(response)
-        if text:
-            yield text
+        chunks = self.extract_chunks_from_response(response)
+        if chunks:
+            for chunk in chunks:
+                yield chunk
         else:
             # 예상과 다른 형식일 경우 JSON으로 직렬화
             # (파서가 JSON을 파싱해서 보기 좋게 표시할 수 있도록)
@@ -584,10 +674,13 @@ class WorkerResponseHandler(SDKResponseHandler):
                 else:
                     response_dict = {'raw': str(response)}
 
-                yield json.dumps(response_dict, ensure_ascii=False, indent=2)
+                yield StreamChunk(
+                    json.dumps(response_dict, ensure_ascii=False, indent=2),
+                    StreamChunk.STATUS
+                )
             except Exception:
                 # JSON 변환 실패 시 문자열로 폴백
-                yield str(response)
+                yield StreamChunk(str(response), StreamChunk.STATUS)
 
 
 class WorkerSDKExecutor:
@@ -601,7 +694,8 @@ class WorkerSDKExecutor:
         config: SDKExecutionConfig,
         allowed_tools: list[str],
         response_handler: WorkerResponseHandler,
-        worker_name: Optional[str] = None
+        worker_name: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         """초기화.
 
@@ -610,13 +704,18 @@ class WorkerSDKExecutor:
             allowed_tools: 허용된 도구 목록
             response_handler: 응답 핸들러
             worker_name: Worker 이름 (로깅용)
+            retry_policy: 재시도 정책 (None이면 system_config.json 설정 사용)
         """
         self.config = config
         self.allowed_tools = allowed_tools
         self.response_handler = response_handler
         self.worker_name = worker_name or "Unknown"
         self.logger = get_logger(__name__, component=self.worker_name)
+        self.hot_logger = get_hot_path_logger(__name__, component=self.worker_name)
+        self._response_log_sampler = LogSampler(every=50, interval=5.0)
         self.last_session_id: Optional[str] = None  # 마지막 실행의 세션 ID 저장
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.retry_count = 0  # 마지막 실행의 재시도 횟수
 
     async def execute_stream(
         self,
@@ -624,7 +723,11 @@ class WorkerSDKExecutor:
         resume_session_id: Optional[str] = None,
         user_input_callback: Optional[Callable[[str], Awaitable[str]]] = None
     ) -> AsyncIterator[str]:
-        """스트림 실행 (연속 대화 지원).
+        """스트림 실행 (연속 대화 지원, 재시도 및 서킷 브레이커 적용).
+
+        일시적 오류(ProcessError, 과부하, 타임아웃 등)는 지터가 적용된 지수 백오프로
+        재시도합니다. 단, 이미 출력이 전달된 뒤에는 중복 출력을 막기 위해 재시도하지 않습니다.
+        재시도할 때마다 "@EVENT:worker_retry:" 마커를 yield합니다.
 
         Args:
             prompt: 프롬프트
@@ -633,220 +736,411 @@ class WorkerSDKExecutor:
                                  질문(str)을 받아서 답변(str)을 반환해야 함
 
         Yields:
-            str: 응답 텍스트 청크
+            str: 응답 텍스트 청크 (StreamChunk, 제어 마커는 일반 str)
 
         Raises:
-            WorkerExecutionError: SDK 실행 중 에러 발생 시
+            WorkerExecutionError: SDK 실행 중 에러 발생 시 (재시도 소진 또는 재시도 불가)
+            WorkerTimeoutError: config.timeout을 초과한 경우 (재시도하지 않음)
+            CircuitOpenError: 모델의 서킷 브레이커가 열려 있는 경우
 
         Note:
             Worker가 "@ASK_USER: 질문내용" 패턴으로 출력하면
             user_input_callback이 호출되어 사용자 입력을 받고,
             같은 세션에서 대화를 계속 진행합니다.
         """
-        from claude_agent_sdk.types import ClaudeAgentOptions
+        breaker = get_circuit_breaker(self.config.model)
+        attempt = 0
+        self.retry_count = 0
+
+        # 제한 시간은 재시도를 포함한 전체 실행에 적용
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.timeout if self.config.timeout is not None else None
+
+        while True:
+            attempt += 1
+
+            if not breaker.allow_request():
+                retry_after = breaker.retry_after()
+                self.logger.warning(
+                    f"[{self.worker_name}] 서킷 브레이커 open: 실행 거부 "
+                    f"(model={self.config.model}, {retry_after:.0f}초 후 재시도 가능)"
+                )
+                raise CircuitOpenError(
+                    f"{self.worker_name} Worker 실행 거부: Claude CLI가 불안정하여 "
+                    f"일시적으로 요청을 차단했습니다 ({retry_after:.0f}초 후 재시도 가능)",
+                    retry_after=retry_after,
+                    worker_name=self.worker_name,
+                    model=self.config.model,
+                    attempts=attempt,
+                )
 
-        try:
-            self.logger.info(
-                f"[{self.worker_name}] Claude Agent SDK 실행 시작",
-                model=self.config.model,
-                allowed_tools_count=len(self.allowed_tools),
-                resume_session=resume_session_id[:8] + "..." if resume_session_id and len(resume_session_id) > 8 else resume_session_id
-            )
+            has_output = False
+            try:
+                async for text in self._execute_with_deadline(
+                    prompt, resume_session_id, user_input_callback, deadline
+                ):
+                    has_output = True
+                    yield text
+
+                breaker.record_success()
+                return
+
+            except WorkerTimeoutError as e:
+                # 멈춘 CLI도 비정상 상태로 간주
+                breaker.record_failure()
+                e.attempts = attempt
+                raise
+
+            except Exception as e:
+                # SDK/CLI 상태와 관련된 실패만 서킷 브레이커에 기록
+                if isinstance(e, ClaudeSDKError) or is_transient_error(e):
+                    breaker.record_failure()
+
+                if not has_output and self.retry_policy.should_retry(attempt, e):
+                    delay = self.retry_policy.compute_delay(attempt)
+
+                    # 대기 후 제한 시간이 남지 않으면 재시도하지 않음
+                    if deadline is None or loop.time() + delay < deadline:
+                        self.retry_count += 1
+                        self.logger.warning(
+                            f"[{self.worker_name}] 일시적 오류, 재시도 예정 "
+                            f"({attempt}/{self.retry_policy.max_attempts}, {delay:.2f}초 후): "
+                            f"{type(e).__name__}: {e}"
+                        )
+                        yield "@EVENT:worker_retry:" + json.dumps({
+                            "attempt": attempt,
+                            "max_attempts": self.retry_policy.max_attempts,
+                            "delay": round(delay, 2),
+                            "error": type(e).__name__,
+                        }, ensure_ascii=False)
+                        await asyncio.sleep(delay)
+                        continue
 
-            chunk_count = 0
-            last_response = None
+                raise WorkerExecutionError(
+                    self._describe_error(e),
+                    worker_name=self.worker_name,
+                    model=self.config.model,
+                    transient=is_transient_error(e),
+                    attempts=attempt,
+                ) from e
 
-            # ClaudeAgentOptions 생성
-            options_dict = {
-                "model": self.config.model,
-                "allowed_tools": self.allowed_tools if self.allowed_tools else [],
-                "cli_path": self.config.cli_path,
-                "permission_mode": self.config.permission_mode
-            }
+    async def _execute_with_deadline(
+        self,
+        prompt: str,
+        resume_session_id: Optional[str],
+        user_input_callback: Optional[Callable[[str], Awaitable[str]]],
+        deadline: Optional[float]
+    ) -> AsyncIterator[str]:
+        """제한 시간을 적용하여 SDK 1회 실행.
 
-            # 선택적 컨텍스트 관리 옵션 추가 (None이 아니면)
-            if self.config.max_turns is not None:
-                options_dict["max_turns"] = self.config.max_turns
-            if self.config.setting_sources:
-                options_dict["setting_sources"] = self.config.setting_sources
+        SDK 세션은 별도 Task(생산자)에서 실행하고 청크를 큐로 전달받습니다.
+        제한 시간을 초과하거나 호출자가 스트림을 중단하면 생산자 Task를 취소하여
+        ClaudeSDKClient가 context manager 종료 경로로 깔끔하게 정리되도록 합니다.
+        (user_input_callback 대기 중에도 동일하게 취소됩니다.)
 
-            # resume_session_id가 주어진 경우 이전 세션 재개
-            if resume_session_id:
-                options_dict["resume"] = resume_session_id
-                self.logger.info(
-                    f"[{self.worker_name}] 이전 세션 재개: {resume_session_id[:8]}... "
-                    f"(대화 컨텍스트 유지)"
-                )
+        Args:
+            prompt: 프롬프트
+            resume_session_id: 재개할 SDK 세션 ID
+            user_input_callback: 사용자 입력 콜백
+            deadline: 종료 기한 (event loop 시각, None이면 제한 없음)
+
+        Yields:
+            str: 응답 텍스트 청크
+
+        Raises:
+            WorkerTimeoutError: 제한 시간 초과 시
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_QUEUE_SIZE)
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for text in self._execute_once(prompt, resume_session_id, user_input_callback):
+                    await queue.put(text)
+            except Exception as e:
+                await queue.put(e)
             else:
-                self.logger.info(
-                    f"[{self.worker_name}] 새 세션 시작"
-                )
+                await queue.put(done)
 
-            # ClaudeSDKClient를 context manager로 사용 (자동 connect/disconnect)
-            async with ClaudeSDKClient(options=ClaudeAgentOptions(**options_dict)) as client:
-                current_prompt = prompt
-                conversation_turn = 0
-                max_conversation_turns = 10  # 무한 루프 방지
+        producer = asyncio.create_task(produce())
 
-                while conversation_turn < max_conversation_turns:
-                    conversation_turn += 1
-                    self.logger.info(
-                        f"[{self.worker_name}] 대화 턴 {conversation_turn} 시작"
+        try:
+            while True:
+                remaining = None if deadline is None else deadline - loop.time()
+                try:
+                    if remaining is not None and remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    self.logger.error(
+                        f"[{self.worker_name}] ⏱️ 실행 제한 시간 초과 ({self.config.timeout}초), SDK 세션 취소"
                     )
+                    raise WorkerTimeoutError(
+                        f"{self.worker_name} Worker 실행 제한 시간({self.config.timeout}초)을 초과했습니다",
+                        timeout=self.config.timeout,
+                        worker_name=self.worker_name,
+                        model=self.config.model,
+                    ) from None
+
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+
+        finally:
+            # 생산자 Task 정리 (제한 시간 초과, 에러, 호출자 중단 모두 해당)
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _execute_once(
+        self,
+        prompt: str,
+        resume_session_id: Optional[str],
+        user_input_callback: Optional[Callable[[str], Awaitable[str]]]
+    ) -> AsyncIterator[str]:
+        """SDK 1회 실행 (재시도 없음, 예외는 그대로 전파).
 
-                    # query 메서드로 질의 전송
-                    await client.query(prompt=current_prompt)
+        Args:
+            prompt: 프롬프트
+            resume_session_id: 재개할 SDK 세션 ID
+            user_input_callback: 사용자 입력 콜백
 
-                    # 응답 수집을 위한 버퍼
-                    collected_texts = []
+        Yields:
+            str: 응답 텍스트 청크
+        """
+        from claude_agent_sdk.types import ClaudeAgentOptions
 
-                    # receive_response()로 응답 스트리밍 수신
-                    async for response in client.receive_response():
-                        chunk_count += 1
-                        last_response = response  # 마지막 응답 저장
+        self.logger.info(
+            f"[{self.worker_name}] Claude Agent SDK 실행 시작",
+            model=self.config.model,
+            allowed_tools_count=len(self.allowed_tools),
+            resume_session=resume_session_id[:8] + "..." if resume_session_id and len(resume_session_id) > 8 else resume_session_id
+        )
+
+        chunk_count = 0
+        last_response = None
+        response_type_counts: Dict[str, int] = {}  # 응답 타입별 수신 횟수 (종료 시 요약 로그)
+
+        # ClaudeAgentOptions 생성
+        options_dict = {
+            "model": self.config.model,
+            "allowed_tools": self.allowed_tools if self.allowed_tools else [],
+            "cli_path": self.config.cli_path,
+            "permission_mode": self.config.permission_mode
+        }
+
+        # 선택적 컨텍스트 관리 옵션 추가 (None이 아니면)
+        if self.config.max_turns is not None:
+            options_dict["max_turns"] = self.config.max_turns
+        if self.config.setting_sources:
+            options_dict["setting_sources"] = self.config.setting_sources
+
+        # 시스템 프롬프트는 작업 프롬프트와 분리하여 전달 (정적 접두부 → 프롬프트 캐시 적중)
+        # Claude Code 기본 프롬프트(도구 사용 지침 등)는 유지하고 뒤에 추가
+        if self.config.system_prompt:
+            options_dict["system_prompt"] = {
+                "type": "preset",
+                "preset": "claude_code",
+                "append": self.config.system_prompt,
+            }
 
-                        self.logger.info(
-                            f"[{self.worker_name}] response #{chunk_count} 수신: "
-                            f"{type(response).__name__}"
-                        )
+        # resume_session_id가 주어진 경우 이전 세션 재개
+        if resume_session_id:
+            options_dict["resume"] = resume_session_id
+            self.logger.info(
+                f"[{self.worker_name}] 이전 세션 재개: {resume_session_id[:8]}... "
+                f"(대화 컨텍스트 유지)"
+            )
+        else:
+            self.logger.info(
+                f"[{self.worker_name}] 새 세션 시작"
+            )
 
-                        # ResultMessage에서 session_id 추출 (보통 마지막 응답)
-                        if type(response).__name__ == 'ResultMessage':
-                            if hasattr(response, 'session_id') and response.session_id:
-                                self.last_session_id = response.session_id
-                                self.logger.info(
-                                    f"[{self.worker_name}] ✓ SDK 세션 ID 저장 성공: {self.last_session_id[:8]}... "
-                                    f"(ResultMessage에서 추출)"
-                                )
-
-                        # 응답 처리하면서 텍스트 수집
-                        async for text in self.response_handler.process_response(response):
-                            collected_texts.append(text)
-                            yield text
-
-                    # 전체 응답 확인
-                    full_response = "".join(collected_texts)
-
-                    # 사용자 입력 요청 패턴 확인
-                    if "@ASK_USER:" in full_response and user_input_callback:
-                        question = self._extract_question_from_response(full_response)
-                        self.logger.info(
-                            f"[{self.worker_name}] 사용자 입력 요청 감지: {question[:50]}..."
-                        )
+        # ClaudeSDKClient를 context manager로 사용 (자동 connect/disconnect)
+        connect_started_at = time.perf_counter()
+        async with ClaudeSDKClient(options=ClaudeAgentOptions(**options_dict)) as client:
+            SDK_CONNECT_SECONDS.observe(time.perf_counter() - connect_started_at, model=self.config.model)
+            first_token_pending = True
 
-                        try:
-                            # 특수 이벤트 마커 전송 (workflow_executor가 감지하여 이벤트 생성)
-                            import json as json_module
-                            event_marker = "@EVENT:user_input_request:" + json_module.dumps({"question": question}, ensure_ascii=False)
-                            yield event_marker
+            current_prompt = prompt
+            conversation_turn = 0
+            max_conversation_turns = 10  # 무한 루프 방지
+
+            while conversation_turn < max_conversation_turns:
+                conversation_turn += 1
+                self.logger.info(
+                    f"[{self.worker_name}] 대화 턴 {conversation_turn} 시작"
+                )
+
+                # query 메서드로 질의 전송
+                query_sent_at = time.perf_counter()
+                await client.query(prompt=current_prompt)
+
+                # 응답 수집을 위한 버퍼
+                collected_texts = []
+
+                # receive_response()로 응답 스트리밍 수신
+                async for response in client.receive_response():
+                    chunk_count += 1
+                    last_response = response  # 마지막 응답 저장
+
+                    # 응답 단위 로그는 샘플링 (요약은 실행 완료 시 1회)
+                    response_type = type(response).__name__
+                    response_type_counts[response_type] = response_type_counts.get(response_type, 0) + 1
+                    if self._response_log_sampler.should_log(self.worker_name):
+                        self.hot_logger.info(
+                            "[%s] response #%d 수신: %s", self.worker_name, chunk_count, response_type
+                        )
 
-                            # 사용자 입력 받기 (Queue 대기)
-                            user_answer = await user_input_callback(question)
+                    # ResultMessage에서 session_id 추출 (보통 마지막 응답)
+                    if type(response).__name__ == 'ResultMessage':
+                        if hasattr(response, 'session_id') and response.session_id:
+                            self.last_session_id = response.session_id
                             self.logger.info(
-                                f"[{self.worker_name}] 사용자 답변 수신: {user_answer[:50]}..."
+                                f"[{self.worker_name}] ✓ SDK 세션 ID 저장 성공: {self.last_session_id[:8]}... "
+                                f"(ResultMessage에서 추출)"
                             )
 
-                            # 다음 프롬프트로 설정
-                            current_prompt = user_answer
+                    # 응답 처리하면서 텍스트 수집
+                    async for text in self.response_handler.process_response(response):
+                        if first_token_pending:
+                            # 첫 턴의 첫 텍스트 청크까지의 시간 (사용자 답변 이후 턴은 제외)
+                            first_token_pending = False
+                            SDK_FIRST_TOKEN_SECONDS.observe(
+                                time.perf_counter() - query_sent_at, model=self.config.model
+                            )
+                        collected_texts.append(text)
+                        yield text
 
-                            # 대화 구분자 출력
-                            yield f"\n\n{'='*60}\n💬 사용자 답변: {user_answer}\n{'='*60}\n\n"
+                # 전체 응답 확인
+                full_response = "".join(collected_texts)
 
-                            # 루프 계속
-                            continue
+                # 사용자 입력 요청 패턴 확인
+                if "@ASK_USER:" in full_response and user_input_callback:
+                    question = self._extract_question_from_response(full_response)
+                    self.logger.info(
+                        f"[{self.worker_name}] 사용자 입력 요청 감지: {question[:50]}..."
+                    )
 
-                        except Exception as e:
-                            self.logger.error(
-                                f"[{self.worker_name}] 사용자 입력 처리 중 에러: {e}"
-                            )
-                            # 에러 발생 시 대화 종료
-                            break
-                    else:
-                        # 사용자 입력 요청 없음 → 대화 종료
+                    try:
+                        # 특수 이벤트 마커 전송 (workflow_executor가 감지하여 이벤트 생성)
+                        import json as json_module
+                        event_marker = "@EVENT:user_input_request:" + json_module.dumps({"question": question}, ensure_ascii=False)
+                        yield event_marker
+
+                        # 사용자 입력 받기 (Queue 대기)
+                        user_answer = await user_input_callback(question)
+                        self.logger.info(
+                            f"[{self.worker_name}] 사용자 답변 수신: {user_answer[:50]}..."
+                        )
+
+                        # 다음 프롬프트로 설정
+                        current_prompt = user_answer
+
+                        # 대화 구분자 출력
+                        yield StreamChunk(
+                            f"\n\n{'='*60}\n💬 사용자 답변: {user_answer}\n{'='*60}\n\n",
+                            StreamChunk.STATUS
+                        )
+
+                        # 루프 계속
+                        continue
+
+                    except Exception as e:
+                        self.logger.error(
+                            f"[{self.worker_name}] 사용자 입력 처리 중 에러: {e}"
+                        )
+                        # 에러 발생 시 대화 종료
                         break
+                else:
+                    # 사용자 입력 요청 없음 → 대화 종료
+                    break
 
-                self.logger.info(
-                    f"[{self.worker_name}] Claude Agent SDK 실행 완료. "
-                    f"총 {chunk_count}개 청크, {conversation_turn}개 대화 턴"
+            self._response_log_sampler.pop(self.worker_name)
+            self.logger.info(
+                f"[{self.worker_name}] Claude Agent SDK 실행 완료. "
+                f"총 {chunk_count}개 청크, {conversation_turn}개 대화 턴 "
+                f"(응답 타입: {response_type_counts})"
+            )
+
+            # 세션 ID를 받지 못한 경우 경고
+            if not self.last_session_id:
+                self.logger.warning(
+                    f"[{self.worker_name}] ⚠️  SDK 세션 ID를 받지 못했습니다. "
+                    f"추가 프롬프트 기능을 사용할 수 없습니다. "
+                    f"(ResultMessage를 받지 못함)"
                 )
 
-                # 세션 ID를 받지 못한 경우 경고
-                if not self.last_session_id:
-                    self.logger.warning(
-                        f"[{self.worker_name}] ⚠️  SDK 세션 ID를 받지 못했습니다. "
-                        f"추가 프롬프트 기능을 사용할 수 없습니다. "
-                        f"(ResultMessage를 받지 못함)"
-                    )
+            # 마지막 응답의 usage 정보 확인 (usage는 스트리밍 중 이미 콜백으로 전달됨,
+            # 재처리하면 원장에 중복 집계되므로 로그만 남김)
+            if last_response and not getattr(last_response, 'usage', None):
+                self.logger.info(f"⚠️  [{self.worker_name}] Last response has no usage information")
 
-                # 마지막 응답에서 usage 정보 재확인
-                if last_response:
-                    self.logger.info(f"[{self.worker_name}] Checking last response for usage...")
-                    if hasattr(last_response, 'usage') and last_response.usage:
-                        self.logger.info(f"[{self.worker_name}] Last response has usage: {last_response.usage}")
-                        # 한 번 더 process_response 호출 (usage만 처리)
-                        async for _ in self.response_handler.process_response(last_response):
-                            pass  # 텍스트는 무시하고 usage만 수집
-                    else:
-                        self.logger.info(f"⚠️  [{self.worker_name}] Last response has no usage information")
-
-        except Exception as e:
-            from src.infrastructure.logging import log_exception_silently
-
-            # SDK 예외를 구체적으로 처리
-            if isinstance(e, CLINotFoundError):
-                self.logger.error("Claude Code CLI가 설치되지 않았습니다")
-                yield (
-                    "\n[시스템 오류] Claude Code CLI가 설치되지 않았습니다.\n"
-                    "설치 방법: npm install -g @anthropic-ai/claude-code"
-                )
+    def _describe_error(self, e: Exception) -> str:
+        """SDK 예외를 로깅하고 사용자에게 보여줄 에러 메시지 반환.
 
-            elif isinstance(e, ProcessError):
-                exit_code = getattr(e, 'exit_code', 'unknown')
-                self.logger.error(
-                    f"Claude CLI 프로세스 실행 실패: exit_code={exit_code}",
-                    worker_name=self.worker_name
-                )
-                yield (
-                    f"\n[시스템 오류] Claude CLI 프로세스 실행 실패 "
-                    f"(exit_code: {exit_code})\n에러 로그를 확인해주세요."
-                )
+        Args:
+            e: 발생한 예외
 
-            elif isinstance(e, CLIJSONDecodeError):
-                self.logger.error(
-                    f"Claude CLI 응답 파싱 실패: {e}",
-                    worker_name=self.worker_name
-                )
-                yield (
-                    "\n[시스템 오류] Claude CLI 응답을 파싱할 수 없습니다. "
-                    "CLI 버전을 확인해주세요."
-                )
+        Returns:
+            str: 에러 메시지
+        """
+        from src.infrastructure.logging import log_exception_silently
+
+        # SDK 예외를 구체적으로 처리
+        if isinstance(e, CLINotFoundError):
+            self.logger.error("Claude Code CLI가 설치되지 않았습니다")
+            return (
+                "Claude Code CLI가 설치되지 않았습니다. "
+                "설치 방법: npm install -g @anthropic-ai/claude-code"
+            )
 
-            elif isinstance(e, ClaudeSDKError):
-                log_exception_silently(
-                    self.logger,
-                    e,
-                    f"Claude SDK 에러 발생 ({self.worker_name})",
-                    worker_name=self.worker_name,
-                    model=self.config.model
-                )
-                yield (
-                    f"\n[시스템 오류] {self.worker_name} Worker SDK 실행 중 "
-                    f"오류가 발생했습니다. 에러 로그를 확인해주세요."
-                )
+        if isinstance(e, ProcessError):
+            exit_code = getattr(e, 'exit_code', 'unknown')
+            self.logger.error(
+                f"Claude CLI 프로세스 실행 실패: exit_code={exit_code}",
+                worker_name=self.worker_name
+            )
+            return (
+                f"Claude CLI 프로세스 실행 실패 (exit_code: {exit_code}). "
+                f"에러 로그를 확인해주세요."
+            )
 
-            else:
-                # 기타 예상하지 못한 에러
-                log_exception_silently(
-                    self.logger,
-                    e,
-                    f"Worker Agent ({self.worker_name}) execution failed (unknown error)",
-                    worker_name=self.worker_name,
-                    model=self.config.model
-                )
-                yield (
-                    f"\n[시스템 오류] {self.worker_name} Worker 실행 중 "
-                    f"예상하지 못한 오류가 발생했습니다: {type(e).__name__}"
-                )
+        if isinstance(e, CLIJSONDecodeError):
+            self.logger.error(
+                f"Claude CLI 응답 파싱 실패: {e}",
+                worker_name=self.worker_name
+            )
+            return "Claude CLI 응답을 파싱할 수 없습니다. CLI 버전을 확인해주세요."
+
+        if isinstance(e, ClaudeSDKError):
+            log_exception_silently(
+                self.logger,
+                e,
+                f"Claude SDK 에러 발생 ({self.worker_name})",
+                worker_name=self.worker_name,
+                model=self.config.model
+            )
+            return (
+                f"{self.worker_name} Worker SDK 실행 중 오류가 발생했습니다. "
+                f"에러 로그를 확인해주세요."
+            )
+
+        # 기타 예상하지 못한 에러
+        log_exception_silently(
+            self.logger,
+            e,
+            f"Worker Agent ({self.worker_name}) execution failed (unknown error)",
+            worker_name=self.worker_name,
+            model=self.config.model
+        )
+        return (
+            f"{self.worker_name} Worker 실행 중 예상하지 못한 오류가 발생했습니다: "
+            f"{type(e).__name__}: {e}"
+        )
 
     def _extract_question_from_response(self, response: str) -> str:
         """응답에서 사용자 입력 요청 질문 추출.
@@ -4,21 +4,29 @@
 WorkerAgent: Claude Code의 agentic harness를 사용하여 파일 읽기/쓰기, 코드 실행 등 수행
 """
 
-from typing import AsyncIterator, Optional, Callable, Dict, Any, Awaitable
+from typing import AsyncIterator, Optional, Callable, Dict, Any, Awaitable, Tuple
 from pathlib import Path
+import hashlib
 import os
 
 from src.domain.models import AgentConfig
 from src.infrastructure.config import get_claude_cli_path, get_project_root
 from src.infrastructure.logging import get_logger
+from src.infrastructure.metrics import CACHE_REQUESTS_TOTAL
 from .sdk_executor import (
     SDKExecutionConfig,
+    StreamChunk,
     WorkerResponseHandler,
     WorkerSDKExecutor
 )
 
 logger = get_logger(__name__)
 
+# 시스템 프롬프트 캐시
+# 입력(프롬프트 원본, 파일 mtime, CLAUDE.md, thinking)이 같으면 바이트 단위로 동일한 문자열을 재사용하여
+# 호출 간 시스템 프롬프트 접두부를 고정 (프롬프트 캐시 적중) + 노드마다 파일을 다시 읽지 않음
+_system_prompt_cache: Dict[Tuple[Any, ...], str] = {}
+
 
 class WorkerAgent:
     """
@@ -46,28 +54,91 @@ class WorkerAgent:
         self.project_dir = project_dir
         self.system_prompt = self._load_system_prompt()
         self.last_session_id: Optional[str] = None  # 마지막 실행의 세션 ID 저장
+        self.last_retry_count: int = 0  # 마지막 실행의 재시도 횟수
+
+    def _resolve_prompt_path(self) -> Optional[Path]:
+        """
+        config.system_prompt가 파일 경로로 보이면 절대 경로로 변환 (프로젝트 루트 기준)
+
+        Returns:
+            프롬프트 파일 경로 (문자열 프롬프트면 None)
+        """
+        prompt_text = self.config.system_prompt
+        if not (prompt_text.endswith('.txt') or '/' in prompt_text):
+            return None
+
+        prompt_path = Path(prompt_text)
+        if not prompt_path.is_absolute():
+            prompt_path = get_project_root() / prompt_text
+        return prompt_path
+
+    @staticmethod
+    def _get_mtime(path: Optional[Path]) -> Optional[int]:
+        """파일 수정 시각 (없으면 None)"""
+        if path is None:
+            return None
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
 
     def _load_system_prompt(self) -> str:
         """
-        시스템 프롬프트 로드 (프로젝트 루트 기준)
+        시스템 프롬프트 로드 (캐시 우선)
+
+        프롬프트 파일/CLAUDE.md가 바뀌지 않았으면 이전에 조립한 문자열을 그대로 반환합니다.
+
+        Returns:
+            시스템 프롬프트 문자열
+        """
+        try:
+            prompt_path = self._resolve_prompt_path()
+        except Exception as e:
+            logger.error(f"❌ 프롬프트 경로 해석 실패: {e}, 기본값 사용")
+            prompt_path = None
+        claude_md_path = Path(self.project_dir) / "CLAUDE.md" if self.project_dir else None
+
+        cache_key = (
+            self.config.system_prompt,
+            self._get_mtime(prompt_path),
+            str(claude_md_path) if claude_md_path else None,
+            self._get_mtime(claude_md_path),
+            self.config.thinking,
+        )
+        cached = _system_prompt_cache.get(cache_key)
+        if cached is not None:
+            CACHE_REQUESTS_TOTAL.inc(cache="system_prompt", result="hit")
+            return cached
+
+        CACHE_REQUESTS_TOTAL.inc(cache="system_prompt", result="miss")
+        prompt_text = self._build_system_prompt(prompt_path, claude_md_path)
+        _system_prompt_cache[cache_key] = prompt_text
+        return prompt_text
+
+    def _build_system_prompt(
+        self,
+        prompt_path: Optional[Path],
+        claude_md_path: Optional[Path]
+    ) -> str:
+        """
+        시스템 프롬프트 조립 (프로젝트 루트 기준)
 
         config.system_prompt가 파일 경로면 파일에서 로드하고,
         그렇지 않으면 문자열 그대로 사용합니다.
         프로젝트 컨텍스트가 있으면 프롬프트에 추가합니다.
 
+        Args:
+            prompt_path: 프롬프트 파일 경로 (문자열 프롬프트면 None)
+            claude_md_path: 프로젝트 CLAUDE.md 경로 (프로젝트 미지정 시 None)
+
         Returns:
             시스템 프롬프트 문자열
         """
         prompt_text = self.config.system_prompt
 
         # .txt 확장자가 있거나 경로처럼 보이면 파일에서 로드 시도
-        if prompt_text.endswith('.txt') or '/' in prompt_text:
+        if prompt_path is not None:
             try:
-                prompt_path = Path(prompt_text)
-                if not prompt_path.is_absolute():
-                    # 프로젝트 루트 기준으로 경로 해석
-                    prompt_path = get_project_root() / prompt_text
-
                 if prompt_path.exists():
                     with open(prompt_path, 'r', encoding='utf-8') as f:
                         loaded_prompt = f.read().strip()
@@ -79,17 +150,15 @@ class WorkerAgent:
                 logger.error(f"❌ 프롬프트 로드 실패: {e}, 기본값 사용")
 
         # 프로젝트 CLAUDE.md 추가 (사용자가 선택한 프로젝트의 가이드라인)
-        if self.project_dir:
-            claude_md_path = Path(self.project_dir) / "CLAUDE.md"
-            if claude_md_path.exists():
-                try:
-                    with open(claude_md_path, 'r', encoding='utf-8') as f:
-                        claude_md_text = f.read().strip()
-                        if claude_md_text:
-                            prompt_text = f"{prompt_text}\n\n# Project Guidelines (from CLAUDE.md)\n\n{claude_md_text}"
-                            logger.info(f"✅ 프로젝트 CLAUDE.md 로드: {claude_md_path}")
-                except Exception as e:
-                    logger.warning(f"⚠️  CLAUDE.md 로드 실패: {e}")
+        if claude_md_path is not None and claude_md_path.exists():
+            try:
+                with open(claude_md_path, 'r', encoding='utf-8') as f:
+                    claude_md_text = f.read().strip()
+                    if claude_md_text:
+                        prompt_text = f"{prompt_text}\n\n# Project Guidelines (from CLAUDE.md)\n\n{claude_md_text}"
+                        logger.info(f"✅ 프로젝트 CLAUDE.md 로드: {claude_md_path}")
+            except Exception as e:
+                logger.warning(f"⚠️  CLAUDE.md 로드 실패: {e}")
 
         # Thinking 모드 활성화 시 ultrathink 프롬프트 추가
         if self.config.thinking:
@@ -111,6 +180,11 @@ Use your thinking process liberally throughout your response to show your reason
 
         return prompt_text
 
+    @property
+    def system_prompt_hash(self) -> str:
+        """시스템 프롬프트 해시 (호출 간 바이트 동일성 확인용, 12자리)"""
+        return hashlib.sha256(self.system_prompt.encode("utf-8")).hexdigest()[:12]
+
     def _generate_debug_info(self, task_description: str) -> str:
         """
         Worker 실행 시 디버그 정보 생성 (시스템 프롬프트, 맥락 포함)
@@ -160,7 +234,8 @@ Use your thinking process liberally throughout your response to show your reason
         task_description: str,
         usage_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
         resume_session_id: Optional[str] = None,
-        user_input_callback: Optional[Callable[[str], Awaitable[str]]] = None
+        user_input_callback: Optional[Callable[[str], Awaitable[str]]] = None,
+        timeout: Optional[float] = None
     ) -> AsyncIterator[str]:
         """
         Claude Agent SDK를 사용하여 작업 실행 (Human-in-the-Loop 지원)
@@ -171,12 +246,14 @@ Use your thinking process liberally throughout your response to show your reason
             resume_session_id: 재개할 SDK 세션 ID (선택, 이전 실행의 컨텍스트 유지)
             user_input_callback: 사용자 입력이 필요할 때 호출되는 async 함수 (선택)
                                  질문(str)을 받아서 답변(str)을 반환해야 함
+            timeout: 실행 제한 시간 (초, 선택, 미지정 시 SDKExecutionConfig 기본값)
 
         Yields:
-            스트리밍 응답 청크
+            스트리밍 응답 청크 (StreamChunk, kind로 블록 타입 구분)
 
         Raises:
-            Exception: 작업 실행 실패 시
+            WorkerExecutionError: SDK 실행 실패 시 (재시도 소진 또는 재시도 불가)
+            WorkerTimeoutError: 제한 시간 초과 시
         """
         # Working directory 변경 (project_dir이 지정된 경우)
         original_cwd = os.getcwd()
@@ -196,14 +273,17 @@ Use your thinking process liberally throughout your response to show your reason
             )
             if show_debug_info:
                 debug_info = self._generate_debug_info(task_description)
-                yield debug_info
-
-            # 시스템 프롬프트와 작업 설명 결합
-            full_prompt = f"{self.system_prompt}\n\n{task_description}"
+                yield StreamChunk(debug_info, StreamChunk.STATUS)
 
+            # 시스템 프롬프트는 SDK 옵션으로 분리 전달 (정적 접두부 → 프롬프트 캐시 적중)
+            # 사용자 프롬프트에는 작업 설명만 포함
             logger.info(f"[{self.config.name}] Claude Agent SDK 실행 시작")
             logger.info(f"[{self.config.name}] Working Directory: {os.getcwd()}")
-            logger.info(f"[{self.config.name}] Prompt 길이: {len(full_prompt)} characters")
+            logger.info(
+                f"[{self.config.name}] System Prompt: {len(self.system_prompt)} characters "
+                f"(hash: {self.system_prompt_hash})"
+            )
+            logger.info(f"[{self.config.name}] Task Prompt 길이: {len(task_description)} characters")
             logger.info(f"[{self.config.name}] Model: {self.config.model}")
             logger.info(f"[{self.config.name}] Tools: {self.config.allowed_tools}")
             logger.info(f"[{self.config.name}] Thinking Mode: {self.config.thinking}")
@@ -213,8 +293,12 @@ Use your thinking process liberally throughout your response to show your reason
             config = SDKExecutionConfig(
                 model=self.config.model,
                 cli_path=get_claude_cli_path(),
-                permission_mode="bypassPermissions"
+                permission_mode="bypassPermissions",
+                system_prompt=self.system_prompt
             )
+            if timeout is not None:
+                config.timeout = timeout
+            logger.info(f"[{self.config.name}] Timeout: {config.timeout}초")
 
             # 응답 핸들러 생성 (usage_callback 전달)
             response_handler = WorkerResponseHandler(usage_callback=usage_callback)
@@ -228,12 +312,15 @@ Use your thinking process liberally throughout your response to show your reason
             )
 
             # 스트림 실행 (resume_session_id 및 user_input_callback 전달)
-            async for text in executor.execute_stream(
-                prompt=full_prompt,
-                resume_session_id=resume_session_id,
-                user_input_callback=user_input_callback
-            ):
-                yield text
+            try:
+                async for text in executor.execute_stream(
+                    prompt=task_description,
+                    resume_session_id=resume_session_id,
+                    user_input_callback=user_input_callback
+                ):
+                    yield text
+            finally:
+                self.last_retry_count = executor.retry_count
 
             # 실제 SDK 세션 ID 저장 (다음 실행에서 재활용)
             self.last_session_id = executor.last_session_id
@@ -249,7 +336,7 @@ Use your thinking process liberally throughout your response to show your reason
                 )
 
             # Worker 실행 완료 표시
-            yield f"\n└─ ✅ [{self.config.name}] 완료\n"
+            yield StreamChunk(f"\n└─ ✅ [{self.config.name}] 완료\n", StreamChunk.STATUS)
 
         finally:
             # Working directory 복원
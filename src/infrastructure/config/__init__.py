@@ -1,10 +1,11 @@
 """
 Configuration Infrastructure
 
-JSON file-based configuration loader and environment validation
+JSON file-based configuration loader, cached agent registry and environment validation
 """
 
 from .loader import JsonConfigLoader, SystemConfig, load_system_config
+from .agent_registry import AgentRegistry, AgentRegistrySnapshot, get_agent_registry
 from .validator import (
     validate_environment,
     get_claude_cli_path,
@@ -17,6 +18,9 @@ __all__ = [
     "JsonConfigLoader",
     "SystemConfig",
     "load_system_config",
+    "AgentRegistry",
+    "AgentRegistrySnapshot",
+    "get_agent_registry",
     "validate_environment",
     "get_claude_cli_path",
     "get_project_root",
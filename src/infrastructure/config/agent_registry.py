@@ -0,0 +1,346 @@
+"""
+에이전트 레지스트리 (핫 리로드 + 메모리 캐시)
+
+기본 에이전트(config/agent_config.json)와 프로젝트별 커스텀 워커
+({project}/.claude-flow/worker-config.json)를 합친 설정을 메모리에 캐싱합니다.
+
+- 조회 시 agent_config.json, worker-config.json, 프롬프트 파일의 mtime/크기를 비교하여
+  바뀐 경우에만 다시 로드합니다 (검사 자체도 check_interval 동안 생략).
+- 다시 로드되면 버전이 올라가고 등록된 리스너(WorkflowExecutor 등)에 새 스냅샷을 알립니다.
+- 설정 파일이 잘못 수정되어 로드에 실패하면 이전 스냅샷을 계속 사용합니다.
+"""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from src.domain.models import AgentConfig
+from src.infrastructure.config.loader import JsonConfigLoader
+from src.infrastructure.config.validator import get_project_root
+from src.infrastructure.logging import get_logger
+from src.infrastructure.storage.custom_worker_repository import CustomWorkerRepository
+
+logger = get_logger(__name__, component="AgentRegistry")
+
+# 프로젝트 미지정 시 캐시 키 (WorkflowExecutor 캐시와 동일)
+DEFAULT_PROJECT_KEY = "~default"
+
+# 파일 서명: (경로, mtime_ns, 크기) 튜플 (파일이 없으면 mtime/크기는 None)
+FileSignature = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+def _file_signature(paths: List[Path]) -> FileSignature:
+    """파일 목록의 변경 감지용 서명 계산"""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+@dataclass(frozen=True)
+class AgentRegistrySnapshot:
+    """
+    특정 시점의 에이전트 설정 (불변)
+
+    Attributes:
+        version: 레지스트리 버전 (다시 로드될 때마다 증가)
+        project_key: 프로젝트 캐시 키 (project_path 또는 "~default")
+        agent_configs: 기본 에이전트 + 커스텀 워커 설정
+        config_map: 이름 → 설정 (같은 이름이면 커스텀 워커 우선)
+        custom_worker_names: 커스텀 워커 이름 집합
+    """
+
+    version: int
+    project_key: str
+    agent_configs: Tuple[AgentConfig, ...]
+    config_map: Dict[str, AgentConfig] = field(hash=False, compare=False)
+    custom_worker_names: FrozenSet[str] = frozenset()
+
+
+@dataclass
+class _ProjectEntry:
+    """프로젝트별 캐시 항목"""
+
+    snapshot: AgentRegistrySnapshot
+    signature: Optional[FileSignature]
+    checked_at: float
+
+
+AgentRegistryListener = Callable[[AgentRegistrySnapshot], None]
+
+
+class AgentRegistry:
+    """
+    에이전트 설정 레지스트리
+
+    Attributes:
+        config_loader: 기본 에이전트 설정 로더
+        check_interval: 파일 변경 검사 최소 간격 (초)
+
+    Example:
+        >>> registry = get_agent_registry()
+        >>> snapshot = registry.get_snapshot("/path/to/project")
+        >>> config = snapshot.config_map.get("coder")
+    """
+
+    def __init__(self, config_loader: JsonConfigLoader, check_interval: float = 1.0):
+        self.config_loader = config_loader
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._version = 0
+        self._entries: Dict[str, _ProjectEntry] = {}
+        # 기본 에이전트 캐시 (agent_config.json 서명, 설정 목록) - 프로젝트 간 공유
+        self._base_configs: Optional[Tuple[FileSignature, List[AgentConfig]]] = None
+        # 프롬프트 파일 내용 캐시: 경로 → (서명, 내용)
+        self._prompt_cache: Dict[str, Tuple[FileSignature, str]] = {}
+        self._listeners: List[Callable[[], Optional[AgentRegistryListener]]] = []
+
+    @property
+    def version(self) -> int:
+        """현재 레지스트리 버전"""
+        return self._version
+
+    def resolve_prompt_path(self, config: AgentConfig) -> Optional[Path]:
+        """
+        config.system_prompt가 파일 경로로 보이면 절대 경로로 변환 (프로젝트 루트 기준)
+
+        Returns:
+            프롬프트 파일 경로 (문자열 프롬프트면 None)
+        """
+        prompt_text = config.system_prompt
+        if not (prompt_text.endswith('.txt') or '/' in prompt_text):
+            return None
+
+        prompt_path = Path(prompt_text)
+        if not prompt_path.is_absolute():
+            prompt_path = self.config_loader.project_root / prompt_text
+        return prompt_path
+
+    def _config_paths(self, project_path: Optional[str]) -> List[Path]:
+        paths = [self.config_loader.agent_config_path]
+        if project_path:
+            paths.append(CustomWorkerRepository(Path(project_path)).config_path)
+        return paths
+
+    def _prompt_paths(self, configs: Tuple[AgentConfig, ...]) -> List[Path]:
+        paths = []
+        for config in configs:
+            prompt_path = self.resolve_prompt_path(config)
+            if prompt_path is not None:
+                paths.append(prompt_path)
+        return paths
+
+    def _compute_signature(
+        self,
+        project_path: Optional[str],
+        configs: Tuple[AgentConfig, ...],
+    ) -> FileSignature:
+        return _file_signature(self._config_paths(project_path) + self._prompt_paths(configs))
+
+    def _load_base_configs(self) -> List[AgentConfig]:
+        """기본 에이전트 로드 (agent_config.json이 바뀌지 않았으면 캐시 사용)"""
+        signature = _file_signature([self.config_loader.agent_config_path])
+        if self._base_configs is not None and self._base_configs[0] == signature:
+            return self._base_configs[1]
+
+        configs = self.config_loader.load_agent_configs()
+        self._base_configs = (signature, configs)
+        return configs
+
+    def _load_snapshot(self, project_key: str, project_path: Optional[str]) -> AgentRegistrySnapshot:
+        """기본 에이전트 + 커스텀 워커를 합쳐 새 스냅샷 생성"""
+        agent_configs = list(self._load_base_configs())
+
+        custom_workers: List[AgentConfig] = []
+        if project_path:
+            try:
+                custom_workers = CustomWorkerRepository(Path(project_path)).load_custom_workers()
+            except Exception as e:
+                logger.warning(
+                    f"커스텀 워커 로드 실패 (프로젝트: {project_path}): {e}",
+                    exc_info=True
+                )
+        agent_configs.extend(custom_workers)
+
+        self._version += 1
+        return AgentRegistrySnapshot(
+            version=self._version,
+            project_key=project_key,
+            agent_configs=tuple(agent_configs),
+            config_map={config.name: config for config in agent_configs},
+            custom_worker_names=frozenset(worker.name for worker in custom_workers),
+        )
+
+    def get_snapshot(self, project_path: Optional[str] = None, force: bool = False) -> AgentRegistrySnapshot:
+        """
+        프로젝트의 에이전트 설정 스냅샷 조회 (변경 시 다시 로드)
+
+        Args:
+            project_path: 프로젝트 경로 (커스텀 워커 로드용, 옵션)
+            force: True면 check_interval과 무관하게 파일 변경 검사
+
+        Returns:
+            AgentRegistrySnapshot: 에이전트 설정 스냅샷
+
+        Raises:
+            FileNotFoundError: 첫 로드 시 agent_config.json이 없는 경우
+            ValueError: 첫 로드 시 설정 파일 형식이 잘못된 경우
+        """
+        project_key = project_path or DEFAULT_PROJECT_KEY
+        reloaded = False
+
+        with self._lock:
+            entry = self._entries.get(project_key)
+            now = time.monotonic()
+            if entry is not None and not force and now - entry.checked_at < self.check_interval:
+                return entry.snapshot
+
+            if entry is not None:
+                signature = self._compute_signature(project_path, entry.snapshot.agent_configs)
+                if signature == entry.signature:
+                    entry.checked_at = now
+                    return entry.snapshot
+
+            try:
+                snapshot = self._load_snapshot(project_key, project_path)
+            except (FileNotFoundError, ValueError) as e:
+                if entry is None:
+                    raise
+                # 편집 중인 설정 파일이 잘못된 경우 이전 설정 유지 (다음 검사에서 재시도)
+                logger.warning(f"에이전트 설정 다시 로드 실패, 이전 설정 유지 (프로젝트: {project_key}): {e}")
+                entry.checked_at = now
+                return entry.snapshot
+
+            # 로드 후 서명 계산 (새 설정의 프롬프트 파일 포함)
+            signature = self._compute_signature(project_path, snapshot.agent_configs)
+            self._entries[project_key] = _ProjectEntry(snapshot=snapshot, signature=signature, checked_at=now)
+            reloaded = entry is not None
+
+        if reloaded:
+            logger.info(
+                f"에이전트 설정 다시 로드: {len(snapshot.agent_configs)}개 "
+                f"(커스텀 {len(snapshot.custom_worker_names)}개, 프로젝트: {project_key}, 버전: {snapshot.version})"
+            )
+            self._notify(snapshot)
+        return snapshot
+
+    def get_agent_configs(self, project_path: Optional[str] = None) -> List[AgentConfig]:
+        """기본 에이전트 + 커스텀 워커 설정 목록 (복사본)"""
+        return list(self.get_snapshot(project_path).agent_configs)
+
+    def get_agent_config(self, agent_name: str, project_path: Optional[str] = None) -> Optional[AgentConfig]:
+        """이름으로 에이전트 설정 조회 (없으면 None)"""
+        return self.get_snapshot(project_path).config_map.get(agent_name)
+
+    def get_system_prompt(self, config: AgentConfig) -> Optional[str]:
+        """
+        프롬프트 파일 내용 조회 (파일이 바뀌지 않았으면 캐시 사용)
+
+        Args:
+            config: 에이전트 설정
+
+        Returns:
+            프롬프트 파일 내용 (문자열 프롬프트이거나 파일이 없으면 None)
+
+        Raises:
+            OSError: 파일 읽기 실패
+        """
+        prompt_path = self.resolve_prompt_path(config)
+        if prompt_path is None:
+            return None
+
+        signature = _file_signature([prompt_path])
+        if signature[0][1] is None:
+            return None
+
+        cache_key = str(prompt_path)
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(prompt_path, 'r', encoding='utf-8') as f:
+            prompt_text = f.read().strip()
+        self._prompt_cache[cache_key] = (signature, prompt_text)
+        return prompt_text
+
+    def invalidate(self, project_path: Optional[str] = None) -> None:
+        """
+        캐시 무효화 (다음 조회 시 파일을 다시 로드)
+
+        Args:
+            project_path: 무효화할 프로젝트 경로 (None이면 전체)
+        """
+        with self._lock:
+            if project_path is None:
+                entries = list(self._entries.values())
+                self._base_configs = None
+            else:
+                entry = self._entries.get(project_path)
+                entries = [entry] if entry is not None else []
+            for entry in entries:
+                entry.signature = None
+                entry.checked_at = float("-inf")
+
+    def add_listener(self, listener: AgentRegistryListener) -> None:
+        """
+        설정 변경 리스너 등록 (다시 로드된 스냅샷을 인자로 호출)
+
+        바운드 메서드는 약한 참조로 보관하므로 객체가 사라지면 자동으로 해제됩니다.
+        """
+        if hasattr(listener, "__self__"):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = lambda: listener  # noqa: E731
+        with self._lock:
+            self._listeners.append(ref)
+
+    def _notify(self, snapshot: AgentRegistrySnapshot) -> None:
+        with self._lock:
+            listeners = []
+            alive = []
+            for ref in self._listeners:
+                listener = ref()
+                if listener is not None:
+                    listeners.append(listener)
+                    alive.append(ref)
+            self._listeners = alive
+
+        for listener in listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.warning(f"에이전트 설정 변경 리스너 실패: {e}", exc_info=True)
+
+
+# 프로젝트 루트별 레지스트리
+_registries: Dict[str, AgentRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_agent_registry(config_loader: Optional[JsonConfigLoader] = None) -> AgentRegistry:
+    """
+    에이전트 레지스트리 반환 (설정 루트별 싱글톤)
+
+    Args:
+        config_loader: 기본 에이전트 설정 로더 (None이면 get_project_root() 기준)
+
+    Returns:
+        AgentRegistry: 에이전트 레지스트리
+    """
+    if config_loader is None:
+        config_loader = JsonConfigLoader(get_project_root())
+
+    key = str(config_loader.project_root)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = AgentRegistry(config_loader)
+            _registries[key] = registry
+        return registry
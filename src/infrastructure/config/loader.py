@@ -33,6 +33,13 @@ class SystemConfig:
     worker_retry_enabled: bool = True
     worker_retry_max_attempts: int = 3
     worker_retry_base_delay: float = 1.0
+    worker_retry_max_delay: float = 30.0
+
+    # Resilience 설정 (서킷 브레이커)
+    circuit_breaker_failure_threshold: int = 5
+    circuit_breaker_success_threshold: int = 2
+    circuit_breaker_timeout_seconds: float = 60.0
+    circuit_breaker_per_model: bool = True
 
     # Security 설정
     max_input_length: int = 5000
@@ -178,6 +185,7 @@ class JsonConfigLoader:
 
             manager = data.get("manager", {})
             performance = data.get("performance", {})
+            circuit_breaker = data.get("resilience", {}).get("circuit_breaker", {})
             security = data.get("security", {})
             logging_config = data.get("logging", {})
 
@@ -189,6 +197,11 @@ class JsonConfigLoader:
                 worker_retry_enabled=performance.get("worker_retry_enabled", True),
                 worker_retry_max_attempts=performance.get("worker_retry_max_attempts", 3),
                 worker_retry_base_delay=performance.get("worker_retry_base_delay", 1.0),
+                worker_retry_max_delay=performance.get("worker_retry_max_delay", 30.0),
+                circuit_breaker_failure_threshold=circuit_breaker.get("failure_threshold", 5),
+                circuit_breaker_success_threshold=circuit_breaker.get("success_threshold", 2),
+                circuit_breaker_timeout_seconds=circuit_breaker.get("timeout_seconds", 60.0),
+                circuit_breaker_per_model=circuit_breaker.get("enable_per_worker", True),
                 max_input_length=security.get("max_input_length", 5000),
                 enable_input_validation=security.get("enable_input_validation", True),
                 log_level=logging_config.get("level", "INFO"),
@@ -7,18 +7,24 @@ structlog 기반 로깅 시스템
 from .structured_logger import (
     configure_structlog,
     get_logger,
+    get_hot_path_logger,
+    LogSampler,
     log_exception_silently,
     add_session_file_handlers,
     remove_session_file_handlers,
+    bind_node_log_context,
 )
 from .error_tracker import track_error, get_error_stats
 
 __all__ = [
     "configure_structlog",
     "get_logger",
+    "get_hot_path_logger",
+    "LogSampler",
     "log_exception_silently",
     "add_session_file_handlers",
     "remove_session_file_handlers",
+    "bind_node_log_context",
     "track_error",
     "get_error_stats",
 ]
@@ -5,10 +5,16 @@ structlog 라이브러리를 사용하여 JSON 형식 로그 출력,
 세션 ID 및 Worker 이름 등 메타데이터를 자동으로 포함합니다.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import structlog
 from structlog.processors import JSONRenderer
@@ -17,6 +23,45 @@ from structlog.stdlib import add_log_level
 # JSON 직렬화 가능한 타입 정의
 JSONSerializable = Union[str, int, float, bool, None, dict, list]
 
+# 핫패스 로거 표시용 컨텍스트 키 (렌더링 전에 제거됨)
+_HOT_PATH_KEY = "_hot_path"
+
+# 호출 위치 정보 추가 프로세서 (프레임 검사 비용이 커서 핫패스 로거에서는 생략)
+_callsite_adder = structlog.processors.CallsiteParameterAdder(
+    [
+        structlog.processors.CallsiteParameter.PATHNAME,
+        structlog.processors.CallsiteParameter.FUNC_NAME,
+        structlog.processors.CallsiteParameter.LINENO,
+    ]
+)
+
+
+def _add_callsite_unless_hot_path(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    호출 위치 정보 추가 (핫패스 로거는 생략)
+
+    get_hot_path_logger()로 생성한 로거는 청크 단위로 호출되므로
+    프레임 검사를 건너뛰고 표시용 키만 제거합니다.
+    """
+    if event_dict.pop(_HOT_PATH_KEY, False):
+        return event_dict
+    return _callsite_adder(logger, method_name, event_dict)
+
+
+# 세션 로그 라우팅 키 (structlog.contextvars에 바인딩되는 세션 ID)
+_SESSION_CONTEXT_KEY = "session_id"
+
+# 동시에 열어둘 세션 로그 파일 수 상한 (초과 시 가장 오래 사용하지 않은 파일부터 닫음)
+_MAX_OPEN_SESSION_FILES = 64
+
+# 큐 기반 로깅 상태
+# 루트 로거에는 QueueHandler 하나만 부착하고, 파일/콘솔 쓰기는 QueueListener의 단일 스레드에서 수행
+_log_queue: Optional[queue.SimpleQueue] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_log_router: Optional["SessionLogRouter"] = None
+_queue_lock = threading.Lock()
+
 
 def _get_default_log_dir() -> str:
     """
@@ -59,18 +104,13 @@ def configure_structlog(
 
     # 프로세서 체인 설정
     processors = [
+        structlog.stdlib.filter_by_level,  # 비활성 레벨은 이후 프로세서 실행 전에 버림
         structlog.contextvars.merge_contextvars,  # context vars 병합
         structlog.stdlib.add_logger_name,  # 로거 이름 추가
         add_log_level,  # 로그 레벨 추가
         structlog.processors.TimeStamper(fmt="iso"),  # ISO 8601 타임스탬프
-        structlog.processors.CallsiteParameterAdder(  # 호출 위치 정보 추가
-            [
-                structlog.processors.CallsiteParameter.PATHNAME,
-                structlog.processors.CallsiteParameter.FUNC_NAME,
-                structlog.processors.CallsiteParameter.LINENO,
-            ]
-        ),
-        structlog.stdlib.PositionalArgumentsFormatter(),  # 위치 인자 포맷팅
+        _add_callsite_unless_hot_path,  # 호출 위치 정보 추가 (핫패스 로거 제외)
+        structlog.stdlib.PositionalArgumentsFormatter(),  # 위치 인자 포맷팅 (지연 포맷팅)
         structlog.processors.StackInfoRenderer(),  # 스택 정보 렌더링
         structlog.processors.format_exc_info,  # 예외 정보 포맷팅
         structlog.processors.UnicodeDecoder(),  # 유니코드 디코딩
@@ -81,10 +121,14 @@ def configure_structlog(
     else:
         processors.append(structlog.dev.ConsoleRenderer())
 
+    # wrapper_class: stdlib BoundLogger는 위치 인자를 event_dict에 그대로 넘기므로
+    # filter_by_level이 먼저 실행되고, 비활성 레벨은 포맷팅(event % args) 없이 버려짐
+    # (기본 wrapper는 프로세서 실행 전에 메시지를 포맷팅함)
     structlog.configure(
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
 
@@ -93,41 +137,316 @@ def configure_structlog(
     # 에러 로그: 5MB (ERROR 이상만 필터링되므로 용량 적음)
     # 디버그 로그: 20MB (상세 정보가 많아 용량 증가)
     # 터미널 출력 추가: 파일 + 콘솔에 로그 기록
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, log_level.upper()),
-        handlers=[
-            logging.handlers.RotatingFileHandler(
-                str(log_path / "claude-flow.log"),
-                maxBytes=10 * 1024 * 1024,  # 10MB
-                backupCount=5,
-                encoding="utf-8"
-            ),
-            logging.StreamHandler(),  # 콘솔 출력 추가
-        ],
-        force=True  # 기존 설정 덮어쓰기
-    )
-
-    # 에러 로그 전용 핸들러 추가
-    error_handler = logging.handlers.RotatingFileHandler(
-        str(log_path / "claude-flow-error.log"),
-        maxBytes=5 * 1024 * 1024,  # 5MB
-        backupCount=3,
-        encoding="utf-8"
-    )
-    error_handler.setLevel(logging.ERROR)
-    logging.getLogger().addHandler(error_handler)
+    global_handlers: List[logging.Handler] = [
+        _make_file_handler(log_path / "claude-flow.log", 10 * 1024 * 1024, 5),
+        logging.StreamHandler(),  # 콘솔 출력 추가
+        _make_file_handler(log_path / "claude-flow-error.log", 5 * 1024 * 1024, 3, logging.ERROR),
+    ]
 
     # DEBUG 레벨이 활성화된 경우 디버그 로그 파일 추가
     if log_level.upper() == "DEBUG":
-        debug_handler = logging.handlers.RotatingFileHandler(
-            str(log_path / "claude-flow-debug.log"),
-            maxBytes=20 * 1024 * 1024,  # 20MB
-            backupCount=3,
-            encoding="utf-8"
+        global_handlers.append(
+            _make_file_handler(log_path / "claude-flow-debug.log", 20 * 1024 * 1024, 3, logging.DEBUG)
+        )
+
+    for handler in global_handlers:
+        handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # 루트 로거: 기존 핸들러 제거 후 QueueHandler만 부착 (실제 쓰기는 백그라운드 스레드)
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        if handler is not _queue_handler:
+            handler.close()
+    root_logger.setLevel(getattr(logging, log_level.upper()))
+
+    router = _ensure_queue_logging()
+    router.set_global_handlers(global_handlers)
+
+
+def _make_file_handler(
+    path: Path,
+    max_bytes: int,
+    backup_count: int,
+    level: int = logging.NOTSET,
+) -> logging.handlers.RotatingFileHandler:
+    """
+    회전 파일 핸들러 생성 (메시지만 기록)
+
+    Args:
+        path: 로그 파일 경로
+        max_bytes: 회전 기준 크기
+        backup_count: 보관할 백업 파일 수
+        level: 핸들러 레벨
+
+    Returns:
+        RotatingFileHandler 인스턴스
+    """
+    handler = logging.handlers.RotatingFileHandler(
+        str(path),
+        maxBytes=max_bytes,
+        backupCount=backup_count,
+        encoding="utf-8",
+        delay=True,  # 첫 기록 시 파일 열기
+    )
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+class _SessionContextFilter(logging.Filter):
+    """
+    레코드에 현재 세션 ID를 기록하는 필터
+
+    로그를 남긴 스레드/Task에서 실행되므로 structlog.contextvars에 바인딩된
+    세션 ID를 읽을 수 있습니다. (QueueListener 스레드에서는 알 수 없음)
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.log_session_id = structlog.contextvars.get_contextvars().get(_SESSION_CONTEXT_KEY)
+        return True
+
+
+def _release_stream(handler: logging.StreamHandler) -> None:
+    """
+    핸들러의 파일 스트림만 닫기 (핸들러는 유지)
+
+    FileHandler는 stream이 None이면 다음 기록 시 append 모드로 다시 엽니다.
+    Handler.close()와 달리 logging 모듈 전역 락을 잡지 않습니다.
+    """
+    handler.acquire()
+    try:
+        stream = handler.stream
+        if stream is not None:
+            handler.stream = None
+            stream.close()
+    finally:
+        handler.release()
+
+
+class _SessionLogRoute:
+    """
+    세션별 로그 파일 핸들러 묶음 (첫 기록 시 생성)
+
+    Attributes:
+        base_log_dir: 로그 디렉토리
+        session_log_dir: {base_log_dir}/{session_id}
+        handlers: 생성된 핸들러 (파일명 → 핸들러)
+    """
+
+    def __init__(self, base_log_dir: Path, session_id: str):
+        self.base_log_dir = base_log_dir
+        self.session_log_dir = base_log_dir / session_id
+        self.handlers: Dict[str, logging.handlers.RotatingFileHandler] = {}
+
+    @staticmethod
+    def file_name_for(levelno: int) -> str:
+        """
+        레벨에 해당하는 세션 로그 파일명
+
+        - DEBUG → debug.log
+        - INFO, WARNING → info.log
+        - ERROR, CRITICAL → error.log
+        """
+        if levelno >= logging.ERROR:
+            return "error.log"
+        if levelno >= logging.INFO:
+            return "info.log"
+        return "debug.log"
+
+    def handler_for(self, file_name: str) -> logging.handlers.RotatingFileHandler:
+        """파일명에 해당하는 핸들러 반환 (없으면 생성)"""
+        handler = self.handlers.get(file_name)
+        if handler is None:
+            max_bytes = 5 * 1024 * 1024 if file_name == "error.log" else 10 * 1024 * 1024
+            self.session_log_dir.mkdir(parents=True, exist_ok=True)
+            handler = _make_file_handler(self.session_log_dir / file_name, max_bytes, 3)
+            self.handlers[file_name] = handler
+        return handler
+
+    def close(self) -> None:
+        """세션 파일 핸들러 닫기 (system.log는 공유되므로 제외)"""
+        for handler in self.handlers.values():
+            handler.close()
+        self.handlers.clear()
+
+
+class SessionLogRouter(logging.Handler):
+    """
+    로그 라우터 (QueueListener의 단일 writer 스레드에서 실행)
+
+    - 전역 핸들러(claude-flow.log, 콘솔 등)에 레벨을 확인하여 전달
+    - 레코드의 세션 ID로 세션 라우트를 조회(O(1))하여 system.log와 레벨별 세션 파일에 기록
+    - 세션 파일은 LRU로 관리하여 열린 파일 수를 max_open_files 이하로 유지
+
+    세션 라우트 등록/해제도 제어 레코드로 큐를 통해 전달되므로,
+    라우트 상태는 writer 스레드에서만 변경됩니다 (락 불필요, 기록 순서 보장).
+
+    Args:
+        max_open_files: 동시에 열어둘 세션 로그 파일 수 상한
+    """
+
+    # 라우트 제어 레코드 속성 (값: (동작, 세션 ID, 로그 디렉토리))
+    CONTROL_ATTR = "_log_route_control"
+
+    def __init__(self, max_open_files: int = _MAX_OPEN_SESSION_FILES):
+        super().__init__(logging.DEBUG)
+        self.max_open_files = max_open_files
+        self._global_handlers: List[logging.Handler] = []
+        self._routes: Dict[str, _SessionLogRoute] = {}
+        # system.log 핸들러 (로그 디렉토리 → (핸들러, 참조 수))
+        self._system_handlers: Dict[Path, Tuple[logging.handlers.RotatingFileHandler, int]] = {}
+        # 스트림이 열린 세션 파일 핸들러 (LRU 순서)
+        self._open_handlers: "OrderedDict[int, logging.handlers.RotatingFileHandler]" = OrderedDict()
+
+    def set_global_handlers(self, handlers: List[logging.Handler]) -> None:
+        """전역 핸들러 교체 (기존 핸들러는 닫음)"""
+        old_handlers = self._global_handlers
+        self._global_handlers = list(handlers)
+        for handler in old_handlers:
+            handler.close()
+
+    @classmethod
+    def make_control_record(
+        cls,
+        action: str,
+        session_id: str,
+        base_log_dir: Optional[Path] = None,
+    ) -> logging.LogRecord:
+        """
+        라우트 제어 레코드 생성
+
+        Args:
+            action: "register" 또는 "close"
+            session_id: 세션 ID
+            base_log_dir: 로그 디렉토리 (register 시 필수)
+
+        Returns:
+            LogRecord: 큐에 넣을 제어 레코드
+        """
+        record = logging.LogRecord(
+            name=__name__, level=logging.DEBUG, pathname="", lineno=0,
+            msg="", args=None, exc_info=None,
         )
-        debug_handler.setLevel(logging.DEBUG)
-        logging.getLogger().addHandler(debug_handler)
+        setattr(record, cls.CONTROL_ATTR, (action, session_id, base_log_dir))
+        return record
+
+    def _register(self, session_id: str, base_log_dir: Path) -> None:
+        """세션 라우트 등록 (writer 스레드에서 호출)"""
+        if session_id in self._routes:
+            return
+
+        system_handler, ref_count = self._system_handlers.get(base_log_dir, (None, 0))
+        if system_handler is None:
+            system_handler = _make_file_handler(base_log_dir / "system.log", 20 * 1024 * 1024, 5)
+        self._system_handlers[base_log_dir] = (system_handler, ref_count + 1)
+        self._routes[session_id] = _SessionLogRoute(base_log_dir, session_id)
+
+    def _unregister(self, session_id: str) -> None:
+        """세션 라우트 제거 및 파일 닫기 (writer 스레드에서 호출)"""
+        route = self._routes.pop(session_id, None)
+        if route is None:
+            return
+        for handler in route.handlers.values():
+            self._open_handlers.pop(id(handler), None)
+        route.close()
+
+        system_handler, ref_count = self._system_handlers[route.base_log_dir]
+        if ref_count <= 1:
+            del self._system_handlers[route.base_log_dir]
+            self._open_handlers.pop(id(system_handler), None)
+            system_handler.close()
+        else:
+            self._system_handlers[route.base_log_dir] = (system_handler, ref_count - 1)
+
+    def _write(self, handler: logging.handlers.RotatingFileHandler, record: logging.LogRecord) -> None:
+        """세션 파일에 기록하고 LRU 갱신 (상한 초과 시 가장 오래된 스트림 닫기)"""
+        handler.handle(record)
+
+        key = id(handler)
+        if key in self._open_handlers:
+            self._open_handlers.move_to_end(key)
+            return
+        self._open_handlers[key] = handler
+        while len(self._open_handlers) > self.max_open_files:
+            _, evicted = self._open_handlers.popitem(last=False)
+            _release_stream(evicted)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        control = getattr(record, self.CONTROL_ATTR, None)
+        if control is not None:
+            action, session_id, base_log_dir = control
+            if action == "register":
+                self._register(session_id, base_log_dir)
+            else:
+                self._unregister(session_id)
+            return
+
+        for handler in self._global_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+        session_id = getattr(record, "log_session_id", None)
+        if session_id is None:
+            return
+        route = self._routes.get(session_id)
+        if route is None:
+            return
+        self._write(self._system_handlers[route.base_log_dir][0], record)
+        self._write(route.handler_for(route.file_name_for(record.levelno)), record)
+
+    def close(self) -> None:
+        for route in self._routes.values():
+            route.close()
+        for handler, _ in self._system_handlers.values():
+            handler.close()
+        for handler in self._global_handlers:
+            handler.close()
+        self._routes.clear()
+        self._system_handlers.clear()
+        self._open_handlers.clear()
+        self._global_handlers = []
+        super().close()
+
+
+def _ensure_queue_logging() -> SessionLogRouter:
+    """
+    큐 기반 로깅 설치 (최초 1회)
+
+    루트 로거에 QueueHandler를 부착하고, QueueListener의 단일 스레드가
+    SessionLogRouter를 통해 실제 파일/콘솔 쓰기를 수행합니다.
+    이벤트 루프 스레드는 큐에 넣기만 하므로 파일 I/O로 블로킹되지 않습니다.
+
+    Returns:
+        SessionLogRouter 인스턴스
+    """
+    global _log_queue, _queue_handler, _queue_listener, _log_router
+
+    with _queue_lock:
+        if _log_router is None:
+            _log_queue = queue.SimpleQueue()
+            _log_router = SessionLogRouter()
+
+            _queue_handler = logging.handlers.QueueHandler(_log_queue)
+            _queue_handler.addFilter(_SessionContextFilter())
+
+            _queue_listener = logging.handlers.QueueListener(_log_queue, _log_router)
+            _queue_listener.start()
+            atexit.register(_stop_queue_logging)
+
+        root_logger = logging.getLogger()
+        if _queue_handler not in root_logger.handlers:
+            root_logger.addHandler(_queue_handler)
+
+        return _log_router
+
+
+def _stop_queue_logging() -> None:
+    """큐에 남은 로그를 모두 기록하고 writer 스레드 종료 (프로세스 종료 시)"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    if _log_router is not None:
+        _log_router.close()
 
 
 def get_logger(name: str, **context: JSONSerializable) -> structlog.stdlib.BoundLogger:
@@ -159,24 +478,80 @@ def get_logger(name: str, **context: JSONSerializable) -> structlog.stdlib.Bound
     return logger
 
 
-class LevelFilter(logging.Filter):
+def get_hot_path_logger(name: str, **context: JSONSerializable) -> structlog.stdlib.BoundLogger:
     """
-    특정 로그 레벨만 통과시키는 필터
+    핫패스(청크 단위 스트리밍 경로)용 로거를 가져옵니다.
+
+    호출 위치 정보(CallsiteParameterAdder) 추가를 생략합니다.
+    메시지는 f-string 대신 %-스타일 인자로 전달해야 비활성 레벨에서 포맷팅 비용이 없습니다.
 
     Args:
-        level: 허용할 로그 레벨 (logging.INFO, logging.ERROR 등)
-        exact_match: True면 정확히 일치하는 레벨만, False면 해당 레벨 이상
+        name: 로거 이름 (일반적으로 __name__ 사용)
+        **context: 기본 컨텍스트
+
+    Returns:
+        BoundLogger 인스턴스
+
+    Example:
+        >>> hot_logger = get_hot_path_logger(__name__)
+        >>> hot_logger.debug("청크 수신: #%d (%d자)", index, len(chunk))
     """
-    def __init__(self, level: int, exact_match: bool = False):
-        super().__init__()
-        self.level = level
-        self.exact_match = exact_match
+    return get_logger(name, **{_HOT_PATH_KEY: True}, **context)
 
-    def filter(self, record: logging.LogRecord) -> bool:
-        if self.exact_match:
-            return record.levelno == self.level
-        else:
-            return record.levelno >= self.level
+
+class LogSampler:
+    """
+    핫패스 로그 샘플러 (키별 카운터 + 빈도 제한)
+
+    청크 단위 로그를 매번 남기지 않고, 키별로 발생 횟수만 세다가
+    첫 발생, every번째 발생, 또는 interval초가 지난 경우에만 로그를 허용합니다.
+    누적 횟수는 노드/스트림 종료 시 요약 로그에 사용합니다.
+
+    Attributes:
+        every: N번마다 1회 로그 허용
+        interval: 마지막 로그 이후 최소 간격 (초)
+
+    Example:
+        >>> sampler = LogSampler(every=100, interval=5.0)
+        >>> if sampler.should_log("sse:abc"):
+        ...     hot_logger.info("SSE 전송 중: %d개", sampler.count("sse:abc"))
+        >>> total = sampler.pop("sse:abc")  # 요약 로그용 누적 횟수
+    """
+
+    def __init__(self, every: int = 100, interval: float = 5.0):
+        self.every = max(1, every)
+        self.interval = interval
+        self._counts: Dict[str, int] = {}
+        self._last_logged: Dict[str, float] = {}
+
+    def should_log(self, key: str) -> bool:
+        """
+        발생 횟수를 1 증가시키고 로그 허용 여부 반환
+
+        Args:
+            key: 카운터 키 (예: "{session_id}:{node_id}")
+
+        Returns:
+            bool: 로그를 남겨야 하면 True
+        """
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is None or count % self.every == 0 or now - last >= self.interval:
+            self._last_logged[key] = now
+            return True
+        return False
+
+    def count(self, key: str) -> int:
+        """키의 현재 누적 횟수"""
+        return self._counts.get(key, 0)
+
+    def pop(self, key: str) -> int:
+        """키의 누적 횟수를 반환하고 카운터 제거 (요약 로그 후 호출)"""
+        self._last_logged.pop(key, None)
+        return self._counts.pop(key, 0)
 
 
 def add_session_file_handlers(
@@ -184,9 +559,13 @@ def add_session_file_handlers(
     project_path: Optional[str] = None,
 ) -> None:
     """
-    세션별 파일 핸들러를 추가합니다.
+    세션별 파일 로그 라우트를 등록하고 세션 ID를 바인딩합니다.
 
     워크플로우 실행 시 각 세션의 로그를 별도 디렉토리에 파일로 기록합니다.
+    세션 ID를 structlog.contextvars에 바인딩하므로, 현재 Task와 여기서 생성된
+    하위 Task의 로그만 해당 세션 파일에 기록됩니다 (다른 세션 로그와 섞이지 않음).
+    전역 핸들러를 추가하지 않으므로 logging 모듈 락을 잡지 않습니다.
+
     로그 파일 구조:
     - logs/system.log: 모든 세션의 로그 (DEBUG 이상)
     - logs/{session_id}/debug.log: DEBUG 레벨만
@@ -215,66 +594,19 @@ def add_session_file_handlers(
 
     base_log_dir.mkdir(parents=True, exist_ok=True)
 
-    # 세션별 로그 디렉토리 생성
-    session_log_dir = base_log_dir / session_id
-    session_log_dir.mkdir(parents=True, exist_ok=True)
+    # 라우트 등록은 큐를 통해 writer 스레드에서 처리 (이후 세션 로그보다 먼저 처리됨)
+    _ensure_queue_logging()
+    _log_queue.put_nowait(SessionLogRouter.make_control_record("register", session_id, base_log_dir))
 
-    # 루트 로거 가져오기
-    root_logger = logging.getLogger()
-
-    # system.log 핸들러 추가 (모든 레벨 - DEBUG 이상)
-    system_handler = logging.handlers.RotatingFileHandler(
-        str(base_log_dir / "system.log"),
-        maxBytes=20 * 1024 * 1024,  # 20MB
-        backupCount=5,
-        encoding="utf-8",
-    )
-    system_handler.setLevel(logging.DEBUG)
-    system_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(system_handler)
-
-    # {session_id}/debug.log 핸들러 추가 (DEBUG 레벨만)
-    debug_handler = logging.handlers.RotatingFileHandler(
-        str(session_log_dir / "debug.log"),
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=3,
-        encoding="utf-8",
-    )
-    debug_handler.setLevel(logging.DEBUG)
-    debug_handler.addFilter(LevelFilter(logging.DEBUG, exact_match=True))
-    debug_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(debug_handler)
-
-    # {session_id}/info.log 핸들러 추가 (INFO, WARNING만)
-    info_handler = logging.handlers.RotatingFileHandler(
-        str(session_log_dir / "info.log"),
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=3,
-        encoding="utf-8",
-    )
-    info_handler.setLevel(logging.INFO)
-    # INFO와 WARNING만 통과 (ERROR는 차단)
-    info_handler.addFilter(lambda record: record.levelno < logging.ERROR)
-    info_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(info_handler)
-
-    # {session_id}/error.log 핸들러 추가 (ERROR, CRITICAL만)
-    error_handler = logging.handlers.RotatingFileHandler(
-        str(session_log_dir / "error.log"),
-        maxBytes=5 * 1024 * 1024,  # 5MB
-        backupCount=3,
-        encoding="utf-8",
-    )
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(logging.Formatter("%(message)s"))
-    root_logger.addHandler(error_handler)
+    structlog.contextvars.bind_contextvars(**{_SESSION_CONTEXT_KEY: session_id})
 
 
 def remove_session_file_handlers(session_id: str) -> None:
     """
-    세션별 파일 핸들러를 제거합니다.
+    세션별 파일 로그 라우트를 제거하고 세션 ID 바인딩을 해제합니다.
 
-    워크플로우 실행 완료 후 메모리 누수를 방지하기 위해 사용합니다.
+    워크플로우 실행 완료 후 파일 핸들을 닫기 위해 사용합니다.
+    제거 요청은 큐를 통해 전달되므로, 이미 큐에 들어간 세션 로그는 모두 기록된 뒤 닫힙니다.
 
     Args:
         session_id: 세션 ID
@@ -282,19 +614,39 @@ def remove_session_file_handlers(session_id: str) -> None:
     Example:
         >>> remove_session_file_handlers("session-123")
     """
-    root_logger = logging.getLogger()
+    if structlog.contextvars.get_contextvars().get(_SESSION_CONTEXT_KEY) == session_id:
+        structlog.contextvars.unbind_contextvars(_SESSION_CONTEXT_KEY)
 
-    # 세션 ID와 관련된 핸들러만 제거
-    handlers_to_remove = []
-    for handler in root_logger.handlers:
-        if isinstance(handler, logging.handlers.RotatingFileHandler):
-            # 파일 경로에 세션 ID가 포함되어 있으면 제거 대상
-            if session_id in str(handler.baseFilename):
-                handlers_to_remove.append(handler)
+    if _log_queue is None:
+        return
 
-    for handler in handlers_to_remove:
-        handler.close()
-        root_logger.removeHandler(handler)
+    _log_queue.put_nowait(SessionLogRouter.make_control_record("close", session_id))
+
+
+@contextmanager
+def bind_node_log_context(node_id: str) -> Iterator[None]:
+    """
+    노드 ID를 structlog.contextvars에 바인딩합니다 (블록 안의 로그에 node_id 필드 추가).
+
+    바인딩은 현재 Task와 블록 안에서 생성된 하위 Task에 적용되므로
+    병렬 실행 중인 노드의 로그도 각자의 node_id로 기록됩니다 (로그 검색의 node_id 필터용).
+
+    Args:
+        node_id: 노드 ID
+
+    Example:
+        >>> with bind_node_log_context("node-1"):
+        ...     logger.info("노드 실행")  # node_id="node-1" 포함
+    """
+    tokens = structlog.contextvars.bind_contextvars(node_id=node_id)
+    try:
+        yield
+    finally:
+        try:
+            structlog.contextvars.reset_contextvars(**tokens)
+        except ValueError:
+            # async generator가 다른 Context에서 정리되는 경우 (이전 값 복원 불가)
+            structlog.contextvars.unbind_contextvars("node_id")
 
 
 def log_exception_silently(
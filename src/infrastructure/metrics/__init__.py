@@ -0,0 +1,103 @@
+"""
+런타임 메트릭 인프라
+
+Prometheus 텍스트 형식으로 노출되는 애플리케이션 메트릭을 정의합니다.
+(GET /metrics 에서 조회)
+"""
+
+from .registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+_registry = get_metrics_registry()
+
+# 워크플로우 실행
+WORKFLOWS = _registry.gauge(
+    "claude_flow_workflows",
+    "BackgroundWorkflowManager별 워크플로우 수 (state: running, queued, completed, failed)",
+    ["project", "state"],
+)
+EVENTS_TOTAL = _registry.counter(
+    "claude_flow_events_total",
+    "발행된 워크플로우 이벤트 수 (rate()로 초당 이벤트 수 계산)",
+    ["event_type"],
+)
+NODE_DURATION_SECONDS = _registry.histogram(
+    "claude_flow_node_duration_seconds",
+    "노드 실행 시간 (초)",
+    ["agent", "status"],
+)
+TOKENS_TOTAL = _registry.counter(
+    "claude_flow_tokens_total",
+    "노드 실행에 사용된 토큰 수 (kind: input, output, cache_read, cache_creation)",
+    ["model", "kind"],
+)
+INPUT_BUDGET_TOKENS_TOTAL = _registry.counter(
+    "claude_flow_input_budget_tokens_total",
+    "입력 예산 적용 대상 부모 출력 토큰 수 (로컬 추정, kind: before, after)",
+    ["strategy", "kind"],
+)
+
+# 세션 저장소
+SESSION_STORE_WRITE_SECONDS = _registry.histogram(
+    "claude_flow_session_store_write_seconds",
+    "세션 파일 저장 시간 (직렬화 + 쓰기, 초)",
+)
+SESSION_STORE_WRITE_BYTES = _registry.counter(
+    "claude_flow_session_store_write_bytes_total",
+    "세션 파일에 쓴 바이트 수",
+)
+
+# SSE 스트리밍
+SSE_SUBSCRIBERS = _registry.gauge(
+    "claude_flow_sse_subscribers",
+    "현재 연결된 SSE 이벤트 스트림 구독자 수",
+)
+SSE_LAG_EVENTS = _registry.histogram(
+    "claude_flow_sse_lag_events",
+    "SSE 구독자가 따라잡아야 하는 이벤트 수 (폴링 시점 기준)",
+    buckets=(0, 1, 5, 10, 50, 100, 500, 1000, 5000),
+)
+
+# Claude Agent SDK
+SDK_CONNECT_SECONDS = _registry.histogram(
+    "claude_flow_sdk_connect_seconds",
+    "Claude Agent SDK 클라이언트 연결 시간 (초)",
+    ["model"],
+)
+SDK_FIRST_TOKEN_SECONDS = _registry.histogram(
+    "claude_flow_sdk_first_token_seconds",
+    "질의 전송부터 첫 텍스트 청크까지의 시간 (초)",
+    ["model"],
+)
+
+# 캐시
+CACHE_REQUESTS_TOTAL = _registry.counter(
+    "claude_flow_cache_requests_total",
+    "캐시 조회 수 (result: hit, miss)",
+    ["cache", "result"],
+)
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "WORKFLOWS",
+    "EVENTS_TOTAL",
+    "NODE_DURATION_SECONDS",
+    "TOKENS_TOTAL",
+    "INPUT_BUDGET_TOKENS_TOTAL",
+    "SESSION_STORE_WRITE_SECONDS",
+    "SESSION_STORE_WRITE_BYTES",
+    "SSE_SUBSCRIBERS",
+    "SSE_LAG_EVENTS",
+    "SDK_CONNECT_SECONDS",
+    "SDK_FIRST_TOKEN_SECONDS",
+    "CACHE_REQUESTS_TOTAL",
+]
@@ -21,6 +21,8 @@ from src.presentation.web.routers import (
     filesystem_router,
     templates_router,
     custom_workers_router,
+    workflow_ws_router,
+    workflow_batches_router,
 )
 
 # .env 파일 로드 (프로젝트 루트)
@@ -73,6 +75,8 @@ app.include_router(projects_router)
 app.include_router(filesystem_router)
 app.include_router(templates_router)
 app.include_router(custom_workers_router)
+app.include_router(workflow_ws_router)
+app.include_router(workflow_batches_router)
 
 REACT_BUILD_DIR = Path(__file__).parent / "static-react"
 
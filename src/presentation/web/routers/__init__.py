@@ -11,5 +11,7 @@ from src.presentation.web.routers.projects import router as projects_router
 from src.presentation.web.routers.filesystem import router as filesystem_router
 from src.presentation.web.routers.templates import router as templates_router
 from src.presentation.web.routers.custom_workers import router as custom_workers_router
+from src.presentation.web.routers.workflow_ws import router as workflow_ws_router
+from src.presentation.web.routers.workflow_batches import router as workflow_batches_router
 
-__all__ = ["agents_router", "health_router", "workflows_router", "projects_router", "filesystem_router", "templates_router", "custom_workers_router"]
+__all__ = ["agents_router", "health_router", "workflows_router", "projects_router", "filesystem_router", "templates_router", "custom_workers_router", "workflow_ws_router", "workflow_batches_router"]
@@ -12,9 +12,14 @@ from fastapi import APIRouter, HTTPException, Depends
 from sse_starlette.sse import EventSourceResponse
 
 from src.domain.models import AgentConfig
-from src.infrastructure.config import JsonConfigLoader, get_project_root
+from src.infrastructure.config import (
+    AgentRegistry,
+    JsonConfigLoader,
+    get_agent_registry,
+    get_project_root,
+)
 from src.infrastructure.claude.worker_client import WorkerAgent
-from src.infrastructure.logging import get_logger
+from src.infrastructure.logging import get_logger, get_hot_path_logger
 from src.presentation.web.schemas.request import (
     AgentExecuteRequest,
     AgentInfo,
@@ -22,6 +27,9 @@ from src.presentation.web.schemas.request import (
 )
 
 logger = get_logger(__name__)
+
+# 청크 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
 router = APIRouter(prefix="/api", tags=["agents"])
 
 
@@ -37,59 +45,58 @@ def get_config_loader() -> JsonConfigLoader:
     return JsonConfigLoader(project_root)
 
 
-def _load_agent_system_prompt(config: AgentConfig) -> str:
+def get_registry(
+    config_loader: JsonConfigLoader = Depends(get_config_loader)
+) -> AgentRegistry:
+    """
+    에이전트 레지스트리 반환 (기본 + 커스텀 워커, 파일 변경 시 자동 갱신)
+
+    Args:
+        config_loader: ConfigLoader 의존성 주입
+
+    Returns:
+        AgentRegistry: 에이전트 레지스트리
+    """
+    return get_agent_registry(config_loader)
+
+
+def _load_agent_system_prompt(registry: AgentRegistry, config: AgentConfig) -> str:
     """
-    에이전트의 시스템 프롬프트 로드 (WorkerAgent와 동일한 로직)
+    에이전트의 시스템 프롬프트 로드 (WorkerAgent와 동일한 경로 해석, 레지스트리 캐시 사용)
 
     Args:
+        registry: 에이전트 레지스트리
         config: 에이전트 설정
 
     Returns:
         시스템 프롬프트 문자열
     """
-    from pathlib import Path
-
-    prompt_text = config.system_prompt
-    logger.info(f"[{config.name}] 시스템 프롬프트 로드 시작: {prompt_text}")
-
-    # .txt 확장자가 있거나 경로처럼 보이면 파일에서 로드 시도
-    if prompt_text.endswith('.txt') or '/' in prompt_text:
-        try:
-            prompt_path = Path(prompt_text)
-            logger.info(f"[{config.name}] 프롬프트 파일 경로 (상대): {prompt_path}")
-
-            if not prompt_path.is_absolute():
-                # 프로젝트 루트 기준으로 경로 해석
-                project_root = get_project_root()
-                prompt_path = project_root / prompt_text
-                logger.info(f"[{config.name}] 프로젝트 루트: {project_root}")
-                logger.info(f"[{config.name}] 프롬프트 파일 경로 (절대): {prompt_path}")
-
-            if prompt_path.exists():
-                with open(prompt_path, 'r', encoding='utf-8') as f:
-                    loaded_prompt = f.read().strip()
-                    logger.info(f"[{config.name}] ✅ 시스템 프롬프트 로드 성공: {len(loaded_prompt)} 문자")
-                    return loaded_prompt
-            else:
-                logger.warning(f"[{config.name}] ⚠️  프롬프트 파일 없음: {prompt_path}, 기본값 사용")
-                return f"프롬프트 파일 없음: {prompt_path}"
-        except Exception as e:
-            logger.error(f"[{config.name}] ❌ 프롬프트 로드 실패: {e}, 기본값 사용", exc_info=True)
-            return f"프롬프트 로드 실패: {str(e)}"
-
-    logger.info(f"[{config.name}] 문자열 프롬프트 사용: {len(prompt_text)} 문자")
-    return prompt_text
+    prompt_path = registry.resolve_prompt_path(config)
+    if prompt_path is None:
+        return config.system_prompt
+
+    try:
+        loaded_prompt = registry.get_system_prompt(config)
+        if loaded_prompt is None:
+            logger.warning(f"[{config.name}] ⚠️  프롬프트 파일 없음: {prompt_path}, 기본값 사용")
+            return f"프롬프트 파일 없음: {prompt_path}"
+        return loaded_prompt
+    except Exception as e:
+        logger.error(f"[{config.name}] ❌ 프롬프트 로드 실패: {e}, 기본값 사용", exc_info=True)
+        return f"프롬프트 로드 실패: {str(e)}"
 
 
 @router.get("/agents", response_model=AgentListResponse)
 async def list_agents(
-    config_loader: JsonConfigLoader = Depends(get_config_loader)
+    registry: AgentRegistry = Depends(get_registry)
 ) -> AgentListResponse:
     """
     사용 가능한 Worker Agent 목록 조회 (기본 워커 + 커스텀 워커)
 
+    설정/프롬프트 파일이 바뀌지 않았으면 디스크를 다시 읽지 않습니다 (레지스트리 캐시).
+
     Args:
-        config_loader: ConfigLoader 의존성 주입 (Depends)
+        registry: 에이전트 레지스트리 의존성 주입 (Depends)
 
     Returns:
         AgentListResponse: Agent 목록 (name, role, description, system_prompt, allowed_tools)
@@ -110,31 +117,17 @@ async def list_agents(
         }
     """
     try:
-        # 1. 기본 워커 로드
-        agent_configs = config_loader.load_agent_configs()
-        base_worker_names = {config.name for config in agent_configs}
-
-        # 2. 커스텀 워커 로드 (프로젝트가 선택된 경우만)
+        # 1. 기본 워커 + 커스텀 워커 (프로젝트가 선택된 경우만)
         from src.presentation.web.routers.projects import _current_project_path
-        from src.infrastructure.storage import CustomWorkerRepository
-        from pathlib import Path
 
-        custom_worker_names = set()
-        if _current_project_path:
-            try:
-                custom_repo = CustomWorkerRepository(Path(_current_project_path))
-                custom_configs = custom_repo.load_custom_workers()
-                custom_worker_names = {config.name for config in custom_configs}
-                agent_configs.extend(custom_configs)
-                logger.info(f"커스텀 워커 로드: {len(custom_configs)}개")
-            except Exception as e:
-                logger.warning(f"커스텀 워커 로드 실패 (무시): {e}")
+        snapshot = registry.get_snapshot(_current_project_path)
+        custom_worker_names = snapshot.custom_worker_names
 
-        # 3. AgentInfo로 변환
+        # 2. AgentInfo로 변환
         agents = []
-        for config in agent_configs:
+        for config in snapshot.agent_configs:
             # 시스템 프롬프트 로드
-            system_prompt = _load_agent_system_prompt(config)
+            system_prompt = _load_agent_system_prompt(registry, config)
 
             # allowed_tools 안전하게 처리
             allowed_tools = []
@@ -261,6 +254,10 @@ async def _execute_worker_stream(
 
         # 스트리밍 실행
         async for chunk in worker.execute_task(task_description):
+            # 재시도 마커는 내부 제어용이므로 클라이언트로 전송하지 않음
+            if chunk.startswith("@EVENT:worker_retry:"):
+                logger.warning(f"[{session_id}] Worker 실행 재시도: {chunk[len('@EVENT:worker_retry:'):]}")
+                continue
             yield chunk
 
         logger.info(f"[{session_id}] Worker 실행 완료: {agent_config.name}")
@@ -279,14 +276,14 @@ async def _execute_worker_stream(
 @router.post("/execute")
 async def execute_agent(
     request: AgentExecuteRequest,
-    config_loader: JsonConfigLoader = Depends(get_config_loader)
+    registry: AgentRegistry = Depends(get_registry)
 ):
     """
     Worker Agent 실행 (Server-Sent Events)
 
     Args:
         request: Agent 실행 요청 (agent_name, task_description, session_id)
-        config_loader: ConfigLoader 의존성 주입 (Depends)
+        registry: 에이전트 레지스트리 의존성 주입 (Depends)
 
     Returns:
         EventSourceResponse: SSE 스트리밍 응답
@@ -309,13 +306,8 @@ async def execute_agent(
     session_id = request.session_id or str(uuid.uuid4())
 
     try:
-        # Agent 설정 로드
-        agent_configs = config_loader.load_agent_configs()
-
-        agent_config = next(
-            (cfg for cfg in agent_configs if cfg.name == request.agent_name),
-            None,
-        )
+        # Agent 설정 조회 (레지스트리 캐시)
+        agent_config = registry.get_agent_config(request.agent_name)
 
         if not agent_config:
             logger.warning(f"❌ 존재하지 않는 Agent: {request.agent_name}")
@@ -337,11 +329,8 @@ async def execute_agent(
                     agent_config, request.task_description, session_id
                 ):
                     chunk_count += 1
-                    # 디버깅 로그: chunk 길이 및 첫 50자 출력
-                    chunk_preview = chunk[:50] if len(chunk) > 50 else chunk
-                    logger.debug(
-                        f"[{session_id}] SSE Chunk #{chunk_count}: "
-                        f"len={len(chunk)}, preview='{chunk_preview}'"
+                    hot_logger.debug(
+                        "[%s] SSE Chunk #%d: len=%d", session_id, chunk_count, len(chunk)
                     )
 
                     # SSE 표준 형식: sse-starlette가 딕셔너리를 자동 변환
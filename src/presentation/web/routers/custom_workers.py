@@ -15,10 +15,10 @@ from fastapi import APIRouter, HTTPException, Query
 from sse_starlette.sse import EventSourceResponse
 
 from src.domain.models import AgentConfig
-from src.infrastructure.config import JsonConfigLoader, get_project_root, get_data_dir
+from src.infrastructure.config import get_agent_registry, get_project_root, get_data_dir
 from src.infrastructure.claude.worker_client import WorkerAgent
 from src.infrastructure.storage import CustomWorkerRepository
-from src.infrastructure.logging import get_logger
+from src.infrastructure.logging import get_logger, get_hot_path_logger
 from src.presentation.web.schemas.request import (
     CustomWorkerGenerateRequest,
     CustomWorkerSaveRequest,
@@ -27,6 +27,9 @@ from src.presentation.web.schemas.request import (
 )
 
 logger = get_logger(__name__)
+
+# 청크 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
 router = APIRouter(prefix="/api/custom-workers", tags=["custom-workers"])
 
 # 활성 세션 관리 (메모리)
@@ -83,13 +86,7 @@ def get_worker_prompt_engineer_config() -> AgentConfig:
         HTTPException: 설정 로드 실패 시
     """
     try:
-        config_loader = JsonConfigLoader(get_project_root())
-        agent_configs = config_loader.load_agent_configs()
-
-        config = next(
-            (cfg for cfg in agent_configs if cfg.name == "worker_prompt_engineer"),
-            None,
-        )
+        config = get_agent_registry().get_agent_config("worker_prompt_engineer")
 
         if not config:
             raise HTTPException(
@@ -138,6 +135,10 @@ async def _execute_worker_prompt_engineer(
         )
 
         async for chunk in worker.execute_task(requirements):
+            # 재시도 마커는 내부 제어용이므로 클라이언트로 전송하지 않음
+            if chunk.startswith("@EVENT:worker_retry:"):
+                logger.warning(f"[{session_id}] Worker 실행 재시도: {chunk[len('@EVENT:worker_retry:'):]}")
+                continue
             yield chunk
 
         logger.info(f"[{session_id}] worker_prompt_engineer 실행 완료")
@@ -243,7 +244,7 @@ async def generate_custom_worker(request: CustomWorkerGenerateRequest):
                 chunk_count += 1
                 accumulated_output += chunk
                 append_session_output(session_id, chunk)  # 파일에 저장
-                logger.debug(f"[{session_id}] SSE Chunk #{chunk_count}: len={len(chunk)}")
+                hot_logger.debug("[%s] SSE Chunk #%d: len=%d", session_id, chunk_count, len(chunk))
                 yield {"data": chunk}
 
             logger.info(f"[{session_id}] SSE 스트림 완료 (총 {chunk_count}개 청크)")
@@ -344,6 +345,9 @@ async def save_custom_worker(request: CustomWorkerSaveRequest):
             role=request.role,
         )
 
+        # 실행 중인 WorkflowExecutor가 다음 조회 시 바로 반영하도록 캐시 무효화
+        get_agent_registry().invalidate()
+
         logger.info(f"커스텀 워커 저장 완료: {request.worker_name} at {project_path}")
 
         return {
@@ -492,6 +496,8 @@ async def delete_custom_worker(
                 detail=f"커스텀 워커를 찾을 수 없거나 삭제 실패: {worker_name}",
             )
 
+        get_agent_registry().invalidate()
+
         logger.info(f"커스텀 워커 삭제 완료: {worker_name} at {project_path}")
 
         return {
@@ -1,15 +1,28 @@
 """
 Health Check API 라우터
 
-서비스 상태 확인을 위한 엔드포인트를 제공합니다.
+서비스 상태 확인 및 런타임 메트릭(Prometheus) 엔드포인트를 제공합니다.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
 
+from src.infrastructure.logging import get_error_stats
+from src.infrastructure.metrics import get_metrics_registry
 from src.presentation.web.schemas.request import HealthCheckResponse
 
 router = APIRouter(tags=["health"])
 
+# error_tracker 통계를 메트릭으로 노출 (수집 시점에 조회)
+_tracked_errors = get_metrics_registry().gauge(
+    "claude_flow_tracked_errors",
+    "track_error로 기록된 에러 수 (에러 타입별)",
+    ["error_type"],
+)
+_tracked_errors.set_function(
+    lambda: {(error_type,): count for error_type, count in get_error_stats()["error_counts"].items()}
+)
+
 
 @router.get("/health", response_model=HealthCheckResponse)
 async def health_check() -> HealthCheckResponse:
@@ -24,3 +37,26 @@ async def health_check() -> HealthCheckResponse:
         Response: {"status": "ok", "message": "Service is running"}
     """
     return HealthCheckResponse(status="ok", message="Service is running")
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """
+    런타임 메트릭 조회 (Prometheus 텍스트 형식)
+
+    워크플로우 실행 수, 이벤트 수, 세션 저장 지연 시간/바이트, SSE 구독자 수/지연,
+    SDK 연결 시간/첫 토큰 시간, Agent별 노드 실행 시간, 토큰 사용량, 캐시 적중 수를 노출합니다.
+
+    Returns:
+        PlainTextResponse: Prometheus 텍스트 노출 형식 (version 0.0.4)
+
+    Example:
+        GET /metrics
+        Response:
+            # TYPE claude_flow_events_total counter
+            claude_flow_events_total{event_type="node_start"} 12
+    """
+    return PlainTextResponse(
+        get_metrics_registry().render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -4,13 +4,17 @@
 프로젝트 디렉토리 선택 및 워크플로우 설정 저장/로드를 위한 엔드포인트를 제공합니다.
 """
 
+import asyncio
 import json
 import shutil
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+from fastapi import APIRouter, HTTPException, Request
+from sse_starlette.sse import EventSourceResponse
 
-from fastapi import APIRouter, HTTPException
 from src.infrastructure.logging import get_logger
 from src.presentation.web.schemas.workflow import (
     ProjectSelectRequest,
@@ -27,8 +31,14 @@ from src.presentation.web.schemas.workflow import (
     SessionFileInfo,
     SessionListResponse,
     LogContentResponse,
+    LogQueryEntry,
+    LogQueryResponse,
     SessionContentResponse,
 )
+from src.presentation.web.services.log_reader import read_tail, read_forward, follow_log
+from src.presentation.web.services.event_codec import encode_json
+from src.presentation.web.services.log_index import LEVELS, LogQuery, get_log_index
+from src.presentation.web.services.workflow_index import get_workflow_index
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/projects", tags=["projects"])
@@ -835,48 +845,106 @@ async def list_logs() -> LogListResponse:
         )
 
 
+def _resolve_log_file(file_path: str) -> Path:
+    """
+    로그 파일 상대 경로를 현재 프로젝트 로그 디렉토리 기준 절대 경로로 변환
+
+    Args:
+        file_path: 로그 파일 상대 경로 (logs/ 기준)
+
+    Returns:
+        Path: 로그 파일 경로
+
+    Raises:
+        HTTPException: 프로젝트 미선택(400), 잘못된 경로(400), 파일 없음(404)
+    """
+    if not _current_project_path:
+        raise HTTPException(
+            status_code=400,
+            detail="프로젝트가 선택되지 않았습니다."
+        )
+
+    project_name = Path(_current_project_path).name
+    logs_dir = Path.home() / ".claude-flow" / project_name / "logs"
+
+    # 경로 검증 (디렉토리 탐색 방지)
+    log_file_path = (logs_dir / file_path).resolve()
+    if not log_file_path.is_relative_to(logs_dir.resolve()):
+        raise HTTPException(
+            status_code=400,
+            detail="잘못된 파일 경로입니다."
+        )
+
+    if not log_file_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"로그 파일을 찾을 수 없습니다: {file_path}"
+        )
+
+    return log_file_path
+
+
+def _resolve_session_log_dir(logs_dir: Path, session_id: str) -> Path:
+    """
+    세션 로그 디렉토리 경로 검증 (디렉토리 탐색 방지)
+
+    Args:
+        logs_dir: 프로젝트 로그 디렉토리
+        session_id: 세션 ID (디렉토리 이름 하나)
+
+    Returns:
+        Path: 세션 로그 디렉토리 경로 (존재 여부는 확인하지 않음)
+
+    Raises:
+        HTTPException: 경로 구분자나 ..이 포함되었거나 로그 디렉토리를 벗어나는 경우(400)
+    """
+    if "/" in session_id or "\\" in session_id or ".." in session_id or Path(session_id).is_absolute():
+        raise HTTPException(
+            status_code=400,
+            detail="잘못된 세션 ID입니다."
+        )
+
+    session_dir = (logs_dir / session_id).resolve()
+    if session_dir.parent != logs_dir.resolve():
+        raise HTTPException(
+            status_code=400,
+            detail="잘못된 세션 ID입니다."
+        )
+
+    return logs_dir / session_id
+
+
 @router.get("/logs/content", response_model=LogContentResponse)
-async def get_log_content(file_path: str, max_lines: int = 1000) -> LogContentResponse:
+async def get_log_content(
+    file_path: str,
+    max_lines: int = 1000,
+    before: Optional[int] = None,
+    after: Optional[int] = None,
+) -> LogContentResponse:
     """
     로그 파일 내용 조회
 
+    파일 전체를 읽지 않고 끝에서부터 블록 단위로 거꾸로 읽습니다.
+    응답의 start_offset/end_offset을 커서로 사용하여 앞/뒤 페이지를 조회할 수 있습니다.
+
     Args:
         file_path: 로그 파일 상대 경로 (logs/ 기준, 예: "system.log", "session-123/debug.log")
         max_lines: 최대 라인 수 (기본: 1000, 최대: 10000)
+        before: 이 바이트 오프셋 이전의 마지막 max_lines 줄 조회 (이전 페이지, 응답의 start_offset)
+        after: 이 바이트 오프셋 이후의 max_lines 줄 조회 (다음 페이지, 응답의 end_offset)
 
     Returns:
         LogContentResponse: 로그 파일 내용 및 정보
 
     Example:
         GET /api/projects/logs/content?file_path=system.log&max_lines=500
+        GET /api/projects/logs/content?file_path=system.log&max_lines=500&before=1048576
     """
-    if not _current_project_path:
-        raise HTTPException(
-            status_code=400,
-            detail="프로젝트가 선택되지 않았습니다."
-        )
-
     # max_lines 제한
-    max_lines = min(max_lines, 10000)
+    max_lines = max(1, min(max_lines, 10000))
 
     try:
-        project_dir = Path(_current_project_path)
-        project_name = project_dir.name
-        logs_dir = Path.home() / ".claude-flow" / project_name / "logs"
-
-        # 경로 검증 (디렉토리 탐색 방지)
-        log_file_path = (logs_dir / file_path).resolve()
-        if not str(log_file_path).startswith(str(logs_dir)):
-            raise HTTPException(
-                status_code=400,
-                detail="잘못된 파일 경로입니다."
-            )
-
-        if not log_file_path.exists():
-            raise HTTPException(
-                status_code=404,
-                detail=f"로그 파일을 찾을 수 없습니다: {file_path}"
-            )
+        log_file_path = _resolve_log_file(file_path)
 
         # 파일 정보
         stat = log_file_path.stat()
@@ -898,14 +966,19 @@ async def get_log_content(file_path: str, max_lines: int = 1000) -> LogContentRe
             type=file_type
         )
 
-        # 파일 내용 읽기 (마지막 max_lines 라인)
-        with open(log_file_path, 'r', encoding='utf-8', errors='replace') as f:
-            lines = f.readlines()
-            content = ''.join(lines[-max_lines:])
+        # 파일 내용 읽기 (after가 있으면 앞으로, 없으면 끝/before에서 거꾸로)
+        if after is not None:
+            chunk = await asyncio.to_thread(read_forward, log_file_path, after, max_lines)
+        else:
+            chunk = await asyncio.to_thread(read_tail, log_file_path, max_lines, before)
 
         return LogContentResponse(
-            content=content,
-            file_info=file_info
+            content=chunk.content,
+            file_info=file_info,
+            start_offset=chunk.start_offset,
+            end_offset=chunk.end_offset,
+            has_more_before=chunk.has_more_before,
+            has_more_after=chunk.has_more_after,
         )
 
     except HTTPException:
@@ -918,6 +991,205 @@ async def get_log_content(file_path: str, max_lines: int = 1000) -> LogContentRe
         )
 
 
+def _with_rotations(log_file: Path) -> List[Path]:
+    """로그 파일과 회전된 백업 파일 목록 (예: system.log, system.log.1, ...)"""
+    paths = [log_file] if log_file.exists() else []
+    paths.extend(
+        p for p in log_file.parent.glob(f"{log_file.name}.*")
+        if p.suffix[1:].isdigit()
+    )
+    return paths
+
+
+def _parse_query_time(value: Optional[str], name: str) -> Optional[float]:
+    """ISO 8601 시각을 epoch 초로 변환 (잘못된 형식이면 400)"""
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"잘못된 시각 형식입니다 ({name}): {value}"
+        )
+    return parsed.timestamp()
+
+
+@router.get("/logs/query", response_model=LogQueryResponse)
+async def query_logs(
+    session_id: Optional[str] = None,
+    node_id: Optional[str] = None,
+    level: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    q: Optional[str] = None,
+    file_path: Optional[str] = None,
+    limit: int = 200,
+) -> LogQueryResponse:
+    """
+    로그 검색
+
+    로그 파일을 증분 인덱싱(세션/노드/레벨/시간 버킷별 오프셋)하여
+    전체 스캔 없이 조건에 맞는 레코드를 최신순으로 반환합니다.
+    회전된 백업 파일(*.log.1 등)도 함께 검색합니다.
+
+    검색 대상 파일:
+    - file_path 지정 시: 해당 파일 (+ 회전 파일)
+    - session_id 지정 시: {session_id}/debug.log, info.log, error.log (+ 회전 파일)
+    - 그 외: system.log (+ 회전 파일)
+
+    Args:
+        session_id: 세션 ID
+        node_id: 노드 ID (로그 레코드의 node_id 필드)
+        level: 최소 로그 레벨 (debug, info, warning, error, critical)
+        since: 시작 시각 (ISO 8601, 포함)
+        until: 종료 시각 (ISO 8601, 제외)
+        q: 부분 문자열 (대소문자 구분 없음)
+        file_path: 검색할 로그 파일 상대 경로 (logs/ 기준)
+        limit: 최대 결과 수 (기본: 200, 최대: 2000)
+
+    Returns:
+        LogQueryResponse: 검색 결과 (최신순)
+
+    Example:
+        GET /api/projects/logs/query?session_id=abc-123&level=warning&q=timeout
+    """
+    if not _current_project_path:
+        raise HTTPException(
+            status_code=400,
+            detail="프로젝트가 선택되지 않았습니다."
+        )
+
+    min_level = None
+    if level is not None:
+        min_level = LEVELS.get(level.lower())
+        if min_level is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"잘못된 로그 레벨입니다: {level}"
+            )
+
+    query = LogQuery(
+        session_id=session_id,
+        node_id=node_id,
+        min_level=min_level,
+        since=_parse_query_time(since, "since"),
+        until=_parse_query_time(until, "until"),
+        text=q or None,
+    )
+    limit = max(1, min(limit, 2000))
+
+    try:
+        project_name = Path(_current_project_path).name
+        logs_dir = Path.home() / ".claude-flow" / project_name / "logs"
+
+        # 검색 대상 파일 결정
+        if file_path:
+            paths = _with_rotations(_resolve_log_file(file_path))
+        elif session_id and _resolve_session_log_dir(logs_dir, session_id).is_dir():
+            paths = [
+                path
+                for name in ("debug.log", "info.log", "error.log")
+                for path in _with_rotations(logs_dir / session_id / name)
+            ]
+        else:
+            paths = _with_rotations(logs_dir / "system.log")
+
+        started_at = time.perf_counter()
+        log_index = get_log_index(logs_dir)
+        matches, truncated = await asyncio.to_thread(
+            log_index.search, paths, query, limit, logs_dir
+        )
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+
+        logger.debug(
+            f"로그 검색 완료: {len(matches)}건, {len(paths)}개 파일, {elapsed_ms:.1f}ms"
+        )
+
+        return LogQueryResponse(
+            entries=[
+                LogQueryEntry(
+                    file=match.file,
+                    offset=match.offset,
+                    timestamp=datetime.fromtimestamp(match.timestamp).astimezone().isoformat(),
+                    level=match.level,
+                    session_id=match.session_id,
+                    node_id=match.node_id,
+                    line=match.line,
+                )
+                for match in matches
+            ],
+            truncated=truncated,
+            files=[str(path.relative_to(logs_dir)) for path in paths],
+            elapsed_ms=round(elapsed_ms, 2),
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"로그 검색 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"로그 검색 실패: {str(e)}"
+        )
+
+
+@router.get("/logs/follow")
+async def follow_log_content(
+    request: Request,
+    file_path: str,
+    offset: Optional[int] = None,
+    poll_interval: float = 1.0,
+):
+    """
+    로그 파일 follow 모드 (SSE, tail -F)
+
+    파일 크기를 폴링하여 새로 추가된 줄을 SSE로 스트리밍합니다.
+    로그 회전/잘림을 감지하면 새 파일의 처음부터 다시 전송합니다.
+
+    Args:
+        request: 요청 (클라이언트 연결 종료 감지용)
+        file_path: 로그 파일 상대 경로 (logs/ 기준)
+        offset: 시작 바이트 오프셋 (logs/content 응답의 end_offset, 없으면 현재 파일 끝)
+        poll_interval: 폴링 간격 (초, 0.2 ~ 10)
+
+    Returns:
+        EventSourceResponse: SSE 스트리밍 응답
+            (data: {"content", "start_offset", "end_offset", "file_size", "line_count", ...})
+
+    Example:
+        GET /api/projects/logs/follow?file_path=system.log&offset=1048576
+    """
+    log_file_path = _resolve_log_file(file_path)
+    poll_interval = max(0.2, min(poll_interval, 10.0))
+
+    logger.info(f"로그 follow 시작: {file_path} (offset={offset})")
+
+    async def event_generator():
+        """SSE 이벤트 생성기"""
+        try:
+            async for chunk in follow_log(log_file_path, offset, poll_interval):
+                if await request.is_disconnected():
+                    break
+                yield b"data: " + encode_json(chunk.to_dict()) + b"\r\n\r\n"
+        except asyncio.CancelledError:
+            logger.info(f"로그 follow 종료 (클라이언트 연결 종료): {file_path}")
+            raise
+        except Exception as e:
+            error_msg = f"로그 follow 에러: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            yield {"data": json.dumps({"error": error_msg})}
+
+    return EventSourceResponse(
+        event_generator(),
+        headers={
+            "X-Accel-Buffering": "no",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 @router.get("/sessions/list", response_model=SessionListResponse)
 async def list_sessions() -> SessionListResponse:
     """
@@ -1091,6 +1363,9 @@ async def list_workflows() -> Dict[str, Any]:
     """
     프로젝트의 모든 워크플로우 목록 조회
 
+    워크플로우 인덱스(.claude-flow/workflow-index.json)를 사용하므로
+    바뀌지 않은 워크플로우 파일은 다시 읽지 않습니다.
+
     Returns:
         Dict[str, Any]: 워크플로우 목록 및 통계
 
@@ -1103,15 +1378,19 @@ async def list_workflows() -> Dict[str, Any]:
                     "name": "default",
                     "display_name": "Default Workflow",
                     "description": "기본 워크플로우",
+                    "node_count": 5,
                     "last_modified": "2025-10-30T10:00:00",
-                    "size": 1024
+                    "size": 1024,
+                    "content_hash": "3a7bd3e2..."
                 },
                 {
                     "name": "code-review",
                     "display_name": "Code Review Workflow",
                     "description": "코드 리뷰 워크플로우",
+                    "node_count": 4,
                     "last_modified": "2025-10-30T09:00:00",
-                    "size": 2048
+                    "size": 2048,
+                    "content_hash": "9f86d081..."
                 }
             ],
             "total_count": 2,
@@ -1137,37 +1416,9 @@ async def list_workflows() -> Dict[str, Any]:
         }
 
     try:
-        workflows = []
-
-        for workflow_file in workflows_dir.glob("*.json"):
-            if not workflow_file.is_file():
-                continue
-
-            try:
-                stat = workflow_file.stat()
-                workflow_name = workflow_file.stem
-
-                # 워크플로우 파일에서 메타데이터 읽기
-                with open(workflow_file, 'r', encoding='utf-8') as f:
-                    workflow_data = json.load(f)
-
-                workflow_info = workflow_data.get("workflow", {})
-                display_name = workflow_info.get("name", workflow_name)
-                description = workflow_info.get("description", "")
-
-                workflows.append({
-                    "name": workflow_name,
-                    "display_name": display_name,
-                    "description": description,
-                    "last_modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "size": stat.st_size
-                })
-            except Exception as e:
-                logger.warning(f"워크플로우 파일 읽기 실패: {workflow_file} - {e}")
-                continue
-
-        # 최근 수정 순으로 정렬
-        workflows.sort(key=lambda x: x["last_modified"], reverse=True)
+        # 인덱스 조회 (파일 stat만 비교, 바뀐 파일만 다시 파싱)
+        entries = await asyncio.to_thread(get_workflow_index(workflows_dir).list)
+        workflows = [entry.to_dict() for entry in entries]
 
         # 현재 워크플로우 (기본값: 첫 번째)
         current_workflow = workflows[0]["name"] if workflows else None
@@ -1303,14 +1554,13 @@ async def save_workflow_by_name(
 
     try:
         workflow_dict = project_config.model_dump(mode='json', exclude_none=False)
+        content = json.dumps(workflow_dict, ensure_ascii=False, indent=2).encode("utf-8")
 
-        with open(workflow_path, 'w', encoding='utf-8') as f:
-            json.dump(
-                workflow_dict,
-                f,
-                ensure_ascii=False,
-                indent=2
-            )
+        with open(workflow_path, 'wb') as f:
+            f.write(content)
+
+        # 인덱스 갱신 (쓴 내용으로 메타데이터 계산, 파일을 다시 읽지 않음)
+        get_workflow_index(workflows_dir).record(workflow_name, content)
 
         logger.info(f"워크플로우 저장: {workflow_name} → {workflow_path}")
 
@@ -1358,6 +1608,7 @@ async def delete_workflow_by_name(workflow_name: str) -> Dict[str, str]:
 
     try:
         workflow_path.unlink()
+        get_workflow_index(get_workflows_dir(_current_project_path)).remove(workflow_name)
         logger.info(f"워크플로우 삭제: {workflow_name} ({workflow_path})")
 
         return {
@@ -1425,6 +1676,7 @@ async def rename_workflow(old_name: str, new_name: str) -> Dict[str, str]:
 
     try:
         shutil.move(str(old_path), str(new_path))
+        get_workflow_index(get_workflows_dir(_current_project_path)).rename(old_name, new_name)
         logger.info(f"워크플로우 이름 변경: {old_name} → {new_name}")
 
         return {
@@ -4,10 +4,10 @@
 템플릿 조회, 저장, 삭제를 위한 엔드포인트를 제공합니다.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
 
 from src.infrastructure.logging import get_logger
 from src.presentation.web.schemas.template import (
@@ -33,23 +33,44 @@ def get_template_manager() -> TemplateManager:
     return TemplateManager()
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("", response_model=TemplateListResponse)
 async def list_templates(
+    request: Request,
+    response: Response,
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    tags: Optional[str] = Query(None, description="태그 필터 (쉼표 구분, 모두 포함하는 템플릿만)"),
+    q: Optional[str] = Query(None, description="검색어 (이름, 설명, 태그)"),
     manager: TemplateManager = Depends(get_template_manager)
 ):
     """
     템플릿 목록 조회 (메타데이터만)
 
     내장 템플릿과 사용자 템플릿을 모두 반환합니다.
+    ETag를 반환하며, If-None-Match가 현재 카탈로그와 일치하면 304 (본문 없음)를 반환합니다.
 
     Args:
+        request: HTTP 요청 (If-None-Match 확인)
+        response: HTTP 응답 (ETag 헤더 설정)
+        category: 카테고리 필터 (옵션)
+        tags: 태그 필터 (쉼표 구분, 옵션)
+        q: 검색어 (옵션)
         manager: TemplateManager 의존성 주입
 
     Returns:
-        TemplateListResponse: 템플릿 메타데이터 목록
+        TemplateListResponse: 템플릿 메타데이터 목록 (변경 없으면 304)
 
     Example:
         GET /api/templates
+        GET /api/templates?category=code_review&tags=planner,coder&q=리뷰
 
     Response:
         {
@@ -71,7 +92,16 @@ async def list_templates(
         }
     """
     try:
-        templates = manager.list_templates()
+        tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else None
+        templates = manager.list_templates(category=category, tags=tag_list, query=q)
+
+        # 카탈로그 ETag는 list_templates()에서 갱신됨 (같은 URL이면 같은 카탈로그 → 같은 응답)
+        etag = f'"{manager.catalog_etag}"'
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
         logger.info(f"템플릿 목록 조회 성공: {len(templates)}개")
         return TemplateListResponse(templates=templates)
     except Exception as e:
@@ -82,17 +112,23 @@ async def list_templates(
 @router.get("/{template_id}", response_model=Template)
 async def get_template(
     template_id: str,
+    request: Request,
+    response: Response,
     manager: TemplateManager = Depends(get_template_manager)
 ):
     """
     템플릿 상세 조회 (전체 데이터)
 
+    ETag(파일 서명 기반)를 반환하며, If-None-Match가 일치하면 304를 반환합니다.
+
     Args:
         template_id: 템플릿 ID
+        request: HTTP 요청 (If-None-Match 확인)
+        response: HTTP 응답 (ETag 헤더 설정)
         manager: TemplateManager 의존성 주입
 
     Returns:
-        Template: 템플릿 객체 (워크플로우 포함)
+        Template: 템플릿 객체 (워크플로우 포함, 변경 없으면 304)
 
     Raises:
         HTTPException: 템플릿을 찾을 수 없는 경우 (404)
@@ -124,6 +160,14 @@ async def get_template(
             logger.warning(f"템플릿을 찾을 수 없습니다: {template_id}")
             raise HTTPException(status_code=404, detail=f"템플릿을 찾을 수 없습니다: {template_id}")
 
+        template_etag = manager.get_template_etag(template_id)
+        if template_etag:
+            etag = f'"{template_etag}"'
+            if _etag_matches(request, etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+
         logger.info(f"템플릿 조회 성공: {template_id}")
         return template
     except HTTPException:
@@ -0,0 +1,366 @@
+"""
+워크플로우 배치 실행 API 라우터
+
+하나의 워크플로우를 여러 입력에 대해 실행하는 배치 엔드포인트를 제공합니다.
+항목마다 별도 세션으로 실행되므로 개별 항목은 기존 세션 API(/api/workflows/sessions/{id})로도 조회할 수 있습니다.
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
+from sse_starlette.sse import EventSourceResponse
+
+from src.infrastructure.logging import get_logger
+from src.presentation.web.schemas.workflow import (
+    ProjectConfig,
+    Workflow,
+    WorkflowBatchRequest,
+)
+from src.presentation.web.routers.workflows import get_background_manager
+from src.presentation.web.services.background_workflow_manager import BackgroundWorkflowManager
+from src.presentation.web.services.workflow_batch import WorkflowBatch, parse_batch_inputs_jsonl
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/api/workflows/batches", tags=["workflows"])
+
+# 진행률 변경이 없을 때 SSE 연결 유지용 heartbeat 간격 (초)
+_PROGRESS_HEARTBEAT_SECONDS = 15.0
+
+
+def _load_project_workflow(workflow_name: str) -> Workflow:
+    """
+    현재 프로젝트에 저장된 워크플로우 로드
+
+    Args:
+        workflow_name: 워크플로우 이름
+
+    Returns:
+        Workflow: 로드된 워크플로우
+
+    Raises:
+        HTTPException: 프로젝트가 선택되지 않았거나(400) 워크플로우가 없는 경우(404)
+    """
+    from src.presentation.web.routers.projects import _current_project_path, get_workflow_path
+
+    if not _current_project_path:
+        raise HTTPException(
+            status_code=400,
+            detail="프로젝트가 선택되지 않았습니다. 먼저 프로젝트를 선택하세요."
+        )
+
+    workflow_path = get_workflow_path(_current_project_path, workflow_name)
+    if not workflow_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"워크플로우를 찾을 수 없습니다: {workflow_name}"
+        )
+
+    with open(workflow_path, "r", encoding="utf-8") as f:
+        return ProjectConfig(**json.load(f)).workflow
+
+
+def _get_batch(bg_manager: BackgroundWorkflowManager, batch_id: str) -> WorkflowBatch:
+    """배치 조회 (없으면 404)"""
+    batch = bg_manager.batches.get(batch_id)
+    if batch is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"배치를 찾을 수 없습니다: {batch_id}"
+        )
+    return batch
+
+
+async def _start_batch(
+    bg_manager: BackgroundWorkflowManager,
+    workflow: Workflow,
+    request: WorkflowBatchRequest,
+) -> Dict[str, Any]:
+    """배치 시작 공통 처리 (워크플로우 검증 → 배치 시작 → 진행률 반환)"""
+    from src.presentation.web.routers.projects import _current_project_path
+
+    if not workflow.nodes:
+        raise HTTPException(
+            status_code=400,
+            detail="워크플로우에 노드가 없습니다"
+        )
+
+    batch = await bg_manager.start_batch(
+        workflow=workflow,
+        inputs=request.inputs,
+        concurrency=request.concurrency,
+        project_path=_current_project_path,
+        start_node_id=request.start_node_id,
+        timeout=request.timeout,
+        token_budget=request.token_budget,
+    )
+    return batch.progress()
+
+
+@router.post("")
+async def start_workflow_batch(
+    request: WorkflowBatchRequest,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> Dict[str, Any]:
+    """
+    워크플로우 배치 실행 시작
+
+    모든 항목이 같은 executor를 공유하므로 실행 계획, Agent 설정, 시스템 프롬프트 캐시를
+    재사용하고, 동시 실행 수는 concurrency로 제한합니다.
+
+    Args:
+        request: 배치 실행 요청
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        Dict[str, Any]: 배치 진행률 (batch_id 포함)
+
+    Raises:
+        HTTPException: 요청이 잘못되었거나 워크플로우를 찾을 수 없는 경우
+
+    Example:
+        POST /api/workflows/batches
+        Body: {
+            "workflow_name": "code-review",
+            "inputs": ["main.py 리뷰", "utils.py 리뷰"],
+            "concurrency": 4
+        }
+    """
+    try:
+        if request.workflow is not None:
+            workflow = request.workflow
+        elif request.workflow_name:
+            workflow = _load_project_workflow(request.workflow_name)
+        else:
+            raise HTTPException(
+                status_code=400,
+                detail="workflow 또는 workflow_name 중 하나를 지정해야 합니다"
+            )
+
+        return await _start_batch(bg_manager, workflow, request)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"배치 실행 시작 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"배치 실행 시작 실패: {str(e)}"
+        )
+
+
+@router.post("/upload")
+async def upload_workflow_batch(
+    request: Request,
+    workflow_name: str,
+    concurrency: int = 4,
+    start_node_id: Optional[str] = None,
+    timeout: Optional[float] = None,
+    token_budget: Optional[int] = None,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> Dict[str, Any]:
+    """
+    JSONL 입력 파일로 배치 실행 시작
+
+    요청 본문은 한 줄에 입력 하나인 JSONL입니다 (JSON 문자열 또는 {"input": "..."}).
+
+    Args:
+        request: HTTP 요청 (본문: JSONL)
+        workflow_name: 저장된 프로젝트 워크플로우 이름
+        concurrency: 최대 동시 실행 수
+        start_node_id: 시작 노드 ID (옵션)
+        timeout: 항목별 실행 제한 시간 (초, 옵션)
+        token_budget: 항목별 토큰 예산 (옵션)
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        Dict[str, Any]: 배치 진행률 (batch_id 포함)
+
+    Raises:
+        HTTPException: 입력 형식이 잘못되었거나 워크플로우를 찾을 수 없는 경우
+
+    Example:
+        POST /api/workflows/batches/upload?workflow_name=code-review&concurrency=8
+        Body:
+            {"input": "main.py 리뷰"}
+            "utils.py 리뷰"
+    """
+    try:
+        content = (await request.body()).decode("utf-8")
+        try:
+            batch_request = WorkflowBatchRequest(
+                workflow_name=workflow_name,
+                inputs=parse_batch_inputs_jsonl(content),
+                concurrency=concurrency,
+                start_node_id=start_node_id,
+                timeout=timeout,
+                token_budget=token_budget,
+            )
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"배치 입력이 잘못되었습니다: {str(e)}"
+            )
+
+        workflow = _load_project_workflow(workflow_name)
+        return await _start_batch(bg_manager, workflow, batch_request)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"배치 업로드 실행 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"배치 업로드 실행 실패: {str(e)}"
+        )
+
+
+@router.get("/{batch_id}")
+async def get_workflow_batch(
+    batch_id: str,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> Dict[str, Any]:
+    """
+    배치 진행률 조회 (집계 + 항목별 요약)
+
+    Args:
+        batch_id: 배치 ID
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        Dict[str, Any]: 집계 진행률과 항목 요약 목록 (items)
+
+    Raises:
+        HTTPException: 배치를 찾을 수 없는 경우
+    """
+    batch = _get_batch(bg_manager, batch_id)
+    progress = batch.progress()
+    progress["items"] = [item.to_summary() for item in batch.items]
+    return progress
+
+
+@router.get("/{batch_id}/stream")
+async def stream_workflow_batch(
+    batch_id: str,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+):
+    """
+    배치 집계 진행률 스트리밍 (Server-Sent Events)
+
+    항목 상태가 바뀔 때마다 batch_progress 이벤트를 보내고, 배치가 끝나면 [DONE]을 보냅니다.
+    항목별 노드 이벤트는 /api/workflows/sessions/{session_id}/stream으로 구독합니다.
+
+    Args:
+        batch_id: 배치 ID
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        EventSourceResponse: SSE 스트리밍 응답
+
+    Raises:
+        HTTPException: 배치를 찾을 수 없는 경우
+
+    SSE Response:
+        data: {"event_type": "batch_progress", "data": {"finished": 3, "total": 10, ...}}
+        ...
+        data: [DONE]
+    """
+    batch = _get_batch(bg_manager, batch_id)
+
+    async def event_generator():
+        try:
+            version = -1
+            while True:
+                changed = await batch.wait_for_change(version, timeout=_PROGRESS_HEARTBEAT_SECONDS)
+                if not changed:
+                    yield {"comment": "heartbeat"}
+                    continue
+
+                version = batch.version
+                yield {"data": json.dumps(
+                    {"event_type": "batch_progress", "data": batch.progress()},
+                    ensure_ascii=False,
+                )}
+
+                if batch.completed:
+                    break
+
+            yield {"data": "[DONE]"}
+
+        except asyncio.CancelledError:
+            # 클라이언트가 연결을 끊어도 배치는 계속 실행됨
+            logger.info(f"[batch:{batch_id}] 진행률 스트림 연결 종료 (배치는 계속 실행 중)")
+            raise
+
+    return EventSourceResponse(
+        event_generator(),
+        headers={
+            "X-Accel-Buffering": "no",
+            "Cache-Control": "no-cache",
+        }
+    )
+
+
+@router.get("/{batch_id}/results")
+async def download_workflow_batch_results(
+    batch_id: str,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> StreamingResponse:
+    """
+    배치 결과 JSONL 다운로드 (종료된 항목만, 입력 순서)
+
+    각 줄: {"index", "session_id", "status", "input", "outputs", "error", "elapsed_time", "total_tokens", ...}
+
+    Args:
+        batch_id: 배치 ID
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        StreamingResponse: JSONL 응답
+
+    Raises:
+        HTTPException: 배치를 찾을 수 없는 경우
+    """
+    batch = _get_batch(bg_manager, batch_id)
+    return StreamingResponse(
+        batch.iter_results_jsonl(),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": f'attachment; filename="batch-{batch_id}.jsonl"',
+        }
+    )
+
+
+@router.post("/{batch_id}/cancel")
+async def cancel_workflow_batch(
+    batch_id: str,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> Dict[str, Any]:
+    """
+    배치 취소 (대기 중인 항목은 건너뛰고 실행 중인 항목은 취소)
+
+    Args:
+        batch_id: 배치 ID
+        bg_manager: BackgroundWorkflowManager 의존성 주입
+
+    Returns:
+        Dict[str, Any]: 취소 후 배치 진행률
+
+    Raises:
+        HTTPException: 배치를 찾을 수 없거나 취소에 실패한 경우
+    """
+    try:
+        batch = await bg_manager.cancel_batch(batch_id)
+        logger.info(f"[batch:{batch_id}] 배치 취소 요청 처리 완료")
+        return batch.progress()
+
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        logger.error(f"[batch:{batch_id}] 배치 취소 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"배치 취소 실패: {str(e)}"
+        )
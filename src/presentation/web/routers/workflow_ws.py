@@ -0,0 +1,222 @@
+"""
+워크플로우 WebSocket 라우터
+
+하나의 WebSocket 연결로 여러 워크플로우 세션의 이벤트를 구독하고,
+사용자 입력(Human-in-the-Loop)과 취소 요청을 같은 연결로 전송합니다.
+SSE(/api/workflows/execute, /sessions/{id}/stream)의 선택적 대안이며, 기존 엔드포인트는 그대로 동작합니다.
+
+프로토콜 (클라이언트 → 서버, 텍스트 JSON):
+    {"type": "subscribe", "session_id": "...", "last_event_index": 10, "id": "req-1"}
+    {"type": "unsubscribe", "session_id": "...", "id": "req-2"}
+    {"type": "user_input", "session_id": "...", "answer": "네, 진행해주세요", "id": "req-3"}
+    {"type": "cancel", "session_id": "...", "id": "req-4"}
+    {"type": "ping", "id": "req-5"}
+
+프로토콜 (서버 → 클라이언트):
+    - 이벤트 (바이너리 프레임, UTF-8 JSON):
+      {"seq": 42, "session_id": "...", "index": 11, "event": {...}}
+      seq: 연결 단위 순번 (1부터 증가), index: 세션 내 이벤트 인덱스 (재구독 시 last_event_index)
+    - 제어 메시지 (텍스트 프레임, JSON):
+      {"type": "ack", "id": "req-1", "request": "subscribe", "session_id": "..."}
+      {"type": "end", "session_id": "...", "next_event_index": 120}
+      {"type": "error", "id": "req-3", "message": "..."}
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+
+from src.infrastructure.logging import get_logger
+from src.presentation.web.routers.workflows import get_background_manager
+from src.presentation.web.services.background_workflow_manager import BackgroundWorkflowManager
+from src.presentation.web.services.event_codec import encode_json
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/api/workflows", tags=["workflows"])
+
+# 송신 대기 프레임 상한 (느린 클라이언트에 대한 backpressure)
+_OUTBOX_MAX_FRAMES = 1000
+
+
+class WorkflowSocketConnection:
+    """
+    WebSocket 연결 하나의 상태 (구독 목록, 송신 큐, 순번)
+
+    송신은 writer Task 하나가 송신 큐에서 꺼내 순서대로 보냅니다.
+    (여러 구독 Task가 동시에 send하지 않도록 직렬화)
+
+    Attributes:
+        websocket: WebSocket 연결
+        bg_manager: 백그라운드 워크플로우 관리자
+        seq: 마지막으로 발급한 이벤트 순번
+        subscriptions: 세션 ID → 이벤트 전달 Task
+    """
+
+    def __init__(self, websocket: WebSocket, bg_manager: BackgroundWorkflowManager):
+        self.websocket = websocket
+        self.bg_manager = bg_manager
+        self.seq = 0
+        self.subscriptions: Dict[str, asyncio.Task] = {}
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=_OUTBOX_MAX_FRAMES)
+
+    async def send_control(self, message: Dict[str, Any]) -> None:
+        """제어 메시지 송신 예약 (텍스트 프레임)"""
+        await self._outbox.put(json.dumps(message, ensure_ascii=False))
+
+    async def run_writer(self) -> None:
+        """송신 큐의 프레임을 순서대로 전송 (연결 종료 시까지)"""
+        while True:
+            frame = await self._outbox.get()
+            if isinstance(frame, bytes):
+                await self.websocket.send_bytes(frame)
+            else:
+                await self.websocket.send_text(frame)
+
+    async def _pump_events(self, session_id: str, start_from_index: int) -> None:
+        """세션 이벤트를 바이너리 프레임으로 송신 큐에 추가 (인코딩된 이벤트 바이트 재사용)"""
+        session_id_json = encode_json(session_id)
+        index = start_from_index
+        try:
+            async for encoded_event in self.bg_manager.stream_events(session_id, start_from_index):
+                self.seq += 1
+                await self._outbox.put(
+                    b'{"seq":' + str(self.seq).encode()
+                    + b',"session_id":' + session_id_json
+                    + b',"index":' + str(index).encode()
+                    + b',"event":' + encoded_event.payload + b"}"
+                )
+                index += 1
+
+            await self.send_control({"type": "end", "session_id": session_id, "next_event_index": index})
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[{session_id}] WebSocket 이벤트 전달 실패: {e}")
+            await self.send_control({"type": "error", "session_id": session_id, "message": str(e)})
+        finally:
+            # 재구독으로 교체된 경우 새 구독 Task는 유지
+            if self.subscriptions.get(session_id) is asyncio.current_task():
+                del self.subscriptions[session_id]
+
+    def subscribe(self, session_id: str, last_event_index: Optional[int]) -> None:
+        """세션 구독 (이미 구독 중이면 기존 구독을 취소하고 다시 시작)"""
+        self.unsubscribe(session_id)
+        start_from_index = last_event_index + 1 if last_event_index is not None else 0
+        self.subscriptions[session_id] = asyncio.create_task(
+            self._pump_events(session_id, start_from_index)
+        )
+
+    def unsubscribe(self, session_id: str) -> bool:
+        """세션 구독 해제"""
+        task = self.subscriptions.pop(session_id, None)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    async def handle_message(self, message: Dict[str, Any]) -> None:
+        """
+        클라이언트 메시지 처리
+
+        Args:
+            message: 클라이언트 메시지 (type, session_id, id 등)
+        """
+        message_type = message.get("type")
+        session_id = message.get("session_id")
+        request_id = message.get("id")
+        ack = {"type": "ack", "id": request_id, "request": message_type, "session_id": session_id}
+
+        if message_type == "ping":
+            await self.send_control({"type": "pong", "id": request_id})
+            return
+
+        if not isinstance(session_id, str) or not session_id:
+            raise ValueError("session_id가 필요합니다")
+
+        if message_type == "subscribe":
+            last_event_index = message.get("last_event_index")
+            if last_event_index is not None and not isinstance(last_event_index, int):
+                raise ValueError("last_event_index는 정수여야 합니다")
+            self.subscribe(session_id, last_event_index)
+            logger.info(
+                f"[{session_id}] WebSocket 구독 시작 (last_event_index={last_event_index})"
+            )
+
+        elif message_type == "unsubscribe":
+            ack["unsubscribed"] = self.unsubscribe(session_id)
+
+        elif message_type == "user_input":
+            answer = message.get("answer")
+            if not isinstance(answer, str):
+                raise ValueError("answer가 필요합니다")
+            queue = self.bg_manager.executor.user_input_queues.get(session_id)
+            if queue is None:
+                raise ValueError(f"세션 {session_id}의 입력 Queue를 찾을 수 없습니다")
+            await queue.put(answer)
+            logger.info(f"[{session_id}] WebSocket 사용자 입력 전달: {answer[:50]}...")
+
+        elif message_type == "cancel":
+            await self.bg_manager.cancel_workflow(session_id)
+            logger.info(f"[{session_id}] WebSocket 워크플로우 취소 완료")
+
+        else:
+            raise ValueError(f"알 수 없는 메시지 타입입니다: {message_type}")
+
+        await self.send_control(ack)
+
+    def close(self) -> None:
+        """모든 구독 취소"""
+        for session_id in list(self.subscriptions):
+            self.unsubscribe(session_id)
+
+
+@router.websocket("/ws")
+async def workflow_websocket(
+    websocket: WebSocket,
+    bg_manager: BackgroundWorkflowManager = Depends(get_background_manager),
+) -> None:
+    """
+    워크플로우 WebSocket (여러 세션 멀티플렉싱 + 사용자 입력/취소)
+
+    하나의 연결로 여러 세션을 구독하며, 이벤트는 순번(seq)이 붙은 바이너리 프레임으로 전송됩니다.
+    사용자 입력과 취소 요청은 별도 HTTP 요청 없이 같은 연결로 보냅니다.
+    프로토콜은 모듈 docstring 참고.
+
+    Args:
+        websocket: WebSocket 연결
+        bg_manager: 백그라운드 워크플로우 관리자
+
+    Example:
+        ws://localhost:8000/api/workflows/ws
+        → {"type": "subscribe", "session_id": "abc-123", "id": "1"}
+        ← {"type": "ack", "id": "1", "request": "subscribe", "session_id": "abc-123"}
+        ← (binary) {"seq": 1, "session_id": "abc-123", "index": 0, "event": {...}}
+    """
+    await websocket.accept()
+    connection = WorkflowSocketConnection(websocket, bg_manager)
+    writer_task = asyncio.create_task(connection.run_writer())
+    logger.info("WebSocket 연결 시작")
+
+    try:
+        while True:
+            raw_message = await websocket.receive_text()
+            message = None
+            try:
+                message = json.loads(raw_message)
+                if not isinstance(message, dict):
+                    raise ValueError("메시지는 JSON 객체여야 합니다")
+                await connection.handle_message(message)
+            except (ValueError, json.JSONDecodeError) as e:
+                request_id = message.get("id") if isinstance(message, dict) else None
+                await connection.send_control({"type": "error", "id": request_id, "message": str(e)})
+
+    except WebSocketDisconnect:
+        logger.info(f"WebSocket 연결 종료 (구독 {len(connection.subscriptions)}개 정리)")
+    except Exception as e:
+        logger.error(f"WebSocket 처리 에러: {e}", exc_info=True)
+    finally:
+        connection.close()
+        writer_task.cancel()
@@ -5,18 +5,19 @@
 """
 
 import asyncio
+import gzip
 import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException, Depends, Body
+from fastapi import APIRouter, HTTPException, Depends, Body, Request, Response
 from sse_starlette.sse import EventSourceResponse
 
-from src.infrastructure.config import JsonConfigLoader, get_project_root
-from src.infrastructure.logging import get_logger
+from src.infrastructure.config import JsonConfigLoader, get_agent_registry, get_project_root
+from src.infrastructure.logging import get_logger, get_hot_path_logger, LogSampler
 from src.presentation.web.schemas.workflow import (
     Workflow,
     WorkflowExecuteRequest,
@@ -25,6 +26,7 @@ from src.presentation.web.schemas.workflow import (
     WorkflowListResponse,
     WorkflowValidateResponse,
     WorkflowValidationError,
+    TokenLedgerResponse,
 )
 from src.presentation.web.schemas.request import WorkflowDesignRequest
 from src.infrastructure.claude.worker_client import WorkerAgent
@@ -33,6 +35,8 @@ from typing import AsyncIterator
 from src.presentation.web.services.workflow_executor import WorkflowExecutor
 from src.presentation.web.services.workflow_validator import WorkflowValidator
 from src.presentation.web.services.workflow_session_store import get_session_store
+from src.presentation.web.services.token_ledger import TokenLedger
+from src.presentation.web.services.blob_store import is_valid_blob_ref
 from src.presentation.web.services.background_workflow_manager import (
     get_background_workflow_manager,
     BackgroundWorkflowManager,
@@ -41,6 +45,12 @@ from src.presentation.web.services.background_workflow_manager import (
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/workflows", tags=["workflows"])
 
+# 이벤트 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
+
+# SSE 전송 로그 샘플러 (세션별 첫 이벤트, 100개마다, 또는 5초마다 1회)
+_sse_log_sampler = LogSampler(every=100, interval=5.0)
+
 
 # 워크플로우 저장 디렉토리
 WORKFLOWS_DIR = Path.home() / ".claude-flow" / "workflows"
@@ -59,6 +69,17 @@ def get_config_loader() -> JsonConfigLoader:
     return JsonConfigLoader(project_root)
 
 
+@lru_cache()
+def get_workflow_validator() -> WorkflowValidator:
+    """
+    WorkflowValidator 싱글톤 인스턴스 반환 (요청 간 검증 결과 캐시 공유)
+
+    Returns:
+        WorkflowValidator: 워크플로우 검증기
+    """
+    return WorkflowValidator(config_loader=get_config_loader())
+
+
 # 프로젝트별 WorkflowExecutor 캐시
 _executors: Dict[str, WorkflowExecutor] = {}
 
@@ -175,6 +196,7 @@ async def execute_workflow(
             workflow=request.workflow,
             initial_input=request.initial_input,
             project_path=_current_project_path,
+            token_budget=request.token_budget,
         )
 
         # 백그라운드 워크플로우 시작 (프로젝트 경로, start_node_id 전달)
@@ -190,6 +212,8 @@ async def execute_workflow(
                 initial_input=request.initial_input,
                 project_path=_current_project_path,
                 start_node_id=request.start_node_id,
+                timeout=request.timeout,
+                token_budget=request.token_budget,
             )
             logger.info(f"[{session_id}] 백그라운드 워크플로우 시작 완료")
         except ValueError as e:
@@ -209,6 +233,7 @@ async def execute_workflow(
             workflow=request.workflow,
             initial_input=request.initial_input,
             project_path=_current_project_path,
+            token_budget=request.token_budget,
         )
 
         # 백그라운드 워크플로우 시작 (프로젝트 경로, start_node_id 전달)
@@ -218,6 +243,8 @@ async def execute_workflow(
             initial_input=request.initial_input,
             project_path=_current_project_path,
             start_node_id=request.start_node_id,
+            timeout=request.timeout,
+            token_budget=request.token_budget,
         )
         logger.info(f"[{session_id}] 새 워크플로우 시작 완료")
     else:
@@ -243,31 +270,24 @@ async def execute_workflow(
             event_count = 0
 
             # 백그라운드 Task에서 이벤트 스트리밍 (start_from_index 전달)
-            async for event in bg_manager.stream_events(
+            # 이벤트는 발행 시점에 인코딩된 바이트를 SSE 프레임으로 그대로 전송 (재직렬화 없음)
+            async for encoded_event in bg_manager.stream_events(
                 session_id,
                 start_from_index=start_from_index
             ):
                 event_count += 1
 
-                # 이벤트를 JSON으로 직렬화
-                event_data = event.model_dump()
-
-                logger.info(
-                    f"[{session_id}] 📤 SSE Event #{start_from_index + event_count}: "
-                    f"{event.event_type} (node: {event.node_id})"
-                )
-                logger.debug(f"[{session_id}] Event data: {event_data}")
-
-                # JSON 문자열 생성
-                json_str = json.dumps(event_data, ensure_ascii=False)
-                logger.debug(f"[{session_id}] JSON 직렬화 완료: {json_str[:100]}...")
+                if _sse_log_sampler.should_log(session_id):
+                    hot_logger.info(
+                        "[%s] 📤 SSE Event #%d: %s (node: %s)",
+                        session_id, start_from_index + event_count,
+                        encoded_event.event_type, encoded_event.node_id
+                    )
 
-                # SSE 형식으로 전송
-                sse_message = {"data": json_str}
-                logger.debug(f"[{session_id}] SSE 메시지 전송: {sse_message}")
-                yield sse_message
+                yield encoded_event.sse_frame()
 
             # 완료 시그널
+            _sse_log_sampler.pop(session_id)
             logger.info(
                 f"[{session_id}] ✅ SSE 스트림 완료 "
                 f"(전송: {event_count}개, 총 누적: {start_from_index + event_count}개)"
@@ -284,6 +304,7 @@ async def execute_workflow(
             )
 
             # [DONE] 시그널을 보내지 않음 (이미 연결이 끊어짐)
+            _sse_log_sampler.pop(session_id)
             raise  # CancelledError는 재발생시켜 정리 작업이 이루어지도록 함
 
         except Exception as e:
@@ -420,6 +441,58 @@ async def list_workflows() -> WorkflowListResponse:
         )
 
 
+# 주의: "/{workflow_id}" 라우트보다 먼저 등록해야 경로 충돌이 없음
+@router.get("/token-usage", response_model=TokenLedgerResponse)
+async def get_project_token_usage(status: Optional[str] = None) -> TokenLedgerResponse:
+    """
+    현재 프로젝트의 토큰 사용량 집계 (용량 계획용)
+
+    프로젝트의 모든 세션 원장을 Agent/모델별로 합산합니다.
+    노드 ID는 세션마다 달라 노드별 집계는 제공하지 않습니다.
+
+    Args:
+        status: 세션 상태 필터 (running, completed, error, cancelled, 옵션)
+
+    Returns:
+        TokenLedgerResponse: 프로젝트 토큰 사용량 집계
+
+    Example:
+        GET /api/workflows/token-usage?status=completed
+
+        Response:
+        {
+            "session_id": null,
+            "session_count": 12,
+            "budget": null,
+            "total": {"input_tokens": 120000, "output_tokens": 34000, "total_tokens": 154000, ...},
+            "by_node": {},
+            "by_agent": {"coder": {...}, "reviewer": {...}},
+            "by_model": {"claude-sonnet-4-5-20250929": {...}}
+        }
+    """
+    try:
+        from src.presentation.web.routers.projects import _current_project_path
+
+        session_store = get_session_store(project_path=_current_project_path)
+        sessions = await session_store.list_sessions(status=status)
+
+        ledger = TokenLedger.aggregate(session.token_ledger for session in sessions)
+
+        logger.info(
+            f"토큰 사용량 집계: 세션 {len(sessions)}개, "
+            f"총 {ledger.total.total_tokens:,} 토큰"
+        )
+
+        return TokenLedgerResponse(session_count=len(sessions), **ledger.to_dict())
+
+    except Exception as e:
+        logger.error(f"토큰 사용량 집계 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"토큰 사용량 집계 실패: {str(e)}"
+        )
+
+
 @router.get("/{workflow_id}", response_model=Workflow)
 async def get_workflow(workflow_id: str) -> Workflow:
     """
@@ -512,7 +585,7 @@ async def delete_workflow(workflow_id: str) -> Dict[str, str]:
 @router.post("/validate", response_model=WorkflowValidateResponse)
 async def validate_workflow(
     workflow: Workflow,
-    config_loader: JsonConfigLoader = Depends(get_config_loader),
+    validator: WorkflowValidator = Depends(get_workflow_validator),
 ):
     """
     워크플로우 검증
@@ -525,9 +598,11 @@ async def validate_workflow(
     - Input 노드 존재 여부 검사
     - Manager 노드 검증
 
+    캔버스 편집마다 호출되므로 바뀐 노드/구조만 다시 검사합니다 (WorkflowValidator 캐시).
+
     Args:
         workflow: 검증할 워크플로우
-        config_loader: ConfigLoader 의존성 주입
+        validator: WorkflowValidator 의존성 주입 (싱글톤)
 
     Returns:
         WorkflowValidateResponse: 검증 결과
@@ -556,9 +631,6 @@ async def validate_workflow(
         }
     """
     try:
-        # WorkflowValidator 생성 (config_loader 전달하여 Worker 도구 목록 동적 로드)
-        validator = WorkflowValidator(config_loader=config_loader)
-
         # 워크플로우 검증
         validation_errors = validator.validate(workflow)
 
@@ -671,6 +743,244 @@ async def get_session(session_id: str) -> Dict[str, Any]:
         )
 
 
+@router.get("/sessions/{session_id}/token-usage", response_model=TokenLedgerResponse)
+async def get_session_token_usage(session_id: str) -> TokenLedgerResponse:
+    """
+    워크플로우 세션의 토큰 사용량 원장 조회
+
+    Args:
+        session_id: 세션 ID
+
+    Returns:
+        TokenLedgerResponse: 노드/Agent/모델별 토큰 사용량
+
+    Example:
+        GET /api/workflows/sessions/abc-123/token-usage
+
+        Response:
+        {
+            "session_id": "abc-123",
+            "session_count": 1,
+            "budget": 200000,
+            "total": {"input_tokens": 5200, "output_tokens": 1800, "total_tokens": 7000, ...},
+            "by_node": {"node-1": {...}, "node-2": {...}},
+            "by_agent": {"coder": {...}},
+            "by_model": {"claude-sonnet-4-5-20250929": {...}}
+        }
+    """
+    try:
+        from src.presentation.web.routers.projects import _current_project_path
+
+        session_store = get_session_store(project_path=_current_project_path)
+        session = await session_store.get_session(session_id)
+
+        # 현재 프로젝트에서 세션을 찾지 못하면, fallback 경로에서 시도
+        if not session:
+            fallback_store = get_session_store(project_path=None)
+            session = await fallback_store.get_session(session_id)
+
+        if not session:
+            raise HTTPException(
+                status_code=404,
+                detail=f"세션을 찾을 수 없습니다: {session_id}"
+            )
+
+        return TokenLedgerResponse(session_id=session_id, **session.token_ledger.to_dict())
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"토큰 사용량 조회 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"토큰 사용량 조회 실패: {str(e)}"
+        )
+
+
+@router.get("/sessions/{session_id}/blobs/{blob_ref}")
+async def get_session_blob(session_id: str, blob_ref: str) -> Response:
+    """
+    세션 blob 조회 (큰 노드 입력/출력 원문)
+
+    이벤트의 input/output이 미리보기로 잘린 경우(input_truncated/output_truncated),
+    input_ref/output_ref로 전체 내용을 조회합니다.
+    내용 주소 기반이므로 같은 참조의 내용은 변하지 않습니다 (장기 캐시 가능).
+
+    Args:
+        session_id: 세션 ID
+        blob_ref: blob 참조 (이벤트의 input_ref/output_ref, sha256 hex)
+
+    Returns:
+        Response: 원문 텍스트 (text/plain)
+
+    Example:
+        GET /api/workflows/sessions/abc-123/blobs/9f86d081884c7d65...
+    """
+    if not is_valid_blob_ref(blob_ref):
+        raise HTTPException(
+            status_code=400,
+            detail=f"잘못된 blob 참조입니다: {blob_ref}"
+        )
+
+    try:
+        from src.presentation.web.routers.projects import _current_project_path
+
+        text = await get_session_store(project_path=_current_project_path).blob_store.get(session_id, blob_ref)
+
+        # 현재 프로젝트에서 찾지 못하면, fallback 경로에서 시도
+        if text is None:
+            text = await get_session_store(project_path=None).blob_store.get(session_id, blob_ref)
+
+        if text is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"blob을 찾을 수 없습니다: {blob_ref}"
+            )
+
+        return Response(
+            content=text,
+            media_type="text/plain; charset=utf-8",
+            headers={
+                "ETag": f'"{blob_ref}"',
+                "Cache-Control": "private, max-age=31536000, immutable",
+            },
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"blob 조회 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"blob 조회 실패: {str(e)}"
+        )
+
+
+# 이 크기 이상의 이벤트 이력 응답만 gzip 압축 (작은 응답은 압축 이득보다 비용이 큼)
+_HISTORY_GZIP_MIN_BYTES = 1024
+
+
+@router.get("/sessions/{session_id}/events")
+async def get_session_events(
+    session_id: str,
+    request: Request,
+    start: int = 0,
+    end: Optional[int] = None,
+    node_id: Optional[str] = None,
+    event_type: Optional[str] = None,
+    format: str = "ndjson",
+) -> Response:
+    """
+    세션 이벤트 이력 일괄 조회 (재접속 시 빠른 복원용)
+
+    이벤트를 SSE로 하나씩 재생하는 대신 범위를 한 번에 반환합니다.
+    저장 시 인코딩된 이벤트 바이트를 그대로 이어 붙이므로 재직렬화가 없으며,
+    클라이언트가 gzip을 지원하면 압축하여 전송합니다.
+
+    응답 후에는 next_event_index - 1을 last_event_index로 지정하여
+    POST /execute (또는 GET /sessions/{session_id}/stream)로 실시간 이벤트를 이어받습니다.
+
+    Args:
+        session_id: 세션 ID
+        request: 요청 (Accept-Encoding 확인용)
+        start: 시작 이벤트 인덱스 (포함, 기본: 0)
+        end: 종료 이벤트 인덱스 (제외, 기본: 마지막까지)
+        node_id: 노드 ID 필터 (옵션, 범위 내에서 해당 노드 이벤트만)
+        event_type: 이벤트 타입 필터 (옵션, 쉼표로 여러 개 지정)
+        format: 응답 형식 ("ndjson": 한 줄에 이벤트 하나, "json": 객체)
+
+    Returns:
+        Response: 이벤트 이력
+            - ndjson: 이벤트 JSON을 줄 단위로 나열
+              (커서는 X-Next-Event-Index, X-Total-Events 헤더)
+            - json: {"events": [...], "next_event_index": N, "total_events": T}
+
+    Example:
+        GET /api/workflows/sessions/abc-123/events?start=0&format=ndjson
+        GET /api/workflows/sessions/abc-123/events?node_id=node-2&format=json
+    """
+    if format not in ("ndjson", "json"):
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 형식입니다: {format} (ndjson 또는 json)"
+        )
+    if start < 0 or (end is not None and end < start):
+        raise HTTPException(
+            status_code=400,
+            detail=f"잘못된 이벤트 범위입니다: start={start}, end={end}"
+        )
+
+    try:
+        from src.presentation.web.routers.projects import _current_project_path
+
+        session_store = get_session_store(project_path=_current_project_path)
+        session = await session_store.get_session(session_id)
+
+        # 현재 프로젝트에서 세션을 찾지 못하면, fallback 경로에서 시도
+        if not session:
+            fallback_store = get_session_store(project_path=None)
+            session = await fallback_store.get_session(session_id)
+
+        if not session:
+            raise HTTPException(
+                status_code=404,
+                detail=f"세션을 찾을 수 없습니다: {session_id}"
+            )
+
+        # 범위 선택 (저장 시 인코딩된 바이트 재사용)
+        total_events = len(session.logs)
+        next_event_index = total_events if end is None else min(end, total_events)
+        encoded_events = session.get_encoded_logs(start, next_event_index)
+
+        event_types = set(event_type.split(",")) if event_type else None
+        payloads = [
+            encoded_event.payload
+            for encoded_event in encoded_events
+            if (node_id is None or encoded_event.node_id == node_id)
+            and (event_types is None or encoded_event.event_type in event_types)
+        ]
+
+        if format == "ndjson":
+            body = b"\n".join(payloads) + (b"\n" if payloads else b"")
+            media_type = "application/x-ndjson"
+        else:
+            body = (
+                b'{"events":[' + b",".join(payloads) + b'],'
+                + f'"next_event_index":{next_event_index},"total_events":{total_events}}}'.encode()
+            )
+            media_type = "application/json"
+
+        headers = {
+            "X-Next-Event-Index": str(next_event_index),
+            "X-Total-Events": str(total_events),
+            "X-Event-Count": str(len(payloads)),
+            "Vary": "Accept-Encoding",
+        }
+
+        # gzip 압축 (클라이언트 지원 시)
+        uncompressed_size = len(body)
+        if "gzip" in request.headers.get("accept-encoding", "") and uncompressed_size >= _HISTORY_GZIP_MIN_BYTES:
+            body = await asyncio.to_thread(gzip.compress, body, 6)
+            headers["Content-Encoding"] = "gzip"
+
+        logger.info(
+            f"[{session_id}] 이벤트 이력 조회: {len(payloads)}개 "
+            f"(범위 {start}~{next_event_index}/{total_events}, {format}, "
+            f"{uncompressed_size} → {len(body)} bytes)"
+        )
+
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"이벤트 이력 조회 실패: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"이벤트 이력 조회 실패: {str(e)}"
+        )
+
+
 @router.post("/sessions/{session_id}/cancel")
 async def cancel_workflow_session(
     session_id: str,
@@ -902,9 +1212,9 @@ async def continue_node_conversation(
                     # 세션 저장소에도 저장
                     await bg_manager.session_store.append_log(new_session_id, event)
 
-                    logger.debug(
-                        f"노드 {node_id} 추가 대화 이벤트: {event.event_type} "
-                        f"({event.data.get('chunk_type', 'N/A')})"
+                    hot_logger.debug(
+                        "노드 %s 추가 대화 이벤트: %s (%s)",
+                        node_id, event.event_type, event.data.get('chunk_type', 'N/A')
                     )
 
                 # 완료 시 task 상태 및 세션 업데이트
@@ -1004,20 +1314,16 @@ async def stream_session_events(
                 yield {"data": json.dumps({"error": error_msg})}
                 return
 
-            # 이벤트 스트리밍
-            async for event in bg_manager.stream_events(session_id, start_from_index=0):
-                # 이벤트를 JSON 문자열로 변환
-                event_dict = {
-                    "event_type": event.event_type,
-                    "node_id": event.node_id,
-                    "data": event.data,
-                    "timestamp": event.timestamp,
-                }
-                yield {"data": json.dumps(event_dict)}
+            # 이벤트 스트리밍 (인코딩된 바이트를 SSE 프레임으로 그대로 전송)
+            async for encoded_event in bg_manager.stream_events(session_id, start_from_index=0):
+                yield encoded_event.sse_frame()
 
                 # 워크플로우 완료 또는 에러 시 종료
-                if event.event_type in ["workflow_complete", "workflow_error"]:
-                    logger.info(f"SSE 스트리밍 종료: session_id={session_id}, event={event.event_type}")
+                if encoded_event.event_type in ["workflow_complete", "workflow_error"]:
+                    logger.info(
+                        f"SSE 스트리밍 종료: session_id={session_id}, "
+                        f"event={encoded_event.event_type}"
+                    )
                     break
 
             # 종료 신호
@@ -1301,13 +1607,7 @@ def get_workflow_designer_config() -> AgentConfig:
         HTTPException: 설정 로드 실패 시
     """
     try:
-        config_loader = JsonConfigLoader(get_project_root())
-        agent_configs = config_loader.load_agent_configs()
-
-        config = next(
-            (cfg for cfg in agent_configs if cfg.name == "workflow_designer"),
-            None,
-        )
+        config = get_agent_registry().get_agent_config("workflow_designer")
 
         if not config:
             raise HTTPException(
@@ -1356,6 +1656,10 @@ async def _execute_workflow_designer(
         )
 
         async for chunk in worker.execute_task(requirements):
+            # 재시도 마커는 내부 제어용이므로 클라이언트로 전송하지 않음
+            if chunk.startswith("@EVENT:worker_retry:"):
+                logger.warning(f"[{session_id}] Worker 실행 재시도: {chunk[len('@EVENT:worker_retry:'):]}")
+                continue
             yield chunk
 
         logger.info(f"[{session_id}] workflow_designer 실행 완료")
@@ -10,6 +10,41 @@ from typing import List, Dict, Any, Optional, Union
 from pydantic import BaseModel, Field
 
 
+class InputBudgetConfig(BaseModel):
+    """
+    노드 입력 예산 (부모 출력 토큰 예산)
+
+    부모 출력의 추정 토큰 수 합계가 max_tokens를 넘으면 주입 전에 줄입니다.
+
+    Attributes:
+        max_tokens: 부모 출력 전체 예산 (로컬 추정 토큰 수)
+        strategy: 전략 ('head_tail', 'per_parent', 'summarize')
+        per_parent_tokens: 부모별 할당량 (옵션, 미지정 시 max_tokens / 부모 수)
+        head_ratio: 중략 시 앞부분 비율 (나머지는 뒷부분)
+        summary_model: summarize 전략에 사용할 저비용 모델 (옵션)
+    """
+    max_tokens: int = Field(..., gt=0, description="부모 출력 전체 예산 (추정 토큰 수)")
+    strategy: str = Field(
+        default="head_tail",
+        description="예산 전략 (head_tail, per_parent, summarize)"
+    )
+    per_parent_tokens: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="부모별 토큰 할당량 (옵션, 미지정 시 max_tokens / 부모 수)"
+    )
+    head_ratio: float = Field(
+        default=0.7,
+        ge=0,
+        le=1,
+        description="중략 시 앞부분 비율 (0~1)"
+    )
+    summary_model: Optional[str] = Field(
+        default=None,
+        description="summarize 전략에 사용할 모델 (옵션, 기본: haiku)"
+    )
+
+
 class WorkerNodeData(BaseModel):
     """
     Worker 노드의 데이터 (개별 Worker Agent)
@@ -20,6 +55,8 @@ class WorkerNodeData(BaseModel):
         allowed_tools: 사용 가능한 도구 목록 (옵션, 미지정 시 기본 설정 사용)
         thinking: Thinking 모드 활성화 여부 (ultrathink 프롬프트 추가, 옵션)
         parallel_execution: 자식 노드를 병렬로 실행할지 여부 (기본: false)
+        timeout: 노드 실행 제한 시간 (초, 옵션, 미지정 시 SDK 기본값 600초)
+        input_budget: 부모 출력 입력 예산 (옵션)
         config: 추가 설정 (옵션)
     """
     agent_name: str = Field(..., description="Worker Agent 이름")
@@ -39,6 +76,15 @@ class WorkerNodeData(BaseModel):
         default=False,
         description="자식 노드를 병렬로 실행할지 여부 (기본: false)"
     )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="노드 실행 제한 시간 (초, 옵션, 미지정 시 SDK 기본값 600초)"
+    )
+    input_budget: Optional[InputBudgetConfig] = Field(
+        default=None,
+        description="부모 출력 입력 예산 (옵션, 미지정 시 원문 그대로 주입)"
+    )
     config: Optional[Dict[str, Any]] = Field(
         default=None,
         description="추가 설정 (옵션)"
@@ -79,6 +125,7 @@ class ConditionNodeData(BaseModel):
         true_branch_id: True 경로 노드 ID
         false_branch_id: False 경로 노드 ID (옵션)
         max_iterations: 최대 반복 횟수 (옵션, 피드백 루프 제한용)
+        local_verdict: llm 조건에서 출력의 명시적 판정 마커(VERDICT: PASS/FAIL, 판정 전용 JSON)를 먼저 확인할지 여부 (기본: true)
         parallel_execution: 자식 노드를 병렬로 실행할지 여부 (기본: false)
     """
     condition_type: str = Field(
@@ -101,6 +148,10 @@ class ConditionNodeData(BaseModel):
         default=None,
         description="최대 반복 횟수 (None이면 반복 안함, 피드백 루프에서 무한 반복 방지)"
     )
+    local_verdict: Optional[bool] = Field(
+        default=True,
+        description="llm 조건: VERDICT: PASS/FAIL 마커나 판정 전용 JSON({\"pass\": true})이 출력에 있으면 LLM 호출 생략 (기본: true)"
+    )
     parallel_execution: Optional[bool] = Field(
         default=False,
         description="자식 노드를 병렬로 실행할지 여부 (기본: false)"
@@ -113,24 +164,43 @@ class MergeNodeData(BaseModel):
 
     병합 노드는 여러 분기의 출력을 하나로 통합합니다.
 
+    quorum 전략은 먼저 완료된 quorum개 분기만 완료 순서대로 결합하며,
+    quorum이 채워지면 아직 실행 중이거나 시작하지 않은 나머지 분기(이 병합 노드로만 이어지는 분기)는 취소됩니다.
+
     Attributes:
-        merge_strategy: 병합 전략 ('concatenate', 'first', 'last', 'custom')
-        separator: 결합 시 사용할 구분자 (concatenate 전략 시)
+        merge_strategy: 병합 전략 ('concatenate', 'first', 'last', 'custom', 'quorum')
+        separator: 결합 시 사용할 구분자 (concatenate, quorum 전략 시)
         custom_template: 커스텀 병합 템플릿 (옵션)
+        quorum: quorum 전략에서 기다릴 분기 수 (기본: 1)
+        stream_partial: 분기가 완료될 때마다 분기 출력 미리보기를 node_output 이벤트로 전송할지 여부 (최종 결과는 node_complete)
+        input_budget: 분기 출력 입력 예산 (옵션)
         parallel_execution: 자식 노드를 병렬로 실행할지 여부 (기본: false)
     """
     merge_strategy: str = Field(
         default="concatenate",
-        description="병합 전략 (concatenate, first, last, custom)"
+        description="병합 전략 (concatenate, first, last, custom, quorum)"
     )
     separator: str = Field(
         default="\n\n---\n\n",
-        description="결합 시 사용할 구분자 (concatenate 전략 시)"
+        description="결합 시 사용할 구분자 (concatenate, quorum 전략 시)"
     )
     custom_template: Optional[str] = Field(
         default=None,
         description="커스텀 병합 템플릿 ({{branch_1}}, {{branch_2}} 등)"
     )
+    quorum: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="quorum 전략: 먼저 완료된 N개 분기만 병합하고 나머지 분기는 취소 (기본: 1)"
+    )
+    stream_partial: Optional[bool] = Field(
+        default=False,
+        description="분기가 완료될 때마다 완료 순서대로 분기 출력 미리보기 전송 (node_output, chunk_type: merge_partial, 최종 결과는 node_complete의 output)"
+    )
+    input_budget: Optional[InputBudgetConfig] = Field(
+        default=None,
+        description="분기 출력 입력 예산 (옵션, 미지정 시 원문 그대로 병합)"
+    )
     parallel_execution: Optional[bool] = Field(
         default=False,
         description="자식 노드를 병렬로 실행할지 여부 (기본: false)"
@@ -238,6 +308,8 @@ class WorkflowExecuteRequest(BaseModel):
         start_node_id: 시작 노드 ID (옵션, Input 노드 선택)
         session_id: 세션 ID (옵션)
         last_event_index: 마지막 수신 이벤트 인덱스 (재접속 시 중복 방지용, 옵션)
+        timeout: 워크플로우 전체 실행 제한 시간 (초, 옵션)
+        token_budget: 워크플로우 전체 토큰 예산 (입력+출력, 옵션)
     """
     workflow: Workflow = Field(..., description="실행할 워크플로우")
     initial_input: str = Field(
@@ -256,6 +328,64 @@ class WorkflowExecuteRequest(BaseModel):
         default=None,
         description="마지막 수신 이벤트 인덱스 (재접속 시 중복 방지용, 0부터 시작)"
     )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="워크플로우 전체 실행 제한 시간 (초, 옵션, 미지정 시 제한 없음)"
+    )
+    token_budget: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="워크플로우 전체 토큰 예산 (입력+출력, 초과 시 실행 중단, 미지정 시 제한 없음)"
+    )
+
+
+class WorkflowBatchRequest(BaseModel):
+    """
+    워크플로우 배치 실행 요청 (같은 워크플로우를 여러 입력에 대해 실행)
+
+    Attributes:
+        workflow_name: 실행할 저장된 프로젝트 워크플로우 이름 (workflow와 둘 중 하나)
+        workflow: 실행할 워크플로우 (workflow_name과 둘 중 하나)
+        inputs: 초기 입력 목록 (항목마다 별도 세션으로 실행)
+        concurrency: 최대 동시 실행 수
+        start_node_id: 시작 노드 ID (옵션, Input 노드 선택)
+        timeout: 항목별 실행 제한 시간 (초, 옵션)
+        token_budget: 항목별 토큰 예산 (입력+출력, 옵션)
+    """
+    workflow_name: Optional[str] = Field(
+        default=None,
+        description="저장된 프로젝트 워크플로우 이름 (workflow 미지정 시 사용)"
+    )
+    workflow: Optional[Workflow] = Field(
+        default=None,
+        description="실행할 워크플로우 (workflow_name보다 우선)"
+    )
+    inputs: List[str] = Field(
+        ...,
+        min_length=1,
+        description="초기 입력 목록 (항목마다 별도 세션으로 실행)"
+    )
+    concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="최대 동시 실행 수"
+    )
+    start_node_id: Optional[str] = Field(
+        default=None,
+        description="시작 노드 ID (옵션, 지정 시 해당 Input 노드에서만 시작)"
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="항목별 실행 제한 시간 (초, 옵션, 미지정 시 제한 없음)"
+    )
+    token_budget: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="항목별 토큰 예산 (입력+출력, 초과 시 해당 항목 중단, 미지정 시 제한 없음)"
+    )
 
 
 class WorkflowExecuteResponse(BaseModel):
@@ -314,11 +444,63 @@ class TokenUsage(BaseModel):
     Attributes:
         input_tokens: 입력 토큰 수
         output_tokens: 출력 토큰 수
-        total_tokens: 전체 토큰 수
+        total_tokens: 전체 토큰 수 (입력 + 출력)
+        cache_read_tokens: 캐시에서 읽은 입력 토큰 수
+        cache_creation_tokens: 캐시 생성 입력 토큰 수
+        cost_usd: 비용 (USD, SDK가 제공하는 경우)
     """
     input_tokens: int = Field(default=0, description="입력 토큰 수")
     output_tokens: int = Field(default=0, description="출력 토큰 수")
     total_tokens: int = Field(default=0, description="전체 토큰 수")
+    cache_read_tokens: int = Field(default=0, description="캐시에서 읽은 입력 토큰 수")
+    cache_creation_tokens: int = Field(default=0, description="캐시 생성 입력 토큰 수")
+    cost_usd: Optional[float] = Field(default=None, description="비용 (USD, SDK가 제공하는 경우)")
+
+
+class TokenUsageTotals(BaseModel):
+    """
+    토큰 사용량 누적값 (원장 집계 단위)
+
+    Attributes:
+        input_tokens: 입력 토큰 수
+        output_tokens: 출력 토큰 수
+        cache_read_tokens: 캐시에서 읽은 입력 토큰 수
+        cache_creation_tokens: 캐시 생성 입력 토큰 수
+        total_tokens: 전체 토큰 수 (입력 + 출력)
+        cache_hit_ratio: 프롬프트 캐시 적중률 (캐시 읽기 / 전체 입력)
+        cost_usd: 누적 비용 (USD)
+        calls: 누적된 노드 실행 횟수
+    """
+    input_tokens: int = Field(default=0, description="입력 토큰 수")
+    output_tokens: int = Field(default=0, description="출력 토큰 수")
+    cache_read_tokens: int = Field(default=0, description="캐시에서 읽은 입력 토큰 수")
+    cache_creation_tokens: int = Field(default=0, description="캐시 생성 입력 토큰 수")
+    total_tokens: int = Field(default=0, description="전체 토큰 수 (입력 + 출력)")
+    cache_hit_ratio: float = Field(default=0.0, description="프롬프트 캐시 적중률 (캐시 읽기 / 전체 입력)")
+    cost_usd: float = Field(default=0.0, description="누적 비용 (USD)")
+    calls: int = Field(default=0, description="누적된 노드 실행 횟수")
+
+
+class TokenLedgerResponse(BaseModel):
+    """
+    토큰 사용량 원장 응답
+
+    Attributes:
+        session_id: 세션 ID (프로젝트 집계 시 None)
+        session_count: 집계된 세션 수
+        budget: 토큰 예산 (세션 조회 시, 미설정이면 None)
+        total: 전체 누적값
+        by_node: 노드별 누적값 (세션 조회 시에만 제공)
+        by_agent: Agent별 누적값
+        by_model: 모델별 누적값
+    """
+    session_id: Optional[str] = Field(default=None, description="세션 ID (프로젝트 집계 시 None)")
+    session_count: int = Field(default=1, description="집계된 세션 수")
+    budget: Optional[int] = Field(default=None, description="토큰 예산 (미설정이면 None)")
+    total: TokenUsageTotals = Field(..., description="전체 누적값")
+    by_node: Dict[str, TokenUsageTotals] = Field(default_factory=dict, description="노드별 누적값")
+    by_agent: Dict[str, TokenUsageTotals] = Field(default_factory=dict, description="Agent별 누적값")
+    by_model: Dict[str, TokenUsageTotals] = Field(default_factory=dict, description="모델별 누적값")
 
 
 class WorkflowNodeExecutionEvent(BaseModel):
@@ -326,9 +508,12 @@ class WorkflowNodeExecutionEvent(BaseModel):
     워크플로우 노드 실행 이벤트 (SSE)
 
     Attributes:
-        event_type: 이벤트 타입 (node_start, node_output, node_complete, node_error)
+        event_type: 이벤트 타입 (node_start, node_output, node_complete, node_error, node_retry, node_timeout, node_cancelled, token_budget_exceeded)
         node_id: 노드 ID
         data: 이벤트 데이터
+            (큰 input/output은 미리보기로 잘리고 {key}_ref, {key}_length, {key}_truncated가 추가됨,
+            원문은 GET /api/workflows/sessions/{session_id}/blobs/{ref}로 조회,
+            input_budget이 설정된 노드의 node_start에는 예산 결정 내역 input_budget이 포함됨)
         timestamp: 이벤트 발생 시각 (ISO 8601)
         elapsed_time: 노드 실행 경과 시간 (초)
         token_usage: 토큰 사용량 정보
@@ -598,9 +783,55 @@ class LogContentResponse(BaseModel):
     Attributes:
         content: 로그 파일 내용
         file_info: 파일 정보
+        start_offset: 내용 시작 바이트 오프셋 (이전 페이지 조회 시 before로 사용)
+        end_offset: 내용 끝 바이트 오프셋 (다음 페이지/follow 시 after/offset으로 사용)
+        has_more_before: 앞쪽에 더 읽을 내용이 있는지 여부
+        has_more_after: 뒤쪽에 더 읽을 내용이 있는지 여부
     """
     content: str = Field(..., description="로그 파일 내용")
     file_info: LogFileInfo = Field(..., description="파일 정보")
+    start_offset: int = Field(0, description="내용 시작 바이트 오프셋")
+    end_offset: int = Field(0, description="내용 끝 바이트 오프셋")
+    has_more_before: bool = Field(False, description="앞쪽에 더 읽을 내용이 있는지 여부")
+    has_more_after: bool = Field(False, description="뒤쪽에 더 읽을 내용이 있는지 여부")
+
+
+class LogQueryEntry(BaseModel):
+    """
+    로그 검색 결과 레코드
+
+    Attributes:
+        file: 로그 파일 상대 경로 (logs/ 기준)
+        offset: 레코드 시작 바이트 오프셋 (logs/content의 before/after 커서로 사용 가능)
+        timestamp: 타임스탬프 (ISO 8601)
+        level: 로그 레벨
+        session_id: 세션 ID
+        node_id: 노드 ID
+        line: 레코드 내용
+    """
+    file: str = Field(..., description="로그 파일 상대 경로")
+    offset: int = Field(..., description="레코드 시작 바이트 오프셋")
+    timestamp: str = Field(..., description="타임스탬프 (ISO 8601)")
+    level: str = Field(..., description="로그 레벨")
+    session_id: Optional[str] = Field(None, description="세션 ID")
+    node_id: Optional[str] = Field(None, description="노드 ID")
+    line: str = Field(..., description="레코드 내용")
+
+
+class LogQueryResponse(BaseModel):
+    """
+    로그 검색 응답
+
+    Attributes:
+        entries: 검색 결과 (최신순)
+        truncated: limit에서 잘렸는지 여부 (마지막 timestamp를 until로 다시 조회)
+        files: 검색한 로그 파일 목록
+        elapsed_ms: 검색 소요 시간 (밀리초)
+    """
+    entries: List[LogQueryEntry] = Field(..., description="검색 결과 (최신순)")
+    truncated: bool = Field(..., description="limit에서 잘렸는지 여부")
+    files: List[str] = Field(..., description="검색한 로그 파일 목록")
+    elapsed_ms: float = Field(..., description="검색 소요 시간 (밀리초)")
 
 
 class SessionContentResponse(BaseModel):
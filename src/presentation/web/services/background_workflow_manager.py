@@ -6,24 +6,33 @@
 """
 
 import asyncio
-from typing import Dict, Optional, AsyncIterator, Any
+import time
+import uuid
+from typing import Dict, List, Optional, AsyncIterator, Any
 from dataclasses import dataclass, field
 from collections import deque
 from datetime import datetime
 
-from src.infrastructure.logging import get_logger
+from src.infrastructure.logging import get_logger, get_hot_path_logger
+from src.infrastructure.metrics import WORKFLOWS, SSE_SUBSCRIBERS, SSE_LAG_EVENTS
 from src.presentation.web.schemas.workflow import (
     Workflow,
     WorkflowNodeExecutionEvent,
 )
 from src.presentation.web.services.workflow_executor import WorkflowExecutor
+from src.presentation.web.services.event_codec import EncodedEvent
+from src.presentation.web.services.workflow_batch import BatchItem, WorkflowBatch
 from src.presentation.web.services.workflow_session_store import (
     get_session_store,
+    WorkflowSession,
     WorkflowSessionStore,
 )
 
 logger = get_logger(__name__)
 
+# 이벤트 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
+
 
 @dataclass
 class BackgroundWorkflowTask:
@@ -56,6 +65,7 @@ class BackgroundWorkflowManager:
         executor: WorkflowExecutor 인스턴스
         session_store: WorkflowSessionStore 인스턴스
         tasks: 세션 ID → BackgroundWorkflowTask 매핑
+        batches: 배치 ID → WorkflowBatch 매핑
     """
 
     def __init__(
@@ -73,6 +83,7 @@ class BackgroundWorkflowManager:
         self.executor = executor
         self.session_store = session_store or get_session_store()
         self.tasks: Dict[str, BackgroundWorkflowTask] = {}
+        self.batches: Dict[str, WorkflowBatch] = {}
 
         logger.info("백그라운드 워크플로우 관리자 초기화")
 
@@ -83,6 +94,9 @@ class BackgroundWorkflowManager:
         initial_input: str,
         project_path: Optional[str] = None,
         start_node_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        isolate_node_sessions: bool = False,
     ) -> None:
         """
         워크플로우를 백그라운드 Task로 시작
@@ -93,6 +107,9 @@ class BackgroundWorkflowManager:
             initial_input: 초기 입력
             project_path: 프로젝트 디렉토리 경로 (세션별 로그 저장용)
             start_node_id: 시작 노드 ID (옵션, 지정 시 해당 Input 노드에서만 시작)
+            timeout: 워크플로우 전체 실행 제한 시간 (초, 옵션)
+            token_budget: 워크플로우 전체 토큰 예산 (옵션, 초과 시 실행 중단)
+            isolate_node_sessions: 노드 세션을 재개/저장하지 않음 (배치 실행용)
 
         Raises:
             ValueError: 이미 실행 중인 세션인 경우
@@ -111,7 +128,10 @@ class BackgroundWorkflowManager:
 
         # 백그라운드 Task 생성 (project_path, start_node_id 전달)
         task = asyncio.create_task(
-            self._run_workflow(session_id, workflow, initial_input, project_path, start_node_id)
+            self._run_workflow(
+                session_id, workflow, initial_input, project_path,
+                start_node_id, timeout, token_budget, isolate_node_sessions
+            )
         )
 
         # Task 등록
@@ -127,6 +147,9 @@ class BackgroundWorkflowManager:
         initial_input: str,
         project_path: Optional[str] = None,
         start_node_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        isolate_node_sessions: bool = False,
     ) -> None:
         """
         워크플로우 실행 (백그라운드 Task 내부)
@@ -137,6 +160,9 @@ class BackgroundWorkflowManager:
             initial_input: 초기 입력
             project_path: 프로젝트 디렉토리 경로 (세션별 로그 저장용)
             start_node_id: 시작 노드 ID (옵션, 지정 시 해당 Input 노드에서만 시작)
+            timeout: 워크플로우 전체 실행 제한 시간 (초, 옵션)
+            token_budget: 워크플로우 전체 토큰 예산 (옵션, 초과 시 실행 중단)
+            isolate_node_sessions: 노드 세션을 재개/저장하지 않음 (배치 실행용)
         """
         bg_task = self.tasks[session_id]
 
@@ -152,6 +178,9 @@ class BackgroundWorkflowManager:
                 session_id=session_id,
                 project_path=project_path,
                 start_node_id=start_node_id,
+                timeout=timeout,
+                token_budget=token_budget,
+                isolate_node_sessions=isolate_node_sessions,
             ):
                 # 이벤트를 큐에 저장
                 bg_task.event_queue.append(event)
@@ -159,9 +188,9 @@ class BackgroundWorkflowManager:
                 # 세션 저장소에도 기록
                 await self.session_store.append_log(session_id, event)
 
-                logger.debug(
-                    f"[{session_id}] 이벤트 큐에 추가: {event.event_type} "
-                    f"(큐 크기: {len(bg_task.event_queue)})"
+                hot_logger.debug(
+                    "[%s] 이벤트 큐에 추가: %s (큐 크기: %d)",
+                    session_id, event.event_type, len(bg_task.event_queue)
                 )
 
             # 완료 처리
@@ -203,18 +232,19 @@ class BackgroundWorkflowManager:
         self,
         session_id: str,
         start_from_index: int = 0,
-    ) -> AsyncIterator[WorkflowNodeExecutionEvent]:
+    ) -> AsyncIterator[EncodedEvent]:
         """
         세션의 이벤트 스트리밍 (세션 저장소 기반 + 실시간 폴링)
 
         새로고침 후 재접속 시에도 중복 없이 이벤트를 이어받을 수 있습니다.
+        이벤트는 발행 시점에 인코딩된 바이트를 그대로 재사용합니다 (pydantic 재검증 없음).
 
         Args:
             session_id: 세션 ID
             start_from_index: 시작 이벤트 인덱스 (0부터 시작, 기본값 0)
 
         Yields:
-            WorkflowNodeExecutionEvent: 노드 실행 이벤트
+            EncodedEvent: 인코딩된 노드 실행 이벤트
 
         Raises:
             ValueError: 세션을 찾을 수 없는 경우
@@ -224,6 +254,30 @@ class BackgroundWorkflowManager:
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
 
+        SSE_SUBSCRIBERS.inc()
+        try:
+            async for encoded_event in self._stream_session_events(session, start_from_index):
+                yield encoded_event
+        finally:
+            SSE_SUBSCRIBERS.dec()
+
+    async def _stream_session_events(
+        self,
+        session: WorkflowSession,
+        start_from_index: int,
+    ) -> AsyncIterator[EncodedEvent]:
+        """
+        stream_events 본문 (구독자 수 메트릭은 호출자에서 관리)
+
+        Args:
+            session: 세션
+            start_from_index: 시작 이벤트 인덱스
+
+        Yields:
+            EncodedEvent: 인코딩된 노드 실행 이벤트
+        """
+        session_id = session.session_id
+
         # 백그라운드 Task 확인 (실시간 폴링 여부 결정)
         bg_task = self.tasks.get(session_id)
         is_task_running = bg_task is not None and not bg_task.completed
@@ -236,11 +290,10 @@ class BackgroundWorkflowManager:
         )
 
         # 1. 세션 저장소에서 기존 이벤트 전송 (start_from_index 이후)
-        existing_logs = session.logs[start_from_index:]
-        for log_entry in existing_logs:
-            # Dict → WorkflowNodeExecutionEvent 변환
-            event = WorkflowNodeExecutionEvent(**log_entry)
-            yield event
+        existing_logs = session.get_encoded_logs(start_from_index)
+        SSE_LAG_EVENTS.observe(len(existing_logs))
+        for encoded_event in existing_logs:
+            yield encoded_event
 
         sent_count = start_from_index + len(existing_logs)
         logger.info(
@@ -259,14 +312,11 @@ class BackgroundWorkflowManager:
                     logger.warning(f"[{session_id}] 세션이 삭제되었습니다. 스트리밍 중단")
                     break
 
-                current_log_count = len(session.logs)
-
                 # 새 이벤트가 있으면 전송
-                if current_log_count > sent_count:
-                    new_logs = session.logs[sent_count:]
-                    for log_entry in new_logs:
-                        event = WorkflowNodeExecutionEvent(**log_entry)
-                        yield event
+                if len(session.logs) > sent_count:
+                    SSE_LAG_EVENTS.observe(len(session.logs) - sent_count)
+                    for encoded_event in session.get_encoded_logs(sent_count):
+                        yield encoded_event
                         sent_count += 1
 
                 # 짧은 대기 (CPU 사용률 최소화)
@@ -275,10 +325,8 @@ class BackgroundWorkflowManager:
             # 3. 완료 후 남은 이벤트 전송 (race condition 방지)
             session = await self.session_store.get_session(session_id)
             if session:
-                final_logs = session.logs[sent_count:]
-                for log_entry in final_logs:
-                    event = WorkflowNodeExecutionEvent(**log_entry)
-                    yield event
+                for encoded_event in session.get_encoded_logs(sent_count):
+                    yield encoded_event
 
                 logger.info(
                     f"[{session_id}] 실시간 폴링 완료 "
@@ -290,6 +338,196 @@ class BackgroundWorkflowManager:
                 f"(상태: {session.status})"
             )
 
+    async def start_batch(
+        self,
+        workflow: Workflow,
+        inputs: List[str],
+        concurrency: int = 4,
+        project_path: Optional[str] = None,
+        start_node_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        token_budget: Optional[int] = None,
+    ) -> WorkflowBatch:
+        """
+        배치 실행 시작 (같은 워크플로우를 여러 입력에 대해 실행)
+
+        항목마다 별도 세션으로 실행하며, 동시에 실행되는 항목 수를 concurrency로 제한합니다.
+        모든 항목이 같은 executor와 Workflow 객체를 공유하므로 실행 계획, Agent 설정,
+        시스템 프롬프트 캐시를 재사용합니다. 항목 간 대화 컨텍스트가 섞이지 않도록 노드 세션은 격리합니다.
+
+        Args:
+            workflow: 실행할 워크플로우
+            inputs: 초기 입력 목록
+            concurrency: 최대 동시 실행 수
+            project_path: 프로젝트 디렉토리 경로
+            start_node_id: 시작 노드 ID (옵션)
+            timeout: 항목별 실행 제한 시간 (초, 옵션)
+            token_budget: 항목별 토큰 예산 (옵션)
+
+        Returns:
+            WorkflowBatch: 시작된 배치
+        """
+        batch_id = str(uuid.uuid4())
+        batch = WorkflowBatch(
+            batch_id=batch_id,
+            workflow=workflow,
+            items=[
+                BatchItem(index=index, input=initial_input, session_id=f"{batch_id}-{index}")
+                for index, initial_input in enumerate(inputs)
+            ],
+            concurrency=concurrency,
+            project_path=project_path,
+            start_node_id=start_node_id,
+            timeout=timeout,
+            token_budget=token_budget,
+        )
+        self.batches[batch_id] = batch
+        batch.task = asyncio.create_task(self._run_batch(batch))
+
+        logger.info(
+            f"[batch:{batch_id}] 배치 실행 시작: {workflow.name} "
+            f"(입력: {len(inputs)}개, 동시 실행: {concurrency})"
+        )
+        return batch
+
+    async def _run_batch(self, batch: WorkflowBatch) -> None:
+        """배치 실행 (동시 실행 수 제한, 배치 Task 내부)"""
+        semaphore = asyncio.Semaphore(batch.concurrency)
+
+        async def run_item(item: BatchItem) -> None:
+            async with semaphore:
+                await self._run_batch_item(batch, item)
+
+        try:
+            await asyncio.gather(*(run_item(item) for item in batch.items))
+            batch.status = "completed"
+            logger.info(
+                f"[batch:{batch.batch_id}] 배치 실행 완료 "
+                f"(완료: {batch.count('completed')}, 실패: {batch.count('error')})"
+            )
+        except asyncio.CancelledError:
+            batch.status = "cancelled"
+            for item in batch.items:
+                if item.status == "queued":
+                    item.status = "cancelled"
+            logger.info(f"[batch:{batch.batch_id}] 배치 실행 취소")
+            raise
+        finally:
+            batch.ended_at = datetime.now().isoformat()
+            batch.notify()
+
+    async def _run_batch_item(self, batch: WorkflowBatch, item: BatchItem) -> None:
+        """
+        배치 항목 하나 실행 (세션 생성 → 백그라운드 실행 → 결과 수집)
+
+        항목 실패는 항목 상태로만 기록하고 배치는 계속 진행합니다.
+        """
+        session_id = item.session_id
+        session_store = self.session_store
+
+        item.status = "running"
+        item.started_at = datetime.now().isoformat()
+        started_at = time.perf_counter()
+        batch.notify()
+
+        try:
+            await session_store.create_session(
+                session_id=session_id,
+                workflow=batch.workflow,
+                initial_input=item.input,
+                project_path=batch.project_path,
+                token_budget=batch.token_budget,
+            )
+            await self.start_workflow(
+                session_id=session_id,
+                workflow=batch.workflow,
+                initial_input=item.input,
+                project_path=batch.project_path,
+                start_node_id=batch.start_node_id,
+                timeout=batch.timeout,
+                token_budget=batch.token_budget,
+                isolate_node_sessions=True,
+            )
+
+            bg_task = self.tasks[session_id]
+            try:
+                await bg_task.task
+            except asyncio.CancelledError:
+                if not bg_task.task.cancelled():
+                    raise  # 배치 자체가 취소된 경우
+                item.status = "cancelled"  # 항목 세션만 개별 취소된 경우
+            else:
+                session = await session_store.get_session(session_id)
+                if session is not None:
+                    item.outputs = {
+                        node_id: session.node_outputs[node_id]
+                        for node_id in self._sink_node_ids(batch.workflow)
+                        if node_id in session.node_outputs
+                    }
+                    item.total_tokens = session.token_ledger.total.total_tokens
+                    item.error = bg_task.error or session.error
+                    if bg_task.error or session.status == "error":
+                        item.status = "error"
+                    elif session.status == "cancelled":
+                        item.status = "cancelled"
+                    else:
+                        item.status = "completed"
+                else:
+                    item.error = bg_task.error
+                    item.status = "error" if bg_task.error else "completed"
+
+        except asyncio.CancelledError:
+            item.status = "cancelled"
+            bg_task = self.tasks.get(session_id)
+            if bg_task is not None and not bg_task.completed:
+                await self.cancel_workflow(session_id)
+            raise
+
+        except Exception as e:
+            logger.error(f"[batch:{batch.batch_id}] 항목 {item.index} 실행 실패: {e}", exc_info=True)
+            item.status = "error"
+            item.error = str(e)
+
+        finally:
+            item.ended_at = datetime.now().isoformat()
+            item.elapsed_time = time.perf_counter() - started_at
+            batch.notify()
+
+    @staticmethod
+    def _sink_node_ids(workflow: Workflow) -> List[str]:
+        """종단 노드 ID 목록 (자식이 없는 Input 이외의 노드, 배치 결과로 내보낼 출력)"""
+        sources = {edge.source for edge in workflow.edges}
+        return [
+            node.id for node in workflow.nodes
+            if node.id not in sources and node.type != "input"
+        ]
+
+    async def cancel_batch(self, batch_id: str) -> WorkflowBatch:
+        """
+        배치 취소 (대기 중인 항목은 실행하지 않고, 실행 중인 항목은 취소)
+
+        Args:
+            batch_id: 배치 ID
+
+        Returns:
+            WorkflowBatch: 취소된 배치
+
+        Raises:
+            ValueError: 배치를 찾을 수 없는 경우
+        """
+        batch = self.batches.get(batch_id)
+        if batch is None:
+            raise ValueError(f"배치를 찾을 수 없습니다: {batch_id}")
+
+        if batch.task is not None and not batch.task.done():
+            batch.task.cancel()
+            try:
+                await batch.task
+            except asyncio.CancelledError:
+                pass
+
+        return batch
+
     def get_task_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
         Task 상태 조회
@@ -381,6 +619,15 @@ class BackgroundWorkflowManager:
             removed_count += 1
             logger.info(f"[{session_id}] 완료된 Task 정리 (메모리 절약)")
 
+        # 종료된 배치 제거
+        for batch_id in [
+            batch_id for batch_id, batch in self.batches.items()
+            if batch.completed and batch.ended_at
+            and (now - datetime.fromisoformat(batch.ended_at)).total_seconds() > max_age_seconds
+        ]:
+            del self.batches[batch_id]
+            logger.info(f"[batch:{batch_id}] 종료된 배치 정리 (메모리 절약)")
+
         return removed_count
 
 
@@ -388,6 +635,28 @@ class BackgroundWorkflowManager:
 _managers: Dict[str, BackgroundWorkflowManager] = {}
 
 
+def _collect_workflow_counts() -> Dict[tuple, float]:
+    """관리자별 워크플로우 상태 집계 (메트릭 수집 시점에 호출)"""
+    counts: Dict[tuple, float] = {}
+    for project, manager in _managers.items():
+        for bg_task in manager.tasks.values():
+            if not bg_task.completed:
+                state = "running"
+            elif bg_task.error:
+                state = "failed"
+            else:
+                state = "completed"
+            counts[(project, state)] = counts.get((project, state), 0) + 1
+        # 배치에서 동시 실행 슬롯을 기다리는 항목
+        queued = sum(batch.count("queued") for batch in manager.batches.values())
+        if queued:
+            counts[(project, "queued")] = counts.get((project, "queued"), 0) + queued
+    return counts
+
+
+WORKFLOWS.set_function(_collect_workflow_counts)
+
+
 def get_background_workflow_manager(
     executor: Optional[WorkflowExecutor] = None,
     project_path: Optional[str] = None,
@@ -0,0 +1,132 @@
+"""
+세션 Blob 저장소 (내용 주소 기반)
+
+큰 노드 입력/출력(Merge 노드의 병합 입력, Condition/Merge 노드 출력 등)을
+세션별 blob 영역에 한 번만 저장하고, 이벤트에는 참조(sha256), 미리보기, 길이만 담습니다.
+같은 내용은 같은 해시로 저장되므로 여러 이벤트가 참조해도 파일은 하나입니다.
+
+저장 경로: {sessions_dir}/blobs/{session_id}/{sha256}
+"""
+
+import hashlib
+import re
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiofiles
+
+# 이 길이(문자 수) 이상인 값만 blob으로 분리
+BLOB_THRESHOLD = 8 * 1024
+
+# 이벤트에 포함할 미리보기 길이 (문자 수)
+BLOB_PREVIEW_LENGTH = 2000
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def is_valid_blob_ref(digest: str) -> bool:
+    """blob 참조(sha256 hex) 형식 검증 (경로 탐색 방지)"""
+    return bool(_DIGEST_RE.match(digest))
+
+
+class SessionBlobStore:
+    """
+    세션별 내용 주소 기반 blob 저장소
+
+    Attributes:
+        blobs_dir: blob 루트 디렉토리
+    """
+
+    def __init__(self, blobs_dir: Path):
+        self.blobs_dir = blobs_dir
+
+    def _get_blob_path(self, session_id: str, digest: str) -> Path:
+        return self.blobs_dir / session_id / digest
+
+    async def put(self, session_id: str, text: str) -> str:
+        """
+        텍스트 저장 (이미 있으면 쓰지 않음)
+
+        Args:
+            session_id: 세션 ID
+            text: 저장할 텍스트
+
+        Returns:
+            str: blob 참조 (sha256 hex)
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._get_blob_path(session_id, digest)
+
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 쓴 뒤 rename (읽는 쪽이 불완전한 파일을 보지 않도록)
+            # 같은 내용을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않도록 쓰기마다 고유한 이름 사용
+            tmp_path = blob_path.with_name(f"{digest}.{uuid.uuid4().hex}.tmp")
+            try:
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    await f.write(data)
+                tmp_path.replace(blob_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        return digest
+
+    async def get(self, session_id: str, digest: str) -> Optional[str]:
+        """
+        blob 조회
+
+        Args:
+            session_id: 세션 ID
+            digest: blob 참조 (sha256 hex)
+
+        Returns:
+            Optional[str]: 텍스트 (없거나 참조 형식이 잘못되면 None)
+        """
+        if not is_valid_blob_ref(digest):
+            return None
+
+        blob_path = self._get_blob_path(session_id, digest)
+        if not blob_path.exists():
+            return None
+
+        async with aiofiles.open(blob_path, "rb") as f:
+            data = await f.read()
+        return data.decode("utf-8")
+
+    def delete_session(self, session_id: str) -> None:
+        """세션의 blob 영역 삭제"""
+        session_dir = self.blobs_dir / session_id
+        if session_dir.exists():
+            shutil.rmtree(session_dir)
+
+    async def externalize(self, session_id: str, data: Dict[str, Any], key: str) -> bool:
+        """
+        이벤트 데이터의 큰 문자열 값을 blob으로 분리
+
+        data[key]는 미리보기로 바꾸고, 참조/길이를 함께 기록합니다.
+        - {key}: 미리보기 (앞부분 BLOB_PREVIEW_LENGTH자)
+        - {key}_ref: blob 참조 (sha256 hex)
+        - {key}_length: 전체 길이 (문자 수)
+        - {key}_truncated: True
+
+        Args:
+            session_id: 세션 ID
+            data: 이벤트 데이터 (직접 수정됨)
+            key: 대상 키 (예: "input", "output")
+
+        Returns:
+            bool: 분리 여부 (값이 없거나 작으면 False)
+        """
+        value = data.get(key)
+        if not isinstance(value, str) or len(value) < BLOB_THRESHOLD:
+            return False
+
+        data[f"{key}_ref"] = await self.put(session_id, value)
+        data[f"{key}_length"] = len(value)
+        data[f"{key}_truncated"] = True
+        data[key] = value[:BLOB_PREVIEW_LENGTH]
+        return True
@@ -0,0 +1,416 @@
+"""
+조건 노드 컴파일러
+
+조건(condition_type, condition_value)을 한 번만 파싱하여 평가 함수로 컴파일합니다.
+같은 조건은 캐시된 컴파일 결과를 재사용하므로, 피드백 루프에서 반복 평가해도
+정규표현식 컴파일/표현식 파싱이 다시 일어나지 않습니다.
+
+조건 타입:
+- contains: 텍스트 포함 여부
+- regex: 정규표현식 검색 (미리 컴파일)
+- length: 길이 비교 (예: ">100", "<=500", "==0", "42")
+- custom: 제한된 표현식 (eval 미사용, AST 검증 후 직접 해석)
+
+custom 표현식에서 사용 가능한 항목:
+- 이름: output (부모 출력), data (출력을 JSON으로 파싱한 값, 실패 시 None)
+- 함수: len, str, int, float, bool, abs, min, max, any, all,
+  number(text=output) (첫 번째 숫자, 없으면 None), json_path(path) (예: "result.items[0].status")
+- 문자열 메서드: lower, upper, strip, startswith, endswith, count, find, split, splitlines
+- 연산: and/or/not, 비교(==, !=, <, <=, >, >=, in, not in, is None), 산술, 인덱싱, 조건식(a if c else b)
+
+Example:
+    >>> compile_condition("custom", "'PASS' in output and len(output) > 10").evaluate("...PASS...")
+    >>> compile_condition("custom", "json_path('summary.failed') == 0").evaluate('{"summary": {"failed": 0}}')
+"""
+
+import ast
+import json
+import operator
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+CONDITION_TYPES = ("contains", "regex", "length", "custom")
+
+# 출력 안의 ```json 코드 블록
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*\n(.*?)```", re.DOTALL)
+
+# 숫자 (정수/소수, 부호 포함)
+_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+
+# json_path 경로 토큰: 키 또는 [인덱스]
+_JSON_PATH_TOKEN_RE = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+# length 조건: 비교 연산자 + 숫자
+_LENGTH_RE = re.compile(r"^\s*(>=|<=|==|>|<)?\s*(\d+)\s*$")
+
+_LENGTH_OPERATORS: Dict[str, Callable[[int, int], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+_COMPARE_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+_UNARY_OPERATORS = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_STR_METHODS = frozenset({
+    "lower", "upper", "strip", "startswith", "endswith", "count", "find", "split", "splitlines",
+})
+
+_NAMES = frozenset({"output", "data"})
+
+# 표현식 최대 길이
+_MAX_EXPRESSION_LENGTH = 1000
+
+
+class ConditionExpressionError(ValueError):
+    """조건 컴파일 실패 (지원하지 않는 구문, 잘못된 정규표현식 등)"""
+
+
+def parse_json_output(output: str) -> Any:
+    """
+    출력에서 JSON 값 추출
+
+    출력 전체 → 마지막 ```json 코드 블록 → 첫 '{'부터 마지막 '}'까지 순서로 시도합니다.
+
+    Args:
+        output: 노드 출력
+
+    Returns:
+        Any: 파싱된 값 (JSON이 없으면 None)
+    """
+    candidates = [output.strip()]
+    blocks = _JSON_BLOCK_RE.findall(output)
+    if blocks:
+        candidates.append(blocks[-1].strip())
+    start, end = output.find("{"), output.rfind("}")
+    if 0 <= start < end:
+        candidates.append(output[start:end + 1])
+
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return None
+
+
+def _resolve_json_path(value: Any, path: str) -> Any:
+    """점/인덱스 경로로 JSON 값 조회 (없으면 None)"""
+    for key, index in _JSON_PATH_TOKEN_RE.findall(path):
+        if index:
+            if not isinstance(value, list) or int(index) >= len(value):
+                return None
+            value = value[int(index)]
+        else:
+            if not isinstance(value, dict) or key not in value:
+                return None
+            value = value[key]
+    return value
+
+
+class _EvaluationContext:
+    """
+    표현식 1회 평가 컨텍스트
+
+    JSON 파싱은 data/json_path가 처음 참조될 때 한 번만 수행합니다.
+    """
+
+    __slots__ = ("output", "_data", "_parsed")
+
+    def __init__(self, output: str):
+        self.output = output
+        self._data: Any = None
+        self._parsed = False
+
+    @property
+    def data(self) -> Any:
+        if not self._parsed:
+            self._data = parse_json_output(self.output)
+            self._parsed = True
+        return self._data
+
+    def number(self, text: Optional[str] = None) -> Optional[float]:
+        match = _NUMBER_RE.search(self.output if text is None else str(text))
+        return float(match.group(0)) if match else None
+
+    def json_path(self, path: str) -> Any:
+        return _resolve_json_path(self.data, str(path))
+
+
+_PLAIN_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "len": len,
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "abs": abs,
+    "min": min,
+    "max": max,
+    "any": any,
+    "all": all,
+}
+
+_CONTEXT_FUNCTIONS = frozenset({"number", "json_path"})
+
+
+def _validate_expression(tree: ast.Expression) -> None:
+    """
+    허용된 구문만 사용하는지 검사
+
+    Raises:
+        ConditionExpressionError: 허용되지 않은 구문이 있는 경우
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Expression, ast.Load, ast.And, ast.Or)):
+            continue
+        if isinstance(node, ast.keyword) and node.arg is not None:
+            continue
+        if isinstance(node, (ast.BoolOp, ast.Compare, ast.IfExp, ast.Subscript, ast.Slice, ast.List, ast.Tuple)):
+            continue
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            continue
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            continue
+        if type(node) in _BINARY_OPERATORS or type(node) in _UNARY_OPERATORS or type(node) in _COMPARE_OPERATORS:
+            continue
+        if isinstance(node, ast.Constant) and isinstance(node.value, (str, int, float, bool, type(None))):
+            continue
+        if isinstance(node, ast.Name):
+            if node.id in _NAMES or node.id in _PLAIN_FUNCTIONS or node.id in _CONTEXT_FUNCTIONS:
+                continue
+            raise ConditionExpressionError(f"알 수 없는 이름: {node.id}")
+        if isinstance(node, ast.Attribute):
+            if node.attr in _STR_METHODS:
+                continue
+            raise ConditionExpressionError(f"허용되지 않은 속성: {node.attr}")
+        if isinstance(node, ast.Call):
+            func = node.func
+            if isinstance(func, ast.Name) and (func.id in _PLAIN_FUNCTIONS or func.id in _CONTEXT_FUNCTIONS):
+                continue
+            if isinstance(func, ast.Attribute) and func.attr in _STR_METHODS:
+                continue
+            raise ConditionExpressionError("허용되지 않은 함수 호출입니다")
+        raise ConditionExpressionError(f"허용되지 않은 구문: {type(node).__name__}")
+
+
+def _evaluate_node(node: ast.AST, ctx: _EvaluationContext) -> Any:
+    """검증된 AST 노드를 직접 해석"""
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.Name):
+        if node.id == "output":
+            return ctx.output
+        if node.id == "data":
+            return ctx.data
+        raise ConditionExpressionError(f"함수 {node.id}는 호출해야 합니다")
+
+    if isinstance(node, ast.BoolOp):
+        if isinstance(node.op, ast.And):
+            result = True
+            for value in node.values:
+                result = _evaluate_node(value, ctx)
+                if not result:
+                    return result
+            return result
+        result = False
+        for value in node.values:
+            result = _evaluate_node(value, ctx)
+            if result:
+                return result
+        return result
+
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPERATORS[type(node.op)](_evaluate_node(node.operand, ctx))
+
+    if isinstance(node, ast.BinOp):
+        left = _evaluate_node(node.left, ctx)
+        right = _evaluate_node(node.right, ctx)
+        # 문자열 반복('a' * n)과 printf 포맷팅('%999999999d' % 1)은 대용량 할당이 가능하므로 숫자만 허용
+        if isinstance(node.op, (ast.Mult, ast.Mod)) and not (
+            isinstance(left, (int, float)) and isinstance(right, (int, float))
+        ):
+            op_name = "곱셈" if isinstance(node.op, ast.Mult) else "나머지 연산(%)"
+            raise ConditionExpressionError(f"{op_name}은 숫자에만 사용할 수 있습니다")
+        return _BINARY_OPERATORS[type(node.op)](left, right)
+
+    if isinstance(node, ast.Compare):
+        left = _evaluate_node(node.left, ctx)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _evaluate_node(comparator, ctx)
+            if not _COMPARE_OPERATORS[type(op)](left, right):
+                return False
+            left = right
+        return True
+
+    if isinstance(node, ast.IfExp):
+        if _evaluate_node(node.test, ctx):
+            return _evaluate_node(node.body, ctx)
+        return _evaluate_node(node.orelse, ctx)
+
+    if isinstance(node, ast.Subscript):
+        value = _evaluate_node(node.value, ctx)
+        if isinstance(node.slice, ast.Slice):
+            lower = _evaluate_node(node.slice.lower, ctx) if node.slice.lower else None
+            upper = _evaluate_node(node.slice.upper, ctx) if node.slice.upper else None
+            step = _evaluate_node(node.slice.step, ctx) if node.slice.step else None
+            return value[lower:upper:step]
+        return value[_evaluate_node(node.slice, ctx)]
+
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return tuple(_evaluate_node(element, ctx) for element in node.elts)
+
+    if isinstance(node, ast.Call):
+        args = [_evaluate_node(arg, ctx) for arg in node.args]
+        kwargs = {kw.arg: _evaluate_node(kw.value, ctx) for kw in node.keywords}
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            target = _evaluate_node(func.value, ctx)
+            if not isinstance(target, str):
+                raise ConditionExpressionError(f"{func.attr}()는 문자열에만 사용할 수 있습니다")
+            return getattr(target, func.attr)(*args, **kwargs)
+        if func.id in _CONTEXT_FUNCTIONS:
+            return getattr(ctx, func.id)(*args, **kwargs)
+        return _PLAIN_FUNCTIONS[func.id](*args, **kwargs)
+
+    raise ConditionExpressionError(f"허용되지 않은 구문: {type(node).__name__}")
+
+
+def _compile_expression(expression: str) -> Callable[[str], bool]:
+    """
+    custom 표현식 컴파일 (AST 파싱 + 검증)
+
+    Raises:
+        ConditionExpressionError: 문법 오류 또는 허용되지 않은 구문
+    """
+    if len(expression) > _MAX_EXPRESSION_LENGTH:
+        raise ConditionExpressionError(f"표현식이 너무 깁니다 (최대 {_MAX_EXPRESSION_LENGTH}자)")
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ConditionExpressionError(f"표현식 문법 오류: {e.msg}") from e
+
+    _validate_expression(tree)
+    body = tree.body
+
+    def evaluate(output: str) -> bool:
+        return bool(_evaluate_node(body, _EvaluationContext(output)))
+
+    return evaluate
+
+
+def _compile_length(condition_value: str) -> Callable[[str], bool]:
+    """
+    length 조건 컴파일
+
+    Raises:
+        ConditionExpressionError: 형식이 잘못된 경우
+    """
+    match = _LENGTH_RE.match(condition_value)
+    if not match:
+        raise ConditionExpressionError(f"길이 조건 형식 오류: {condition_value} (예: >100, <=500, ==0)")
+    compare = _LENGTH_OPERATORS[match.group(1) or "=="]
+    threshold = int(match.group(2))
+    return lambda output: compare(len(output), threshold)
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    """
+    컴파일된 조건
+
+    Attributes:
+        condition_type: 조건 타입
+        condition_value: 원본 조건 값
+        predicate: 출력 → 조건 결과
+    """
+    condition_type: str
+    condition_value: str
+    predicate: Callable[[str], bool]
+
+    def evaluate(self, output: str) -> bool:
+        """
+        조건 평가
+
+        Args:
+            output: 평가할 텍스트 (부모 노드 출력)
+
+        Returns:
+            bool: 조건 결과
+
+        Raises:
+            Exception: 표현식 실행 중 오류 (타입 불일치 등)
+        """
+        return self.predicate(output)
+
+
+@lru_cache(maxsize=256)
+def compile_condition(condition_type: str, condition_value: str) -> CompiledCondition:
+    """
+    조건 컴파일 (같은 조건은 캐시 재사용)
+
+    Args:
+        condition_type: 조건 타입 (contains, regex, length, custom)
+        condition_value: 조건 값
+
+    Returns:
+        CompiledCondition: 컴파일된 조건
+
+    Raises:
+        ConditionExpressionError: 알 수 없는 타입이거나 조건 값이 잘못된 경우
+    """
+    if condition_type == "contains":
+        predicate = lambda output: condition_value in output  # noqa: E731
+
+    elif condition_type == "regex":
+        try:
+            pattern = re.compile(condition_value)
+        except re.error as e:
+            raise ConditionExpressionError(f"정규표현식 오류: {e}") from e
+        predicate = lambda output: pattern.search(output) is not None  # noqa: E731
+
+    elif condition_type == "length":
+        predicate = _compile_length(condition_value)
+
+    elif condition_type == "custom":
+        predicate = _compile_expression(condition_value)
+
+    else:
+        raise ConditionExpressionError(f"알 수 없는 조건 타입: {condition_type}")
+
+    return CompiledCondition(
+        condition_type=condition_type,
+        condition_value=condition_value,
+        predicate=predicate,
+    )
@@ -0,0 +1,105 @@
+"""
+워크플로우 이벤트 인코딩
+
+이벤트를 발행 시점에 한 번만 JSON 바이트로 인코딩하고,
+SSE 전송/재생 시에는 인코딩된 바이트를 그대로 사용합니다.
+
+- orjson이 설치되어 있으면 orjson 사용 (빠른 경로)
+- 없으면 표준 json 모듈로 폴백
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    # orjson은 선택적 의존성 (미설치 시 표준 json 사용)
+    orjson = None
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 인코딩 (개행 없는 compact 형식)
+
+    Args:
+        obj: 인코딩할 객체 (dict, list 등)
+
+    Returns:
+        bytes: JSON 바이트
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def decode_json(data: bytes) -> Any:
+    """
+    JSON 바이트 디코딩
+
+    Args:
+        data: JSON 바이트 (또는 문자열)
+
+    Returns:
+        Any: 디코딩된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(frozen=True)
+class EncodedEvent:
+    """
+    인코딩된 워크플로우 이벤트
+
+    라우팅/로깅에 필요한 최소 필드만 유지하고, 본문은 인코딩된 바이트로 보관합니다.
+
+    Attributes:
+        event_type: 이벤트 타입
+        node_id: 노드 ID
+        payload: 이벤트 전체의 JSON 바이트
+    """
+    event_type: str
+    node_id: str
+    payload: bytes
+
+    @classmethod
+    def from_dict(cls, log_entry: Dict[str, Any]) -> "EncodedEvent":
+        """
+        이벤트 딕셔너리(WorkflowNodeExecutionEvent.model_dump())에서 생성
+
+        Args:
+            log_entry: 이벤트 딕셔너리
+
+        Returns:
+            EncodedEvent: 인코딩된 이벤트
+        """
+        return cls(
+            event_type=log_entry.get("event_type", ""),
+            node_id=log_entry.get("node_id", ""),
+            payload=encode_json(log_entry),
+        )
+
+    def sse_frame(self, event_id: Optional[int] = None) -> bytes:
+        """
+        SSE 프레임 바이트 생성 (EventSourceResponse에 bytes로 yield하면 그대로 전송됨)
+
+        payload는 개행이 없는 JSON이므로 data 필드 한 줄로 전송할 수 있습니다.
+
+        Args:
+            event_id: SSE 이벤트 ID (옵션, 재접속 시 Last-Event-ID로 사용)
+
+        Returns:
+            bytes: SSE 프레임
+        """
+        if event_id is None:
+            return b"data: " + self.payload + b"\r\n\r\n"
+        return b"id: " + str(event_id).encode() + b"\r\ndata: " + self.payload + b"\r\n\r\n"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """이벤트 딕셔너리로 디코딩 (필요한 경우에만 사용)"""
+        return decode_json(self.payload)
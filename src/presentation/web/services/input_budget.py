@@ -0,0 +1,268 @@
+"""
+노드 입력 예산 (부모 출력 토큰 예산)
+
+부모 노드 출력이 자식 프롬프트에 그대로 주입되면 컨텍스트가 길어지고 입력 토큰이 늘어납니다.
+노드별 input_budget 정책으로 주입 전에 부모 출력을 줄입니다.
+
+전략:
+- head_tail: 전체 예산을 부모별 출력 크기에 비례해 나누고, 초과분은 앞/뒤만 남기고 중략
+- per_parent: 부모마다 같은 할당량(per_parent_tokens)으로 앞/뒤 중략
+- summarize: 할당량을 넘는 부모 출력을 저비용 모델로 요약 (실패 시 head_tail 방식으로 중략)
+
+토큰 수는 로컬 추정치입니다 (ASCII 약 4자/토큰, 그 외 문자 약 1.5자/토큰).
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+STRATEGIES = ("head_tail", "per_parent", "summarize")
+
+# 요약 전략 기본 모델 (저비용)
+DEFAULT_SUMMARY_MODEL = "claude-haiku-4-5-20251001"
+
+# 중략 시 최소로 남길 토큰 수 (너무 작은 할당량 방지)
+_MIN_KEEP_TOKENS = 32
+
+# 요약 함수: (원문, 목표 토큰 수, 모델) → 요약문
+SummarizeFunc = Callable[[str, int, str], Awaitable[str]]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 로컬 추정 (API 호출 없음)
+
+    UTF-8 바이트 수와 문자 수의 차이로 비 ASCII 문자 수를 근사합니다
+    (한글 등 3바이트 문자 기준, 문자열을 순회하지 않음).
+
+    Args:
+        text: 대상 문자열
+
+    Returns:
+        int: 추정 토큰 수
+    """
+    if not text:
+        return 0
+    char_count = len(text)
+    non_ascii = min(char_count, (len(text.encode("utf-8")) - char_count) // 2)
+    ascii_count = char_count - non_ascii
+    return math.ceil(ascii_count / 4 + non_ascii / 1.5)
+
+
+def truncate_head_tail(text: str, max_tokens: int, head_ratio: float = 0.7) -> str:
+    """
+    앞/뒤만 남기고 가운데를 중략
+
+    Args:
+        text: 원문
+        max_tokens: 남길 최대 토큰 수 (추정치)
+        head_ratio: 앞부분 비율 (0~1, 나머지는 뒷부분)
+
+    Returns:
+        str: 중략된 문자열 (예산 이내면 원문)
+    """
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+
+    marker = f"\n\n... (중략: 약 {tokens - max_tokens} 토큰 생략) ...\n\n"
+    keep_tokens = max(1, max_tokens - estimate_tokens(marker))
+
+    # 이 텍스트의 문자/토큰 비율로 문자 예산 환산
+    max_chars = max(1, int(len(text) * keep_tokens / tokens))
+    head_chars = int(max_chars * head_ratio)
+    tail_chars = max_chars - head_chars
+
+    head = text[:head_chars]
+    tail = text[len(text) - tail_chars:] if tail_chars > 0 else ""
+    return f"{head}{marker}{tail}"
+
+
+@dataclass
+class InputBudgetPolicy:
+    """
+    노드 입력 예산 정책
+
+    Attributes:
+        max_tokens: 부모 출력 전체 예산 (추정 토큰 수)
+        strategy: 전략 (head_tail, per_parent, summarize)
+        per_parent_tokens: 부모별 할당량 (per_parent/summarize, 미지정 시 max_tokens / 부모 수)
+        head_ratio: 중략 시 앞부분 비율
+        summary_model: summarize 전략에 사용할 모델
+    """
+    max_tokens: int
+    strategy: str = "head_tail"
+    per_parent_tokens: Optional[int] = None
+    head_ratio: float = 0.7
+    summary_model: str = DEFAULT_SUMMARY_MODEL
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["InputBudgetPolicy"]:
+        """
+        노드 설정(input_budget)에서 정책 생성
+
+        Args:
+            config: dict 또는 pydantic 모델 (None이면 정책 없음)
+
+        Returns:
+            Optional[InputBudgetPolicy]: 정책 (설정이 없으면 None)
+
+        Raises:
+            ValueError: 설정 값이 잘못된 경우
+        """
+        if config is None:
+            return None
+        if hasattr(config, "model_dump"):
+            config = config.model_dump()
+        if not isinstance(config, dict):
+            raise ValueError(f"input_budget은 객체여야 합니다: {config!r}")
+
+        max_tokens = config.get("max_tokens")
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            raise ValueError(f"input_budget.max_tokens는 양의 정수여야 합니다: {max_tokens!r}")
+
+        strategy = config.get("strategy") or "head_tail"
+        if strategy not in STRATEGIES:
+            raise ValueError(
+                f"알 수 없는 input_budget 전략: {strategy} (사용 가능: {', '.join(STRATEGIES)})"
+            )
+
+        per_parent_tokens = config.get("per_parent_tokens")
+        if per_parent_tokens is not None and (not isinstance(per_parent_tokens, int) or per_parent_tokens <= 0):
+            raise ValueError(f"input_budget.per_parent_tokens는 양의 정수여야 합니다: {per_parent_tokens!r}")
+
+        head_ratio = config.get("head_ratio")
+        head_ratio = 0.7 if head_ratio is None else float(head_ratio)
+        if not 0.0 <= head_ratio <= 1.0:
+            raise ValueError(f"input_budget.head_ratio는 0~1 사이여야 합니다: {head_ratio}")
+
+        return cls(
+            max_tokens=max_tokens,
+            strategy=strategy,
+            per_parent_tokens=per_parent_tokens,
+            head_ratio=head_ratio,
+            summary_model=config.get("summary_model") or DEFAULT_SUMMARY_MODEL,
+        )
+
+    def quotas(self, tokens_by_parent: Dict[str, int]) -> Dict[str, int]:
+        """
+        부모별 토큰 할당량 계산
+
+        Args:
+            tokens_by_parent: 부모 ID → 추정 토큰 수
+
+        Returns:
+            Dict[str, int]: 부모 ID → 할당량
+        """
+        if not tokens_by_parent:
+            return {}
+
+        if self.strategy == "head_tail":
+            # 출력 크기에 비례해 전체 예산 분배 (작은 출력은 그대로 유지될 가능성이 큼)
+            total = sum(tokens_by_parent.values()) or 1
+            return {
+                pid: max(_MIN_KEEP_TOKENS, self.max_tokens * tokens // total)
+                for pid, tokens in tokens_by_parent.items()
+            }
+
+        quota = self.per_parent_tokens or max(_MIN_KEEP_TOKENS, self.max_tokens // len(tokens_by_parent))
+        return {pid: quota for pid in tokens_by_parent}
+
+
+@dataclass
+class BudgetDecision:
+    """
+    예산 적용 결과 (이벤트 보고용)
+
+    Attributes:
+        strategy: 적용 전략
+        max_tokens: 전체 예산
+        parents: 부모별 결정 목록 (parent_id, action, tokens_before, tokens_after, quota)
+    """
+    strategy: str
+    max_tokens: int
+    parents: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def tokens_before(self) -> int:
+        return sum(p["tokens_before"] for p in self.parents)
+
+    @property
+    def tokens_after(self) -> int:
+        return sum(p["tokens_after"] for p in self.parents)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """이벤트 데이터용 딕셔너리"""
+        return {
+            "strategy": self.strategy,
+            "max_tokens": self.max_tokens,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "tokens_saved": self.tokens_before - self.tokens_after,
+            "parents": self.parents,
+        }
+
+
+async def apply_input_budget(
+    policy: InputBudgetPolicy,
+    parent_outputs: Dict[str, str],
+    summarize: Optional[SummarizeFunc] = None,
+) -> Tuple[Dict[str, str], BudgetDecision]:
+    """
+    부모 출력에 입력 예산 적용
+
+    전체 추정 토큰 수가 예산 이내면 원문을 그대로 사용합니다.
+
+    Args:
+        policy: 입력 예산 정책
+        parent_outputs: 부모 ID → 출력 (순서 유지)
+        summarize: 요약 함수 (summarize 전략, 없거나 실패하면 중략으로 폴백)
+
+    Returns:
+        Tuple[Dict[str, str], BudgetDecision]: (예산 적용된 부모 출력, 결정 내역)
+    """
+    decision = BudgetDecision(strategy=policy.strategy, max_tokens=policy.max_tokens)
+    tokens_by_parent = {pid: estimate_tokens(output) for pid, output in parent_outputs.items()}
+
+    if sum(tokens_by_parent.values()) <= policy.max_tokens:
+        for pid, tokens in tokens_by_parent.items():
+            decision.parents.append({
+                "parent_id": pid, "action": "kept",
+                "tokens_before": tokens, "tokens_after": tokens, "quota": None,
+            })
+        return dict(parent_outputs), decision
+
+    quotas = policy.quotas(tokens_by_parent)
+    budgeted: Dict[str, str] = {}
+
+    for pid, output in parent_outputs.items():
+        tokens = tokens_by_parent[pid]
+        quota = quotas[pid]
+        action = "kept"
+        result = output
+        error: Optional[str] = None
+
+        if tokens > quota:
+            if policy.strategy == "summarize" and summarize is not None:
+                try:
+                    result = await summarize(output, quota, policy.summary_model)
+                    action = "summarized"
+                except Exception as e:
+                    error = str(e) or type(e).__name__  # 시간 초과(TimeoutError)는 메시지가 비어 있음
+                    result = truncate_head_tail(output, quota, policy.head_ratio)
+                    action = "truncated"
+            else:
+                result = truncate_head_tail(output, quota, policy.head_ratio)
+                action = "truncated"
+
+        budgeted[pid] = result
+        entry = {
+            "parent_id": pid, "action": action,
+            "tokens_before": tokens, "tokens_after": estimate_tokens(result) if result is not output else tokens,
+            "quota": quota,
+        }
+        if error:
+            entry["error"] = error
+        decision.parents.append(entry)
+
+    return budgeted, decision
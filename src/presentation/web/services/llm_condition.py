@@ -0,0 +1,195 @@
+"""
+LLM 조건 판정 보조 (로컬 판정 + 판정 캐시)
+
+LLM 조건 노드는 다음 순서로 평가합니다:
+1. 로컬 판정: 부모 출력에 명시적인 판정 신호가 있으면 LLM을 호출하지 않음
+   - 판정 마커 줄: "VERDICT: PASS", "판정: 실패" 등 (마지막 마커 기준)
+   - 판정 전용 JSON 객체: {"pass": true}, {"passed": false}, {"verdict": "PASS"} (reason 외 다른 키 없음)
+   "result", "ok", "success" 같은 일반 키는 도구 출력 등에도 흔하고 조건 프롬프트와 무관하므로
+   로컬 판정에 사용하지 않습니다.
+2. 판정 캐시: 같은 (조건 프롬프트, 출력 해시)에 대한 이전 LLM 판정 재사용
+3. LLM 호출: 위 두 단계에서 결정되지 않은 경우에만 호출
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from src.presentation.web.services.condition_expression import parse_json_output
+
+# 판정 마커 줄 (줄 시작 기준, 대소문자 무시, 명시적인 VERDICT/판정 마커만)
+_VERDICT_LINE_RE = re.compile(
+    r"^[\s>*#`_-]*(?:VERDICT|판정)[*`_]*\s*[:=]\s*[*`_\[]*"
+    r"(PASS(?:ED)?|FAIL(?:ED)?|통과|실패)(?![\w])",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+_POSITIVE_WORDS = frozenset({
+    "PASS", "PASSED", "YES", "Y", "TRUE", "APPROVE", "APPROVED", "OK", "SUCCESS",
+    "통과", "예", "승인", "성공",
+})
+_NEGATIVE_WORDS = frozenset({
+    "FAIL", "FAILED", "NO", "N", "FALSE", "REJECT", "REJECTED", "FAILURE",
+    "실패", "아니오", "거절",
+})
+
+# JSON 판정 키 (LLM 응답 파싱용, 앞에 있는 키 우선)
+_JSON_VERDICT_KEYS = ("pass", "passed", "verdict", "result", "approved", "success", "ok")
+
+# 로컬 판정에 사용하는 판정 전용 JSON 키 (이 중 하나만 있어야 함)
+_LOCAL_VERDICT_KEYS = frozenset({"pass", "passed", "verdict"})
+_REASON_KEYS = frozenset({"reason", "이유"})
+
+# 판정 마커는 출력 끝부분에 오는 경우가 많으므로 검사 범위를 마지막 부분으로 제한
+_SCAN_TAIL_CHARS = 20000
+
+
+def _word_to_bool(word: str) -> Optional[bool]:
+    """판정 단어 → bool (알 수 없으면 None)"""
+    normalized = word.strip().upper()
+    if normalized in _POSITIVE_WORDS:
+        return True
+    if normalized in _NEGATIVE_WORDS:
+        return False
+    return None
+
+
+def _json_verdict(data: Any) -> Optional[Tuple[bool, str]]:
+    """JSON 객체에서 판정 추출"""
+    if not isinstance(data, dict):
+        return None
+
+    for key in _JSON_VERDICT_KEYS:
+        if key not in data:
+            continue
+        value = data[key]
+        if isinstance(value, bool):
+            verdict = value
+        elif isinstance(value, str):
+            verdict = _word_to_bool(value)
+            if verdict is None:
+                continue
+        else:
+            continue
+
+        reason = data.get("reason") or data.get("이유") or f'JSON 판정 ("{key}": {value})'
+        return verdict, str(reason)
+
+    return None
+
+
+def detect_verdict(output: str) -> Optional[Tuple[bool, str]]:
+    """
+    출력에서 명시적인 판정 신호 추출 (LLM 호출 없음)
+
+    Args:
+        output: 평가 대상 출력
+
+    Returns:
+        Optional[Tuple[bool, str]]: (판정, 이유) - 신호가 없으면 None
+    """
+    if not output:
+        return None
+
+    tail = output[-_SCAN_TAIL_CHARS:]
+
+    matches = _VERDICT_LINE_RE.findall(tail)
+    if matches:
+        verdict = _word_to_bool(matches[-1])
+        if verdict is not None:
+            return verdict, f"판정 마커 ({matches[-1].upper()})"
+
+    # 판정 전용 JSON 객체 (중괄호가 없으면 파싱 생략)
+    if "{" in tail:
+        data = parse_json_output(tail)
+        if isinstance(data, dict):
+            verdict_keys = _LOCAL_VERDICT_KEYS.intersection(data)
+            if len(verdict_keys) == 1 and set(data) <= verdict_keys | _REASON_KEYS:
+                return _json_verdict(data)
+
+    return None
+
+
+def parse_llm_verdict(response_text: str) -> Tuple[bool, str]:
+    """
+    LLM 응답 파싱 (JSON 또는 "판단:/이유:" 형식)
+
+    Args:
+        response_text: LLM 응답
+
+    Returns:
+        Tuple[bool, str]: (판정, 이유) - 판정을 찾지 못하면 False
+    """
+    structured = _json_verdict(parse_json_output(response_text)) if "{" in response_text else None
+    if structured is not None:
+        return structured
+
+    result = False
+    reason = ""
+    for line in response_text.strip().split("\n"):
+        line = line.strip()
+        if line.startswith("판단:"):
+            result = _word_to_bool(line[len("판단:"):]) is True
+        elif line.startswith("이유:"):
+            reason = line[len("이유:"):].strip()
+
+    if not reason:
+        reason = response_text[:200]  # 파싱 실패 시 전체 응답 사용
+    return result, reason
+
+
+@dataclass(frozen=True)
+class CachedVerdict:
+    """
+    캐시된 LLM 판정
+
+    Attributes:
+        result: 판정
+        reason: 이유
+    """
+    result: bool
+    reason: str
+
+
+class VerdictCache:
+    """
+    LLM 조건 판정 LRU 캐시 ((모델, 조건 프롬프트, 출력 sha256) → 판정)
+
+    Attributes:
+        max_size: 최대 항목 수
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str, str], CachedVerdict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, condition_prompt: str, output: str) -> Tuple[str, str, str]:
+        """캐시 키 생성 (출력은 해시로 저장)"""
+        output_hash = hashlib.sha256(output.encode("utf-8")).hexdigest()
+        return model, condition_prompt, output_hash
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[CachedVerdict]:
+        """캐시 조회 (hit 시 최근 사용으로 이동)"""
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is not None:
+                self._entries.move_to_end(key)
+            return verdict
+
+    def put(self, key: Tuple[str, str, str], result: bool, reason: str) -> None:
+        """판정 저장 (가장 오래된 항목부터 제거)"""
+        with self._lock:
+            self._entries[key] = CachedVerdict(result=result, reason=reason)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
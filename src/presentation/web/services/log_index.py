@@ -0,0 +1,490 @@
+"""
+로그 검색 인덱스
+
+로그 파일(JSON 또는 콘솔 형식)을 한 번만 파싱하여 레코드별 메타데이터
+(바이트 오프셋, 길이, 타임스탬프, 레벨, session_id, node_id)와
+세션/노드/레벨/시간 버킷별 역색인을 메모리에 유지합니다.
+
+- 증분 인덱싱: 파일에 추가된 부분만 파싱 (이전에 인덱싱한 크기부터)
+- 로그 회전 대응: 인덱스를 경로가 아닌 (device, inode)로 관리하므로
+  system.log → system.log.1 회전 후에도 기존 인덱스를 그대로 재사용
+- 검색: 역색인으로 후보 레코드를 좁힌 뒤, 부분 문자열 검색이 필요한 경우에만
+  후보 레코드의 바이트 범위를 읽어 확인
+"""
+
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 인덱싱 시 한 번에 읽을 크기
+_READ_SIZE = 1024 * 1024
+
+# 시간 버킷 크기 (초)
+_BUCKET_SECONDS = 60
+
+# 삭제된 파일의 인덱스 정리 주기 (초)
+_PRUNE_INTERVAL = 60.0
+
+# 로그 레벨 이름 → 숫자
+LEVELS: Dict[str, int] = {
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "warn": 30,
+    "error": 40,
+    "critical": 50,
+    "exception": 40,
+}
+_LEVEL_NAMES = {10: "debug", 20: "info", 30: "warning", 40: "error", 50: "critical"}
+
+# ANSI 색상 코드 (ConsoleRenderer 출력)
+_ANSI_RE = re.compile(rb"\x1b\[[0-9;]*m")
+# 콘솔 형식 헤더: "2025-01-01T00:00:00.000000Z [info     ] ..."
+_CONSOLE_HEADER_RE = re.compile(rb"^(\d{4}-\d{2}-\d{2}T[0-9:.]+Z?)\s+\[\s*([a-zA-Z]+)\s*\]")
+_SESSION_RE = re.compile(rb"\bsession_id=([^\s,]+)")
+_NODE_RE = re.compile(rb"\bnode_id=([^\s,]+)")
+
+
+def _parse_timestamp(value: str) -> float:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _parse_header(line: bytes) -> Optional[Tuple[float, int, Optional[str], Optional[str]]]:
+    """
+    레코드 첫 줄 파싱
+
+    Returns:
+        (타임스탬프, 레벨, session_id, node_id) 또는 None (이전 레코드의 연속 줄)
+    """
+    if line.startswith(b"{"):
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        return (
+            _parse_timestamp(str(data.get("timestamp", ""))),
+            LEVELS.get(str(data.get("level", "")).lower(), 0),
+            data.get("session_id"),
+            data.get("node_id"),
+        )
+
+    line = _ANSI_RE.sub(b"", line)
+    match = _CONSOLE_HEADER_RE.match(line)
+    if not match:
+        return None
+
+    session_match = _SESSION_RE.search(line)
+    node_match = _NODE_RE.search(line)
+    return (
+        _parse_timestamp(match.group(1).decode("ascii")),
+        LEVELS.get(match.group(2).decode("ascii").lower(), 0),
+        session_match.group(1).decode("utf-8", errors="replace").strip("'\"") if session_match else None,
+        node_match.group(1).decode("utf-8", errors="replace").strip("'\"") if node_match else None,
+    )
+
+
+@dataclass
+class LogQuery:
+    """
+    로그 검색 조건
+
+    Attributes:
+        session_id: 세션 ID
+        node_id: 노드 ID
+        min_level: 최소 레벨 (숫자, LEVELS 참고)
+        since: 시작 시각 (epoch 초, 포함)
+        until: 종료 시각 (epoch 초, 제외)
+        text: 부분 문자열 (대소문자 구분 없음)
+    """
+    session_id: Optional[str] = None
+    node_id: Optional[str] = None
+    min_level: Optional[int] = None
+    since: Optional[float] = None
+    until: Optional[float] = None
+    text: Optional[str] = None
+
+
+@dataclass
+class LogMatch:
+    """
+    검색 결과 레코드
+
+    Attributes:
+        file: 파일 경로
+        offset: 레코드 시작 바이트 오프셋
+        timestamp: 타임스탬프 (epoch 초)
+        level: 레벨 이름
+        session_id: 세션 ID
+        node_id: 노드 ID
+        line: 레코드 내용 (ANSI 색상 코드 제거)
+    """
+    file: str
+    offset: int
+    timestamp: float
+    level: str
+    session_id: Optional[str]
+    node_id: Optional[str]
+    line: str
+
+
+class FileLogIndex:
+    """
+    로그 파일 하나의 인덱스
+
+    레코드 메타데이터는 array로 저장하여 레코드당 메모리를 최소화합니다.
+    session_id/node_id는 문자열 풀에 인터닝하여 숫자 ID로 저장합니다.
+
+    Attributes:
+        indexed_size: 인덱싱된 바이트 수 (완전한 줄까지)
+    """
+
+    def __init__(self, default_session_id: Optional[str] = None):
+        self.default_session_id = default_session_id
+        self.indexed_size = 0
+        self.offsets = array("q")
+        self.lengths = array("l")
+        self.timestamps = array("d")
+        self.levels = array("b")
+        self.session_ids = array("l")
+        self.node_ids = array("l")
+        self._strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+        self.by_session: Dict[int, array] = {}
+        self.by_node: Dict[int, array] = {}
+        self.by_level: Dict[int, array] = {}
+        self.by_bucket: Dict[int, array] = {}
+        self._lock = threading.Lock()
+
+    def _intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def string(self, string_id: int) -> Optional[str]:
+        return self._strings[string_id] if string_id >= 0 else None
+
+    def _add_entry(self, offset: int, length: int, header: Tuple[float, int, Optional[str], Optional[str]]) -> None:
+        timestamp, level, session_id, node_id = header
+        entry = len(self.offsets)
+        session_key = self._intern(session_id or self.default_session_id)
+        node_key = self._intern(node_id)
+
+        self.offsets.append(offset)
+        self.lengths.append(length)
+        self.timestamps.append(timestamp)
+        self.levels.append(level)
+        self.session_ids.append(session_key)
+        self.node_ids.append(node_key)
+
+        if session_key >= 0:
+            self.by_session.setdefault(session_key, array("l")).append(entry)
+        if node_key >= 0:
+            self.by_node.setdefault(node_key, array("l")).append(entry)
+        self.by_level.setdefault(level, array("l")).append(entry)
+        self.by_bucket.setdefault(int(timestamp) // _BUCKET_SECONDS, array("l")).append(entry)
+
+    def update(self, path: Path, size: int) -> None:
+        """
+        파일에 추가된 부분 인덱싱 (indexed_size부터 마지막 완전한 줄까지)
+
+        헤더가 없는 줄(트레이스백 등)은 이전 레코드에 포함시킵니다.
+
+        Args:
+            path: 파일 경로
+            size: 현재 파일 크기
+        """
+        with self._lock:
+            if size <= self.indexed_size:
+                return
+
+            with open(path, "rb") as f:
+                f.seek(self.indexed_size)
+                position = self.indexed_size
+                pending = b""
+                while position + len(pending) < size:
+                    block = f.read(min(_READ_SIZE, size - position - len(pending)))
+                    if not block:
+                        break
+                    data = pending + block
+                    last_newline = data.rfind(b"\n")
+                    if last_newline == -1:
+                        pending = data
+                        continue
+                    pending = data[last_newline + 1:]
+                    self._index_lines(data[:last_newline + 1], position)
+                    position += last_newline + 1
+
+            self.indexed_size = position
+
+    def _index_lines(self, data: bytes, base_offset: int) -> None:
+        start = 0
+        while start < len(data):
+            end = data.index(b"\n", start) + 1
+            line = data[start:end]
+            header = _parse_header(line.rstrip(b"\r\n"))
+            if header is not None:
+                self._add_entry(base_offset + start, len(line), header)
+            elif self.lengths:
+                # 연속 줄 (이전 레코드 길이 확장)
+                self.lengths[-1] += len(line)
+            start = end
+
+    def candidates(self, query: LogQuery) -> Iterator[int]:
+        """
+        역색인으로 후보 레코드 번호 조회 (가장 작은 posting 목록 기준, 최신 레코드부터)
+
+        posting 목록(이미 오름차순)을 뒤에서부터 지연 순회하고, 레벨/시간 범위 조건은
+        heapq.merge(reverse=True)로 병합하므로 후보를 복사하거나 다시 정렬하지 않습니다.
+        _lock을 잡은 상태에서 호출하면 그 시점의 레코드 수까지만 반환하므로,
+        반환된 이터레이터는 lock 밖에서 순회해도 됩니다.
+
+        Args:
+            query: 검색 조건
+
+        Returns:
+            후보 레코드 번호 (내림차순)
+        """
+        count = len(self.offsets)
+        postings: List[Tuple[int, Iterable[int]]] = []  # (후보 수, 레코드 번호)
+
+        if query.session_id is not None:
+            key = self._string_ids.get(query.session_id)
+            if key is None:
+                return iter(())
+            entries = self.by_session.get(key, array("l"))
+            postings.append((len(entries), reversed(entries)))
+
+        if query.node_id is not None:
+            key = self._string_ids.get(query.node_id)
+            if key is None:
+                return iter(())
+            entries = self.by_node.get(key, array("l"))
+            postings.append((len(entries), reversed(entries)))
+
+        if query.min_level is not None:
+            postings.append(_merge_postings([
+                entries for level, entries in self.by_level.items()
+                if level >= query.min_level
+            ]))
+
+        if query.since is not None or query.until is not None:
+            low = int(query.since) // _BUCKET_SECONDS if query.since is not None else None
+            high = int(query.until) // _BUCKET_SECONDS if query.until is not None else None
+            postings.append(_merge_postings([
+                entries for bucket, entries in self.by_bucket.items()
+                if (low is None or bucket >= low) and (high is None or bucket <= high)
+            ]))
+
+        if not postings:
+            return iter(range(count - 1, -1, -1))
+        entries = min(postings, key=lambda posting: posting[0])[1]
+        # 스냅샷 이후 추가된 레코드는 내림차순 앞부분에만 있으므로 건너뜀
+        return itertools.dropwhile(lambda entry: entry >= count, entries)
+
+    def matches(self, entry: int, query: LogQuery) -> bool:
+        """레코드 메타데이터가 검색 조건(부분 문자열 제외)에 맞는지 확인"""
+        if query.session_id is not None and self.string(self.session_ids[entry]) != query.session_id:
+            return False
+        if query.node_id is not None and self.string(self.node_ids[entry]) != query.node_id:
+            return False
+        if query.min_level is not None and self.levels[entry] < query.min_level:
+            return False
+        timestamp = self.timestamps[entry]
+        if query.since is not None and timestamp < query.since:
+            return False
+        if query.until is not None and timestamp >= query.until:
+            return False
+        return True
+
+
+def _merge_postings(postings: List[array]) -> Tuple[int, Iterable[int]]:
+    """
+    오름차순 posting 목록을 뒤에서부터 병합 (지연 병합, 복사/전체 정렬 없음)
+
+    Args:
+        postings: 각각 오름차순인 레코드 번호 목록
+
+    Returns:
+        Tuple[int, Iterable[int]]: (전체 후보 수, 내림차순 레코드 번호)
+    """
+    if len(postings) == 1:
+        return len(postings[0]), reversed(postings[0])
+    return (
+        sum(len(entries) for entries in postings),
+        heapq.merge(*(reversed(entries) for entries in postings), reverse=True),
+    )
+
+
+class LogIndex:
+    """
+    로그 디렉토리 인덱스 (파일별 FileLogIndex 관리)
+
+    파일 인덱스는 (device, inode)로 관리하므로 회전된 파일은 다시 파싱하지 않습니다.
+
+    Args:
+        logs_dir: 로그 디렉토리
+    """
+
+    def __init__(self, logs_dir: Path):
+        self.logs_dir = logs_dir
+        self._files: Dict[Tuple[int, int], FileLogIndex] = {}
+        self._lock = threading.Lock()
+        self._last_pruned = time.monotonic()
+
+    def refresh(self, paths: List[Path]) -> List[Tuple[Path, FileLogIndex]]:
+        """
+        파일 인덱스 갱신 (추가된 부분만 인덱싱)
+
+        Args:
+            paths: 대상 로그 파일 목록
+
+        Returns:
+            (경로, 파일 인덱스) 목록
+        """
+        result = []
+        seen = set()
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            key = (stat.st_dev, stat.st_ino)
+            seen.add(key)
+            with self._lock:
+                file_index = self._files.get(key)
+                if file_index is None or stat.st_size < file_index.indexed_size:
+                    # 새 파일 또는 잘린 파일 → 처음부터 인덱싱
+                    # 세션 디렉토리의 파일은 디렉토리명을 기본 session_id로 사용
+                    default_session_id = path.parent.name if path.name.split(".")[0] in ("debug", "info", "error") else None
+                    file_index = FileLogIndex(default_session_id)
+                    self._files[key] = file_index
+
+            file_index.update(path, stat.st_size)
+            result.append((path, file_index))
+
+        return result
+
+    def prune(self) -> None:
+        """로그 디렉토리에 더 이상 없는 파일의 인덱스 제거 (회전/삭제된 파일)"""
+        keys = set()
+        for path in self.logs_dir.rglob("*.log*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            keys.add((stat.st_dev, stat.st_ino))
+        with self._lock:
+            for key in [key for key in self._files if key not in keys]:
+                del self._files[key]
+            self._last_pruned = time.monotonic()
+
+    def search(
+        self,
+        paths: List[Path],
+        query: LogQuery,
+        limit: int = 200,
+        base_dir: Optional[Path] = None,
+    ) -> Tuple[List[LogMatch], bool]:
+        """
+        로그 검색 (최신 레코드부터)
+
+        Args:
+            paths: 대상 로그 파일 목록
+            query: 검색 조건
+            limit: 최대 결과 수
+            base_dir: 결과 파일 경로를 상대 경로로 표시할 기준 디렉토리
+
+        Returns:
+            (검색 결과 목록, 결과가 limit에서 잘렸는지 여부)
+        """
+        if time.monotonic() - self._last_pruned > _PRUNE_INTERVAL:
+            self.prune()
+        indexed_files = self.refresh(paths)
+
+        # 1. 메타데이터로 파일별 후보 선정 (파일 내 기록 순서 = 시간 순서)
+        def file_candidates(file_no: int, file_index: FileLogIndex) -> Iterator[Tuple[float, int, int]]:
+            # lock은 레코드 수 스냅샷과 posting 선택까지만 유지 (후보는 지연 순회)
+            with file_index._lock:
+                entries = file_index.candidates(query)
+            for entry in entries:
+                if file_index.matches(entry, query):
+                    yield (file_index.timestamps[entry], file_no, entry)
+
+        # 파일별 최신순 후보를 병합 (limit개를 채우면 나머지는 확인하지 않음)
+        candidates = heapq.merge(
+            *(file_candidates(file_no, file_index) for file_no, (_, file_index) in enumerate(indexed_files)),
+            reverse=True,
+        )
+
+        # 2. 최신순으로 내용 읽기 (부분 문자열 확인)
+        text = query.text.lower() if query.text else None
+        matches: List[LogMatch] = []
+        handles = {}
+        try:
+            for timestamp, file_no, entry in candidates:
+                path, file_index = indexed_files[file_no]
+                handle = handles.get(file_no)
+                if handle is None:
+                    handle = handles[file_no] = open(path, "rb")
+                handle.seek(file_index.offsets[entry])
+                raw = _ANSI_RE.sub(b"", handle.read(file_index.lengths[entry]))
+                line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+                if text is not None and text not in line.lower():
+                    continue
+
+                if len(matches) >= limit:
+                    return matches, True
+
+                matches.append(LogMatch(
+                    file=str(path.relative_to(base_dir)) if base_dir else str(path),
+                    offset=file_index.offsets[entry],
+                    timestamp=timestamp,
+                    level=_LEVEL_NAMES.get(file_index.levels[entry], "unknown"),
+                    session_id=file_index.string(file_index.session_ids[entry]),
+                    node_id=file_index.string(file_index.node_ids[entry]),
+                    line=line,
+                ))
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+        return matches, False
+
+
+# 로그 디렉토리별 인덱스 (서버 메모리)
+_log_indexes: Dict[str, LogIndex] = {}
+
+
+def get_log_index(logs_dir: Path) -> LogIndex:
+    """
+    로그 디렉토리의 인덱스 반환 (없으면 생성)
+
+    Args:
+        logs_dir: 로그 디렉토리
+
+    Returns:
+        LogIndex: 로그 인덱스
+    """
+    key = str(logs_dir)
+    if key not in _log_indexes:
+        _log_indexes[key] = LogIndex(logs_dir)
+    return _log_indexes[key]
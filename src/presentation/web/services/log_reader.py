@@ -0,0 +1,232 @@
+"""
+로그 파일 리더
+
+대용량 로그 파일(수십 MB)을 전부 읽지 않고 필요한 부분만 읽습니다.
+
+- read_tail: 파일 끝(또는 지정한 바이트 오프셋)에서 블록 단위로 거꾸로 읽어 마지막 N줄 반환
+- read_forward: 지정한 바이트 오프셋부터 앞으로 N줄 반환
+- follow_log: 파일 크기 폴링으로 새로 추가된 줄을 스트리밍 (로그 회전/잘림 감지)
+
+반환되는 오프셋은 항상 줄 경계이므로 다음 페이지 요청의 커서로 그대로 사용할 수 있습니다.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional
+
+# 거꾸로 읽을 때의 블록 크기
+_BLOCK_SIZE = 64 * 1024
+
+# 한 번에 읽을 최대 바이트 (아주 긴 줄이 있어도 응답 크기 제한)
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class LogChunk:
+    """
+    로그 파일 일부
+
+    Attributes:
+        content: 로그 내용 (완전한 줄만 포함)
+        start_offset: 내용 시작 바이트 오프셋 (이전 페이지 요청 시 before로 사용)
+        end_offset: 내용 끝 바이트 오프셋 (다음 페이지/follow 요청 시 after로 사용)
+        file_size: 읽은 시점의 파일 크기
+        line_count: 줄 수
+    """
+    content: str
+    start_offset: int
+    end_offset: int
+    file_size: int
+    line_count: int
+
+    @property
+    def has_more_before(self) -> bool:
+        """앞쪽에 더 읽을 내용이 있는지 여부"""
+        return self.start_offset > 0
+
+    @property
+    def has_more_after(self) -> bool:
+        """뒤쪽에 더 읽을 내용이 있는지 여부"""
+        return self.end_offset < self.file_size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (JSON 직렬화용)"""
+        return {
+            "content": self.content,
+            "start_offset": self.start_offset,
+            "end_offset": self.end_offset,
+            "file_size": self.file_size,
+            "line_count": self.line_count,
+            "has_more_before": self.has_more_before,
+            "has_more_after": self.has_more_after,
+        }
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+def read_tail(
+    path: Path,
+    max_lines: int,
+    before: Optional[int] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> LogChunk:
+    """
+    파일 끝에서 거꾸로 블록 단위로 읽어 마지막 max_lines 줄 반환
+
+    Args:
+        path: 로그 파일 경로
+        max_lines: 최대 줄 수
+        before: 이 바이트 오프셋 이전의 줄만 반환 (None이면 파일 끝, 이전 페이지 조회용)
+        max_bytes: 최대 읽기 바이트
+
+    Returns:
+        LogChunk: 마지막 max_lines 줄
+    """
+    with open(path, "rb") as f:
+        file_size = f.seek(0, os.SEEK_END)
+        end = file_size if before is None else max(0, min(before, file_size))
+
+        # 필요한 줄 수보다 개행이 많아질 때까지 뒤에서부터 블록 읽기
+        blocks = []
+        pos = end
+        newline_count = 0
+        while pos > 0 and newline_count <= max_lines and end - pos < max_bytes:
+            read_size = min(_BLOCK_SIZE, pos)
+            pos -= read_size
+            f.seek(pos)
+            block = f.read(read_size)
+            blocks.append(block)
+            newline_count += block.count(b"\n")
+
+    buf = b"".join(reversed(blocks))
+
+    # 마지막 개행은 줄 구분자로 세지 않음
+    search_end = len(buf) - 1 if buf.endswith(b"\n") else len(buf)
+    idx = search_end
+    for _ in range(max_lines):
+        idx = buf.rfind(b"\n", 0, idx)
+        if idx == -1:
+            break
+
+    if idx != -1:
+        start_in_buf = idx + 1
+    elif pos == 0:
+        start_in_buf = 0
+    else:
+        # max_bytes에 걸려 시작 부분이 잘린 줄은 제외
+        first_newline = buf.find(b"\n")
+        start_in_buf = first_newline + 1 if first_newline != -1 else 0
+
+    data = buf[start_in_buf:]
+    return LogChunk(
+        content=_decode(data),
+        start_offset=pos + start_in_buf,
+        end_offset=end,
+        file_size=file_size,
+        line_count=data.count(b"\n") + (0 if not data or data.endswith(b"\n") else 1),
+    )
+
+
+def read_forward(
+    path: Path,
+    after: int,
+    max_lines: int,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> LogChunk:
+    """
+    바이트 오프셋부터 앞으로 최대 max_lines 줄 반환
+
+    기록 중인 마지막 줄(개행 없음)은 제외하여 다음 요청에서 완전한 줄로 읽히도록 합니다.
+
+    Args:
+        path: 로그 파일 경로
+        after: 시작 바이트 오프셋 (이전 응답의 end_offset)
+        max_lines: 최대 줄 수
+        max_bytes: 최대 읽기 바이트
+
+    Returns:
+        LogChunk: 읽은 줄
+    """
+    with open(path, "rb") as f:
+        file_size = f.seek(0, os.SEEK_END)
+        start = max(0, min(after, file_size))
+        f.seek(start)
+        data = f.read(min(max_bytes, file_size - start))
+
+    # max_lines번째 개행까지 자르기
+    cut = -1
+    for _ in range(max_lines):
+        next_newline = data.find(b"\n", cut + 1)
+        if next_newline == -1:
+            break
+        cut = next_newline
+
+    if cut != -1:
+        data = data[:cut + 1]
+    elif len(data) < max_bytes:
+        # 개행 없는 미완성 줄 (기록 중)
+        data = b""
+    # else: max_bytes보다 긴 한 줄 → 진행을 위해 잘라서 반환
+
+    return LogChunk(
+        content=_decode(data),
+        start_offset=start,
+        end_offset=start + len(data),
+        file_size=file_size,
+        line_count=data.count(b"\n"),
+    )
+
+
+async def follow_log(
+    path: Path,
+    offset: Optional[int] = None,
+    poll_interval: float = 1.0,
+    max_lines: int = 1000,
+) -> AsyncIterator[LogChunk]:
+    """
+    파일 크기 폴링으로 새로 추가된 줄 스트리밍 (tail -F)
+
+    파일이 회전(inode 변경)되거나 잘리면(크기 < 오프셋) 처음부터 다시 읽습니다.
+    호출자가 반복을 중단할 때까지 계속됩니다.
+
+    Args:
+        path: 로그 파일 경로
+        offset: 시작 바이트 오프셋 (None이면 현재 파일 끝부터)
+        poll_interval: 폴링 간격 (초)
+        max_lines: 한 번에 전달할 최대 줄 수
+
+    Yields:
+        LogChunk: 새로 추가된 줄
+    """
+    inode = None
+    if offset is None:
+        try:
+            stat = path.stat()
+            offset, inode = stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            offset = 0
+
+    while True:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # 회전 중 잠시 파일이 없을 수 있음
+            await asyncio.sleep(poll_interval)
+            continue
+
+        if (inode is not None and stat.st_ino != inode) or stat.st_size < offset:
+            offset = 0
+        inode = stat.st_ino
+
+        if stat.st_size > offset:
+            chunk = await asyncio.to_thread(read_forward, path, offset, max_lines)
+            if chunk.end_offset > offset:
+                offset = chunk.end_offset
+                yield chunk
+                continue
+
+        await asyncio.sleep(poll_interval)
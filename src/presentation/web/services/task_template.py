@@ -0,0 +1,146 @@
+"""
+Worker 작업 템플릿 컴파일러
+
+task_template을 한 번만 파싱하여 (리터럴, 변수) 세그먼트 목록으로 컴파일하고,
+렌더링은 세그먼트를 순회하며 한 번의 join으로 수행합니다.
+(변수마다 str.replace로 전체 문자열을 복사하지 않음)
+
+변수:
+- {{input}}: 초기 입력
+- {{parent}}: 부모 노드의 출력
+- {{node_<id>}} 또는 {{<node_id>}}: 특정 노드의 출력
+
+필터:
+- {{parent|truncate}}, {{parent|truncate:2000}}: 최대 문자 수로 자르기 (기본 DEFAULT_TRUNCATE_LENGTH)
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, Union
+
+# 템플릿 변수 패턴: {{name}}, {{name|filter}}, {{name|filter:arg}}
+TEMPLATE_VAR_RE = re.compile(r"\{\{\s*(\w+)\s*(?:\|\s*(\w+)\s*(?::\s*(\d+)\s*)?)?\}\}")
+
+# truncate 필터 기본 최대 길이 (문자 수)
+DEFAULT_TRUNCATE_LENGTH = 4000
+
+SUPPORTED_FILTERS = ("truncate",)
+
+
+@dataclass(frozen=True)
+class TemplateVariable:
+    """
+    템플릿 변수 세그먼트
+
+    Attributes:
+        name: 변수 이름 (input, parent, 노드 ID 등)
+        raw: 원본 텍스트 (값이 없으면 그대로 출력)
+        filter_name: 필터 이름 (옵션)
+        filter_arg: 필터 인자 (옵션)
+    """
+    name: str
+    raw: str
+    filter_name: Optional[str] = None
+    filter_arg: Optional[int] = None
+
+
+Segment = Union[str, TemplateVariable]
+
+
+def truncate_text(value: str, max_length: int) -> str:
+    """
+    최대 문자 수로 자르기 (생략된 길이 표시)
+
+    Args:
+        value: 원본 문자열
+        max_length: 최대 문자 수
+
+    Returns:
+        str: 잘린 문자열 (max_length 이하면 원본)
+    """
+    if len(value) <= max_length:
+        return value
+    return f"{value[:max_length]}\n... (출력 {len(value)}자 중 {len(value) - max_length}자 생략)"
+
+
+@dataclass(frozen=True)
+class CompiledTaskTemplate:
+    """
+    컴파일된 작업 템플릿
+
+    Attributes:
+        segments: 리터럴 문자열과 변수가 섞인 세그먼트 목록
+        variables: 템플릿에 포함된 변수 이름 (중복 제거, 등장 순서)
+    """
+    segments: Tuple[Segment, ...]
+    variables: Tuple[str, ...]
+
+    def render(self, resolve: Callable[[str], Optional[str]]) -> str:
+        """
+        템플릿 렌더링 (한 번의 join)
+
+        치환된 값 안의 {{...}}는 다시 치환하지 않습니다.
+
+        Args:
+            resolve: 변수 이름 → 값 (없으면 None, 원본 텍스트 유지)
+
+        Returns:
+            str: 렌더링된 문자열
+        """
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            value = resolve(segment.name)
+            if value is None:
+                parts.append(segment.raw)
+                continue
+
+            if segment.filter_name == "truncate":
+                value = truncate_text(value, segment.filter_arg or DEFAULT_TRUNCATE_LENGTH)
+            parts.append(value)
+
+        return "".join(parts)
+
+
+@lru_cache(maxsize=512)
+def compile_task_template(template: str) -> CompiledTaskTemplate:
+    """
+    작업 템플릿 컴파일 (같은 템플릿 문자열은 캐시 재사용)
+
+    알 수 없는 필터는 무시합니다 (값은 그대로 치환).
+
+    Args:
+        template: 템플릿 문자열
+
+    Returns:
+        CompiledTaskTemplate: 컴파일된 템플릿
+    """
+    segments = []
+    variables = []
+    position = 0
+
+    for match in TEMPLATE_VAR_RE.finditer(template):
+        if match.start() > position:
+            segments.append(template[position:match.start()])
+
+        name, filter_name, filter_arg = match.groups()
+        if filter_name not in SUPPORTED_FILTERS:
+            filter_name = None
+        segments.append(TemplateVariable(
+            name=name,
+            raw=match.group(0),
+            filter_name=filter_name,
+            filter_arg=int(filter_arg) if filter_arg and filter_name else None,
+        ))
+        if name not in variables:
+            variables.append(name)
+        position = match.end()
+
+    if position < len(template):
+        segments.append(template[position:])
+
+    return CompiledTaskTemplate(segments=tuple(segments), variables=tuple(variables))
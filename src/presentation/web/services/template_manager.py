@@ -2,18 +2,48 @@
 워크플로우 템플릿 관리자
 
 TemplateManager: 템플릿 CRUD 및 검증 로직
+
+템플릿은 메모리 카탈로그(템플릿 ID → 템플릿 + 메타데이터)에 캐싱되며,
+파일의 mtime/크기가 바뀐 경우에만 다시 파싱합니다.
 """
 
+import hashlib
 import json
+import threading
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from src.presentation.web.schemas.template import Template, TemplateMetadata
 from src.infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 파일 서명: (mtime_ns, 크기)
+FileSignature = Tuple[int, int]
+
+
+@dataclass
+class _CatalogEntry:
+    """
+    카탈로그 항목 (파싱된 템플릿 + 목록용 메타데이터)
+
+    Attributes:
+        template_file: 템플릿 파일 경로
+        signature: 파싱 시점의 파일 서명
+        template: 템플릿 객체
+        metadata: 목록 조회용 메타데이터 (미리 계산)
+        search_text: 검색용 소문자 텍스트 (이름, 설명, 태그)
+        tags: 필터용 소문자 태그 집합
+    """
+    template_file: Path
+    signature: FileSignature
+    template: Template
+    metadata: TemplateMetadata
+    search_text: str
+    tags: frozenset
+
 
 class TemplateManager:
     """
@@ -23,9 +53,13 @@ class TemplateManager:
     - 내장 템플릿: templates/ 디렉토리 (읽기 전용, 삭제 불가)
     - 사용자 템플릿: ~/.claude-flow/templates/ 디렉토리 (읽기/쓰기/삭제 가능)
 
+    템플릿은 메모리 카탈로그에 캐싱되며, 조회 시 파일 서명(mtime, 크기)을 비교하여
+    추가/수정/삭제된 파일만 다시 반영합니다.
+
     Attributes:
         builtin_templates_dir: 내장 템플릿 디렉토리
         user_templates_dir: 사용자 템플릿 디렉토리
+        catalog_etag: 현재 카탈로그의 ETag (템플릿 파일이 바뀌면 변경)
     """
 
     def __init__(
@@ -56,44 +90,205 @@ class TemplateManager:
         # 사용자 템플릿 디렉토리 생성 (존재하지 않으면)
         self.user_templates_dir.mkdir(parents=True, exist_ok=True)
 
+        # 템플릿 카탈로그 (템플릿 ID → 항목), 내장 → 사용자 순서 유지
+        self._catalog: Dict[str, _CatalogEntry] = {}
+        # 파싱 실패 파일 (경로 → 서명): 파일이 바뀔 때까지 다시 파싱하지 않음
+        self._failed_files: Dict[Path, FileSignature] = {}
+        self._lock = threading.Lock()
+        self.catalog_etag = ""
+
         logger.info(f"TemplateManager 초기화 완료: builtin={self.builtin_templates_dir}, user={self.user_templates_dir}")
 
-    def list_templates(self) -> List[TemplateMetadata]:
+    @staticmethod
+    def _get_signature(template_file: Path) -> Optional[FileSignature]:
+        """파일 서명 (없으면 None)"""
+        try:
+            stat = template_file.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _scan_template_files(self) -> List[Tuple[str, Path, bool, FileSignature]]:
+        """
+        템플릿 파일 목록 (내장 → 사용자 순서, 같은 ID면 내장 템플릿 우선)
+
+        Returns:
+            (템플릿 ID, 파일 경로, 내장 여부, 파일 서명) 목록
+        """
+        files = []
+        seen = set()
+        for templates_dir, is_builtin in (
+            (self.builtin_templates_dir, True),
+            (self.user_templates_dir, False),
+        ):
+            if not templates_dir.exists():
+                continue
+            for template_file in sorted(templates_dir.glob("*.json")):
+                template_id = template_file.stem
+                if template_id in seen:
+                    continue
+                signature = self._get_signature(template_file)
+                if signature is None:
+                    continue
+                seen.add(template_id)
+                files.append((template_id, template_file, is_builtin, signature))
+        return files
+
+    def _build_entry(
+        self,
+        template_file: Path,
+        is_builtin: bool,
+        signature: FileSignature
+    ) -> Optional[_CatalogEntry]:
+        """템플릿 파일을 파싱하여 카탈로그 항목 생성 (로드 실패 시 None)"""
+        if self._failed_files.get(template_file) == signature:
+            return None
+
+        template = self._load_template_from_file(template_file, is_builtin=is_builtin)
+        if template is None:
+            self._failed_files[template_file] = signature
+            return None
+        self._failed_files.pop(template_file, None)
+
+        tags = template.tags or []
+        search_text = " ".join([template.name, template.description or "", *tags]).lower()
+        return _CatalogEntry(
+            template_file=template_file,
+            signature=signature,
+            template=template,
+            metadata=template.to_metadata(),
+            search_text=search_text,
+            tags=frozenset(tag.lower() for tag in tags),
+        )
+
+    def _refresh_catalog(self) -> None:
         """
-        템플릿 목록 조회 (메타데이터만)
+        카탈로그 갱신 (추가/수정된 파일만 다시 파싱, 삭제된 파일은 제거)
+
+        파싱에 실패한 파일은 카탈로그에서 제외되며, 파일이 다시 수정되면 재시도합니다.
+        (목록 조회마다 디렉토리 스캔과 stat만 수행)
+        """
+        with self._lock:
+            catalog: Dict[str, _CatalogEntry] = {}
+            etag_source = []
+            reloaded = 0
+
+            for template_id, template_file, is_builtin, signature in self._scan_template_files():
+                etag_source.append(f"{template_id}:{int(is_builtin)}:{signature[0]}:{signature[1]}")
+
+                entry = self._catalog.get(template_id)
+                if (
+                    entry is not None
+                    and entry.template_file == template_file
+                    and entry.signature == signature
+                ):
+                    catalog[template_id] = entry
+                    continue
+
+                entry = self._build_entry(template_file, is_builtin, signature)
+                if entry is not None:
+                    catalog[template_id] = entry
+                    reloaded += 1
+
+            self._catalog = catalog
+            self.catalog_etag = hashlib.sha1("\n".join(etag_source).encode("utf-8")).hexdigest()[:16]
+
+        if reloaded:
+            logger.info(f"템플릿 카탈로그 갱신: {reloaded}개 파싱 (전체 {len(catalog)}개)")
+
+    def list_templates(
+        self,
+        category: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        query: Optional[str] = None
+    ) -> List[TemplateMetadata]:
+        """
+        템플릿 목록 조회 (메타데이터만, 메모리 카탈로그에서 필터링)
 
         내장 템플릿과 사용자 템플릿을 모두 반환합니다.
 
+        Args:
+            category: 카테고리 필터 (옵션)
+            tags: 태그 필터 (모든 태그를 포함하는 템플릿만, 대소문자 무시, 옵션)
+            query: 검색어 (이름, 설명, 태그에 포함, 대소문자 무시, 옵션)
+
         Returns:
             템플릿 메타데이터 목록
         """
-        templates = []
+        self._refresh_catalog()
 
-        # 내장 템플릿 로드
-        if self.builtin_templates_dir.exists():
-            for template_file in self.builtin_templates_dir.glob("*.json"):
-                try:
-                    template = self._load_template_from_file(template_file, is_builtin=True)
-                    if template:
-                        templates.append(template.to_metadata())
-                except Exception as e:
-                    logger.error(f"내장 템플릿 로드 실패: {template_file.name} - {e}")
-
-        # 사용자 템플릿 로드
-        for template_file in self.user_templates_dir.glob("*.json"):
-            try:
-                template = self._load_template_from_file(template_file, is_builtin=False)
-                if template:
-                    templates.append(template.to_metadata())
-            except Exception as e:
-                logger.error(f"사용자 템플릿 로드 실패: {template_file.name} - {e}")
-
-        logger.info(f"템플릿 목록 조회 완료: {len(templates)}개")
+        required_tags = {tag.lower() for tag in tags} if tags else set()
+        query_text = query.lower() if query else None
+
+        templates = []
+        for entry in list(self._catalog.values()):
+            if category and entry.metadata.category != category:
+                continue
+            if required_tags and not required_tags <= entry.tags:
+                continue
+            if query_text and query_text not in entry.search_text:
+                continue
+            templates.append(entry.metadata)
+
+        logger.debug(f"템플릿 목록 조회 완료: {len(templates)}개")
         return templates
 
+    def get_template_etag(self, template_id: str) -> Optional[str]:
+        """
+        템플릿 ETag (파일 서명 기반, 템플릿이 없으면 None)
+
+        Args:
+            template_id: 템플릿 ID
+
+        Returns:
+            ETag 문자열 (따옴표 제외)
+        """
+        entry = self._get_entry(template_id)
+        if entry is None:
+            return None
+        return f"{template_id}-{entry.signature[0]:x}-{entry.signature[1]:x}"
+
+    def _get_entry(self, template_id: str) -> Optional[_CatalogEntry]:
+        """
+        카탈로그 항목 조회 (해당 파일만 검사하여 바뀐 경우 다시 파싱)
+
+        Args:
+            template_id: 템플릿 ID
+
+        Returns:
+            카탈로그 항목 (없으면 None)
+        """
+        for templates_dir, is_builtin in (
+            (self.builtin_templates_dir, True),
+            (self.user_templates_dir, False),
+        ):
+            template_file = templates_dir / f"{template_id}.json"
+            signature = self._get_signature(template_file)
+            if signature is None:
+                continue
+
+            with self._lock:
+                entry = self._catalog.get(template_id)
+                if (
+                    entry is not None
+                    and entry.template_file == template_file
+                    and entry.signature == signature
+                ):
+                    return entry
+
+            entry = self._build_entry(template_file, is_builtin, signature)
+            if entry is None:
+                continue
+            # 카탈로그 ETag는 다음 목록 조회(_refresh_catalog) 시 갱신
+            with self._lock:
+                self._catalog[template_id] = entry
+            return entry
+
+        return None
+
     def get_template(self, template_id: str) -> Optional[Template]:
         """
-        템플릿 상세 조회 (전체 데이터)
+        템플릿 상세 조회 (전체 데이터, 파일이 바뀌지 않았으면 캐시 사용)
 
         Args:
             template_id: 템플릿 ID
@@ -101,21 +296,10 @@ class TemplateManager:
         Returns:
             템플릿 객체 (없으면 None)
         """
-        # 내장 템플릿 검색
-        builtin_file = self.builtin_templates_dir / f"{template_id}.json"
-        if builtin_file.exists():
-            template = self._load_template_from_file(builtin_file, is_builtin=True)
-            if template:
-                logger.info(f"내장 템플릿 조회 완료: {template_id}")
-                return template
-
-        # 사용자 템플릿 검색
-        user_file = self.user_templates_dir / f"{template_id}.json"
-        if user_file.exists():
-            template = self._load_template_from_file(user_file, is_builtin=False)
-            if template:
-                logger.info(f"사용자 템플릿 조회 완료: {template_id}")
-                return template
+        entry = self._get_entry(template_id)
+        if entry is not None:
+            logger.debug(f"{'내장' if entry.template.is_builtin else '사용자'} 템플릿 조회 완료: {template_id}")
+            return entry.template
 
         logger.warning(f"템플릿을 찾을 수 없습니다: {template_id}")
         return None
@@ -169,7 +353,7 @@ class TemplateManager:
             "updated_at": now
         }
 
-        # 파일로 저장
+        # 파일로 저장 (카탈로그는 다음 조회 시 파일 서명 비교로 갱신)
         template_file = self.user_templates_dir / f"{template_id}.json"
         with open(template_file, "w", encoding="utf-8") as f:
             json.dump(template_data, f, indent=2, ensure_ascii=False)
@@ -196,6 +380,8 @@ class TemplateManager:
         user_file = self.user_templates_dir / f"{template_id}.json"
         if user_file.exists():
             user_file.unlink()
+            with self._lock:
+                self._catalog.pop(template_id, None)
             logger.info(f"사용자 템플릿 삭제 완료: {template_id}")
             return True
 
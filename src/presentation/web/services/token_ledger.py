@@ -0,0 +1,197 @@
+"""
+토큰 사용량 원장 (Token Ledger)
+
+워크플로우 세션의 토큰 사용량을 노드/Agent/모델별로 누적 집계합니다.
+세션 저장소(WorkflowSession)에 함께 저장되며, 프로젝트 단위 집계에도 사용됩니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Optional
+
+
+@dataclass
+class UsageTotals:
+    """
+    토큰 사용량 누적값
+
+    Attributes:
+        input_tokens: 입력 토큰 수
+        output_tokens: 출력 토큰 수
+        cache_read_tokens: 캐시에서 읽은 입력 토큰 수
+        cache_creation_tokens: 캐시 생성 입력 토큰 수
+        cost_usd: 비용 (USD, SDK가 제공하는 경우)
+        calls: 누적된 실행 횟수
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+    calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """전체 토큰 수 (입력 + 출력)"""
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """
+        프롬프트 캐시 적중률 (캐시 읽기 / 전체 입력)
+
+        SDK의 input_tokens에는 캐시 토큰이 포함되지 않으므로
+        전체 입력 = input + cache_read + cache_creation
+        """
+        prompt_tokens = self.input_tokens + self.cache_read_tokens + self.cache_creation_tokens
+        return self.cache_read_tokens / prompt_tokens if prompt_tokens else 0.0
+
+    def add(self, usage: Dict[str, Any]) -> None:
+        """
+        사용량 누적
+
+        Args:
+            usage: 토큰 사용량 딕셔너리 (TokenUsage.model_dump() 또는 SDK usage 딕셔너리)
+        """
+        self.input_tokens += usage.get("input_tokens") or 0
+        self.output_tokens += usage.get("output_tokens") or 0
+        self.cache_read_tokens += usage.get("cache_read_tokens") or 0
+        self.cache_creation_tokens += usage.get("cache_creation_tokens") or 0
+        self.cost_usd += usage.get("cost_usd") or 0.0
+        self.calls += 1
+
+    def merge(self, other: "UsageTotals") -> None:
+        """다른 누적값 병합"""
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.cost_usd += other.cost_usd
+        self.calls += other.calls
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (JSON 직렬화용)"""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
+            "total_tokens": self.total_tokens,
+            "cache_hit_ratio": round(self.cache_hit_ratio, 4),
+            "cost_usd": round(self.cost_usd, 6),
+            "calls": self.calls,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "UsageTotals":
+        """딕셔너리에서 복원"""
+        return cls(
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            cache_read_tokens=data.get("cache_read_tokens", 0),
+            cache_creation_tokens=data.get("cache_creation_tokens", 0),
+            cost_usd=data.get("cost_usd", 0.0),
+            calls=data.get("calls", 0),
+        )
+
+
+def _totals_map_to_dict(totals_map: Dict[str, UsageTotals]) -> Dict[str, Dict[str, Any]]:
+    return {key: totals.to_dict() for key, totals in totals_map.items()}
+
+
+def _totals_map_from_dict(data: Dict[str, Dict[str, Any]]) -> Dict[str, UsageTotals]:
+    return {key: UsageTotals.from_dict(value) for key, value in (data or {}).items()}
+
+
+@dataclass
+class TokenLedger:
+    """
+    토큰 사용량 원장
+
+    Attributes:
+        total: 전체 누적값
+        by_node: 노드별 누적값 (node_id → UsageTotals)
+        by_agent: Agent별 누적값 (agent_name → UsageTotals)
+        by_model: 모델별 누적값 (model → UsageTotals)
+        budget: 토큰 예산 (None이면 제한 없음)
+    """
+    total: UsageTotals = field(default_factory=UsageTotals)
+    by_node: Dict[str, UsageTotals] = field(default_factory=dict)
+    by_agent: Dict[str, UsageTotals] = field(default_factory=dict)
+    by_model: Dict[str, UsageTotals] = field(default_factory=dict)
+    budget: Optional[int] = None
+
+    def record(
+        self,
+        usage: Dict[str, Any],
+        node_id: Optional[str] = None,
+        agent_name: Optional[str] = None,
+        model: Optional[str] = None,
+    ) -> None:
+        """
+        사용량 기록 (전체/노드/Agent/모델별 동시 누적)
+
+        Args:
+            usage: 토큰 사용량 딕셔너리
+            node_id: 노드 ID (옵션)
+            agent_name: Agent 이름 (옵션)
+            model: 모델명 (옵션)
+        """
+        self.total.add(usage)
+        for key, totals_map in ((node_id, self.by_node), (agent_name, self.by_agent), (model, self.by_model)):
+            if key:
+                totals_map.setdefault(key, UsageTotals()).add(usage)
+
+    def merge(self, other: "TokenLedger") -> None:
+        """다른 원장 병합 (프로젝트 단위 집계용)"""
+        self.total.merge(other.total)
+        for source, target in (
+            (other.by_node, self.by_node),
+            (other.by_agent, self.by_agent),
+            (other.by_model, self.by_model),
+        ):
+            for key, totals in source.items():
+                target.setdefault(key, UsageTotals()).merge(totals)
+
+    def is_over_budget(self) -> bool:
+        """토큰 예산 초과 여부"""
+        return self.budget is not None and self.total.total_tokens > self.budget
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (JSON 직렬화용)"""
+        return {
+            "total": self.total.to_dict(),
+            "by_node": _totals_map_to_dict(self.by_node),
+            "by_agent": _totals_map_to_dict(self.by_agent),
+            "by_model": _totals_map_to_dict(self.by_model),
+            "budget": self.budget,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "TokenLedger":
+        """딕셔너리에서 복원 (없으면 빈 원장)"""
+        if not data:
+            return cls()
+        return cls(
+            total=UsageTotals.from_dict(data.get("total", {})),
+            by_node=_totals_map_from_dict(data.get("by_node", {})),
+            by_agent=_totals_map_from_dict(data.get("by_agent", {})),
+            by_model=_totals_map_from_dict(data.get("by_model", {})),
+            budget=data.get("budget"),
+        )
+
+    @classmethod
+    def aggregate(cls, ledgers: Iterable["TokenLedger"]) -> "TokenLedger":
+        """
+        여러 원장을 하나로 집계 (노드별 집계는 세션마다 ID가 달라 제외)
+
+        Args:
+            ledgers: 집계할 원장 목록
+
+        Returns:
+            TokenLedger: 집계된 원장
+        """
+        result = cls()
+        for ledger in ledgers:
+            result.merge(ledger)
+        result.by_node = {}
+        return result
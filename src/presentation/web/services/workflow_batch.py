@@ -0,0 +1,223 @@
+"""
+워크플로우 배치 실행 상태
+
+하나의 워크플로우를 여러 입력에 대해 실행하는 배치의 항목별 상태와 집계 진행률을 관리합니다.
+실행 자체는 BackgroundWorkflowManager.start_batch가 동시 실행 수를 제한하여 수행합니다.
+
+- 항목마다 별도 세션(session_id)으로 실행되므로 기존 세션 API(/sessions/{id}/stream 등)로 개별 조회 가능
+- 진행률이 바뀔 때마다 wait_for_change 대기자를 깨워 집계 진행률을 스트리밍
+- 결과는 항목당 한 줄의 JSONL로 내보냄
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from src.presentation.web.schemas.workflow import Workflow
+
+# 항목 상태
+ITEM_STATES = ("queued", "running", "completed", "error", "cancelled")
+FINISHED_ITEM_STATES = ("completed", "error", "cancelled")
+
+
+@dataclass
+class BatchItem:
+    """
+    배치 항목 (입력 하나에 대한 실행)
+
+    Attributes:
+        index: 입력 순번 (0부터)
+        input: 초기 입력
+        session_id: 항목 실행 세션 ID
+        status: 상태 (queued, running, completed, error, cancelled)
+        outputs: 종단 노드(자식이 없는 노드) ID → 출력
+        error: 에러 메시지
+        started_at: 시작 시각 (ISO 8601)
+        ended_at: 종료 시각 (ISO 8601)
+        elapsed_time: 실행 시간 (초)
+        total_tokens: 사용한 토큰 수
+    """
+    index: int
+    input: str
+    session_id: str
+    status: str = "queued"
+    outputs: Dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None
+    started_at: Optional[str] = None
+    ended_at: Optional[str] = None
+    elapsed_time: Optional[float] = None
+    total_tokens: int = 0
+
+    def to_summary(self) -> Dict[str, Any]:
+        """진행률 조회용 요약 (입력/출력 본문 제외)"""
+        return {
+            "index": self.index,
+            "session_id": self.session_id,
+            "status": self.status,
+            "error": self.error,
+            "elapsed_time": self.elapsed_time,
+            "total_tokens": self.total_tokens,
+        }
+
+    def to_result(self) -> Dict[str, Any]:
+        """결과 내보내기용 딕셔너리 (JSONL 한 줄)"""
+        return {
+            "index": self.index,
+            "session_id": self.session_id,
+            "status": self.status,
+            "input": self.input,
+            "outputs": self.outputs,
+            "error": self.error,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "elapsed_time": self.elapsed_time,
+            "total_tokens": self.total_tokens,
+        }
+
+
+@dataclass
+class WorkflowBatch:
+    """
+    워크플로우 배치
+
+    Attributes:
+        batch_id: 배치 ID
+        workflow: 실행할 워크플로우 (모든 항목이 같은 객체 공유 → 실행 계획 캐시 재사용)
+        items: 배치 항목 목록
+        concurrency: 최대 동시 실행 수
+        project_path: 프로젝트 경로
+        start_node_id: 시작 노드 ID (옵션)
+        timeout: 항목별 실행 제한 시간 (초, 옵션)
+        token_budget: 항목별 토큰 예산 (옵션)
+        status: 배치 상태 (running, completed, cancelled)
+        created_at: 생성 시각 (ISO 8601)
+        ended_at: 종료 시각 (ISO 8601)
+        task: 배치 실행 Task
+    """
+    batch_id: str
+    workflow: Workflow
+    items: List[BatchItem]
+    concurrency: int
+    project_path: Optional[str] = None
+    start_node_id: Optional[str] = None
+    timeout: Optional[float] = None
+    token_budget: Optional[int] = None
+    status: str = "running"
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    ended_at: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+    version: int = 0
+    _changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def completed(self) -> bool:
+        """배치 종료 여부"""
+        return self.status != "running"
+
+    def count(self, status: str) -> int:
+        """상태별 항목 수"""
+        return sum(1 for item in self.items if item.status == status)
+
+    def notify(self) -> None:
+        """진행률 변경 알림 (wait_for_change 대기자 깨우기)"""
+        self.version += 1
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    async def wait_for_change(self, version: int, timeout: float = 15.0) -> bool:
+        """
+        진행률 변경 대기
+
+        Args:
+            version: 마지막으로 본 버전
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            bool: 변경 여부 (시간 초과 시 False)
+        """
+        if self.version != version:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        집계 진행률
+
+        Returns:
+            Dict[str, Any]: 배치 ID, 상태, 상태별 항목 수, 완료 비율, 누적 토큰 수 등
+        """
+        counts = {state: 0 for state in ITEM_STATES}
+        total_tokens = 0
+        elapsed_times = []
+        for item in self.items:
+            counts[item.status] += 1
+            total_tokens += item.total_tokens
+            if item.elapsed_time is not None:
+                elapsed_times.append(item.elapsed_time)
+
+        total = len(self.items)
+        finished = sum(counts[state] for state in FINISHED_ITEM_STATES)
+        return {
+            "batch_id": self.batch_id,
+            "workflow_name": self.workflow.name,
+            "status": self.status,
+            "total": total,
+            "finished": finished,
+            "progress": finished / total if total else 1.0,
+            "counts": counts,
+            "concurrency": self.concurrency,
+            "total_tokens": total_tokens,
+            "avg_elapsed_time": sum(elapsed_times) / len(elapsed_times) if elapsed_times else None,
+            "created_at": self.created_at,
+            "ended_at": self.ended_at,
+        }
+
+    def iter_results_jsonl(self):
+        """
+        결과 JSONL 줄 생성 (입력 순서, 종료된 항목만)
+
+        Yields:
+            str: JSON 한 줄 (개행 포함)
+        """
+        for item in self.items:
+            if item.status in FINISHED_ITEM_STATES:
+                yield json.dumps(item.to_result(), ensure_ascii=False) + "\n"
+
+
+def parse_batch_inputs_jsonl(content: str) -> List[str]:
+    """
+    JSONL 배치 입력 파싱
+
+    각 줄은 JSON 문자열("...") 또는 input 필드가 있는 객체({"input": "..."})입니다.
+    빈 줄은 무시합니다.
+
+    Args:
+        content: JSONL 본문
+
+    Returns:
+        List[str]: 입력 목록
+
+    Raises:
+        ValueError: 줄 형식이 잘못된 경우
+    """
+    inputs = []
+    for line_no, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{line_no}번째 줄 JSON 파싱 실패: {e}") from e
+
+        if isinstance(value, dict):
+            value = value.get("input")
+        if not isinstance(value, str):
+            raise ValueError(f"{line_no}번째 줄: 문자열 또는 {{\"input\": \"...\"}} 형식이어야 합니다")
+        inputs.append(value)
+    return inputs
@@ -7,16 +7,24 @@
 import asyncio
 import time
 from datetime import datetime
-from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
-from collections import deque
+from typing import Dict, Any, AsyncIterator, Callable, List, NamedTuple, Optional, Set, Tuple
+from collections import OrderedDict, deque
 from dataclasses import replace
-from pathlib import Path
 
 from src.domain.models import AgentConfig
-from src.infrastructure.config import JsonConfigLoader
+from src.infrastructure.config import JsonConfigLoader, AgentRegistrySnapshot, get_agent_registry
+from src.infrastructure.config.agent_registry import DEFAULT_PROJECT_KEY
 from src.infrastructure.claude.worker_client import WorkerAgent
-from src.infrastructure.storage.custom_worker_repository import CustomWorkerRepository
-from src.infrastructure.logging import get_logger, add_session_file_handlers, remove_session_file_handlers
+from src.infrastructure.claude.sdk_executor import StreamChunk, WorkerResponseHandler
+from src.infrastructure.claude.resilience import WorkerTimeoutError
+from src.infrastructure.logging import (
+    get_logger,
+    add_session_file_handlers,
+    remove_session_file_handlers,
+    get_hot_path_logger,
+    bind_node_log_context,
+)
+from src.infrastructure.metrics import CACHE_REQUESTS_TOTAL, INPUT_BUDGET_TOKENS_TOTAL
 from src.presentation.web.schemas.workflow import (
     Workflow,
     WorkflowNode,
@@ -28,126 +36,60 @@ from src.presentation.web.schemas.workflow import (
     MergeNodeData,
     TokenUsage,
 )
+from src.presentation.web.services.task_template import compile_task_template
+from src.presentation.web.services.input_budget import InputBudgetPolicy, apply_input_budget
+from src.presentation.web.services.condition_expression import ConditionExpressionError, compile_condition
+from src.presentation.web.services.llm_condition import VerdictCache, detect_verdict, parse_llm_verdict
 
 logger = get_logger(__name__)
 
+# 실행 계획 캐시 최대 항목 수
+_PLAN_CACHE_SIZE = 64
 
-def extract_text_from_worker_output(output: str) -> str:
-    """
-    Worker 출력에서 최종 텍스트만 추출
-
-    Worker 출력은 thinking, tool_use, tool_result, text 블록을 포함할 수 있습니다.
-    이 함수는 type="text"인 블록만 추출하여 반환합니다.
-
-    Args:
-        output: Worker의 전체 출력
-
-    Returns:
-        str: 최종 텍스트만 추출된 결과
-    """
-    import json
-
-    text_parts = []
-
-    # {"role": "assistant"로 시작하는 JSON 객체 찾기 (중괄호 카운팅)
-    start_pattern = '{"role":'
-    idx = 0
-
-    while idx < len(output):
-        # {"role": 패턴 찾기
-        start_idx = output.find(start_pattern, idx)
-        if start_idx == -1:
-            break
+# LLM 조건 평가 모델 (저비용)
+LLM_CONDITION_MODEL = "claude-haiku-4-5-20251001"
 
-        # 중괄호 카운팅으로 완전한 JSON 객체 추출
-        brace_count = 0
-        in_string = False
-        escape_next = False
-        end_idx = start_idx
+# 청크 단위로 호출되는 로그 전용 (호출 위치 검사 생략, %-스타일 지연 포맷팅)
+hot_logger = get_hot_path_logger(__name__)
 
-        for i in range(start_idx, len(output)):
-            char = output[i]
 
-            if escape_next:
-                escape_next = False
-                continue
+class WorkflowTimeoutError(Exception):
+    """워크플로우 전체 실행 제한 시간 초과 예외"""
 
-            if char == '\\':
-                escape_next = True
-                continue
 
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-
-            if not in_string:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_idx = i + 1
-                        break
-
-        # 완전한 JSON 객체 추출 시도
-        if end_idx > start_idx:
-            try:
-                json_str = output[start_idx:end_idx]
-                data = json.loads(json_str)
-
-                # content 배열에서 type="text"인 블록만 추출
-                if isinstance(data.get("content"), list):
-                    for block in data["content"]:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-
-            except json.JSONDecodeError as e:
-                logger.debug(f"JSON 파싱 실패 (위치: {start_idx}-{end_idx}): {e}")
-
-            idx = end_idx
-        else:
-            idx = start_idx + len(start_pattern)
-
-    # 텍스트 블록을 찾았으면 조합하여 반환
-    if text_parts:
-        result = "\n".join(text_parts).strip()
-        logger.debug(f"텍스트 추출 성공: {len(text_parts)}개 블록, {len(result)}자")
-        return result
+class _NodeFailure(NamedTuple):
+    """
+    병렬 실행 중 노드 실패 (이벤트 큐 전달용)
 
-    # JSON 파싱 실패 시 전체 출력 반환 (안전장치)
-    logger.warning("텍스트 블록을 찾을 수 없어 전체 출력 반환")
-    return output
+    Attributes:
+        node_id: 실패한 노드 ID
+        error: 발생한 예외
+        reported: 노드가 이미 node_error/node_timeout 이벤트를 보냈는지 여부
+    """
+    node_id: str
+    error: Exception
+    reported: bool
 
 
-def classify_chunk_type(chunk: str) -> str:
+class TokenBudgetExceededError(Exception):
     """
-    Worker 출력 청크의 타입을 분류합니다.
-
-    Args:
-        chunk: 출력 청크
+    워크플로우 토큰 예산 초과 예외
 
-    Returns:
-        str: "thinking", "tool", "text" 중 하나
+    Attributes:
+        budget: 토큰 예산
+        used: 초과 시점까지 사용한 토큰 수
+        node_id: 초과 시점에 실행 중이던 노드 ID (노드 실행 중 초과한 경우)
+        node_usage: 해당 노드의 중단 시점까지 사용량 (원장 기록용)
+        node_info: 해당 노드의 agent_name, model (원장 기록용)
     """
-    import json
 
-    # JSON 블록인지 확인
-    if chunk.strip().startswith('{"role":'):
-        try:
-            data = json.loads(chunk)
-            if isinstance(data.get("content"), list):
-                for block in data["content"]:
-                    if isinstance(block, dict):
-                        block_type = block.get("type", "")
-                        if block_type in ("thinking", "tool_use", "tool_result"):
-                            return "thinking" if block_type == "thinking" else "tool"
-                        elif block_type == "text":
-                            return "text"
-        except json.JSONDecodeError:
-            pass
-
-    # 기본적으로 text로 간주
-    return "text"
+    def __init__(self, message: str, budget: int, used: int):
+        super().__init__(message)
+        self.budget = budget
+        self.used = used
+        self.node_id: Optional[str] = None
+        self.node_usage: Optional[TokenUsage] = None
+        self.node_info: Dict[str, Any] = {}
 
 
 class WorkflowExecutor:
@@ -159,7 +101,8 @@ class WorkflowExecutor:
 
     Attributes:
         config_loader: Agent 설정 로더
-        agent_configs: Agent 설정 목록 (캐시)
+        agent_registry: Agent 레지스트리 (기본 + 커스텀 워커, 핫 리로드)
+        agent_configs: Agent 설정 목록 (레지스트리 스냅샷)
     """
 
     def __init__(self, config_loader: JsonConfigLoader, project_path: Optional[str] = None):
@@ -172,18 +115,25 @@ class WorkflowExecutor:
         """
         self.config_loader = config_loader
         self.project_path = project_path
-        self.agent_configs = config_loader.load_agent_configs()
 
         # Condition 노드 반복 횟수 추적 (세션별, 노드별)
         # {session_id: {node_id: iteration_count}}
         self._condition_iterations: Dict[str, Dict[str, int]] = {}
 
+        # 노드 완료 순번 (세션별, 노드별 마지막 완료 순번)
+        # {session_id: {node_id: seq}}
+        # quorum 병합 (먼저 완료된 분기 선택, 반복 시 병합 노드 완료 이후 분기만 집계)
+        self._completion_order: Dict[str, Dict[str, int]] = {}
+
         # 노드 세션 관리 (노드별 현재 활성 SDK 세션 ID 저장)
         # {node_id: session_id}
         # 메모리 기반: 서버 재시작 시 초기화
         # 여러 워크플로우 실행에 걸쳐 유지되어 컨텍스트 재활용
         self._node_sessions: Dict[str, str] = {}
 
+        # 노드 세션을 재개/저장하지 않는 실행 (배치 실행: 입력 간 대화 컨텍스트 공유 방지)
+        self._isolated_sessions: Set[str] = set()
+
         # 노드 세션 이력 (노드별 모든 세션 목록)
         # {node_id: [SessionInfo, ...]}
         # 사용자가 세션 목록을 보고 선택할 수 있도록 지원
@@ -199,27 +149,42 @@ class WorkflowExecutor:
         # Human-in-the-Loop 지원: Worker가 사용자 입력을 요청할 때 사용
         self.user_input_queues: Dict[str, asyncio.Queue] = {}
 
-        # 커스텀 워커 로드 (프로젝트 경로가 주어진 경우)
-        self.custom_worker_names = set()
-        if project_path:
-            try:
-                custom_repo = CustomWorkerRepository(Path(project_path))
-                custom_workers = custom_repo.load_custom_workers()
-                self.agent_configs.extend(custom_workers)
-                self.custom_worker_names = {w.name for w in custom_workers}
-                logger.info(
-                    f"커스텀 워커 로드 완료: {len(custom_workers)}개 "
-                    f"(프로젝트: {project_path})"
-                )
-            except Exception as e:
-                logger.warning(
-                    f"커스텀 워커 로드 실패 (프로젝트: {project_path}): {e}",
-                    exc_info=True
-                )
-
-        self.agent_config_map = {
-            config.name: config for config in self.agent_configs
-        }
+        # 토큰 예산 관리 (세션별)
+        # {session_id: budget}, {session_id: 완료된 노드의 누적 토큰 수}
+        self._token_budgets: Dict[str, Optional[int]] = {}
+        self._token_spent: Dict[str, int] = {}
+
+        # LLM 조건 판정 캐시 ((모델, 조건 프롬프트, 출력 해시) → 판정)
+        # 피드백 루프에서 같은 출력을 다시 평가할 때 LLM 호출 생략
+        self._llm_verdict_cache = VerdictCache()
+
+        # 실행 계획 캐시 (워크플로우 구조 → 위상 정렬 순서, 실행 그룹)
+        # 배치 실행처럼 같은 워크플로우를 반복 실행할 때 그래프 분석 재사용
+        self._plan_cache: "OrderedDict[Tuple[Any, ...], Tuple[List[str], List[List[str]]]]" = OrderedDict()
+
+        # Agent 설정 (기본 + 커스텀 워커, 레지스트리 캐시)
+        # 설정/프롬프트 파일이 바뀌면 레지스트리가 다시 로드하고 리스너로 알려줌 (재시작 불필요)
+        self.agent_registry = get_agent_registry(config_loader)
+        self._apply_agent_snapshot(self.agent_registry.get_snapshot(project_path))
+        self.agent_registry.add_listener(self._on_agent_configs_changed)
+
+    def _apply_agent_snapshot(self, snapshot: AgentRegistrySnapshot) -> None:
+        """레지스트리 스냅샷을 agent_configs/agent_config_map에 반영"""
+        self._agent_registry_version = snapshot.version
+        self.agent_configs = list(snapshot.agent_configs)
+        self.custom_worker_names = set(snapshot.custom_worker_names)
+        self.agent_config_map = snapshot.config_map
+
+    def _on_agent_configs_changed(self, snapshot: AgentRegistrySnapshot) -> None:
+        """레지스트리 변경 알림 (같은 프로젝트의 스냅샷만 반영)"""
+        if snapshot.project_key != (self.project_path or DEFAULT_PROJECT_KEY):
+            return
+        if snapshot.version > self._agent_registry_version:
+            self._apply_agent_snapshot(snapshot)
+            logger.info(
+                f"Agent 설정 갱신: {len(self.agent_configs)}개 "
+                f"(커스텀 {len(self.custom_worker_names)}개, 버전: {snapshot.version})"
+            )
 
     def _get_agent_config(self, agent_name: str) -> AgentConfig:
         """
@@ -234,6 +199,8 @@ class WorkflowExecutor:
         Raises:
             ValueError: Agent를 찾을 수 없는 경우
         """
+        # 파일 변경 검사 (check_interval 이내면 캐시 그대로, 변경 시 리스너로 갱신됨)
+        self.agent_registry.get_snapshot(self.project_path)
         config = self.agent_config_map.get(agent_name)
         if not config:
             # 더 명확한 에러 메시지 제공
@@ -259,6 +226,133 @@ class WorkflowExecutor:
             raise ValueError(error_msg)
         return config
 
+    @staticmethod
+    def _get_chunk_type(chunk: str) -> str:
+        """
+        UI 표시용 청크 타입 반환
+
+        Args:
+            chunk: Worker 출력 청크 (StreamChunk 또는 str)
+
+        Returns:
+            str: "thinking", "tool", "text" 중 하나
+        """
+        if isinstance(chunk, StreamChunk):
+            return chunk.chunk_type
+        return "text"
+
+    @staticmethod
+    def _is_final_text_chunk(chunk: str) -> bool:
+        """
+        다음 노드로 전달할 최종 텍스트 청크인지 확인
+
+        타입 정보가 없는 일반 문자열은 텍스트로 간주합니다.
+
+        Args:
+            chunk: Worker 출력 청크 (StreamChunk 또는 str)
+
+        Returns:
+            bool: 최종 텍스트 여부
+        """
+        if isinstance(chunk, StreamChunk):
+            return chunk.is_final_text
+        return True
+
+    @staticmethod
+    def _summarize_token_usage(
+        result_usages: List[Dict[str, Any]],
+        last_message_usage: Optional[Dict[str, Any]],
+    ) -> Optional[TokenUsage]:
+        """
+        노드의 토큰 사용량 집계
+
+        ResultMessage의 usage는 쿼리 단위 최종 누적값이므로 합산하고,
+        아직 ResultMessage를 받지 못했다면 마지막 메시지 단위 usage를 사용합니다.
+
+        Args:
+            result_usages: ResultMessage usage 목록 (쿼리별 1개)
+            last_message_usage: 마지막 메시지 단위 usage (대체값)
+
+        Returns:
+            Optional[TokenUsage]: 토큰 사용량 (정보가 없으면 None)
+        """
+        usages = result_usages or ([last_message_usage] if last_message_usage else [])
+        if not usages:
+            return None
+
+        input_tokens = sum(u.get("input_tokens") or 0 for u in usages)
+        output_tokens = sum(u.get("output_tokens") or 0 for u in usages)
+        costs = [u["cost_usd"] for u in usages if u.get("cost_usd") is not None]
+        return TokenUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            total_tokens=input_tokens + output_tokens,
+            cache_read_tokens=sum(u.get("cache_read_tokens") or 0 for u in usages),
+            cache_creation_tokens=sum(u.get("cache_creation_tokens") or 0 for u in usages),
+            cost_usd=sum(costs) if costs else None,
+        )
+
+    @staticmethod
+    def _combine_token_usage(*usages: Optional[TokenUsage]) -> Optional[TokenUsage]:
+        """
+        토큰 사용량 합산 (입력 예산 요약 + Worker 실행 등)
+
+        Args:
+            *usages: 합산할 사용량 (None은 무시)
+
+        Returns:
+            Optional[TokenUsage]: 합산 결과 (모두 None이면 None)
+        """
+        present = [u for u in usages if u is not None]
+        if not present:
+            return None
+        if len(present) == 1:
+            return present[0]
+        costs = [u.cost_usd for u in present if u.cost_usd is not None]
+        return TokenUsage(
+            input_tokens=sum(u.input_tokens for u in present),
+            output_tokens=sum(u.output_tokens for u in present),
+            total_tokens=sum(u.total_tokens for u in present),
+            cache_read_tokens=sum(u.cache_read_tokens for u in present),
+            cache_creation_tokens=sum(u.cache_creation_tokens for u in present),
+            cost_usd=sum(costs) if costs else None,
+        )
+
+    def _add_token_spent(self, session_id: str, token_usage: Optional[TokenUsage]) -> None:
+        """완료(또는 실패)된 노드의 토큰 사용량을 세션 누적값에 반영"""
+        if token_usage and session_id in self._token_spent:
+            self._token_spent[session_id] += token_usage.total_tokens
+
+    def _check_token_budget(
+        self,
+        session_id: str,
+        node_token_usage: Optional[TokenUsage] = None,
+    ) -> None:
+        """
+        토큰 예산 초과 여부 확인
+
+        Args:
+            session_id: 세션 ID
+            node_token_usage: 실행 중인 노드의 현재까지 사용량 (옵션)
+
+        Raises:
+            TokenBudgetExceededError: 누적 사용량이 예산을 초과한 경우
+        """
+        budget = self._token_budgets.get(session_id)
+        if budget is None:
+            return
+
+        used = self._token_spent.get(session_id, 0)
+        if node_token_usage:
+            used += node_token_usage.total_tokens
+
+        if used > budget:
+            raise TokenBudgetExceededError(
+                f"워크플로우 토큰 예산({budget:,})을 초과했습니다 (사용: {used:,})",
+                budget=budget,
+                used=used,
+            )
+
     def _topological_sort(
         self, nodes: List[WorkflowNode], edges: List[WorkflowEdge], start_node_id: Optional[str] = None
     ) -> List[WorkflowNode]:
@@ -659,76 +753,298 @@ class WorkflowExecutor:
 
         return execution_groups
 
+    def _get_execution_plan(
+        self, workflow: Workflow, start_node_id: Optional[str] = None
+    ) -> Tuple[List[WorkflowNode], List[List[WorkflowNode]]]:
+        """
+        실행 계획 (위상 정렬 + 실행 그룹) 조회
+
+        그래프 구조(노드 ID/타입/병렬 플래그/반복 제한, 엣지)가 같으면 이전에 계산한 순서를 재사용하고,
+        노드 객체는 이번 워크플로우의 것으로 매핑합니다.
+
+        Args:
+            workflow: 실행할 워크플로우
+            start_node_id: 시작 노드 ID (옵션)
+
+        Returns:
+            Tuple[List[WorkflowNode], List[List[WorkflowNode]]]: (정렬된 노드, 실행 그룹)
+
+        Raises:
+            ValueError: 순환 참조 등으로 정렬할 수 없는 경우
+        """
+        def node_key(node: WorkflowNode) -> Tuple[Any, ...]:
+            if isinstance(node.data, dict):
+                max_iterations = node.data.get("max_iterations")
+            else:
+                max_iterations = getattr(node.data, "max_iterations", None)
+            return node.id, node.type, bool(self._check_parallel_execution(node)), max_iterations
+
+        key = (
+            start_node_id,
+            tuple(node_key(node) for node in workflow.nodes),
+            tuple((edge.id, edge.source, edge.target, edge.sourceHandle) for edge in workflow.edges),
+        )
+        node_map = {node.id: node for node in workflow.nodes}
+
+        cached = self._plan_cache.get(key)
+        if cached is not None:
+            self._plan_cache.move_to_end(key)
+            CACHE_REQUESTS_TOTAL.inc(cache="execution_plan", result="hit")
+            sorted_ids, group_ids = cached
+            return (
+                [node_map[node_id] for node_id in sorted_ids],
+                [[node_map[node_id] for node_id in group] for group in group_ids],
+            )
+        CACHE_REQUESTS_TOTAL.inc(cache="execution_plan", result="miss")
+
+        sorted_nodes = self._topological_sort(workflow.nodes, workflow.edges, start_node_id)
+        execution_groups = self._compute_execution_groups(sorted_nodes, workflow.edges)
+
+        self._plan_cache[key] = (
+            [node.id for node in sorted_nodes],
+            [[node.id for node in group] for group in execution_groups],
+        )
+        while len(self._plan_cache) > _PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+
+        return sorted_nodes, execution_groups
+
+    def _record_completion(self, session_id: str, node_id: str) -> None:
+        """노드 완료 순번 기록 (quorum 병합용)"""
+        order = self._completion_order.setdefault(session_id, {})
+        order[node_id] = max(order.values(), default=0) + 1
+
+    def _arrived_branches(self, session_id: str, merge_node_id: str, edges: List[WorkflowEdge]) -> List[str]:
+        """
+        병합 노드가 마지막으로 완료된 이후 완료된 부모 노드 (완료 순)
+
+        Args:
+            session_id: 세션 ID
+            merge_node_id: 병합 노드 ID
+            edges: 엣지 목록
+
+        Returns:
+            List[str]: 부모 노드 ID 목록 (먼저 완료된 순)
+        """
+        order = self._completion_order.get(session_id, {})
+        merge_seq = order.get(merge_node_id, -1)
+        arrived = [
+            pid for pid in self._get_parent_nodes(merge_node_id, edges)
+            if order.get(pid, -1) > merge_seq
+        ]
+        return sorted(arrived, key=lambda pid: order[pid])
+
+    def _is_quorum_merge(self, node: Optional[WorkflowNode]) -> bool:
+        """quorum 전략 병합 노드인지 확인"""
+        return (
+            node is not None
+            and node.type == "merge"
+            and getattr(node.data, "merge_strategy", None) == "quorum"
+        )
+
+    def _quorum_satisfied(self, session_id: str, merge_node: WorkflowNode, edges: List[WorkflowEdge]) -> bool:
+        """quorum 병합 노드의 분기가 quorum개 이상 완료되었는지 확인"""
+        quorum = getattr(merge_node.data, "quorum", None) or 1
+        return len(self._arrived_branches(session_id, merge_node.id, edges)) >= quorum
+
+    def _find_quorum_merge_for_straggler(
+        self,
+        session_id: str,
+        node_id: str,
+        edges: List[WorkflowEdge],
+        node_map: Dict[str, WorkflowNode],
+    ) -> Optional[str]:
+        """
+        더 이상 필요 없는 분기인지 확인
+
+        노드의 자식이 모두 quorum이 채워진 quorum 병합 노드이면
+        이 노드의 출력은 사용되지 않으므로 실행하지 않아도 됩니다.
+
+        Returns:
+            Optional[str]: quorum을 채운 병합 노드 ID (필요한 분기면 None)
+        """
+        child_ids = self._get_child_nodes(node_id, edges)
+        if not child_ids:
+            return None
+        for child_id in child_ids:
+            child = node_map.get(child_id)
+            if not self._is_quorum_merge(child) or not self._quorum_satisfied(session_id, child, edges):
+                return None
+        return child_ids[0]
+
+    def _merge_partial_events(
+        self,
+        session_id: str,
+        completed_node_id: str,
+        node_outputs: Dict[str, str],
+        edges: List[WorkflowEdge],
+        node_map: Dict[str, WorkflowNode],
+    ) -> List[WorkflowNodeExecutionEvent]:
+        """
+        완료된 분기에 대한 부분 병합 이벤트 생성
+
+        stream_partial이 켜진 병합 노드(quorum 전략은 항상)에 대해, 분기가 완료될 때마다
+        해당 분기 출력을 node_output(chunk_type: merge_partial) 청크로 전송합니다.
+        청크는 분기 완료 순서대로 구분자와 함께 이어 붙인 미리보기일 뿐이며, 최종 병합 결과와 같다는 보장은 없습니다
+        (first/last/custom 전략, 또는 분기가 부모 순서와 다르게 완료된 concatenate 전략).
+        입력 예산이 설정된 경우에도 최종 병합에는 줄어든 출력이 쓰이므로 다릅니다.
+        클라이언트는 병합 노드 node_complete 이벤트의 output을 최종 결과로 사용해야 합니다.
+
+        Args:
+            session_id: 세션 ID
+            completed_node_id: 방금 완료된 노드 ID
+            node_outputs: 노드 출력
+            edges: 엣지 목록
+            node_map: 노드 ID → 노드
+
+        Returns:
+            List[WorkflowNodeExecutionEvent]: 부분 병합 이벤트 목록
+        """
+        events = []
+        for child_id in self._get_child_nodes(completed_node_id, edges):
+            merge_node = node_map.get(child_id)
+            if merge_node is None or merge_node.type != "merge":
+                continue
+
+            merge_data = merge_node.data
+            is_quorum = self._is_quorum_merge(merge_node)
+            if not is_quorum and not getattr(merge_data, "stream_partial", False):
+                continue
+
+            arrived = self._arrived_branches(session_id, child_id, edges)
+            if completed_node_id not in arrived:
+                continue
+            position = arrived.index(completed_node_id)
+            quorum = (getattr(merge_data, "quorum", None) or 1) if is_quorum else None
+            if quorum is not None and position >= quorum:
+                continue
+
+            separator = getattr(merge_data, "separator", "\n\n---\n\n")
+            output = node_outputs.get(completed_node_id, "")
+            total = quorum or len(self._get_parent_nodes(child_id, edges))
+            events.append(WorkflowNodeExecutionEvent(
+                event_type="node_output",
+                node_id=child_id,
+                data={
+                    "chunk": f"{separator}{output}" if position > 0 else output,
+                    "chunk_type": "merge_partial",
+                    "branch_id": completed_node_id,
+                    "branches_merged": position + 1,
+                    "branches_expected": total,
+                },
+                timestamp=datetime.now().isoformat(),
+            ))
+        return events
+
+    @staticmethod
+    def _quorum_cancel_event(node_id: str, merge_node_id: str, started: bool) -> WorkflowNodeExecutionEvent:
+        """quorum 충족으로 취소/생략된 분기의 node_cancelled 이벤트"""
+        return WorkflowNodeExecutionEvent(
+            event_type="node_cancelled",
+            node_id=node_id,
+            data={
+                "reason": "quorum_satisfied",
+                "merge_node_id": merge_node_id,
+                "started": started,
+                "message": f"병합 노드 {merge_node_id}의 quorum이 충족되어 {'취소' if started else '생략'}되었습니다",
+            },
+            timestamp=datetime.now().isoformat(),
+        )
+
     def _render_task_template(
         self,
         template: str,
         node_id: str,
         node_outputs: Dict[str, str],
         initial_input: str,
+        all_node_outputs: Optional[Dict[str, str]] = None,
     ) -> str:
         """
-        작업 설명 템플릿 렌더링
+        작업 설명 템플릿 렌더링 (컴파일된 템플릿 캐시 + 한 번의 join)
 
         변수:
         - {{input}}: 초기 입력 (첫 번째 노드)
-        - {{node_<id>}}: 특정 노드의 출력
+        - {{node_<id>}} 또는 {{<node_id>}}: 특정 노드의 출력
         - {{parent}}: 부모 노드의 출력 (부모가 1개인 경우)
+        - {{parent|truncate:2000}}: 필터 (최대 문자 수로 자르기)
 
         Args:
             template: 템플릿 문자열
             node_id: 현재 노드 ID
-            node_outputs: 노드 ID → 출력 매핑
+            node_outputs: 부모 노드 ID → 출력 매핑
             initial_input: 초기 입력
+            all_node_outputs: 완료된 모든 노드 ID → 출력 매핑 (옵션, 없으면 부모 출력만 참조)
 
         Returns:
             str: 렌더링된 작업 설명
         """
-        result = template
-
-        # {{input}} 치환
-        result = result.replace("{{input}}", initial_input)
-
-        # {{node_<id>}} 치환
-        for nid, output in node_outputs.items():
-            result = result.replace(f"{{{{node_{nid}}}}}", output)
-
-        # {{parent}} 치환 (부모가 1개인 경우만 지원)
-        if "{{parent}}" in result:
-            parent_node_ids = list(node_outputs.keys())
-            if len(parent_node_ids) == 1:
-                # 부모가 1개인 경우, 해당 노드의 출력 사용
-                result = result.replace("{{parent}}", node_outputs[parent_node_ids[0]])
-            elif len(parent_node_ids) == 0:
-                # 부모가 없으면 빈 문자열로 치환
-                result = result.replace("{{parent}}", "")
-            else:
-                # 부모가 여러 개인 경우, 경고 로그 및 첫 번째 부모 출력 사용
-                logger.warning(
-                    f"노드에 부모가 {len(parent_node_ids)}개 있습니다. "
-                    f"{{{{parent}}}} 변수는 부모가 1개인 경우만 지원합니다. "
-                    f"첫 번째 부모의 출력을 사용합니다: {parent_node_ids[0]}"
-                )
-                result = result.replace("{{parent}}", node_outputs[parent_node_ids[0]])
+        compiled = compile_task_template(template)
+        referable_outputs = all_node_outputs if all_node_outputs is not None else node_outputs
+
+        def resolve(name: str) -> Optional[str]:
+            if name == "input":
+                return initial_input
+
+            if name == "parent":
+                parent_node_ids = list(node_outputs.keys())
+                if len(parent_node_ids) == 0:
+                    # 부모가 없으면 빈 문자열로 치환
+                    return ""
+                if len(parent_node_ids) > 1:
+                    # 부모가 여러 개인 경우, 경고 로그 및 첫 번째 부모 출력 사용
+                    logger.warning(
+                        f"노드 {node_id}에 부모가 {len(parent_node_ids)}개 있습니다. "
+                        f"{{{{parent}}}} 변수는 부모가 1개인 경우만 지원합니다. "
+                        f"첫 번째 부모의 출력을 사용합니다: {parent_node_ids[0]}"
+                    )
+                return node_outputs[parent_node_ids[0]]
 
-        return result
+            # {{<node_id>}} (노드 ID 직접 참조) 우선, 다음 {{node_<id>}}
+            if name in referable_outputs:
+                return referable_outputs[name]
+            if name.startswith("node_"):
+                return referable_outputs.get(name[len("node_"):])
+            return None
+
+        return compiled.render(resolve)
 
     async def _evaluate_llm_condition(
         self,
         condition_prompt: str,
         input_text: str,
         session_id: str,
+        local_verdict: bool = True,
     ) -> Tuple[bool, str]:
         """
-        LLM을 사용하여 조건 평가 (Haiku 모델 사용)
+        LLM 조건 평가 (로컬 판정 → 판정 캐시 → Haiku 모델 순)
 
         Args:
             condition_prompt: LLM에게 전달할 조건 프롬프트
             input_text: 평가할 텍스트
             session_id: 세션 ID
+            local_verdict: 출력의 명시적 판정 마커(VERDICT: PASS/FAIL, 판정 전용 JSON {"pass": true})를 먼저 확인할지 여부
 
         Returns:
-            Tuple[bool, str]: (조건 결과, LLM 응답 이유)
+            Tuple[bool, str]: (조건 결과, 판단 이유)
         """
+        # 1. 로컬 판정 (LLM 호출 없음)
+        if local_verdict:
+            detected = detect_verdict(input_text)
+            if detected is not None:
+                result, reason = detected
+                logger.info(f"[{session_id}] LLM 조건 로컬 판정: {result} ({reason[:100]})")
+                return result, f"{reason} (로컬 판정)"
+
+        # 2. 판정 캐시
+        cache_key = VerdictCache.make_key(LLM_CONDITION_MODEL, condition_prompt, input_text)
+        cached = self._llm_verdict_cache.get(cache_key)
+        if cached is not None:
+            CACHE_REQUESTS_TOTAL.inc(cache="llm_condition", result="hit")
+            logger.info(f"[{session_id}] LLM 조건 캐시 사용: {cached.result} ({cached.reason[:100]})")
+            return cached.result, f"{cached.reason} (캐시)"
+        CACHE_REQUESTS_TOTAL.inc(cache="llm_condition", result="miss")
+
+        # 3. LLM 호출
         from claude_agent_sdk import query
         from claude_agent_sdk.types import ClaudeAgentOptions
 
@@ -736,12 +1052,12 @@ class WorkflowExecutor:
 
         # Haiku 모델로 빠른 판단
         options = ClaudeAgentOptions(
-            model="claude-haiku-4-5-20251001",  # Claude Haiku 4.5 (2024-10-01 출시)
+            model=LLM_CONDITION_MODEL,
             allowed_tools=[],  # 도구 사용 안함
             permission_mode="bypassPermissions",  # 자동 실행을 위해 승인 우회
         )
 
-        # LLM에게 전달할 전체 프롬프트
+        # LLM에게 전달할 전체 프롬프트 (구조화된 JSON 응답 요청)
         full_prompt = f"""다음 출력을 분석하여 조건을 평가해주세요.
 
 <조건>
@@ -749,17 +1065,15 @@ class WorkflowExecutor:
 </조건>
 
 <평가 대상 출력>
-{input_text[:5000]}  # 처음 5000자만
+{input_text[:5000]}
 </평가 대상 출력>
 
-위 출력이 조건을 만족하는지 판단하여, 다음 형식으로 응답해주세요:
+위 출력이 조건을 만족하는지 판단하여, 다른 설명 없이 JSON 한 줄로만 응답해주세요:
 
-판단: [YES 또는 NO]
-이유: [한 줄 설명]
+{{"pass": true 또는 false, "reason": "한 줄 설명"}}
 
 예시:
-판단: YES
-이유: 테스트가 모두 통과했으며 에러가 없습니다.
+{{"pass": true, "reason": "테스트가 모두 통과했으며 에러가 없습니다."}}
 """
 
         try:
@@ -773,20 +1087,9 @@ class WorkflowExecutor:
 
             logger.debug(f"[{session_id}] LLM 응답: {response_text[:200]}")
 
-            # 응답 파싱
-            lines = response_text.strip().split('\n')
-            result = False
-            reason = ""
-
-            for line in lines:
-                if line.startswith('판단:'):
-                    decision = line.replace('판단:', '').strip().upper()
-                    result = decision in ['YES', 'Y', 'TRUE', '예']
-                elif line.startswith('이유:'):
-                    reason = line.replace('이유:', '').strip()
-
-            if not reason:
-                reason = response_text[:200]  # 파싱 실패 시 전체 응답 사용
+            # 응답 파싱 (JSON, 실패 시 "판단:/이유:" 형식)
+            result, reason = parse_llm_verdict(response_text)
+            self._llm_verdict_cache.put(cache_key, result, reason)
 
             logger.info(
                 f"[{session_id}] LLM 조건 평가 완료: {result} (이유: {reason[:100]})"
@@ -796,9 +1099,164 @@ class WorkflowExecutor:
 
         except Exception as e:
             logger.error(f"[{session_id}] LLM 조건 평가 실패: {e}", exc_info=True)
-            # 에러 발생 시 안전하게 False 반환
+            # 에러 발생 시 안전하게 False 반환 (캐시하지 않음)
             return False, f"LLM 평가 실패: {str(e)}"
 
+    async def _summarize_parent_output(
+        self,
+        text: str,
+        max_tokens: int,
+        model: str,
+        session_id: str,
+        usage_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        입력 예산용 부모 출력 요약 (저비용 모델 사용)
+
+        응답은 Worker와 같은 응답 핸들러로 처리하므로 토큰 사용량도 같은 형식으로 usage_callback에 전달됩니다.
+
+        Args:
+            text: 요약할 부모 출력
+            max_tokens: 목표 토큰 수 (로컬 추정치)
+            model: 요약 모델
+            session_id: 세션 ID
+            usage_callback: 토큰 사용량 콜백 (Worker의 usage_callback과 같은 형식)
+            timeout: 제한 시간 (초, 노드/워크플로우 남은 시간, None이면 제한 없음)
+
+        Returns:
+            str: 요약문
+
+        Raises:
+            ValueError: 응답이 비어 있는 경우
+            asyncio.TimeoutError: 제한 시간 초과
+        """
+        from claude_agent_sdk import query
+        from claude_agent_sdk.types import ClaudeAgentOptions
+
+        options = ClaudeAgentOptions(
+            model=model,
+            allowed_tools=[],  # 도구 사용 안함
+            permission_mode="bypassPermissions",  # 자동 실행을 위해 승인 우회
+        )
+
+        full_prompt = f"""다음 출력을 다음 단계 작업의 입력으로 쓸 수 있도록 요약해주세요.
+결론, 결정 사항, 발견된 문제, 파일 경로와 코드 식별자는 빠짐없이 유지하고 약 {max_tokens} 토큰 이내로 작성하세요.
+요약 외의 설명은 쓰지 마세요.
+
+<출력>
+{text}
+</출력>
+"""
+
+        response_handler = WorkerResponseHandler(usage_callback=usage_callback)
+
+        async def run_query() -> str:
+            text_parts: List[str] = []
+            async for response in query(prompt=full_prompt, options=options):
+                async for chunk in response_handler.process_response(response):
+                    if self._is_final_text_chunk(chunk):
+                        text_parts.append(chunk)
+            return "".join(text_parts)
+
+        if timeout is None:
+            response_text = await run_query()
+        else:
+            response_text = await asyncio.wait_for(run_query(), timeout=max(0.0, timeout))
+
+        summary = response_text.strip()
+        if not summary:
+            raise ValueError("요약 응답이 비어 있습니다")
+
+        logger.info(f"[{session_id}] 부모 출력 요약 완료 ({model}, {len(text)}자 → {len(summary)}자)")
+        return summary
+
+    async def _apply_input_budget(
+        self,
+        node_id: str,
+        input_budget: Any,
+        parent_outputs: Dict[str, str],
+        session_id: str,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Dict[str, str], Optional[Dict[str, Any]], Optional[TokenUsage]]:
+        """
+        노드 입력 예산 적용 (부모 출력 줄이기)
+
+        요약 호출은 timeout 안에서만 실행하고, 시간을 넘기면 중략으로 대체합니다.
+        요약에 쓴 토큰은 반환값으로 돌려주며, 호출자가 노드 사용량에 합산합니다 (예산 확인, 원장 기록).
+
+        Args:
+            node_id: 노드 ID
+            input_budget: 노드의 input_budget 설정 (dict 또는 InputBudgetConfig, 없으면 None)
+            parent_outputs: 부모 노드 ID → 출력
+            session_id: 세션 ID
+            timeout: 요약 호출 전체 제한 시간 (초, 노드/워크플로우 남은 시간, None이면 제한 없음)
+
+        Returns:
+            Tuple[Dict[str, str], Optional[Dict[str, Any]], Optional[TokenUsage]]:
+                (예산 적용된 부모 출력, 이벤트용 결정 내역 - 예산이 없으면 None, 요약 토큰 사용량)
+
+        Raises:
+            ValueError: input_budget 설정이 잘못된 경우
+        """
+        try:
+            policy = InputBudgetPolicy.from_config(input_budget)
+        except ValueError as e:
+            raise ValueError(f"노드 {node_id}: {e}") from e
+
+        if policy is None or not parent_outputs:
+            return parent_outputs, None, None
+
+        loop = asyncio.get_running_loop()
+        summary_deadline = loop.time() + timeout if timeout is not None else None
+        call_usages: List[Dict[str, Any]] = []  # 요약 호출별 최종 usage
+
+        async def summarize(text: str, max_tokens: int, model: str) -> str:
+            result_usages: List[Dict[str, Any]] = []
+            last_message_usage: Optional[Dict[str, Any]] = None
+
+            def usage_callback(usage_info: Dict[str, Any]) -> None:
+                nonlocal last_message_usage
+                if usage_info.get("source") == "result":
+                    result_usages.append(usage_info)
+                else:
+                    last_message_usage = usage_info
+
+            remaining = summary_deadline - loop.time() if summary_deadline is not None else None
+            try:
+                return await self._summarize_parent_output(
+                    text, max_tokens, model, session_id,
+                    usage_callback=usage_callback, timeout=remaining,
+                )
+            finally:
+                # 실패/시간 초과한 호출도 사용한 토큰은 반영 (ResultMessage가 없으면 마지막 메시지 usage)
+                call_usages.extend(result_usages or ([last_message_usage] if last_message_usage else []))
+
+        budgeted, decision = await apply_input_budget(policy, parent_outputs, summarize)
+
+        summary_usage = self._summarize_token_usage(call_usages, None)
+
+        INPUT_BUDGET_TOKENS_TOTAL.inc(decision.tokens_before, strategy=policy.strategy, kind="before")
+        INPUT_BUDGET_TOKENS_TOTAL.inc(decision.tokens_after, strategy=policy.strategy, kind="after")
+
+        if decision.tokens_after < decision.tokens_before:
+            logger.info(
+                f"[{session_id}] 노드 {node_id}: 입력 예산 적용 ({policy.strategy}, "
+                f"약 {decision.tokens_before} → {decision.tokens_after} 토큰, 예산 {policy.max_tokens})"
+            )
+        for entry in decision.parents:
+            if "error" in entry:
+                logger.warning(
+                    f"[{session_id}] 노드 {node_id}: 부모 '{entry['parent_id']}' 요약 실패, "
+                    f"중략으로 대체 - {entry['error']}"
+                )
+
+        decision_dict = decision.to_dict()
+        if summary_usage is not None:
+            decision_dict["summary_tokens"] = summary_usage.total_tokens
+            decision_dict["summary_model"] = policy.summary_model
+        return budgeted, decision_dict, summary_usage
+
     def _evaluate_condition(
         self,
         condition_type: str,
@@ -806,78 +1264,27 @@ class WorkflowExecutor:
         input_text: str
     ) -> bool:
         """
-        조건 평가
+        조건 평가 (custom 표현식은 eval 없이 제한된 문법으로 해석)
 
         Args:
-            condition_type: 조건 타입 ('contains', 'regex', 'length', 'custom', 'llm')
+            condition_type: 조건 타입 ('contains', 'regex', 'length', 'custom')
             condition_value: 조건 값
             input_text: 평가할 텍스트
 
         Returns:
             bool: 조건이 True인지 여부
         """
-        import re
-
-        if condition_type == "contains":
-            # 텍스트 포함 검사
-            return condition_value in input_text
-
-        elif condition_type == "regex":
-            # 정규표현식 매칭
-            try:
-                pattern = re.compile(condition_value)
-                return bool(pattern.search(input_text))
-            except re.error as e:
-                logger.error(f"정규표현식 오류: {e}")
-                return False
-
-        elif condition_type == "length":
-            # 길이 비교 (예: ">100", "<=500", "==0")
-            try:
-                text_length = len(input_text)
-                # condition_value를 파싱하여 비교
-                if condition_value.startswith(">="):
-                    threshold = int(condition_value[2:].strip())
-                    return text_length >= threshold
-                elif condition_value.startswith("<="):
-                    threshold = int(condition_value[2:].strip())
-                    return text_length <= threshold
-                elif condition_value.startswith(">"):
-                    threshold = int(condition_value[1:].strip())
-                    return text_length > threshold
-                elif condition_value.startswith("<"):
-                    threshold = int(condition_value[1:].strip())
-                    return text_length < threshold
-                elif condition_value.startswith("=="):
-                    threshold = int(condition_value[2:].strip())
-                    return text_length == threshold
-                else:
-                    # 숫자만 있는 경우 == 로 간주
-                    threshold = int(condition_value.strip())
-                    return text_length == threshold
-            except (ValueError, IndexError) as e:
-                logger.error(f"길이 조건 파싱 오류: {e}")
-                return False
-
-        elif condition_type == "custom":
-            # 커스텀 Python 표현식 평가
-            try:
-                # 안전한 평가를 위해 제한된 네임스페이스 사용
-                namespace = {
-                    "output": input_text,
-                    "len": len,
-                    "str": str,
-                    "int": int,
-                    "float": float,
-                }
-                result = eval(condition_value, {"__builtins__": {}}, namespace)
-                return bool(result)
-            except Exception as e:
-                logger.error(f"커스텀 조건 평가 오류: {e}")
-                return False
+        # 조건은 한 번만 컴파일 (정규표현식/표현식 파싱 캐시, 반복 평가 시 재사용)
+        try:
+            condition = compile_condition(condition_type, condition_value)
+        except ConditionExpressionError as e:
+            logger.error(f"조건 컴파일 오류: {e}")
+            return False
 
-        else:
-            logger.warning(f"알 수 없는 조건 타입: {condition_type}")
+        try:
+            return condition.evaluate(input_text)
+        except Exception as e:
+            logger.error(f"조건 평가 오류 ({condition_type}): {e}")
             return False
 
     async def _execute_condition_node(
@@ -932,7 +1339,8 @@ class WorkflowExecutor:
             condition_result, llm_reason = await self._evaluate_llm_condition(
                 node_data.condition_value,
                 parent_output,
-                session_id
+                session_id,
+                local_verdict=node_data.local_verdict is not False,
             )
         else:
             # 일반 조건 평가
@@ -1023,6 +1431,25 @@ class WorkflowExecutor:
         if not parent_nodes:
             raise ValueError(f"병합 노드 {node_id}에 부모 노드가 없습니다")
 
+        # quorum: 먼저 완료된 quorum개 분기만 완료 순서대로 결합 (취소된 분기는 제외)
+        if node_data.merge_strategy == "quorum":
+            quorum = node_data.quorum or 1
+            arrived = [
+                pid for pid in self._arrived_branches(session_id, node_id, edges)
+                if pid in node_outputs
+            ]
+            if len(arrived) < quorum:
+                raise ValueError(
+                    f"병합 노드 {node_id}: quorum {quorum}개 중 {len(arrived)}개 분기만 완료되었습니다"
+                )
+
+            merged_output = node_data.separator.join(node_outputs[pid] for pid in arrived[:quorum])
+            logger.info(
+                f"[{session_id}] 병합 노드 완료: {node_id} "
+                f"(quorum {quorum}/{len(parent_nodes)}, 사용 분기: {arrived[:quorum]}, 출력 길이: {len(merged_output)})"
+            )
+            return merged_output
+
         parent_outputs = []
         for pid in parent_nodes:
             if pid not in node_outputs:
@@ -1078,6 +1505,41 @@ class WorkflowExecutor:
         edges: List[WorkflowEdge],
         all_nodes: List[WorkflowNode],
         project_path: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[WorkflowNodeExecutionEvent]:
+        """
+        단일 노드 실행 (노드 실행 중 로그에 node_id 바인딩)
+
+        Args:
+            node: 실행할 노드
+            node_outputs: 이전 노드 출력들
+            initial_input: 초기 입력
+            session_id: 세션 ID
+            edges: 엣지 목록
+            all_nodes: 모든 노드 목록
+            project_path: 프로젝트 디렉토리 경로
+            deadline: 워크플로우 종료 기한 (event loop 시각, None이면 제한 없음)
+
+        Yields:
+            WorkflowNodeExecutionEvent: 노드 실행 이벤트
+        """
+        with bind_node_log_context(node.id):
+            async for event in self._execute_node_events(
+                node, node_outputs, initial_input, session_id,
+                edges, all_nodes, project_path, deadline
+            ):
+                yield event
+
+    async def _execute_node_events(
+        self,
+        node: WorkflowNode,
+        node_outputs: Dict[str, str],
+        initial_input: str,
+        session_id: str,
+        edges: List[WorkflowEdge],
+        all_nodes: List[WorkflowNode],
+        project_path: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> AsyncIterator[WorkflowNodeExecutionEvent]:
         """
         단일 노드 실행 (모든 노드 타입 지원)
@@ -1090,6 +1552,7 @@ class WorkflowExecutor:
             edges: 엣지 목록
             all_nodes: 모든 노드 목록
             project_path: 프로젝트 디렉토리 경로
+            deadline: 워크플로우 종료 기한 (event loop 시각, None이면 제한 없음)
 
         Yields:
             WorkflowNodeExecutionEvent: 노드 실행 이벤트
@@ -1224,47 +1687,67 @@ class WorkflowExecutor:
 
             # 부모 노드 출력들 가져오기 (입력으로 사용)
             parent_nodes = self._get_parent_nodes(node_id, edges)
-            parent_outputs_list = []
-            for pid in parent_nodes:
-                parent_outputs_list.append(node_outputs.get(pid, ""))
-
             node_data: MergeNodeData = node.data  # type: ignore
 
-            # 입력 요약 (각 부모 노드의 출력 길이)
-            input_summary = {
-                f"parent_{i+1}": len(output) for i, output in enumerate(parent_outputs_list)
-            }
+            budget_decision: Optional[Dict[str, Any]] = None
+            budget_usage: Optional[TokenUsage] = None
 
-            yield WorkflowNodeExecutionEvent(
-                event_type="node_start",
-                node_id=node_id,
-                data={
+            try:
+                # 입력 예산 적용 (설정된 경우 병합 전에 분기 출력 줄이기, 요약은 워크플로우 남은 시간 안에서만)
+                merge_inputs, budget_decision, budget_usage = await self._apply_input_budget(
+                    node_id,
+                    node_data.input_budget,
+                    {pid: node_outputs[pid] for pid in parent_nodes if pid in node_outputs},
+                    session_id,
+                    timeout=deadline - asyncio.get_running_loop().time() if deadline is not None else None,
+                )
+                self._check_token_budget(session_id, budget_usage)
+                parent_outputs_list = [merge_inputs.get(pid, "") for pid in parent_nodes]
+
+                # 입력 요약 (각 부모 노드의 출력 길이)
+                input_summary = {
+                    f"parent_{i+1}": len(output) for i, output in enumerate(parent_outputs_list)
+                }
+
+                start_data = {
                     "node_type": "merge",
                     "input": "\n\n---\n\n".join(parent_outputs_list),
                     "input_summary": input_summary,
                     "merge_strategy": node_data.merge_strategy,
-                },
-                timestamp=datetime.now().isoformat(),
-            )
+                }
+                if budget_decision is not None:
+                    start_data["input_budget"] = budget_decision
+
+                yield WorkflowNodeExecutionEvent(
+                    event_type="node_start",
+                    node_id=node_id,
+                    data=start_data,
+                    timestamp=datetime.now().isoformat(),
+                )
 
-            try:
                 merged_output = await self._execute_merge_node(
-                    node, node_outputs, edges, session_id
+                    node, merge_inputs, edges, session_id
                 )
 
                 node_outputs[node_id] = merged_output
                 elapsed_time = time.time() - start_time
+                self._add_token_spent(session_id, budget_usage)
+
+                complete_data = {
+                    "node_type": "merge",
+                    "output_length": len(merged_output),
+                    "output": merged_output,
+                }
+                if budget_usage is not None:
+                    complete_data["model"] = budget_decision["summary_model"]  # 요약 토큰 원장 기록용
 
                 yield WorkflowNodeExecutionEvent(
                     event_type="node_complete",
                     node_id=node_id,
-                    data={
-                        "node_type": "merge",
-                        "output_length": len(merged_output),
-                        "output": merged_output,
-                    },
+                    data=complete_data,
                     timestamp=datetime.now().isoformat(),
                     elapsed_time=elapsed_time,
+                    token_usage=budget_usage,
                 )
 
                 logger.info(
@@ -1272,18 +1755,32 @@ class WorkflowExecutor:
                     f"(출력 길이: {len(merged_output)})"
                 )
 
+            except TokenBudgetExceededError as e:
+                # 워크플로우 수준 이벤트(token_budget_exceeded)로 보고 (node_error 아님)
+                self._add_token_spent(session_id, budget_usage)
+                e.node_id = node_id
+                e.node_usage = budget_usage
+                e.node_info = {"model": budget_decision["summary_model"]} if budget_usage else {}
+                raise
+
             except Exception as e:
                 error_msg = f"병합 노드 실행 실패: {str(e)}"
                 logger.error(f"[{session_id}] {node_id}: {error_msg}", exc_info=True)
 
                 elapsed_time = time.time() - start_time
+                self._add_token_spent(session_id, budget_usage)
+
+                error_data = {"error": error_msg}
+                if budget_usage is not None:
+                    error_data["model"] = budget_decision["summary_model"]  # 요약 토큰 원장 기록용
 
                 yield WorkflowNodeExecutionEvent(
                     event_type="node_error",
                     node_id=node_id,
-                    data={"error": error_msg},
+                    data=error_data,
                     timestamp=datetime.now().isoformat(),
                     elapsed_time=elapsed_time,
+                    token_usage=budget_usage,
                 )
 
                 raise
@@ -1295,6 +1792,8 @@ class WorkflowExecutor:
                 task_template = node.data.get("task_template")
                 allowed_tools_override = node.data.get("allowed_tools")
                 thinking_override = node.data.get("thinking")
+                node_timeout = node.data.get("timeout")
+                input_budget = node.data.get("input_budget")
 
                 if not agent_name:
                     raise ValueError(f"노드 {node_id}: agent_name이 지정되지 않았습니다")
@@ -1306,9 +1805,16 @@ class WorkflowExecutor:
                 task_template = node_data.task_template
                 allowed_tools_override = node_data.allowed_tools
                 thinking_override = node_data.thinking
+                node_timeout = node_data.timeout
+                input_budget = node_data.input_budget
 
             start_time = time.time()
 
+            # 노드 제한 시간: 노드 설정과 워크플로우 남은 시간 중 작은 값
+            if deadline is not None:
+                workflow_remaining = max(0.0, deadline - asyncio.get_running_loop().time())
+                node_timeout = min(node_timeout, workflow_remaining) if node_timeout else workflow_remaining
+
             # 먼저 task_description 생성 (입력 저장용)
             agent_config = self._get_agent_config(agent_name)
 
@@ -1332,20 +1838,62 @@ class WorkflowExecutor:
                 if pid in node_outputs
             }
 
+            # 입력 예산 적용 (부모 출력만 대상, {{node_id}}로 참조하는 부모 출력도 줄어든 값 사용)
+            # 요약 호출은 노드 제한 시간 안에서 실행하고, 사용한 시간은 Worker 제한 시간에서 뺌
+            budget_usage: Optional[TokenUsage] = None
+            budget_started_at = asyncio.get_running_loop().time()
+            try:
+                parent_outputs, budget_decision, budget_usage = await self._apply_input_budget(
+                    node_id, input_budget, parent_outputs, session_id, timeout=node_timeout
+                )
+                self._check_token_budget(session_id, budget_usage)
+            except TokenBudgetExceededError as e:
+                # 워크플로우 수준 이벤트(token_budget_exceeded)로 보고 (node_error 아님)
+                self._add_token_spent(session_id, budget_usage)
+                e.node_id = node_id
+                e.node_usage = budget_usage
+                e.node_info = {"agent_name": agent_name, "model": agent_config.model}
+                raise
+            except Exception as e:
+                error_msg = f"노드 실행 실패: {str(e)}"
+                logger.error(f"[{session_id}] {node_id}: {error_msg}", exc_info=True)
+
+                yield WorkflowNodeExecutionEvent(
+                    event_type="node_error",
+                    node_id=node_id,
+                    data={
+                        "agent_name": agent_name,
+                        "model": agent_config.model,
+                        "error": error_msg,
+                        "error_type": type(e).__name__,
+                        "retry_count": 0,
+                    },
+                    timestamp=datetime.now().isoformat(),
+                    elapsed_time=time.time() - start_time,
+                )
+                raise
+
+            if node_timeout:
+                budget_elapsed = asyncio.get_running_loop().time() - budget_started_at
+                node_timeout = max(0.0, node_timeout - budget_elapsed)
+            template_outputs = {**node_outputs, **parent_outputs} if budget_decision is not None else node_outputs
+
             task_description = self._render_task_template(
                 template=task_template,
                 node_id=node_id,
                 node_outputs=parent_outputs,
                 initial_input=initial_input,
+                all_node_outputs=template_outputs,
             )
 
             # node_start 이벤트
+            start_data = {"agent_name": agent_name}
+            if budget_decision is not None:
+                start_data["input_budget"] = budget_decision
             start_event = WorkflowNodeExecutionEvent(
                 event_type="node_start",
                 node_id=node_id,
-                data={
-                    "agent_name": agent_name,
-                },
+                data=start_data,
                 timestamp=datetime.now().isoformat(),
             )
             logger.info(f"[{session_id}] 🟢 이벤트 생성: node_start (node: {node_id}, agent: {agent_name})")
@@ -1363,14 +1911,21 @@ class WorkflowExecutor:
             logger.debug(f"[{session_id}] 📥 이벤트 생성: node_input (node: {node_id})")
             yield input_event
 
+            node_retry_count = 0
+            # 입력 예산 요약 사용량을 노드 사용량에 포함 (예산 확인, 원장 기록)
+            node_token_usage: Optional[TokenUsage] = budget_usage
+
             try:
                 logger.info(
                     f"[{session_id}] 노드 실행: {node_id} ({agent_name}) "
                     f"- 작업 길이: {len(task_description)}"
                 )
 
-                # 노드별 세션 관리: 이전 세션 ID가 있으면 재사용
-                previous_session_id = self._node_sessions.get(node_id)
+                # 노드별 세션 관리: 이전 세션 ID가 있으면 재사용 (격리 실행은 항상 새 세션)
+                previous_session_id = (
+                    None if session_id in self._isolated_sessions
+                    else self._node_sessions.get(node_id)
+                )
                 if previous_session_id:
                     logger.info(
                         f"[{session_id}] 노드 {node_id}: 이전 세션 재개 "
@@ -1382,19 +1937,25 @@ class WorkflowExecutor:
                     )
 
                 worker = WorkerAgent(config=agent_config, project_dir=project_path)
-                node_output_chunks = []
-                node_token_usage: Optional[TokenUsage] = None
+                final_text_parts: List[str] = []  # 최종 텍스트 청크 (점진적 조립)
+                output_length = 0
+                chunk_type_counts: Dict[str, int] = {}  # 청크 타입별 개수 (노드 요약 로그용)
+                result_usages: List[Dict[str, Any]] = []
+                last_message_usage: Optional[Dict[str, Any]] = None
 
                 def usage_callback(usage_info: Dict[str, Any]):
-                    nonlocal node_token_usage
-                    node_token_usage = TokenUsage(
-                        input_tokens=usage_info.get("input_tokens", 0),
-                        output_tokens=usage_info.get("output_tokens", 0),
-                        total_tokens=usage_info.get("total_tokens", 0),
+                    nonlocal node_token_usage, last_message_usage
+                    if usage_info.get("source") == "result":
+                        result_usages.append(usage_info)
+                    else:
+                        last_message_usage = usage_info
+                    node_token_usage = self._combine_token_usage(
+                        budget_usage, self._summarize_token_usage(result_usages, last_message_usage)
                     )
-                    logger.debug(
-                        f"[{session_id}] 💰 토큰 사용량: {node_token_usage.total_tokens} "
-                        f"(입력: {node_token_usage.input_tokens}, 출력: {node_token_usage.output_tokens})"
+                    hot_logger.debug(
+                        "[%s] 💰 토큰 사용량: %d (입력: %d, 출력: %d, 캐시 읽기: %d)",
+                        session_id, node_token_usage.total_tokens, node_token_usage.input_tokens,
+                        node_token_usage.output_tokens, node_token_usage.cache_read_tokens
                     )
 
                 # 사용자 입력 콜백 정의 (Human-in-the-Loop)
@@ -1411,64 +1972,100 @@ class WorkflowExecutor:
                     return answer
 
                 # Worker 실행 (이전 세션 ID 및 user_input_callback 전달)
-                async for chunk in worker.execute_task(
+                worker_stream = worker.execute_task(
                     task_description,
                     usage_callback=usage_callback,
                     resume_session_id=previous_session_id,
-                    user_input_callback=user_input_callback_impl
-                ):
-                    # 특수 이벤트 마커 감지 (Human-in-the-Loop)
-                    if chunk.startswith("@EVENT:user_input_request:"):
-                        import json
-                        # 마커 제거 및 JSON 파싱
-                        json_str = chunk[len("@EVENT:user_input_request:"):]
-                        event_data = json.loads(json_str)
-                        question = event_data.get("question", "")
-
-                        # user_input_request 이벤트 전송
-                        user_input_event = WorkflowNodeExecutionEvent(
-                            event_type="user_input_request",
-                            node_id=node_id,
-                            data={
-                                "question": question,
-                                "session_id": session_id,
-                            },
-                        )
-                        logger.info(f"[{session_id}] 💬 이벤트 생성: user_input_request (node: {node_id})")
-                        yield user_input_event
+                    user_input_callback=user_input_callback_impl,
+                    timeout=node_timeout,
+                )
+                try:
+                    async for chunk in worker_stream:
+                        # 특수 이벤트 마커 감지 (Human-in-the-Loop)
+                        if chunk.startswith("@EVENT:user_input_request:"):
+                            import json
+                            # 마커 제거 및 JSON 파싱
+                            json_str = chunk[len("@EVENT:user_input_request:"):]
+                            event_data = json.loads(json_str)
+                            question = event_data.get("question", "")
+
+                            # user_input_request 이벤트 전송
+                            user_input_event = WorkflowNodeExecutionEvent(
+                                event_type="user_input_request",
+                                node_id=node_id,
+                                data={
+                                    "question": question,
+                                    "session_id": session_id,
+                                },
+                            )
+                            logger.info(f"[{session_id}] 💬 이벤트 생성: user_input_request (node: {node_id})")
+                            yield user_input_event
 
-                        # 이 청크는 출력에 포함하지 않음 (내부 제어용)
-                        continue
+                            # 이 청크는 출력에 포함하지 않음 (내부 제어용)
+                            continue
 
-                    node_output_chunks.append(chunk)
+                        # 재시도 마커 감지 (일시적 오류로 SDK 실행 재시도)
+                        if chunk.startswith("@EVENT:worker_retry:"):
+                            import json
+                            retry_data = json.loads(chunk[len("@EVENT:worker_retry:"):])
+                            node_retry_count += 1
+
+                            retry_event = WorkflowNodeExecutionEvent(
+                                event_type="node_retry",
+                                node_id=node_id,
+                                data={
+                                    "agent_name": agent_name,
+                                    "retry_count": node_retry_count,
+                                    **retry_data,
+                                },
+                                timestamp=datetime.now().isoformat(),
+                            )
+                            logger.warning(
+                                f"[{session_id}] 🔁 이벤트 생성: node_retry (node: {node_id}, "
+                                f"시도: {retry_data.get('attempt')}/{retry_data.get('max_attempts')})"
+                            )
+                            yield retry_event
+                            continue
 
-                    # 청크 타입 분류
-                    chunk_type = classify_chunk_type(chunk)
+                        # 토큰 예산 확인 (초과 시 Worker 실행을 즉시 중단)
+                        self._check_token_budget(session_id, node_token_usage)
 
-                    output_event = WorkflowNodeExecutionEvent(
-                        event_type="node_output",
-                        node_id=node_id,
-                        data={
-                            "chunk": chunk,
-                            "chunk_type": chunk_type,  # "thinking", "tool", "text"
-                        },
-                    )
-                    logger.debug(f"[{session_id}] 📝 이벤트 생성: node_output (node: {node_id}, type: {chunk_type}, chunk: {len(chunk)}자)")
-                    yield output_event
+                        output_length += len(chunk)
+
+                        # 청크 타입은 SDK 응답 처리 시점에 결정됨 (재파싱 불필요)
+                        chunk_type = self._get_chunk_type(chunk)
+                        chunk_type_counts[chunk_type] = chunk_type_counts.get(chunk_type, 0) + 1
+                        if self._is_final_text_chunk(chunk):
+                            final_text_parts.append(chunk)
 
-                # 전체 출력에서 최종 텍스트만 추출하여 저장
-                full_output = "".join(node_output_chunks)
-                final_text = extract_text_from_worker_output(full_output)
+                        # 청크 단위 로그는 남기지 않음 (노드 완료 시 타입별 개수로 요약)
+                        yield WorkflowNodeExecutionEvent(
+                            event_type="node_output",
+                            node_id=node_id,
+                            data={
+                                "chunk": chunk,
+                                "chunk_type": chunk_type,  # "thinking", "tool", "text"
+                            },
+                        )
+                finally:
+                    # 예산 초과 등으로 중간에 빠져나와도 SDK 스트림 정리
+                    await worker_stream.aclose()
+
+                # 스트리밍 중 모아둔 텍스트 청크로 최종 텍스트 조립
+                final_text = "\n".join(final_text_parts).strip()
                 node_outputs[node_id] = final_text  # 다음 노드에는 최종 텍스트만 전달
 
                 logger.info(
                     f"[{session_id}] 노드 출력 처리 완료: {node_id} "
-                    f"(전체: {len(full_output)}자, 최종 텍스트: {len(final_text)}자)"
+                    f"(전체: {output_length}자, 최종 텍스트: {len(final_text)}자, "
+                    f"청크: {chunk_type_counts})"
                 )
 
                 # Worker에서 반환된 실제 SDK 세션 ID 저장
-                # SDK 세션 ID가 있을 때만 저장 (UUID 형식이어야 함)
-                if worker.last_session_id:
+                # SDK 세션 ID가 있을 때만 저장 (UUID 형식이어야 함, 격리 실행은 저장하지 않음)
+                if session_id in self._isolated_sessions:
+                    logger.debug(f"[{session_id}] 노드 {node_id}: 격리 실행이므로 노드 세션을 저장하지 않습니다")
+                elif worker.last_session_id:
                     self._node_sessions[node_id] = worker.last_session_id
                     self._node_agent_names[node_id] = agent_name  # agent_name도 함께 저장
 
@@ -1509,13 +2106,16 @@ class WorkflowExecutor:
 
 
                 elapsed_time = time.time() - start_time
+                self._add_token_spent(session_id, node_token_usage)
 
                 complete_event = WorkflowNodeExecutionEvent(
                     event_type="node_complete",
                     node_id=node_id,
                     data={
                         "agent_name": agent_name,
+                        "model": agent_config.model,
                         "output_length": len(final_text),
+                        "retry_count": node_retry_count,
                     },
                     timestamp=datetime.now().isoformat(),
                     elapsed_time=elapsed_time,
@@ -1528,19 +2128,66 @@ class WorkflowExecutor:
                     f"[{session_id}] 노드 완료: {node_id} ({agent_name}) "
                     f"- 출력 길이: {len(final_text)}"
                 )
+                if node_token_usage:
+                    logger.info(
+                        f"[{session_id}] 💰 노드 토큰 사용량: {node_id} "
+                        f"(입력: {node_token_usage.input_tokens}, 출력: {node_token_usage.output_tokens}, "
+                        f"캐시 읽기: {node_token_usage.cache_read_tokens}, "
+                        f"캐시 생성: {node_token_usage.cache_creation_tokens})"
+                    )
+
+            except WorkerTimeoutError as e:
+                elapsed_time = time.time() - start_time
+                self._add_token_spent(session_id, node_token_usage)
+                logger.error(f"[{session_id}] {node_id}: 노드 실행 제한 시간 초과 ({e.timeout}초)")
+
+                timeout_event = WorkflowNodeExecutionEvent(
+                    event_type="node_timeout",
+                    node_id=node_id,
+                    data={
+                        "agent_name": agent_name,
+                        "model": agent_config.model,
+                        "error": f"노드 실행 제한 시간 초과: {str(e)}",
+                        "timeout": e.timeout,
+                        "retry_count": node_retry_count,
+                    },
+                    timestamp=datetime.now().isoformat(),
+                    elapsed_time=elapsed_time,
+                    token_usage=node_token_usage,
+                )
+                logger.error(f"[{session_id}] ⏱️ 이벤트 생성: node_timeout (node: {node_id})")
+                yield timeout_event
+
+                raise
+
+            except TokenBudgetExceededError as e:
+                # 워크플로우 수준 이벤트(token_budget_exceeded)로 보고 (node_error 아님)
+                self._add_token_spent(session_id, node_token_usage)
+                e.node_id = node_id
+                e.node_usage = node_token_usage
+                e.node_info = {"agent_name": agent_name, "model": agent_config.model}
+                raise
 
             except Exception as e:
                 error_msg = f"노드 실행 실패: {str(e)}"
                 logger.error(f"[{session_id}] {node_id}: {error_msg}", exc_info=True)
 
                 elapsed_time = time.time() - start_time
+                self._add_token_spent(session_id, node_token_usage)
 
                 error_event = WorkflowNodeExecutionEvent(
                     event_type="node_error",
                     node_id=node_id,
-                    data={"error": error_msg},
+                    data={
+                        "agent_name": agent_name,
+                        "model": agent_config.model,
+                        "error": error_msg,
+                        "error_type": type(e).__name__,
+                        "retry_count": node_retry_count,
+                    },
                     timestamp=datetime.now().isoformat(),
                     elapsed_time=elapsed_time,
+                    token_usage=node_token_usage,
                 )
                 logger.error(f"[{session_id}] 🔴 이벤트 생성: node_error (node: {node_id})")
                 yield error_event
@@ -1557,6 +2204,7 @@ class WorkflowExecutor:
         all_nodes: List[WorkflowNode],
         event_queue: asyncio.Queue,
         project_path: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> None:
         """
         단일 노드를 실행하고 모든 이벤트를 큐에 전송
@@ -1570,20 +2218,27 @@ class WorkflowExecutor:
             all_nodes: 모든 노드 목록
             event_queue: 이벤트를 전송할 큐
             project_path: 프로젝트 경로
+            deadline: 워크플로우 종료 기한 (event loop 시각)
         """
+        reported = False
         try:
             async for event in self._execute_single_node(
                 node, node_outputs, initial_input, session_id,
-                edges, all_nodes, project_path
+                edges, all_nodes, project_path, deadline
             ):
+                if event.event_type in ("node_error", "node_timeout"):
+                    reported = True
                 await event_queue.put(event)
+        except TokenBudgetExceededError as e:
+            # 워크플로우 수준에서 token_budget_exceeded로 보고 (트레이스백 불필요)
+            await event_queue.put(_NodeFailure(node.id, e, reported))
         except Exception as e:
             # 에러 발생 시 에러를 큐에 전달
             logger.error(
                 f"[{session_id}] 노드 {node.id} 실행 중 에러: {str(e)}",
                 exc_info=True
             )
-            await event_queue.put(e)  # 예외를 큐에 넣음
+            await event_queue.put(_NodeFailure(node.id, e, reported))
 
     async def execute_single_node_continue(
         self,
@@ -1653,19 +2308,24 @@ class WorkflowExecutor:
         # Worker 실행 (이전 세션 재개)
         try:
             worker = WorkerAgent(config=agent_config, project_dir=project_path)
-            node_output_chunks = []
+            final_text_parts: List[str] = []  # 최종 텍스트 청크 (점진적 조립)
+            output_length = 0
+            chunk_type_counts: Dict[str, int] = {}  # 청크 타입별 개수 (노드 요약 로그용)
             node_token_usage: Optional[TokenUsage] = None
+            result_usages: List[Dict[str, Any]] = []
+            last_message_usage: Optional[Dict[str, Any]] = None
 
             def usage_callback(usage_info: Dict[str, Any]):
-                nonlocal node_token_usage
-                node_token_usage = TokenUsage(
-                    input_tokens=usage_info.get("input_tokens", 0),
-                    output_tokens=usage_info.get("output_tokens", 0),
-                    total_tokens=usage_info.get("total_tokens", 0),
-                )
-                logger.debug(
-                    f"💰 토큰 사용량: {node_token_usage.total_tokens} "
-                    f"(입력: {node_token_usage.input_tokens}, 출력: {node_token_usage.output_tokens})"
+                nonlocal node_token_usage, last_message_usage
+                if usage_info.get("source") == "result":
+                    result_usages.append(usage_info)
+                else:
+                    last_message_usage = usage_info
+                node_token_usage = self._summarize_token_usage(result_usages, last_message_usage)
+                hot_logger.debug(
+                    "💰 토큰 사용량: %d (입력: %d, 출력: %d, 캐시 읽기: %d)",
+                    node_token_usage.total_tokens, node_token_usage.input_tokens,
+                    node_token_usage.output_tokens, node_token_usage.cache_read_tokens
                 )
 
             # Worker 실행 (이전 세션 ID로 재개, user_input_callback은 None)
@@ -1675,12 +2335,27 @@ class WorkflowExecutor:
                 resume_session_id=previous_session_id,
                 user_input_callback=None,  # 주도적 대화에서는 사용자 입력 요청 없음
             ):
-                node_output_chunks.append(chunk)
+                # 재시도 마커 감지 (일시적 오류로 SDK 실행 재시도)
+                if chunk.startswith("@EVENT:worker_retry:"):
+                    import json
+                    retry_data = json.loads(chunk[len("@EVENT:worker_retry:"):])
+                    yield WorkflowNodeExecutionEvent(
+                        event_type="node_retry",
+                        node_id=node_id,
+                        data={"agent_name": agent_name, **retry_data},
+                        timestamp=datetime.now().isoformat(),
+                    )
+                    continue
+
+                output_length += len(chunk)
 
-                # 청크 타입 분류
-                chunk_type = classify_chunk_type(chunk)
+                # 청크 타입은 SDK 응답 처리 시점에 결정됨 (재파싱 불필요)
+                chunk_type = self._get_chunk_type(chunk)
+                chunk_type_counts[chunk_type] = chunk_type_counts.get(chunk_type, 0) + 1
+                if self._is_final_text_chunk(chunk):
+                    final_text_parts.append(chunk)
 
-                output_event = WorkflowNodeExecutionEvent(
+                yield WorkflowNodeExecutionEvent(
                     event_type="node_output",
                     node_id=node_id,
                     data={
@@ -1688,16 +2363,14 @@ class WorkflowExecutor:
                         "chunk_type": chunk_type,
                     },
                 )
-                logger.debug(f"📝 이벤트 생성: node_output (node: {node_id}, type: {chunk_type})")
-                yield output_event
 
-            # 전체 출력에서 최종 텍스트만 추출
-            full_output = "".join(node_output_chunks)
-            final_text = extract_text_from_worker_output(full_output)
+            # 스트리밍 중 모아둔 텍스트 청크로 최종 텍스트 조립
+            final_text = "\n".join(final_text_parts).strip()
 
             logger.info(
                 f"노드 출력 처리 완료: {node_id} "
-                f"(전체: {len(full_output)}자, 최종 텍스트: {len(final_text)}자)"
+                f"(전체: {output_length}자, 최종 텍스트: {len(final_text)}자, "
+                f"청크: {chunk_type_counts})"
             )
 
             # Worker에서 반환된 실제 SDK 세션 ID 업데이트 (동일해야 하지만 갱신)
@@ -1725,7 +2398,9 @@ class WorkflowExecutor:
                 node_id=node_id,
                 data={
                     "agent_name": agent_name,
+                    "model": agent_config.model,
                     "output_length": len(final_text),
+                    "retry_count": worker.last_retry_count,
                 },
                 timestamp=datetime.now().isoformat(),
                 token_usage=node_token_usage,
@@ -1754,6 +2429,9 @@ class WorkflowExecutor:
         session_id: str,
         project_path: Optional[str] = None,
         start_node_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+        token_budget: Optional[int] = None,
+        isolate_node_sessions: bool = False,
     ) -> AsyncIterator[WorkflowNodeExecutionEvent]:
         """
         워크플로우 실행 (스트리밍, 병렬 실행 지원)
@@ -1764,37 +2442,54 @@ class WorkflowExecutor:
             session_id: 세션 ID
             project_path: 프로젝트 디렉토리 경로 (세션별 로그 저장용)
             start_node_id: 시작 노드 ID (옵션, 지정 시 해당 Input 노드에서만 시작)
+            timeout: 워크플로우 전체 실행 제한 시간 (초, 옵션)
+            token_budget: 워크플로우 전체 토큰 예산 (입력+출력, 옵션, 초과 시 실행 중단)
+            isolate_node_sessions: 이전 노드 세션을 재개하지 않고 이번 실행의 세션도 저장하지 않음 (배치 실행용)
 
         Yields:
             WorkflowNodeExecutionEvent: 노드 실행 이벤트
 
         Raises:
             ValueError: 워크플로우 설정 오류
+            WorkflowTimeoutError: 워크플로우 제한 시간 초과
+            TokenBudgetExceededError: 워크플로우 토큰 예산 초과
             Exception: 노드 실행 실패
         """
-        # 세션별 파일 핸들러 추가
+        # 세션 로그 라우트 등록 + session_id를 structlog contextvars에 바인딩
+        # (이 Task와 하위 Task의 로그만 이 세션의 로그 파일로 라우팅됨)
         add_session_file_handlers(session_id, project_path)
 
         # 세션별 Condition 노드 반복 횟수 초기화
         self._condition_iterations[session_id] = {}
+        self._completion_order[session_id] = {}
+        if isolate_node_sessions:
+            self._isolated_sessions.add(session_id)
 
         # 세션별 사용자 입력 Queue 생성 (Human-in-the-Loop)
         user_input_queue = asyncio.Queue()
         self.user_input_queues[session_id] = user_input_queue
         logger.info(f"[{session_id}] 사용자 입력 Queue 생성 (Human-in-the-Loop 지원)")
 
+        # 세션별 토큰 예산 초기화
+        self._token_budgets[session_id] = token_budget
+        self._token_spent[session_id] = 0
+
         # 실행 중인 병렬 태스크 추적 (취소 시 정리용)
         running_tasks: List[asyncio.Task] = []
 
+        # 워크플로우 종료 기한 (event loop 시각)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout else None
+
         try:
             logger.info(
                 f"[{session_id}] 워크플로우 실행 시작: {workflow.name} "
                 f"(노드: {len(workflow.nodes)}, 엣지: {len(workflow.edges)})"
             )
 
-            # 위상 정렬
+            # 위상 정렬 + 실행 그룹 계산 (병렬 실행 그룹 포함, 같은 구조는 캐시 재사용)
             try:
-                sorted_nodes = self._topological_sort(workflow.nodes, workflow.edges, start_node_id)
+                sorted_nodes, execution_groups = self._get_execution_plan(workflow, start_node_id)
             except ValueError as e:
                 logger.error(f"[{session_id}] 워크플로우 정렬 실패: {e}")
                 raise
@@ -1804,9 +2499,6 @@ class WorkflowExecutor:
                 f"{[node.id for node in sorted_nodes]}"
             )
 
-            # 실행 그룹 계산 (병렬 실행 그룹 포함)
-            execution_groups = self._compute_execution_groups(sorted_nodes, workflow.edges)
-
             logger.info(
                 f"[{session_id}] 실행 그룹: {len(execution_groups)}개 "
                 f"(병렬 그룹: {sum(1 for g in execution_groups if len(g) > 1)}개)"
@@ -1814,14 +2506,37 @@ class WorkflowExecutor:
 
             # 노드 출력 저장 (노드 ID → 출력)
             node_outputs: Dict[str, str] = {}
+            node_map = {node.id: node for node in workflow.nodes}
 
             # 실행 그룹별로 처리 (병렬 실행 지원)
             for group_idx, group in enumerate(execution_groups):
                 group_node_ids = [node.id for node in group]
 
+                if deadline is not None and loop.time() >= deadline:
+                    raise WorkflowTimeoutError(
+                        f"워크플로우 실행 제한 시간({timeout}초)을 초과했습니다 "
+                        f"(미실행 노드: {group_node_ids} 외)"
+                    )
+
+                # 이전 그룹까지의 누적 사용량이 예산을 넘었으면 다음 그룹을 시작하지 않음
+                self._check_token_budget(session_id)
+
                 if len(group) == 1:
                     # 단독 실행
                     node = group[0]
+
+                    # quorum이 이미 채워진 병합 노드로만 이어지는 분기는 실행하지 않음
+                    quorum_merge_id = self._find_quorum_merge_for_straggler(
+                        session_id, node.id, workflow.edges, node_map
+                    )
+                    if quorum_merge_id is not None:
+                        logger.info(
+                            f"[{session_id}] 노드 {node.id} 실행 생략: "
+                            f"병합 노드 {quorum_merge_id}의 quorum 충족"
+                        )
+                        yield self._quorum_cancel_event(node.id, quorum_merge_id, started=False)
+                        continue
+
                     logger.info(
                         f"[{session_id}] 그룹 {group_idx + 1}/{len(execution_groups)}: "
                         f"노드 {node.id} 단독 실행"
@@ -1829,9 +2544,15 @@ class WorkflowExecutor:
 
                     async for event in self._execute_single_node(
                         node, node_outputs, initial_input, session_id,
-                        workflow.edges, workflow.nodes, project_path
+                        workflow.edges, workflow.nodes, project_path, deadline
                     ):
                         yield event
+                        if event.event_type == "node_complete":
+                            self._record_completion(session_id, event.node_id)
+                            for partial_event in self._merge_partial_events(
+                                session_id, event.node_id, node_outputs, workflow.edges, node_map
+                            ):
+                                yield partial_event
 
                 else:
                     # 병렬 실행 (실시간 이벤트 스트리밍)
@@ -1848,7 +2569,8 @@ class WorkflowExecutor:
                         asyncio.create_task(
                             self._execute_node_and_queue_events(
                                 node, node_outputs, initial_input, session_id,
-                                workflow.edges, workflow.nodes, event_queue, project_path
+                                workflow.edges, workflow.nodes, event_queue, project_path,
+                                deadline
                             )
                         )
                         for node in group
@@ -1856,62 +2578,116 @@ class WorkflowExecutor:
 
                     # 실행 중인 태스크 추적에 추가
                     running_tasks.extend(tasks)
+                    task_by_node_id = {node.id: task for node, task in zip(group, tasks)}
 
-                    # 완료된 노드 수 추적
-                    completed_nodes = 0
+                    # 완료된 노드 추적 (완료/에러/타임아웃/취소)
+                    finished_node_ids: set = set()
                     total_nodes = len(group)
 
-                    # 실시간으로 이벤트를 스트리밍
-                    while completed_nodes < total_nodes:
-                        # 큐에서 이벤트 가져오기 (타임아웃 1초)
-                        try:
-                            event_or_exception = await asyncio.wait_for(
-                                event_queue.get(), timeout=1.0
-                            )
+                    try:
+                        # 실시간으로 이벤트를 스트리밍
+                        while len(finished_node_ids) < total_nodes:
+                            # 모든 태스크가 종료되었고 큐가 비었으면 더 받을 이벤트 없음
+                            # (완료 이벤트 없이 종료된 태스크가 있어도 무한 대기하지 않음)
+                            if event_queue.empty() and all(t.done() for t in tasks):
+                                logger.warning(
+                                    f"[{session_id}] 병렬 태스크가 모두 종료됨 "
+                                    f"(완료 이벤트 {len(finished_node_ids)}/{total_nodes})"
+                                )
+                                break
+
+                            # 큐에서 이벤트 가져오기 (태스크 상태 확인 주기 1초, 워크플로우 기한 이내)
+                            wait_timeout = 1.0
+                            if deadline is not None:
+                                remaining = deadline - loop.time()
+                                if remaining <= 0:
+                                    raise WorkflowTimeoutError(
+                                        f"워크플로우 실행 제한 시간({timeout}초)을 초과했습니다 "
+                                        f"(병렬 그룹: {group_node_ids})"
+                                    )
+                                wait_timeout = min(wait_timeout, remaining)
+
+                            try:
+                                event_or_exception = await asyncio.wait_for(
+                                    event_queue.get(), timeout=wait_timeout
+                                )
+                            except asyncio.TimeoutError:
+                                continue
+
+                            # 노드 실패인 경우
+                            if isinstance(event_or_exception, _NodeFailure):
+                                failure = event_or_exception
 
-                            # 예외인 경우
-                            if isinstance(event_or_exception, Exception):
-                                error_msg = f"병렬 실행 중 노드 실패: {str(event_or_exception)}"
-                                logger.error(f"[{session_id}] {error_msg}", exc_info=event_or_exception)
+                                # 예산 초과(token_budget_exceeded)와 노드 타임아웃(node_timeout),
+                                # 이미 node_error를 보낸 실패는 추가 이벤트 없이 그대로 전파
+                                if failure.reported or isinstance(
+                                    failure.error, (TokenBudgetExceededError, WorkerTimeoutError)
+                                ):
+                                    raise failure.error
 
-                                # 에러 이벤트 생성
+                                error_msg = f"병렬 실행 중 노드 실패: {str(failure.error)}"
+                                logger.error(f"[{session_id}] {error_msg}", exc_info=failure.error)
+
+                                # 노드 이벤트 없이 실패한 경우에만 에러 이벤트 생성
                                 yield WorkflowNodeExecutionEvent(
                                     event_type="node_error",
-                                    node_id="unknown",
+                                    node_id=failure.node_id,
                                     data={"error": error_msg},
                                     timestamp=datetime.now().isoformat(),
                                 )
 
-                                # 모든 태스크 취소
-                                for task in tasks:
-                                    task.cancel()
-
-                                raise event_or_exception
+                                raise failure.error
 
                             # 정상 이벤트인 경우
                             event = event_or_exception
+                            if event.node_id in finished_node_ids:
+                                # quorum으로 취소된 분기가 취소 직전에 보낸 이벤트는 버림
+                                continue
                             yield event
 
-                            # 노드 완료/에러 이벤트 카운팅
-                            if event.event_type in ["node_complete", "node_error"]:
-                                completed_nodes += 1
+                            # 노드 완료/에러/타임아웃 이벤트 카운팅
+                            if event.event_type in ["node_complete", "node_error", "node_timeout"]:
+                                finished_node_ids.add(event.node_id)
                                 logger.info(
                                     f"[{session_id}] 병렬 노드 완료: {event.node_id} "
-                                    f"({completed_nodes}/{total_nodes})"
+                                    f"({len(finished_node_ids)}/{total_nodes})"
                                 )
 
-                        except asyncio.TimeoutError:
-                            # 타임아웃 시 태스크 상태 확인
-                            done_tasks = [t for t in tasks if t.done()]
-                            if done_tasks:
-                                # 완료된 태스크가 있으면 다시 시도
-                                continue
-                            else:
-                                # 모든 태스크가 아직 실행 중
+                            if event.event_type != "node_complete":
                                 continue
 
-                    # 모든 태스크 완료 대기 (정리 작업)
-                    await asyncio.gather(*tasks, return_exceptions=True)
+                            # 부분 병합 전송 + quorum이 채워지면 남은 분기 취소
+                            self._record_completion(session_id, event.node_id)
+                            for partial_event in self._merge_partial_events(
+                                session_id, event.node_id, node_outputs, workflow.edges, node_map
+                            ):
+                                yield partial_event
+
+                            for straggler_id, straggler_task in task_by_node_id.items():
+                                if straggler_id in finished_node_ids:
+                                    continue
+                                quorum_merge_id = self._find_quorum_merge_for_straggler(
+                                    session_id, straggler_id, workflow.edges, node_map
+                                )
+                                if quorum_merge_id is None:
+                                    continue
+
+                                straggler_task.cancel()
+                                finished_node_ids.add(straggler_id)
+                                logger.info(
+                                    f"[{session_id}] 분기 {straggler_id} 취소: "
+                                    f"병합 노드 {quorum_merge_id}의 quorum 충족"
+                                )
+                                yield self._quorum_cancel_event(straggler_id, quorum_merge_id, started=True)
+                    finally:
+                        # 남은 태스크 취소 및 정리 (SDK 세션 종료, 동시 실행 슬롯 반환)
+                        for task in tasks:
+                            if not task.done():
+                                task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+                        for task in tasks:
+                            if task in running_tasks:
+                                running_tasks.remove(task)
 
                     logger.info(
                         f"[{session_id}] 병렬 그룹 완료: {group_node_ids}"
@@ -1929,6 +2705,29 @@ class WorkflowExecutor:
             logger.info(f"[{session_id}] 🎉 이벤트 생성: workflow_complete")
             yield workflow_complete_event
 
+        except WorkflowTimeoutError as e:
+            logger.error(f"[{session_id}] ⏱️ {e}")
+
+            yield WorkflowNodeExecutionEvent(
+                event_type="workflow_timeout",
+                node_id="",
+                data={"error": str(e), "timeout": timeout},
+                timestamp=datetime.now().isoformat(),
+            )
+            raise
+
+        except TokenBudgetExceededError as e:
+            logger.error(f"[{session_id}] 💸 {e}")
+
+            yield WorkflowNodeExecutionEvent(
+                event_type="token_budget_exceeded",
+                node_id=e.node_id or "",
+                data={"error": str(e), "token_budget": e.budget, "tokens_used": e.used, **e.node_info},
+                timestamp=datetime.now().isoformat(),
+                token_usage=e.node_usage,  # 중단된 노드 사용량 (원장 기록용)
+            )
+            raise
+
         except asyncio.CancelledError:
             # 워크플로우 취소 요청 시
             logger.warning(
@@ -1960,10 +2759,16 @@ class WorkflowExecutor:
             raise
 
         finally:
-            # 세션별 파일 핸들러 제거 (메모리 누수 방지)
+            # 세션 로그 라우트 제거 + session_id 바인딩 해제 (파일 핸들 정리)
             remove_session_file_handlers(session_id)
 
             # 사용자 입력 Queue 정리
             if session_id in self.user_input_queues:
                 del self.user_input_queues[session_id]
                 logger.info(f"[{session_id}] 사용자 입력 Queue 정리 완료")
+
+            # 토큰 예산 정리
+            self._token_budgets.pop(session_id, None)
+            self._token_spent.pop(session_id, None)
+            self._completion_order.pop(session_id, None)
+            self._isolated_sessions.discard(session_id)
@@ -0,0 +1,282 @@
+"""
+프로젝트 워크플로우 라이브러리 인덱스
+
+프로젝트의 저장된 워크플로우({project}/.claude-flow/workflows/*.json) 목록 조회용 메타데이터
+(이름, 표시 이름, 설명, 노드 수, 수정 시각, 크기, 내용 해시)를 유지합니다.
+
+- 메모리 + 디스크({project}/.claude-flow/workflow-index.json)에 저장되어 서버 재시작 후에도 재사용
+- 저장/이름 변경/삭제 엔드포인트가 인덱스를 직접 갱신
+- 목록 조회 시 파일 stat(mtime, 크기)만 비교하여 외부에서 바뀐 파일만 다시 파싱
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 디스크 인덱스 형식 버전 (필드가 바뀌면 증가 → 기존 인덱스 무시)
+INDEX_VERSION = 1
+
+INDEX_FILENAME = "workflow-index.json"
+
+
+@dataclass
+class WorkflowIndexEntry:
+    """
+    워크플로우 인덱스 항목
+
+    Attributes:
+        name: 워크플로우 이름 (파일명, 확장자 제외)
+        display_name: 표시 이름 (workflow.name)
+        description: 설명 (workflow.description)
+        node_count: 노드 개수
+        last_modified: 파일 수정 시각 (ISO 8601)
+        size: 파일 크기 (바이트)
+        content_hash: 파일 내용 sha256
+        mtime_ns: 파일 수정 시각 (나노초, 변경 감지용)
+    """
+    name: str
+    display_name: str
+    description: str
+    node_count: int
+    last_modified: str
+    size: int
+    content_hash: str
+    mtime_ns: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        """API 응답용 딕셔너리 (변경 감지용 필드 제외)"""
+        data = asdict(self)
+        data.pop("mtime_ns")
+        return data
+
+
+def _build_entry(name: str, content: bytes, stat: os.stat_result) -> WorkflowIndexEntry:
+    """
+    워크플로우 파일 내용으로 인덱스 항목 생성
+
+    Raises:
+        ValueError: JSON 파싱 실패
+    """
+    workflow_data = json.loads(content)
+    workflow_info = workflow_data.get("workflow", {}) if isinstance(workflow_data, dict) else {}
+    nodes = workflow_info.get("nodes") or []
+
+    return WorkflowIndexEntry(
+        name=name,
+        display_name=workflow_info.get("name", name),
+        description=workflow_info.get("description") or "",
+        node_count=len(nodes) if isinstance(nodes, list) else 0,
+        last_modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
+        size=stat.st_size,
+        content_hash=hashlib.sha256(content).hexdigest(),
+        mtime_ns=stat.st_mtime_ns,
+    )
+
+
+class WorkflowIndex:
+    """
+    프로젝트별 워크플로우 인덱스
+
+    Attributes:
+        workflows_dir: 워크플로우 디렉토리 (.claude-flow/workflows)
+        index_path: 디스크 인덱스 파일 경로 (.claude-flow/workflow-index.json)
+    """
+
+    def __init__(self, workflows_dir: Path):
+        self.workflows_dir = workflows_dir
+        self.index_path = workflows_dir.parent / INDEX_FILENAME
+        self._entries: Dict[str, WorkflowIndexEntry] = {}
+        # 파싱 실패 파일 (이름 → (mtime_ns, 크기)): 파일이 바뀔 때까지 다시 읽지 않음
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        """디스크 인덱스 로드 (최초 1회, 손상/버전 불일치 시 빈 인덱스로 시작)"""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.index_path.exists():
+            return
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            for item in data.get("workflows", []):
+                entry = WorkflowIndexEntry(**item)
+                self._entries[entry.name] = entry
+        except Exception as e:
+            logger.warning(f"워크플로우 인덱스 로드 실패 (재생성): {self.index_path} - {e}")
+            self._entries.clear()
+
+    def _save(self) -> None:
+        """변경된 인덱스를 디스크에 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": INDEX_VERSION,
+            "workflows": [asdict(entry) for entry in self._entries.values()],
+        }
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            tmp_path.replace(self.index_path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"워크플로우 인덱스 저장 실패: {self.index_path} - {e}")
+
+    def _index_file(self, name: str, workflow_file: Path, stat: os.stat_result) -> bool:
+        """
+        워크플로우 파일을 읽어 인덱스 항목 갱신 (파싱 실패 시 항목 제거)
+
+        Returns:
+            bool: 파일을 다시 읽었는지 여부 (이전에 실패한 그대로면 False)
+        """
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._failed.get(name) == signature:
+            return False
+
+        try:
+            content = workflow_file.read_bytes()
+            self._entries[name] = _build_entry(name, content, stat)
+            self._failed.pop(name, None)
+        except Exception as e:
+            logger.warning(f"워크플로우 파일 읽기 실패: {workflow_file} - {e}")
+            self._entries.pop(name, None)
+            self._failed[name] = signature
+        self._dirty = True
+        return True
+
+    def list(self) -> List[WorkflowIndexEntry]:
+        """
+        워크플로우 목록 (최근 수정 순)
+
+        디렉토리를 스캔하여 mtime/크기가 인덱스와 다른 파일만 다시 읽고,
+        사라진 파일은 인덱스에서 제거합니다.
+
+        Returns:
+            List[WorkflowIndexEntry]: 인덱스 항목 목록
+        """
+        with self._lock:
+            self._load()
+
+            seen = set()
+            reindexed = 0
+            if self.workflows_dir.exists():
+                with os.scandir(self.workflows_dir) as it:
+                    for dir_entry in it:
+                        if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                            continue
+                        name = dir_entry.name[:-len(".json")]
+                        seen.add(name)
+
+                        stat = dir_entry.stat()
+                        entry = self._entries.get(name)
+                        if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                            continue
+
+                        if self._index_file(name, Path(dir_entry.path), stat):
+                            reindexed += 1
+
+            for name in [name for name in self._entries if name not in seen]:
+                del self._entries[name]
+                self._dirty = True
+
+            self._save()
+            entries = sorted(self._entries.values(), key=lambda e: e.mtime_ns, reverse=True)
+
+        if reindexed:
+            logger.info(f"워크플로우 인덱스 갱신: {reindexed}개 파일 (전체 {len(entries)}개)")
+        return entries
+
+    def record(self, name: str, content: bytes) -> Optional[WorkflowIndexEntry]:
+        """
+        저장된 워크플로우 반영 (저장 엔드포인트에서 호출, 파일을 다시 읽지 않음)
+
+        Args:
+            name: 워크플로우 이름
+            content: 파일에 쓴 내용
+
+        Returns:
+            Optional[WorkflowIndexEntry]: 갱신된 항목 (실패 시 None)
+        """
+        workflow_file = self.workflows_dir / f"{name}.json"
+        with self._lock:
+            self._load()
+            try:
+                entry = _build_entry(name, content, workflow_file.stat())
+            except Exception as e:
+                logger.warning(f"워크플로우 인덱스 갱신 실패: {name} - {e}")
+                self._entries.pop(name, None)
+                entry = None
+            else:
+                self._entries[name] = entry
+            self._dirty = True
+            self._save()
+            return entry
+
+    def remove(self, name: str) -> None:
+        """삭제된 워크플로우 반영"""
+        with self._lock:
+            self._load()
+            if self._entries.pop(name, None) is not None:
+                self._dirty = True
+                self._save()
+
+    def rename(self, old_name: str, new_name: str) -> None:
+        """이름이 변경된 워크플로우 반영 (내용은 그대로이므로 다시 읽지 않음)"""
+        new_file = self.workflows_dir / f"{new_name}.json"
+        with self._lock:
+            self._load()
+            entry = self._entries.pop(old_name, None)
+            self._dirty = True
+            try:
+                stat = new_file.stat()
+            except OSError:
+                self._save()
+                return
+
+            if entry is not None and entry.size == stat.st_size:
+                entry.name = new_name
+                entry.mtime_ns = stat.st_mtime_ns
+                entry.last_modified = datetime.fromtimestamp(stat.st_mtime).isoformat()
+                self._entries[new_name] = entry
+            else:
+                self._index_file(new_name, new_file, stat)
+            self._save()
+
+
+# 워크플로우 디렉토리별 인덱스 (서버 메모리)
+_workflow_indexes: Dict[str, WorkflowIndex] = {}
+
+
+def get_workflow_index(workflows_dir: Path) -> WorkflowIndex:
+    """
+    워크플로우 디렉토리의 인덱스 반환 (없으면 생성)
+
+    Args:
+        workflows_dir: 워크플로우 디렉토리
+
+    Returns:
+        WorkflowIndex: 워크플로우 인덱스
+    """
+    key = str(workflows_dir)
+    if key not in _workflow_indexes:
+        _workflow_indexes[key] = WorkflowIndex(workflows_dir)
+    return _workflow_indexes[key]
@@ -10,6 +10,7 @@
 
 import json
 import asyncio
+import time
 import aiofiles
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Literal
@@ -17,7 +18,17 @@ from datetime import datetime
 from dataclasses import dataclass, field
 
 from src.infrastructure.logging import get_logger
+from src.infrastructure.metrics import (
+    EVENTS_TOTAL,
+    NODE_DURATION_SECONDS,
+    TOKENS_TOTAL,
+    SESSION_STORE_WRITE_SECONDS,
+    SESSION_STORE_WRITE_BYTES,
+)
 from src.presentation.web.schemas.workflow import Workflow, WorkflowNodeExecutionEvent
+from src.presentation.web.services.token_ledger import TokenLedger
+from src.presentation.web.services.event_codec import EncodedEvent
+from src.presentation.web.services.blob_store import SessionBlobStore
 
 logger = get_logger(__name__)
 
@@ -39,6 +50,8 @@ class WorkflowSession:
         start_time: 시작 시각
         end_time: 종료 시각
         error: 에러 메시지 (에러 발생 시)
+        token_ledger: 토큰 사용량 원장 (노드/Agent/모델별 누적)
+        _encoded_logs: 인코딩된 로그 (logs와 1:1, 메모리 전용, 파일에 저장하지 않음)
     """
     session_id: str
     workflow: Workflow
@@ -52,6 +65,40 @@ class WorkflowSession:
     start_time: str = field(default_factory=lambda: datetime.now().isoformat())
     end_time: Optional[str] = None
     error: Optional[str] = None
+    token_ledger: TokenLedger = field(default_factory=TokenLedger)
+    _encoded_logs: List[EncodedEvent] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def append_event(self, log_entry: Dict[str, Any]) -> EncodedEvent:
+        """
+        로그 추가 + 발행 시점 1회 인코딩
+
+        Args:
+            log_entry: 이벤트 딕셔너리
+
+        Returns:
+            EncodedEvent: 인코딩된 이벤트
+        """
+        self.logs.append(log_entry)
+        return self.get_encoded_logs(len(self.logs) - 1)[0]
+
+    def get_encoded_logs(self, start: int = 0, end: Optional[int] = None) -> List[EncodedEvent]:
+        """
+        인코딩된 로그 조회 (logs[start:end]에 대응)
+
+        파일에서 복원한 세션은 최초 조회 시 한 번만 인코딩합니다.
+
+        Args:
+            start: 시작 인덱스
+            end: 종료 인덱스 (제외, None이면 끝까지)
+
+        Returns:
+            List[EncodedEvent]: 인코딩된 이벤트 목록
+        """
+        for log_entry in self.logs[len(self._encoded_logs):]:
+            self._encoded_logs.append(EncodedEvent.from_dict(log_entry))
+        return self._encoded_logs[start:end]
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환 (JSON 직렬화용)"""
@@ -68,6 +115,7 @@ class WorkflowSession:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "error": self.error,
+            "token_ledger": self.token_ledger.to_dict(),
         }
 
     @classmethod
@@ -89,6 +137,7 @@ class WorkflowSession:
             start_time=data["start_time"],
             end_time=data.get("end_time"),
             error=data.get("error"),
+            token_ledger=TokenLedger.from_dict(data.get("token_ledger")),
         )
 
 
@@ -100,6 +149,7 @@ class WorkflowSessionStore:
 
     Attributes:
         sessions_dir: 세션 저장 디렉토리
+        blob_store: 큰 노드 입력/출력 저장소 (sessions_dir/blobs/)
         _cache: 메모리 캐시 (session_id → WorkflowSession)
         _locks: 세션별 파일 쓰기 락 (동시성 제어)
     """
@@ -117,6 +167,9 @@ class WorkflowSessionStore:
         self.sessions_dir = sessions_dir
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
 
+        # 큰 노드 입력/출력은 내용 주소 기반 blob으로 한 번만 저장
+        self.blob_store = SessionBlobStore(self.sessions_dir / "blobs")
+
         # 메모리 캐시 (session_id → WorkflowSession)
         self._cache: Dict[str, WorkflowSession] = {}
 
@@ -141,6 +194,7 @@ class WorkflowSessionStore:
         workflow: Workflow,
         initial_input: str,
         project_path: Optional[str] = None,
+        token_budget: Optional[int] = None,
     ) -> WorkflowSession:
         """
         새 세션 생성 및 저장
@@ -150,6 +204,7 @@ class WorkflowSessionStore:
             workflow: 워크플로우 정의
             initial_input: 초기 입력
             project_path: 프로젝트 디렉토리 경로 (세션 복원용)
+            token_budget: 워크플로우 토큰 예산 (None이면 제한 없음)
 
         Returns:
             WorkflowSession: 생성된 세션
@@ -160,6 +215,7 @@ class WorkflowSessionStore:
             initial_input=initial_input,
             project_path=project_path,
             status="running",
+            token_ledger=TokenLedger(budget=token_budget),
         )
 
         # 메모리 캐시에 저장
@@ -256,17 +312,52 @@ class WorkflowSessionStore:
         if not session:
             raise ValueError(f"세션을 찾을 수 없습니다: {session_id}")
 
-        # 이벤트를 딕셔너리로 변환하여 로그에 추가
+        # 큰 입력/출력은 blob으로 분리 (로그/SSE에는 참조 + 미리보기 + 길이만 포함)
+        full_data = event.data
+        if event.event_type in ("node_start", "node_complete"):
+            data = dict(event.data)
+            externalized = False
+            for key in ("input", "output"):
+                externalized |= await self.blob_store.externalize(session_id, data, key)
+            if externalized:
+                event.data = data
+
+        # 이벤트를 딕셔너리로 변환하여 로그에 추가 (SSE 전송용 바이트는 여기서 1회 인코딩)
         log_entry = event.model_dump()
-        session.logs.append(log_entry)
+        session.append_event(log_entry)
+        EVENTS_TOTAL.inc(event_type=event.event_type)
+
+        if event.event_type in ("node_complete", "node_error", "node_timeout"):
+            # 노드 실행 시간 메트릭 (Agent별)
+            if event.elapsed_time is not None:
+                NODE_DURATION_SECONDS.observe(
+                    event.elapsed_time,
+                    agent=event.data.get("agent_name") or "unknown",
+                    status=event.event_type[len("node_"):],
+                )
+
+        if event.event_type in ("node_complete", "node_error", "node_timeout", "token_budget_exceeded"):
+            # 토큰 사용량 원장 기록 (노드 종료 이벤트와 예산 초과로 중단된 노드에만 usage가 포함됨)
+            if event.token_usage:
+                usage = event.token_usage.model_dump()
+                session.token_ledger.record(
+                    usage,
+                    node_id=event.node_id,
+                    agent_name=event.data.get("agent_name"),
+                    model=event.data.get("model"),
+                )
+                model = event.data.get("model") or "unknown"
+                for kind in ("input", "output", "cache_read", "cache_creation"):
+                    if usage.get(f"{kind}_tokens"):
+                        TOKENS_TOTAL.inc(usage[f"{kind}_tokens"], model=model, kind=kind)
 
         # 이벤트 타입별 처리
         if event.event_type == "node_start":
             session.current_node_id = event.node_id
 
             # 노드 입력 저장 (디버깅용)
-            if "input" in event.data:
-                session.node_inputs[event.node_id] = event.data["input"]
+            if "input" in full_data:
+                session.node_inputs[event.node_id] = full_data["input"]
 
         elif event.event_type == "node_output":
             # 노드 출력 누적 (청크 단위 추가)
@@ -277,10 +368,10 @@ class WorkflowSessionStore:
 
         elif event.event_type == "node_complete":
             # 노드 완료 시 전체 출력 저장 (이벤트에 포함된 경우)
-            if "output" in event.data:
-                session.node_outputs[event.node_id] = event.data["output"]
+            if "output" in full_data:
+                session.node_outputs[event.node_id] = full_data["output"]
 
-        elif event.event_type == "node_error":
+        elif event.event_type in ("node_error", "node_timeout", "workflow_timeout", "token_budget_exceeded"):
             session.status = "error"
             session.error = event.data.get("error", "Unknown error")
             session.end_time = datetime.now().isoformat()
@@ -324,6 +415,9 @@ class WorkflowSessionStore:
             session_path.unlink()
             logger.info(f"세션 삭제: {session_id}")
 
+        # blob 영역 삭제
+        self.blob_store.delete_session(session_id)
+
     async def list_sessions(
         self,
         status: Optional[Literal["running", "completed", "error", "cancelled"]] = None,
@@ -362,13 +456,18 @@ class WorkflowSessionStore:
         lock = self._get_lock(session.session_id)
         async with lock:
             try:
+                started_at = time.perf_counter()
+
                 # JSON 직렬화
                 data = session.to_dict()
-                json_str = json.dumps(data, ensure_ascii=False, indent=2)
+                json_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
 
                 # 비동기 파일 쓰기 (이벤트 루프 블로킹 방지)
-                async with aiofiles.open(session_path, "w", encoding="utf-8") as f:
-                    await f.write(json_str)
+                async with aiofiles.open(session_path, "wb") as f:
+                    await f.write(json_bytes)
+
+                SESSION_STORE_WRITE_SECONDS.observe(time.perf_counter() - started_at)
+                SESSION_STORE_WRITE_BYTES.inc(len(json_bytes))
 
                 logger.debug(f"세션 저장 완료: {session.session_id}")
 
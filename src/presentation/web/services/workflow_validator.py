@@ -6,12 +6,19 @@
 - 고아 노드 검사
 - 템플릿 변수 유효성 검사
 - Worker별 필수 도구 검사
-- Condition 노드 검증 (순환 경로에서 max_iterations 설정 확인)
+- Condition 노드 검증 (조건 컴파일 가능 여부, 순환 경로에서 max_iterations 설정 확인)
+
+캔버스가 편집할 때마다 검증을 호출하므로 결과를 증분 캐싱합니다:
+- 구조 검사(순환, 고아 노드, 순환 경로 노드)는 (노드 ID/타입 집합, 엣지 집합) 키로 캐싱
+- 노드별 검사(템플릿 변수 파싱, 도구 권한)는 노드 내용 + 에이전트 설정 버전 키로 캐싱
+  (agent_config.json이 바뀌면 에이전트 레지스트리 버전이 올라가 도구 목록을 다시 읽음)
 """
 
-from typing import List, Dict, Set, Optional
+from collections import OrderedDict
+from typing import List, Dict, Set, Optional, Tuple, FrozenSet, Any
 from dataclasses import dataclass
-import re
+
+from src.infrastructure.config import get_agent_registry
 
 from ..schemas.workflow import (
     Workflow,
@@ -19,6 +26,8 @@ from ..schemas.workflow import (
     WorkflowEdge,
     WorkerNodeData,
 )
+from .condition_expression import ConditionExpressionError, compile_condition
+from .task_template import TEMPLATE_VAR_RE, compile_task_template
 
 
 @dataclass
@@ -38,6 +47,34 @@ class ValidationError:
     suggestion: str
 
 
+@dataclass
+class _StructureResult:
+    """
+    그래프 구조 검사 결과 (노드 ID/타입 + 엣지에만 의존)
+
+    Attributes:
+        cycle_errors: 순환 참조 에러
+        orphan_errors: 고아 노드 경고
+        nodes_in_cycles: 순환 경로에 포함된 노드 ID
+    """
+    cycle_errors: List[ValidationError]
+    orphan_errors: List[ValidationError]
+    nodes_in_cycles: FrozenSet[str]
+
+
+@dataclass
+class _NodeResult:
+    """
+    노드별 검사 결과 (노드 내용에만 의존)
+
+    Attributes:
+        template_vars: 템플릿에서 추출한 변수 이름 (순서 유지)
+        tool_errors: 도구 권한 에러
+    """
+    template_vars: Tuple[str, ...]
+    tool_errors: List[ValidationError]
+
+
 class WorkflowValidator:
     """
     워크플로우 검증기
@@ -65,38 +102,64 @@ class WorkflowValidator:
         "log_analyzer": ["read", "bash", "glob", "grep"],
     }
 
-    # 템플릿 변수 패턴 ({{input}}, {{node_123}} 등)
-    TEMPLATE_VAR_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+    # 템플릿 변수 패턴 ({{input}}, {{node_123}}, {{parent|truncate:2000}} 등)
+    TEMPLATE_VAR_PATTERN = TEMPLATE_VAR_RE
+
+    # 캐시 상한 (LRU)
+    MAX_STRUCTURE_CACHE = 256
+    MAX_NODE_CACHE = 4096
 
     def __init__(self, config_loader=None):
         """
         워크플로우 검증기 초기화
 
+        검증 결과 캐시는 인스턴스에 보관되므로 요청 간에 같은 인스턴스를 재사용해야
+        증분 검증 효과가 있습니다.
+
         Args:
             config_loader: 설정 로더 (옵션, Worker 도구 목록 동적 로드용)
         """
         self.config_loader = config_loader
 
+        # Worker별 도구 목록 (기본값 + agent_config.json, 레지스트리 버전이 바뀌면 다시 로드)
+        self.worker_tools: Dict[str, List[str]] = dict(self.WORKER_TOOLS)
+        self._agent_registry = get_agent_registry(config_loader) if config_loader else None
+        self._tools_version: Optional[int] = None
+
+        # 구조 키 → 구조 검사 결과
+        self._structure_cache: "OrderedDict[Tuple[FrozenSet, FrozenSet], _StructureResult]" = OrderedDict()
+        # 노드 내용 키 → 노드별 검사 결과
+        self._node_cache: "OrderedDict[Tuple[Any, ...], _NodeResult]" = OrderedDict()
+
         # config_loader가 제공되면 동적으로 Worker 도구 목록 로드
         if config_loader:
             self._load_worker_tools_from_config()
 
     def _load_worker_tools_from_config(self):
-        """agent_config.json에서 Worker별 도구 목록 동적 로드"""
+        """
+        agent_config.json에서 Worker별 도구 목록 동적 로드 (레지스트리 버전이 바뀐 경우에만)
+
+        검증 요청마다 호출되며, 레지스트리가 파일 변경을 감지해 다시 로드하면 버전이 올라갑니다.
+        """
         try:
-            config = self.config_loader.load_agent_config()
-            for agent in config.get("agents", []):
-                agent_name = agent.get("name")
-                tools = agent.get("tools", [])
-                if agent_name and tools:
-                    self.WORKER_TOOLS[agent_name] = tools
+            snapshot = self._agent_registry.get_snapshot()
         except Exception:
-            # 로드 실패 시 기본값 사용
-            pass
+            # 로드 실패 시 기존 목록 사용
+            return
+
+        if snapshot.version == self._tools_version:
+            return
+
+        worker_tools = dict(self.WORKER_TOOLS)
+        for config in snapshot.agent_configs:
+            if config.name and config.allowed_tools:
+                worker_tools[config.name] = list(config.allowed_tools)
+        self.worker_tools = worker_tools
+        self._tools_version = snapshot.version
 
     def validate(self, workflow: Workflow) -> List[ValidationError]:
         """
-        워크플로우 검증 (전체)
+        워크플로우 검증 (전체, 바뀐 부분만 다시 검사)
 
         Args:
             workflow: 검증할 워크플로우
@@ -104,29 +167,125 @@ class WorkflowValidator:
         Returns:
             검증 에러 목록 (비어있으면 검증 통과)
         """
+        if self._agent_registry is not None:
+            self._load_worker_tools_from_config()
+
         errors: List[ValidationError] = []
+        structure = self._get_structure_result(workflow)
+        node_results = [self._get_node_result(node) for node in workflow.nodes]
 
         # 1. 순환 참조 검사
-        errors.extend(self._check_cycles(workflow))
+        errors.extend(structure.cycle_errors)
 
         # 2. 고아 노드 검사
-        errors.extend(self._check_orphan_nodes(workflow))
+        errors.extend(structure.orphan_errors)
 
         # 3. 템플릿 변수 검증
-        errors.extend(self._validate_template_variables(workflow))
+        errors.extend(self._validate_template_variables(workflow, node_results))
 
         # 4. Worker별 필수 도구 권한 검사
-        errors.extend(self._check_worker_tools(workflow))
+        for node_result in node_results:
+            errors.extend(node_result.tool_errors)
 
         # 5. Input 노드 존재 여부 검사
         errors.extend(self._check_input_node(workflow))
 
         # 6. Condition 노드 검증 (순환 경로의 max_iterations 확인)
-        errors.extend(self._check_condition_nodes(workflow))
+        errors.extend(self._check_condition_nodes(workflow, structure.nodes_in_cycles))
 
         return errors
 
-    def _check_cycles(self, workflow: Workflow) -> List[ValidationError]:
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any) -> Any:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+        cache[key] = value
+        if len(cache) > max_size:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def _get_worker_fields(node: WorkflowNode) -> Tuple[Optional[str], Optional[str], Optional[Tuple[str, ...]]]:
+        """Worker 노드의 (task_template, agent_name, allowed_tools) 추출"""
+        if isinstance(node.data, WorkerNodeData):
+            template = node.data.task_template
+            agent_name = node.data.agent_name
+            allowed_tools = node.data.allowed_tools
+        elif isinstance(node.data, dict):
+            template = node.data.get("task_template", "")
+            agent_name = node.data.get("agent_name")
+            allowed_tools = node.data.get("allowed_tools")
+        else:
+            return None, None, None
+        return template, agent_name, tuple(allowed_tools) if allowed_tools else None
+
+    def _get_structure_result(self, workflow: Workflow) -> _StructureResult:
+        """
+        구조 검사 결과 조회 (노드 ID/타입 집합 + 엣지 집합이 같으면 캐시 사용)
+
+        Args:
+            workflow: 검증할 워크플로우
+
+        Returns:
+            _StructureResult: 구조 검사 결과
+        """
+        structure_key = (
+            frozenset((node.id, node.type) for node in workflow.nodes),
+            frozenset((edge.source, edge.target) for edge in workflow.edges),
+        )
+        cached = self._cache_get(self._structure_cache, structure_key)
+        if cached is not None:
+            return cached
+
+        graph = self._build_graph(workflow)
+        result = _StructureResult(
+            cycle_errors=self._check_cycles(workflow, graph),
+            orphan_errors=self._check_orphan_nodes(workflow),
+            nodes_in_cycles=frozenset(self._find_nodes_in_cycles(graph)),
+        )
+        self._cache_put(self._structure_cache, structure_key, result, self.MAX_STRUCTURE_CACHE)
+        return result
+
+    def _get_node_result(self, node: WorkflowNode) -> _NodeResult:
+        """
+        노드별 검사 결과 조회 (노드 내용이 같으면 캐시 사용)
+
+        Args:
+            node: 검사할 노드
+
+        Returns:
+            _NodeResult: 노드별 검사 결과
+        """
+        if node.type != "worker":
+            return _NodeResult(template_vars=(), tool_errors=[])
+
+        template, agent_name, allowed_tools = self._get_worker_fields(node)
+        node_key = (node.id, template, agent_name, allowed_tools, self._tools_version)
+        cached = self._cache_get(self._node_cache, node_key)
+        if cached is not None:
+            return cached
+
+        result = _NodeResult(
+            template_vars=compile_task_template(template).variables if template else (),
+            tool_errors=self._check_worker_tools(node.id, agent_name, allowed_tools),
+        )
+        self._cache_put(self._node_cache, node_key, result, self.MAX_NODE_CACHE)
+        return result
+
+    @staticmethod
+    def _build_graph(workflow: Workflow) -> Dict[str, List[str]]:
+        """그래프 구성 (인접 리스트)"""
+        graph: Dict[str, List[str]] = {node.id: [] for node in workflow.nodes}
+        for edge in workflow.edges:
+            if edge.source in graph:
+                graph[edge.source].append(edge.target)
+        return graph
+
+    def _check_cycles(self, workflow: Workflow, graph: Dict[str, List[str]]) -> List[ValidationError]:
         """
         순환 참조 검사 (DFS)
 
@@ -135,6 +294,7 @@ class WorkflowValidator:
 
         Args:
             workflow: 검증할 워크플로우
+            graph: 인접 리스트
 
         Returns:
             순환 참조 에러 목록
@@ -148,12 +308,6 @@ class WorkflowValidator:
             if node.type == "condition":
                 control_nodes.add(node.id)
 
-        # 그래프 구성 (인접 리스트)
-        graph: Dict[str, List[str]] = {node.id: [] for node in workflow.nodes}
-        for edge in workflow.edges:
-            if edge.source in graph:
-                graph[edge.source].append(edge.target)
-
         # DFS로 순환 참조 검사
         visited: Set[str] = set()
         rec_stack: Set[str] = set()
@@ -237,14 +391,20 @@ class WorkflowValidator:
 
         return errors
 
-    def _validate_template_variables(self, workflow: Workflow) -> List[ValidationError]:
+    def _validate_template_variables(
+        self,
+        workflow: Workflow,
+        node_results: List[_NodeResult]
+    ) -> List[ValidationError]:
         """
         템플릿 변수 유효성 검사
 
         {{parent}}, {{input}}, {{node_123}} 등의 템플릿 변수가 유효한지 검사합니다.
+        변수 추출(정규식)은 노드별 캐시 결과를 사용하고, 노드 ID 존재 여부만 매번 확인합니다.
 
         Args:
             workflow: 검증할 워크플로우
+            node_results: 노드별 검사 결과 (workflow.nodes와 같은 순서)
 
         Returns:
             템플릿 변수 에러 목록
@@ -253,38 +413,23 @@ class WorkflowValidator:
 
         # 노드 ID 집합
         node_ids = {node.id for node in workflow.nodes}
+        example_node = workflow.nodes[0].id if workflow.nodes else 'node_1'
 
         # 각 노드의 템플릿 검증
-        for node in workflow.nodes:
-            template = None
-
-            # 노드 타입별 템플릿 추출
-            if node.type == "worker" and isinstance(node.data, (WorkerNodeData, dict)):
-                if isinstance(node.data, WorkerNodeData):
-                    template = node.data.task_template
-                elif isinstance(node.data, dict):
-                    template = node.data.get("task_template", "")
-
-            if not template:
-                continue
-
-            # 템플릿 변수 추출 ({{...}})
-            variables = self.TEMPLATE_VAR_PATTERN.findall(template)
-
-            for var in variables:
+        for node, node_result in zip(workflow.nodes, node_results):
+            for var in node_result.template_vars:
                 # 'input', 'parent'는 항상 유효
                 if var in ("input", "parent"):
                     continue
 
-                # 노드 ID 참조 검증 (예: {{node_123}})
-                if var.startswith("node_"):
-                    referenced_node_id = var  # 전체 변수 이름이 노드 ID
-                elif var in node_ids:
+                # 노드 ID 참조 검증 ({{<node_id>}} 또는 {{node_<id>}})
+                if var in node_ids:
                     # 노드 ID 직접 참조
-                    referenced_node_id = var
+                    continue
+                elif var.startswith("node_"):
+                    referenced_node_id = var[len("node_"):]
                 else:
                     # 유효하지 않은 변수
-                    example_node = list(node_ids)[0] if node_ids else 'node_1'
                     errors.append(ValidationError(
                         severity="error",
                         node_id=node.id,
@@ -299,62 +444,52 @@ class WorkflowValidator:
                         severity="error",
                         node_id=node.id,
                         message=f"존재하지 않는 노드를 참조합니다: {{{{{var}}}}}",
-                        suggestion=f"노드 ID '{referenced_node_id}'가 존재하지 않습니다. 올바른 노드 ID를 사용하세요."
+                        suggestion=f"노드 ID '{var}' 또는 '{referenced_node_id}'가 존재하지 않습니다. 올바른 노드 ID를 사용하세요."
                     ))
 
         return errors
 
-    def _check_worker_tools(self, workflow: Workflow) -> List[ValidationError]:
+    def _check_worker_tools(
+        self,
+        node_id: str,
+        agent_name: Optional[str],
+        allowed_tools: Optional[Tuple[str, ...]]
+    ) -> List[ValidationError]:
         """
-        Worker별 필수 도구 권한 검사
+        Worker별 필수 도구 권한 검사 (노드 1개)
 
         Worker 노드에서 사용하는 도구가 해당 Worker의 허용 도구 목록에 있는지 검사합니다.
 
         Args:
-            workflow: 검증할 워크플로우
+            node_id: 노드 ID
+            agent_name: Worker 이름
+            allowed_tools: 노드에 지정된 허용 도구
 
         Returns:
             도구 권한 에러 목록
         """
-        errors: List[ValidationError] = []
-
-        for node in workflow.nodes:
-            if node.type != "worker":
-                continue
+        if not agent_name:
+            return []
 
-            # Worker 노드 데이터 추출
-            agent_name = None
-            allowed_tools = None
+        # Worker 기본 도구 목록 가져오기
+        default_tools = self.worker_tools.get(agent_name, [])
 
-            if isinstance(node.data, WorkerNodeData):
-                agent_name = node.data.agent_name
-                allowed_tools = node.data.allowed_tools
-            elif isinstance(node.data, dict):
-                agent_name = node.data.get("agent_name")
-                allowed_tools = node.data.get("allowed_tools")
+        # 커스텀 워커인 경우 (worker_tools에 없음) 검증 스킵
+        if not default_tools:
+            return []
 
-            if not agent_name:
-                continue
+        # allowed_tools가 지정된 경우, 기본 도구 목록과 비교
+        if allowed_tools:
+            invalid_tools = [tool for tool in allowed_tools if tool not in default_tools]
+            if invalid_tools:
+                return [ValidationError(
+                    severity="error",
+                    node_id=node_id,
+                    message=f"Worker '{agent_name}'이(가) 사용할 수 없는 도구가 지정되었습니다: {', '.join(invalid_tools)}",
+                    suggestion=f"'{agent_name}'의 허용 도구: {', '.join(default_tools)}"
+                )]
 
-            # Worker 기본 도구 목록 가져오기
-            default_tools = self.WORKER_TOOLS.get(agent_name, [])
-
-            # 커스텀 워커인 경우 (WORKER_TOOLS에 없음) 검증 스킵
-            if not default_tools:
-                continue
-
-            # allowed_tools가 지정된 경우, 기본 도구 목록과 비교
-            if allowed_tools:
-                invalid_tools = [tool for tool in allowed_tools if tool not in default_tools]
-                if invalid_tools:
-                    errors.append(ValidationError(
-                        severity="error",
-                        node_id=node.id,
-                        message=f"Worker '{agent_name}'이(가) 사용할 수 없는 도구가 지정되었습니다: {', '.join(invalid_tools)}",
-                        suggestion=f"'{agent_name}'의 허용 도구: {', '.join(default_tools)}"
-                    ))
-
-        return errors
+        return []
 
     def _check_input_node(self, workflow: Workflow) -> List[ValidationError]:
         """
@@ -370,9 +505,7 @@ class WorkflowValidator:
         """
         errors: List[ValidationError] = []
 
-        input_nodes = [node for node in workflow.nodes if node.type == "input"]
-
-        if len(input_nodes) == 0:
+        if not any(node.type == "input" for node in workflow.nodes):
             errors.append(ValidationError(
                 severity="error",
                 node_id="",
@@ -383,28 +516,18 @@ class WorkflowValidator:
 
         return errors
 
-    def _check_condition_nodes(self, workflow: Workflow) -> List[ValidationError]:
+    @staticmethod
+    def _find_nodes_in_cycles(graph: Dict[str, List[str]]) -> Set[str]:
         """
-        Condition 노드 검증
-
-        순환 경로에 포함된 Condition 노드의 max_iterations 설정을 확인합니다.
+        순환 경로에 포함된 노드 찾기 (DFS)
 
         Args:
-            workflow: 검증할 워크플로우
+            graph: 인접 리스트
 
         Returns:
-            Condition 노드 에러 목록
+            순환 경로의 노드 ID 집합
         """
-        errors: List[ValidationError] = []
-
-        # 그래프 구성
-        graph: Dict[str, List[str]] = {node.id: [] for node in workflow.nodes}
-        for edge in workflow.edges:
-            if edge.source in graph:
-                graph[edge.source].append(edge.target)
-
-        # 순환 경로에 포함된 노드 찾기
-        nodes_in_cycles = set()
+        nodes_in_cycles: Set[str] = set()
 
         def find_cycles_from(start_id: str, visited: Set[str], rec_stack: Set[str]) -> None:
             """DFS로 순환 경로에 포함된 노드 찾기"""
@@ -426,9 +549,55 @@ class WorkflowValidator:
             if node_id not in visited_global:
                 find_cycles_from(node_id, visited_global, set())
 
-        # 순환 경로에 포함된 Condition 노드 검증
+        return nodes_in_cycles
+
+    def _check_condition_nodes(
+        self,
+        workflow: Workflow,
+        nodes_in_cycles: FrozenSet[str]
+    ) -> List[ValidationError]:
+        """
+        Condition 노드 검증
+
+        조건 값이 컴파일되는지(정규표현식, 길이 조건, custom 표현식 문법) 확인하고,
+        순환 경로에 포함된 Condition 노드의 max_iterations 설정을 확인합니다.
+
+        Args:
+            workflow: 검증할 워크플로우
+            nodes_in_cycles: 순환 경로에 포함된 노드 ID (구조 검사 결과)
+
+        Returns:
+            Condition 노드 에러 목록
+        """
+        errors: List[ValidationError] = []
+
         for node in workflow.nodes:
-            if node.type != "condition" or node.id not in nodes_in_cycles:
+            if node.type != "condition":
+                continue
+
+            # 조건 컴파일 검사 (llm 조건 제외, 결과는 캐시되어 실행 시 재사용)
+            if isinstance(node.data, dict):
+                condition_type = node.data.get("condition_type")
+                condition_value = node.data.get("condition_value")
+            else:
+                condition_type = getattr(node.data, "condition_type", None)
+                condition_value = getattr(node.data, "condition_value", None)
+
+            if condition_type != "llm" and isinstance(condition_type, str) and isinstance(condition_value, str):
+                try:
+                    compile_condition(condition_type, condition_value)
+                except ConditionExpressionError as e:
+                    errors.append(ValidationError(
+                        severity="error",
+                        node_id=node.id,
+                        message=f"조건을 해석할 수 없습니다: {e}",
+                        suggestion=(
+                            "custom 조건은 output, data, len(), number(), json_path() 등 "
+                            "허용된 표현식만 사용할 수 있습니다"
+                        )
+                    ))
+
+            if node.id not in nodes_in_cycles:
                 continue
 
             # max_iterations 추출